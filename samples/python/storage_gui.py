@@ -1,7 +1,8 @@
 import pandas as pd
 import ipywidgets as ipw
 import ipysheet as ips
-from cmdty_storage import CmdtyStorage, three_factor_seasonal_value, MultiFactorModel, multi_factor, RatchetInterp
+from cmdty_storage import CmdtyStorage, three_factor_seasonal_value, MultiFactorModel, multi_factor, RatchetInterp, \
+    DayOfFollowingMonth
 from curves import max_smooth_interp, adjustments
 from datetime import date, timedelta
 from IPython.display import display
@@ -716,7 +717,8 @@ def on_save_tech_params(b):
                                    ipw.Label('s=Spot Price'),
                                    ipw.Label('x_st=Short-term Factor'),
                                    ipw.Label('x_sw=Sum/Win Factor'),
-                                   ipw.Label('x_lt=Long-term Factor')])
+                                   ipw.Label('x_lt=Long-term Factor'),
+                                   ipw.Label('hermite(x_st, 2)=Standardised Polynomial')])
 
 basis_funcs_input_wgt = ipw.Textarea(
     value='1 + x_st + x_sw + x_lt + x_st**2 + x_sw**2 + x_lt**2 + x_st**3 + x_sw**3 + x_lt**3',
@@ -836,7 +838,7 @@ def on_progress(progress):
 
 
 # Inputs Not Defined in GUI
-def twentieth_of_next_month(period): return period.asfreq('M').asfreq('D', 'end') + 20
+twentieth_of_next_month = DayOfFollowingMonth(20)  # Built-in rule, so valuation doesn't call back into Python
 
 
 def enumerate_fwd_points():
@@ -0,0 +1,101 @@
+# Copyright(c) 2020 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import pandas as pd
+from cmdty_storage import MultiFactorSpotSim, MultiFactorModel, three_factor_seasonal_value
+from . import common
+
+
+class MultiFactorSpotSimulate:
+    params = (common.FREQS, common.HORIZON_DAYS, common.NUM_SIMS)
+    param_names = ['freq', 'horizon_days', 'num_sims']
+    timeout = 300.0
+
+    def setup(self, freq, horizon_days, num_sims):
+        factors, factor_corrs = common.create_factors(freq, horizon_days, 3)
+        fwd_curve = common.create_forward_curve(freq, horizon_days)
+        sim_periods = fwd_curve.index[fwd_curve.index.start_time >= pd.Timestamp(common.STORAGE_START)]
+        self.spot_simulator = MultiFactorSpotSim(freq, factors, factor_corrs, common.VAL_DATE, fwd_curve,
+                                                 sim_periods, seed=12)
+
+    def time_simulate(self, freq, horizon_days, num_sims):
+        self.spot_simulator.simulate(num_sims)
+
+    def peakmem_simulate(self, freq, horizon_days, num_sims):
+        self.spot_simulator.simulate(num_sims)
+
+
+class MultiFactorModelIntegratedCovar:
+    params = (common.FREQS, common.HORIZON_DAYS, [1, 3])
+    param_names = ['freq', 'horizon_days', 'num_factors']
+
+    def setup(self, freq, horizon_days, num_factors):
+        factors, factor_corrs = common.create_factors(freq, horizon_days, num_factors)
+        self.model = MultiFactorModel(freq, factors, factor_corrs if num_factors > 1 else None)
+        vol_curve_index = factors[0][1].index
+        self.fwd_contract_1 = vol_curve_index[len(vol_curve_index) // 2]
+        self.fwd_contract_2 = vol_curve_index[-1]
+        # First period of each delivery day of the storage horizon
+        self.fwd_contracts = [period for period in vol_curve_index
+                              if period.start_time >= pd.Timestamp(common.STORAGE_START)][::common.periods_per_day(freq)]
+        self.obs_end = common.STORAGE_START
+
+    def time_integrated_covar(self, freq, horizon_days, num_factors):
+        self.model.integrated_covar(common.VAL_DATE, self.obs_end, self.fwd_contract_1, self.fwd_contract_2)
+
+    def time_integrated_covar_matrix(self, freq, horizon_days, num_factors):
+        self.model.integrated_covar_matrix(common.VAL_DATE, self.obs_end, self.fwd_contracts)
+
+
+class ThreeFactorSeasonalValue:
+    params = (common.FREQS, common.HORIZON_DAYS, common.NUM_INVENTORY_GRID_POINTS, common.NUM_SIMS)
+    param_names = ['freq', 'horizon_days', 'num_inventory_grid_points', 'num_sims']
+    timeout = 1200.0
+    # CmdtyStorage memoises its compiled form and inventory space, so each timed call is run on the new storage
+    # created by setup, to include these calculations in the measurement as they would be for a first valuation
+    number = 1
+    warmup_time = 0.0
+    repeat = 3
+
+    def setup(self, freq, horizon_days, num_inventory_grid_points, num_sims):
+        self.storage = common.create_ratchet_storage(freq, horizon_days)
+        self.forward_curve = common.create_forward_curve(freq, horizon_days)
+        self.interest_rates = common.create_interest_rates(horizon_days)
+
+    def time_three_factor_seasonal_value(self, freq, horizon_days, num_inventory_grid_points, num_sims):
+        three_factor_seasonal_value(self.storage, common.VAL_DATE, 0.0, self.forward_curve, self.interest_rates,
+                                    common.settlement_rule, spot_mean_reversion=16.2, spot_vol=1.15,
+                                    long_term_vol=0.14, seasonal_vol=0.18, num_sims=num_sims,
+                                    basis_funcs='1 + x_st + x_sw + x_lt + s + s**2 + s**3 + x_st*s',
+                                    discount_deltas=False, seed=11,
+                                    num_inventory_grid_points=num_inventory_grid_points)
+
+    def track_npv(self, freq, horizon_days, num_inventory_grid_points, num_sims):
+        # Tracked alongside the timings so that speed-ups which change the valuation are visible in the results
+        return three_factor_seasonal_value(self.storage, common.VAL_DATE, 0.0, self.forward_curve,
+                                           self.interest_rates, common.settlement_rule, spot_mean_reversion=16.2,
+                                           spot_vol=1.15, long_term_vol=0.14, seasonal_vol=0.18, num_sims=num_sims,
+                                           basis_funcs='1 + x_st + x_sw + x_lt + s + s**2 + s**3 + x_st*s',
+                                           discount_deltas=False, seed=11,
+                                           num_inventory_grid_points=num_inventory_grid_points).npv
+    track_npv.unit = 'npv'
@@ -0,0 +1,46 @@
+# Copyright(c) 2020 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+from cmdty_storage import CmdtyStorage, RatchetInterp
+from . import common
+
+
+class CmdtyStorageConstruction:
+    params = (common.FREQS, common.HORIZON_DAYS)
+    param_names = ['freq', 'horizon_days']
+
+    def setup(self, freq, horizon_days):
+        self.storage_end = common.storage_end(horizon_days)
+        self.ratchets = common.create_ratchets(freq, horizon_days)
+
+    def time_linear_ratchets(self, freq, horizon_days):
+        CmdtyStorage(freq, common.STORAGE_START, self.storage_end, injection_cost=0.015, withdrawal_cost=0.02,
+                     ratchets=self.ratchets, ratchet_interp=RatchetInterp.LINEAR)
+
+    def time_step_ratchets(self, freq, horizon_days):
+        CmdtyStorage(freq, common.STORAGE_START, self.storage_end, injection_cost=0.015, withdrawal_cost=0.02,
+                     ratchets=self.ratchets, ratchet_interp=RatchetInterp.STEP,
+                     terminal_storage_npv=lambda price, inventory: 0.0)
+
+    def time_constant_rates(self, freq, horizon_days):
+        common.create_simple_storage(freq, horizon_days)
@@ -0,0 +1,69 @@
+# Copyright(c) 2020 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+from cmdty_storage import trinomial_value, trinomial_deltas
+from . import common
+
+
+class _TrinomialBase:
+    params = (common.FREQS, common.HORIZON_DAYS, common.NUM_INVENTORY_GRID_POINTS)
+    param_names = ['freq', 'horizon_days', 'num_inventory_grid_points']
+    timeout = 600.0
+    # CmdtyStorage memoises its compiled form and inventory space, so each timed call is run on the new storage
+    # created by setup, to include these calculations in the measurement as they would be for a first valuation
+    number = 1
+    warmup_time = 0.0
+
+    def setup(self, freq, horizon_days, num_inventory_grid_points):
+        self.storage = common.create_ratchet_storage(freq, horizon_days)
+        self.forward_curve = common.create_forward_curve(freq, horizon_days)
+        self.spot_volatility = common.create_spot_volatility(freq, horizon_days)
+        self.interest_rates = common.create_interest_rates(horizon_days)
+        self.time_step = common.trinomial_time_step(freq)
+
+
+class TrinomialValue(_TrinomialBase):
+
+    def time_trinomial_value(self, freq, horizon_days, num_inventory_grid_points):
+        trinomial_value(self.storage, common.VAL_DATE, 0.0, self.forward_curve, self.spot_volatility, 12.5,
+                        self.time_step, self.interest_rates, common.settlement_rule,
+                        num_inventory_grid_points=num_inventory_grid_points)
+
+    def peakmem_trinomial_value(self, freq, horizon_days, num_inventory_grid_points):
+        trinomial_value(self.storage, common.VAL_DATE, 0.0, self.forward_curve, self.spot_volatility, 12.5,
+                        self.time_step, self.interest_rates, common.settlement_rule,
+                        num_inventory_grid_points=num_inventory_grid_points)
+
+
+class TrinomialDeltas(_TrinomialBase):
+
+    def setup(self, freq, horizon_days, num_inventory_grid_points):
+        super().setup(freq, horizon_days, num_inventory_grid_points)
+        # One delta per calendar month of storage, each of which requires two tree valuations
+        self.fwd_contracts = sorted({period.asfreq('M') for period in self.forward_curve.index
+                                     if period.start_time.date() >= common.STORAGE_START})
+
+    def time_trinomial_deltas(self, freq, horizon_days, num_inventory_grid_points):
+        trinomial_deltas(self.storage, common.VAL_DATE, 0.0, self.forward_curve, self.spot_volatility, 12.5,
+                         self.time_step, self.interest_rates, common.settlement_rule, self.fwd_contracts,
+                         num_inventory_grid_points=num_inventory_grid_points)
@@ -0,0 +1,120 @@
+# Copyright(c) 2020 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+"""Market data and storage facility builders shared by the benchmark suites."""
+import pandas as pd
+import numpy as np
+from datetime import date
+from cmdty_storage import CmdtyStorage, RatchetInterp
+
+FREQS = ['D', 'H', '30min']
+HORIZON_DAYS = [31, 92]
+NUM_INVENTORY_GRID_POINTS = [50, 100]
+NUM_SIMS = [500, 2000]
+
+VAL_DATE = date(2019, 8, 29)
+STORAGE_START = date(2019, 9, 1)
+
+_PERIODS_PER_DAY = {'D': 1, 'H': 24, '30min': 48}
+
+
+def periods_per_day(freq: str) -> int:
+    return _PERIODS_PER_DAY[freq]
+
+
+def storage_end(horizon_days: int) -> date:
+    return (pd.Timestamp(STORAGE_START) + pd.Timedelta(days=horizon_days)).date()
+
+
+def create_ratchets(freq: str, horizon_days: int):
+    """Inventory dependent injection and withdrawal rates, which change half way through the storage life."""
+    scale = 1.0 / periods_per_day(freq)
+    mid_date = (pd.Timestamp(STORAGE_START) + pd.Timedelta(days=horizon_days // 2)).date()
+    return [
+        (STORAGE_START,
+         [
+             (0.0, -150.0 * scale, 255.2 * scale),
+             (2000.0, -200.0 * scale, 175.0 * scale),
+         ]),
+        (mid_date,
+         [
+             (0.0, -170.5 * scale, 235.8 * scale),
+             (700.0, -180.2 * scale, 200.77 * scale),
+             (1800.0, -190.5 * scale, 174.45 * scale),
+         ]),
+    ]
+
+
+def create_ratchet_storage(freq: str, horizon_days: int) -> CmdtyStorage:
+    return CmdtyStorage(freq, STORAGE_START, storage_end(horizon_days), injection_cost=0.015,
+                        withdrawal_cost=0.02, ratchets=create_ratchets(freq, horizon_days),
+                        ratchet_interp=RatchetInterp.LINEAR, cmdty_consumed_inject=0.0001,
+                        cmdty_consumed_withdraw=0.000088, inventory_loss=0.001, inventory_cost=0.002)
+
+
+def create_simple_storage(freq: str, horizon_days: int) -> CmdtyStorage:
+    scale = 1.0 / periods_per_day(freq)
+    return CmdtyStorage(freq, STORAGE_START, storage_end(horizon_days), injection_cost=0.01,
+                        withdrawal_cost=0.025, min_inventory=0.0, max_inventory=1500.0,
+                        max_injection_rate=25.5 * scale, max_withdrawal_rate=30.9 * scale)
+
+
+def create_forward_curve(freq: str, horizon_days: int) -> pd.Series:
+    index = pd.period_range(start=pd.Period(VAL_DATE, freq=freq),
+                            end=pd.Period(storage_end(horizon_days), freq=freq), freq=freq)
+    t = np.arange(len(index)) / (periods_per_day(freq) * 365.0)
+    prices = 60.0 + 8.5 * np.sin(2.0 * np.pi * t * 12.0) + 2.5 * np.sin(2.0 * np.pi * t * 365.0)
+    return pd.Series(data=prices, index=index)
+
+
+def create_spot_volatility(freq: str, horizon_days: int) -> pd.Series:
+    fwd_curve = create_forward_curve(freq, horizon_days)
+    return pd.Series(data=np.linspace(1.15, 0.95, num=len(fwd_curve)), index=fwd_curve.index)
+
+
+def create_interest_rates(horizon_days: int) -> pd.Series:
+    index = pd.period_range(start=VAL_DATE, end=storage_end(horizon_days + 60), freq='D')
+    return pd.Series(data=0.005, index=index)
+
+
+def settlement_rule(period: pd.Period) -> pd.Period:
+    return period.asfreq('M').asfreq('D', 'end') + 20
+
+
+def trinomial_time_step(freq: str) -> float:
+    return 1.0 / (365.0 * periods_per_day(freq))
+
+
+def create_factors(freq: str, horizon_days: int, num_factors: int):
+    index = pd.period_range(start=pd.Period(VAL_DATE, freq=freq),
+                            end=pd.Period(storage_end(horizon_days), freq=freq), freq=freq)
+    mean_reversions = [0.0, 2.5, 16.2][:num_factors]
+    factors = [(mean_reversion, pd.Series(data=np.linspace(0.35 + i * 0.3, 0.29 + i * 0.3, num=len(index)),
+                                          index=index))
+               for i, mean_reversion in enumerate(mean_reversions)]
+    factor_corrs = np.array([
+        [1.0, 0.6, 0.3],
+        [0.6, 1.0, 0.4],
+        [0.3, 0.4, 1.0]
+    ])[:num_factors, :num_factors]
+    return factors, factor_corrs
@@ -22,13 +22,68 @@
 # OTHER DEALINGS IN THE SOFTWARE.
 
 from cmdty_storage.__version__ import __version__
-from cmdty_storage.cmdty_storage import CmdtyStorage, RatchetInterp
-from cmdty_storage.intrinsic import intrinsic_value
-from cmdty_storage.trinomial import trinomial_value, trinomial_deltas
-from cmdty_storage.multi_factor import MultiFactorSpotSim, MultiFactorModel, three_factor_seasonal_value, \
-    multi_factor_value
-from cmdty_storage.utils import FREQ_TO_PERIOD_TYPE, numerics_provider
+import importlib
 import logging
+import sys
+import typing as tp
 
 logger: logging.Logger = logging.getLogger('cmdty.storage')
 logger.addHandler(logging.NullHandler())
+
+# Public names mapped to the submodule defining them. The submodules are only imported, and their .NET assemblies
+# only referenced via clr.AddReference, the first time one of their names is accessed, so that e.g. a process which
+# only needs intrinsic_value doesn't pay for loading Cmdty.Core.Simulation.
+_LAZY_ATTRIBUTES: tp.Dict[str, str] = {
+    'CmdtyStorage': 'cmdty_storage.cmdty_storage',
+    'RatchetInterp': 'cmdty_storage.cmdty_storage',
+    'intrinsic_value': 'cmdty_storage.intrinsic',
+    'trinomial_value': 'cmdty_storage.trinomial',
+    'trinomial_value_with_phase_timings': 'cmdty_storage.trinomial',
+    'TrinomialValuationResults': 'cmdty_storage.trinomial',
+    'trinomial_deltas': 'cmdty_storage.trinomial',
+    'MultiFactorSpotSim': 'cmdty_storage.multi_factor',
+    'MultiFactorModel': 'cmdty_storage.multi_factor',
+    'three_factor_seasonal_value': 'cmdty_storage.multi_factor',
+    'multi_factor_value': 'cmdty_storage.multi_factor',
+    'SettlementRule': 'cmdty_storage.settlement_rules',
+    'DayOfFollowingMonth': 'cmdty_storage.settlement_rules',
+    'SameDay': 'cmdty_storage.settlement_rules',
+    'FirstOfPeriod': 'cmdty_storage.settlement_rules',
+    'BusinessDayOffset': 'cmdty_storage.settlement_rules',
+    'FREQ_TO_PERIOD_TYPE': 'cmdty_storage.utils',
+    'numerics_provider': 'cmdty_storage.utils',
+}
+
+__all__ = ['__version__', 'logger'] + list(_LAZY_ATTRIBUTES)
+
+if tp.TYPE_CHECKING:
+    from cmdty_storage.cmdty_storage import CmdtyStorage, RatchetInterp
+    from cmdty_storage.intrinsic import intrinsic_value
+    from cmdty_storage.trinomial import trinomial_value, trinomial_value_with_phase_timings, trinomial_deltas, \
+        TrinomialValuationResults
+    from cmdty_storage.multi_factor import MultiFactorSpotSim, MultiFactorModel, three_factor_seasonal_value, \
+        multi_factor_value
+    from cmdty_storage.settlement_rules import SettlementRule, DayOfFollowingMonth, SameDay, FirstOfPeriod, \
+        BusinessDayOffset
+    from cmdty_storage.utils import FREQ_TO_PERIOD_TYPE, numerics_provider
+
+
+def _load_attribute(name: str) -> tp.Any:
+    module = importlib.import_module(_LAZY_ATTRIBUTES[name])
+    value = getattr(module, name)
+    globals()[name] = value  # Cache so __getattr__ is only hit once per name
+    return value
+
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name: str) -> tp.Any:
+        if name in _LAZY_ATTRIBUTES:
+            return _load_attribute(name)
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+    def __dir__() -> tp.List[str]:
+        return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+else:
+    # Module level __getattr__ (PEP 562) isn't supported before Python 3.7 so fall back to eager import
+    for _name in _LAZY_ATTRIBUTES:
+        _load_attribute(_name)
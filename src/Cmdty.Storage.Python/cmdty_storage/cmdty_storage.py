@@ -32,6 +32,7 @@
 from typing import Union, Callable, Iterable, Tuple, NamedTuple, Optional
 from datetime import datetime, date
 import pandas as pd
+import numpy as np
 from enum import Enum
 from cmdty_storage import utils
 import logging
@@ -44,6 +45,11 @@ class InjectWithdrawRange(NamedTuple):
     max_inject_withdraw_rate: float
 
 
+class InjectWithdrawRangeGrid(NamedTuple):
+    min_inject_withdraw_rate: pd.DataFrame
+    max_inject_withdraw_rate: pd.DataFrame
+
+
 class RatchetInterp(Enum):
     LINEAR = 1
     STEP = 2
@@ -205,6 +211,30 @@ def _net_time_period(self, period):
         time_period_type = utils.FREQ_TO_PERIOD_TYPE[self._freq]
         return utils.from_datetime_like(period, time_period_type)
 
+    def _to_period_index(self, periods) -> pd.PeriodIndex:
+        if not pd.api.types.is_list_like(periods):
+            periods = [periods]
+        return pd.PeriodIndex(periods, freq=self._freq)
+
+    def _net_period_offsets(self, period_index: pd.PeriodIndex):
+        # Period ordinals are in units of the base frequency, e.g. minutes for '30min', hence division by freq.n
+        offsets = (period_index.asi8 - self.start.ordinal) // period_index.freq.n
+        return offsets.astype(np.int32)
+
+    def _bulk_query_args(self, periods, *float_args):
+        period_index = self._to_period_index(periods)
+        broadcast = np.broadcast_arrays(self._net_period_offsets(period_index),
+                                        *(np.asarray(arg, dtype=np.float64) for arg in float_args))
+        if broadcast[0].ndim != 1:
+            raise ValueError('inventory and volume arguments should be scalars or one-dimensional arrays.')
+        net_args = [utils.as_net_array(np.ascontiguousarray(arg)) for arg in broadcast]
+        return [self._net_storage] + net_args
+
+    def _bulk_query(self, net_method, periods, *float_args) -> np.ndarray:
+        time_period_type = utils.FREQ_TO_PERIOD_TYPE[self._freq]
+        net_args = self._bulk_query_args(periods, *float_args)
+        return utils.as_numpy_array(net_method[time_period_type](*net_args))
+
     @property
     def net_storage(self) -> net_cs.CmdtyStorage:
         return self._net_storage
@@ -276,3 +306,60 @@ def inventory_cost(self, period, inventory) -> float:
             return net_inventory_cost[0].Amount
         return 0.0
 
+    def clear_inventory_space_cache(self):
+        # Inventory space is memoised by the .NET storage, keyed on starting inventory and current period, and shared
+        # between all valuations of this storage
+        self._net_storage.ClearInventorySpaceCache()
+
+    # Array versions of the query methods above. Each takes periods as a pandas PeriodIndex (or anything which can be
+    # converted to one with the storage freq) and inventories/volumes as numpy arrays or scalars, which are broadcast
+    # against each other. All points are evaluated with a single call into .NET.
+
+    def inject_withdraw_range_array(self, periods, inventories) -> pd.DataFrame:
+        period_index = self._to_period_index(periods)
+        net_ranges = self._bulk_query(net_cs.PythonHelpers.CmdtyStorageBulkQuery.InjectWithdrawRanges,
+                                      period_index, inventories)
+        num_points = len(net_ranges) // 2
+        if len(period_index) != num_points:  # Single period broadcast against inventories
+            period_index = period_index.repeat(num_points)
+        return pd.DataFrame(data={'min_inject_withdraw_rate': net_ranges[:num_points],
+                                  'max_inject_withdraw_rate': net_ranges[num_points:]}, index=period_index)
+
+    def inject_withdraw_range_grid(self, periods, inventories) -> InjectWithdrawRangeGrid:
+        period_index = self._to_period_index(periods)
+        inventories = np.asarray(inventories, dtype=np.float64)
+        num_periods = len(period_index)
+        num_inventories = len(inventories)
+        net_ranges = self._bulk_query(net_cs.PythonHelpers.CmdtyStorageBulkQuery.InjectWithdrawRanges,
+                                      period_index.repeat(num_inventories), np.tile(inventories, num_periods))
+        num_points = num_periods * num_inventories
+        min_rates = net_ranges[:num_points].reshape(num_periods, num_inventories)
+        max_rates = net_ranges[num_points:].reshape(num_periods, num_inventories)
+        return InjectWithdrawRangeGrid(pd.DataFrame(data=min_rates, index=period_index, columns=inventories),
+                                       pd.DataFrame(data=max_rates, index=period_index, columns=inventories))
+
+    def min_inventory_array(self, periods) -> np.ndarray:
+        return self._bulk_query(net_cs.PythonHelpers.CmdtyStorageBulkQuery.MinInventories, periods)
+
+    def max_inventory_array(self, periods) -> np.ndarray:
+        return self._bulk_query(net_cs.PythonHelpers.CmdtyStorageBulkQuery.MaxInventories, periods)
+
+    def injection_cost_array(self, periods, inventories, injected_volumes) -> np.ndarray:
+        return self._bulk_query(net_cs.PythonHelpers.CmdtyStorageBulkQuery.InjectionCosts,
+                                periods, inventories, injected_volumes)
+
+    def cmdty_consumed_inject_array(self, periods, inventories, injected_volumes) -> np.ndarray:
+        return self._bulk_query(net_cs.PythonHelpers.CmdtyStorageBulkQuery.CmdtyVolumesConsumedOnInject,
+                                periods, inventories, injected_volumes)
+
+    def withdrawal_cost_array(self, periods, inventories, withdrawn_volumes) -> np.ndarray:
+        return self._bulk_query(net_cs.PythonHelpers.CmdtyStorageBulkQuery.WithdrawalCosts,
+                                periods, inventories, withdrawn_volumes)
+
+    def cmdty_consumed_withdraw_array(self, periods, inventories, withdrawn_volumes) -> np.ndarray:
+        return self._bulk_query(net_cs.PythonHelpers.CmdtyStorageBulkQuery.CmdtyVolumesConsumedOnWithdraw,
+                                periods, inventories, withdrawn_volumes)
+
+    def inventory_cost_array(self, periods, inventories) -> np.ndarray:
+        return self._bulk_query(net_cs.PythonHelpers.CmdtyStorageBulkQuery.CmdtyInventoryCosts,
+                                periods, inventories)
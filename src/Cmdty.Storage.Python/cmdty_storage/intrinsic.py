@@ -24,8 +24,8 @@
 import pandas as pd
 import clr
 import System as dotnet
-from cmdty_storage import utils, CmdtyStorage
-from typing import NamedTuple, Union, Callable
+from cmdty_storage import utils, CmdtyStorage, settlement_rules
+from typing import NamedTuple, Union, Callable, Optional, Dict
 from datetime import date
 from pathlib import Path
 clr.AddReference(str(Path('cmdty_storage/lib/Cmdty.Storage')))
@@ -37,6 +37,7 @@
 class IntrinsicValuationResults(NamedTuple):
     npv: float
     profile: pd.DataFrame
+    phase_timings: Optional[Dict[str, float]] = None
 
 
 def intrinsic_value(cmdty_storage: CmdtyStorage,
@@ -44,29 +45,36 @@ def intrinsic_value(cmdty_storage: CmdtyStorage,
                     inventory: Union[float, int],
                     forward_curve: pd.Series,
                     interest_rates: pd.Series,
-                    settlement_rule: Callable[[pd.Period], date],
+                    settlement_rule: settlement_rules.SettlementRuleType,
                     num_inventory_grid_points: int = 100,
-                    numerical_tolerance: float = 1E-12) -> IntrinsicValuationResults:
+                    numerical_tolerance: float = 1E-12,
+                    profile_phases: bool = False) -> IntrinsicValuationResults:
     """
     Calculates the intrinsic value of commodity storage.
 
     Args:
-        settlement_rule (callable): Mapping function from pandas.Period type to the date on which the cmdty delivered in
-            this period is settled. The pandas.Period parameter will have freq equal to the cmdty_storage parameter's freq property.
+        settlement_rule (str, SettlementRule or callable): Built-in settlement rule, specified by name or object (see
+            cmdty_storage.settlement_rules), or mapping function from pandas.Period type to the date on which the cmdty
+            delivered in this period is settled. The pandas.Period parameter will have freq equal to the cmdty_storage parameter's freq property.
+        profile_phases (bool): If True, the phase_timings property of the results is populated with the time in seconds
+            spent in each phase of the calculation.
     """
     if cmdty_storage.freq != forward_curve.index.freqstr:
         raise ValueError("cmdty_storage and forward_curve have different frequencies.")
     time_period_type = utils.FREQ_TO_PERIOD_TYPE[cmdty_storage.freq]
     current_period = utils.from_datetime_like(val_date, time_period_type)
     net_forward_curve = utils.series_to_double_time_series(forward_curve, time_period_type)
-    net_settlement_rule = utils.wrap_settle_for_dotnet(settlement_rule, cmdty_storage.freq)
+    net_settlement_rule = settlement_rules.settle_rule_to_dotnet(settlement_rule, cmdty_storage.freq,
+                                                                 current_period, cmdty_storage.net_storage)
     interest_rate_time_series = utils.series_to_double_time_series(interest_rates, utils.FREQ_TO_PERIOD_TYPE['D'])
     return net_intrinsic_calc(cmdty_storage, current_period, interest_rate_time_series, inventory, net_forward_curve,
-                                 net_settlement_rule, num_inventory_grid_points, numerical_tolerance, time_period_type)
+                                 net_settlement_rule, num_inventory_grid_points, numerical_tolerance, time_period_type,
+                                 profile_phases)
 
 
 def net_intrinsic_calc(cmdty_storage, current_period, interest_rate_time_series, inventory, net_forward_curve,
-                       net_settlement_rule, num_inventory_grid_points, numerical_tolerance, time_period_type):
+                       net_settlement_rule, num_inventory_grid_points, numerical_tolerance, time_period_type,
+                       profile_phases=False):
     intrinsic_calc = net_cs.IntrinsicStorageValuation[time_period_type].ForStorage(cmdty_storage.net_storage)
     net_cs.IIntrinsicAddStartingInventory[time_period_type](intrinsic_calc).WithStartingInventory(inventory)
     net_cs.IIntrinsicAddCurrentPeriod[time_period_type](intrinsic_calc).ForCurrentPeriod(current_period)
@@ -79,9 +87,12 @@ def net_intrinsic_calc(cmdty_storage, current_period, interest_rate_time_series,
         intrinsic_calc, num_inventory_grid_points)
     net_cs.IntrinsicStorageValuationExtensions.WithLinearInventorySpaceInterpolation[time_period_type](intrinsic_calc)
     net_cs.IIntrinsicAddNumericalTolerance[time_period_type](intrinsic_calc).WithNumericalTolerance(numerical_tolerance)
+    if profile_phases:
+        net_cs.IIntrinsicCalculate[time_period_type](intrinsic_calc).WithPhaseTimings()
     net_val_results = net_cs.IIntrinsicCalculate[time_period_type](intrinsic_calc).Calculate()
     data_frame = profile_to_data_frame(cmdty_storage.freq, net_val_results.StorageProfile)
-    results = IntrinsicValuationResults(net_val_results.NetPresentValue, data_frame)
+    phase_timings = utils.net_phase_timings_to_dict(net_val_results.PhaseTimings) if profile_phases else None
+    results = IntrinsicValuationResults(net_val_results.NetPresentValue, data_frame, phase_timings)
     return results
 
 
@@ -35,7 +35,7 @@
 import numpy as np
 from datetime import datetime, date
 import typing as tp
-from cmdty_storage import utils, CmdtyStorage
+from cmdty_storage import utils, CmdtyStorage, settlement_rules
 from cmdty_storage import time_func as tf
 import math
 import cmdty_storage.intrinsic as cs_intrinsic
@@ -44,6 +44,7 @@
 logger: logging.Logger = logging.getLogger('cmdty.storage.multi-factor')
 
 FactorCorrsType = tp.Optional[tp.Union[float, np.ndarray]]
+SimDTypeType = tp.Union[type, np.dtype, str]
 
 
 class MultiFactorSpotSim:
@@ -57,6 +58,8 @@ def __init__(self,
                  sim_periods: tp.Iterable[tp.Union[pd.Period, datetime, date, str]],
                  seed: tp.Optional[int] = None,
                  antithetic: bool = False,
+                 parallel: bool = False,
+                 rng: str = 'mersenne_twister',
                  # time_func: Callable[[Union[datetime, date], Union[datetime, date]], float] TODO add this back in
                  ):
         factor_corrs = _validate_multi_factor_params(factors, factor_corrs)
@@ -64,6 +67,9 @@ def __init__(self,
             raise ValueError("freq parameter value of '{}' not supported. The allowable values can be found in the "
                              "keys of the dict curves.FREQ_TO_PERIOD_TYPE.".format(freq))
 
+        _validate_rng(rng)
+        if rng == 'sobol' and (parallel or antithetic):
+            raise ValueError("rng value of 'sobol' cannot be used with parallel or antithetic simulation.")
         time_period_type = utils.FREQ_TO_PERIOD_TYPE[freq]
 
         net_multi_factor_params = _create_net_multi_factor_params(factor_corrs, factors, time_period_type)
@@ -73,23 +79,114 @@ def __init__(self,
         net_sim_periods = dotnet_cols_gen.List[time_period_type]()
         [net_sim_periods.Add(utils.from_datetime_like(p, time_period_type)) for p in sim_periods]
 
-        if seed is None:
-            mt_rand = net_sim.MersenneTwisterGenerator(antithetic)
+        if parallel:
+            def create_simulator(normal_generator):
+                return net_sim.MultiFactor.MultiFactorSpotPriceSimulator[time_period_type](
+                    net_multi_factor_params, net_current_date, net_forward_curve, net_sim_periods, net_time_func,
+                    normal_generator)
+            net_simulator_factory = dotnet.Func[net_sim.IStandardNormalGenerator,
+                                                net_sim.MultiFactor.MultiFactorSpotPriceSimulator[time_period_type]](
+                create_simulator)
+            net_parallel_sim_type = net_cs.ParallelSpotSimulator[time_period_type]
+            sims_per_block = int(net_parallel_sim_type.DefaultSimsPerBlock)
+            self._net_simulator = net_parallel_sim_type(net_simulator_factory, seed, antithetic, None, sims_per_block)
+            # Block size is even, so antithetic pairs are also never split
+            self._chunk_size_multiple = sims_per_block
         else:
-            mt_rand = net_sim.MersenneTwisterGenerator(seed, antithetic)
-        mt_rand = net_sim.IStandardNormalGeneratorWithSeed(mt_rand)
-
-        self._net_simulator = net_sim.MultiFactor.MultiFactorSpotPriceSimulator[time_period_type](
-            net_multi_factor_params, net_current_date, net_forward_curve, net_sim_periods, net_time_func, mt_rand)
+            if rng == 'sobol':
+                normal_generator = net_cs.SobolBrownianBridgeGenerator(len(factor_corrs), net_sim_periods.Count, seed)
+                normal_generator = net_sim.IStandardNormalGenerator(normal_generator)
+            else:
+                if seed is None:
+                    normal_generator = net_sim.MersenneTwisterGenerator(antithetic)
+                else:
+                    normal_generator = net_sim.MersenneTwisterGenerator(seed, antithetic)
+                normal_generator = net_sim.IStandardNormalGeneratorWithSeed(normal_generator)
+
+            self._net_simulator = net_sim.MultiFactor.MultiFactorSpotPriceSimulator[time_period_type](
+                net_multi_factor_params, net_current_date, net_forward_curve, net_sim_periods, net_time_func,
+                normal_generator)
+            self._chunk_size_multiple = 2 if antithetic else 1
         self._sim_periods = [_to_pd_period(freq, p) for p in sim_periods]
         self._freq = freq
+        self._time_period_type = time_period_type
+        self._antithetic = antithetic
 
-    def simulate(self, num_sims: int) -> pd.DataFrame:
+    def simulate(self, num_sims: int, dtype: SimDTypeType = np.float64) -> pd.DataFrame:
+        net_sim_results = self._net_simulator.Simulate(num_sims)
+        spot_sim_array = self._spot_sims_to_numpy(net_sim_results, dtype)
+        return pd.DataFrame(data=spot_sim_array, index=self._period_index())
+
+    def simulate_with_factors(self, num_sims: int, dtype: SimDTypeType = np.float64) -> 'SpotSimResults':
+        """
+        Simulates spot prices, also returning the simulated Markov factor paths as a numpy array of shape
+        (num_factors, num_sim_periods, num_sims). Use dtype of np.float32 to halve the memory of the results.
+        """
         net_sim_results = self._net_simulator.Simulate(num_sims)
-        spot_sim_array = utils.as_numpy_array(net_sim_results.SpotPrices)
-        spot_sim_array.resize((net_sim_results.NumSteps, net_sim_results.NumSims))
-        period_index = pd.PeriodIndex(data=self._sim_periods, freq=self._freq)
-        return pd.DataFrame(data=spot_sim_array, index=period_index)
+        spot_sim_array = self._spot_sims_to_numpy(net_sim_results, dtype)
+        net_markov_factors = net_cs.PythonHelpers.SpotSimResultsHelper.MarkovFactorsToArray[self._time_period_type](
+            net_sim_results)
+        markov_factors = _net_sim_array_to_numpy(net_markov_factors, dtype).reshape(
+            (net_sim_results.NumFactors, net_sim_results.NumSteps, net_sim_results.NumSims))
+        return SpotSimResults(pd.DataFrame(data=spot_sim_array, index=self._period_index()), markov_factors)
+
+    def simulate_chunks(self, num_sims: int, chunk_size: int,
+                        dtype: SimDTypeType = np.float64) -> tp.Iterator[np.ndarray]:
+        """
+        Generator of simulated spot prices in blocks of at most chunk_size simulations, for aggregating over large
+        numbers of simulations in bounded memory. Each yielded numpy array has one row per simulated period and one
+        column per simulation. The random number stream continues from one chunk to the next, so the chunks
+        concatenated along axis 1 are the same as the result of a single call to simulate with num_sims.
+
+        To guarantee this chunk_size is rounded down to a multiple of the number of simulations which must be
+        generated together: the parallel block size of 1,000 if parallel is True, otherwise 2 if antithetic is True,
+        so that antithetic pairs are never split across chunks. A chunk_size smaller than this multiple is rounded up
+        to it.
+        """
+        if num_sims <= 0:
+            raise ValueError("num_sims must be positive.")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive.")
+        chunk_size = max(chunk_size - chunk_size % self._chunk_size_multiple, self._chunk_size_multiple)
+        num_sims_remaining = num_sims
+        while num_sims_remaining > 0:
+            num_sims_chunk = min(chunk_size, num_sims_remaining)
+            net_sim_results = self._net_simulator.Simulate(num_sims_chunk)
+            yield self._spot_sims_to_numpy(net_sim_results, dtype)
+            num_sims_remaining -= num_sims_chunk
+
+    def _period_index(self) -> pd.PeriodIndex:
+        return pd.PeriodIndex(data=self._sim_periods, freq=self._freq)
+
+    @staticmethod
+    def _spot_sims_to_numpy(net_sim_results, dtype: SimDTypeType) -> np.ndarray:
+        spot_sim_array = _net_sim_array_to_numpy(net_sim_results.SpotPrices, dtype)
+        # reshape returns a view, so the simulated prices are only copied once out of the .NET array
+        return spot_sim_array.reshape((net_sim_results.NumSteps, net_sim_results.NumSims))
+
+
+class SpotSimResults(tp.NamedTuple):
+    spot_prices: pd.DataFrame
+    markov_factors: np.ndarray
+
+
+def _net_sim_array_to_numpy(net_array, dtype: SimDTypeType) -> np.ndarray:
+    dtype = np.dtype(dtype)
+    if dtype == np.float32:
+        # Conversion done in .NET so only the half-size array is copied across
+        net_array = net_cs.PythonHelpers.SpotSimResultsHelper.ToSingleArray(net_array)
+    elif dtype != np.float64:
+        raise ValueError("dtype must be either float64 or float32.")
+    return utils.as_numpy_array(net_array)
+
+
+_RNG_NAMES = ('mersenne_twister', 'sobol')
+
+
+def _validate_rng(rng: str):
+    if rng not in _RNG_NAMES:
+        raise ValueError("rng parameter value of '{}' not supported. The allowable values are {}.".format(
+            rng, ', '.join("'{}'".format(name) for name in _RNG_NAMES)))
 
 
 def _to_pd_period(freq: str, date_like: tp.Union[pd.Period, datetime, date, str]) -> pd.Period:
@@ -162,6 +259,7 @@ def __init__(self,
         self._factor_corrs = _validate_multi_factor_params(factors, factor_corrs)
         self._factors = list(factors)
         self._time_func = tf.act_365 if time_func is None else time_func
+        self._freq = freq
 
     def integrated_covar(self,
                          obs_start: utils.TimePeriodSpecType,
@@ -222,6 +320,152 @@ def integrated_corr(self,
             return -1.0
         return corr
 
+    def integrated_covar_matrix(self,
+                                obs_start: utils.TimePeriodSpecType,
+                                obs_end: utils.TimePeriodSpecType,
+                                fwd_contracts: tp.Iterable[utils.ForwardPointType]) -> np.ndarray:
+        """
+        Integrated covariance between every pair of fwd_contracts. Equivalent to calling integrated_covar for each
+        pair, but vectorised over the contracts.
+
+        Args:
+            obs_start: Start of the observation period.
+            obs_end: End of the observation period. Cannot be before obs_start.
+            fwd_contracts: Forward contracts, each of which must have a point in the vol curve of every factor.
+
+        Returns:
+            Square numpy array of covariances, with rows and columns in the same order as fwd_contracts.
+        """
+        obs_end_t = self._time_func(obs_start, obs_end)
+        if obs_end_t < 0.0:
+            raise ValueError("obs_end cannot be before obs_start.")
+        scaled_vols = self._scaled_factor_vols(obs_start, fwd_contracts)
+        return scaled_vols.T @ self._factor_covar_weights(obs_end_t) @ scaled_vols
+
+    def integrated_variances(self,
+                             obs_start: utils.TimePeriodSpecType,
+                             obs_end: utils.TimePeriodSpecType,
+                             fwd_contracts: tp.Iterable[utils.ForwardPointType]) -> np.ndarray:
+        """
+        Integrated variance of each of fwd_contracts over the observation period. Equivalent to calling
+        integrated_variance for each contract, but vectorised over the contracts.
+
+        Args:
+            obs_start: Start of the observation period.
+            obs_end: End of the observation period. Cannot be before obs_start.
+            fwd_contracts: Forward contracts, each of which must have a point in the vol curve of every factor.
+
+        Returns:
+            numpy array of integrated variances, in the same order as fwd_contracts.
+        """
+        obs_end_t = self._time_func(obs_start, obs_end)
+        if obs_end_t < 0.0:
+            raise ValueError("obs_end cannot be before obs_start.")
+        scaled_vols = self._scaled_factor_vols(obs_start, fwd_contracts)
+        return np.einsum('ia,ij,ja->a', scaled_vols, self._factor_covar_weights(obs_end_t), scaled_vols)
+
+    def integrated_stan_devs(self,
+                             obs_start: utils.TimePeriodSpecType,
+                             obs_end: utils.TimePeriodSpecType,
+                             fwd_contracts: tp.Iterable[utils.ForwardPointType]) -> np.ndarray:
+        """
+        Integrated standard deviation of each of fwd_contracts over the observation period, i.e. the square root of
+        the result of integrated_variances.
+
+        Args:
+            obs_start: Start of the observation period.
+            obs_end: End of the observation period. Cannot be before obs_start.
+            fwd_contracts: Forward contracts, each of which must have a point in the vol curve of every factor.
+
+        Returns:
+            numpy array of integrated standard deviations, in the same order as fwd_contracts.
+        """
+        return np.sqrt(self.integrated_variances(obs_start, obs_end, fwd_contracts))
+
+    def integrated_vols(self,
+                        val_date: utils.TimePeriodSpecType,
+                        expiry: utils.TimePeriodSpecType,
+                        fwd_contracts: tp.Iterable[utils.ForwardPointType]) -> np.ndarray:
+        """
+        Implied volatility of each of fwd_contracts for an option expiring on expiry. Equivalent to calling
+        integrated_vol for each contract, but vectorised over the contracts.
+
+        Args:
+            val_date: Valuation date, from which the volatility is integrated.
+            expiry: Option expiry. Must be after val_date.
+            fwd_contracts: Forward contracts, each of which must have a point in the vol curve of every factor.
+
+        Returns:
+            numpy array of annualised volatilities, in the same order as fwd_contracts.
+        """
+        time_to_expiry = self._time_func(val_date, expiry)
+        if time_to_expiry <= 0:
+            raise ValueError("val_date must be before expiry.")
+        return np.sqrt(self.integrated_variances(val_date, expiry, fwd_contracts) / time_to_expiry)
+
+    def integrated_corr_matrix(self,
+                               obs_start: utils.TimePeriodSpecType,
+                               obs_end: utils.TimePeriodSpecType,
+                               fwd_contracts: tp.Iterable[utils.ForwardPointType]) -> np.ndarray:
+        """
+        Integrated correlation between every pair of fwd_contracts. Equivalent to calling integrated_corr for each
+        pair, but vectorised over the contracts.
+
+        Args:
+            obs_start: Start of the observation period.
+            obs_end: End of the observation period. Cannot be before obs_start.
+            fwd_contracts: Forward contracts, each of which must have a point in the vol curve of every factor.
+
+        Returns:
+            Square numpy array of correlations, with rows and columns in the same order as fwd_contracts.
+        """
+        covariance = self.integrated_covar_matrix(obs_start, obs_end, fwd_contracts)
+        stan_devs = np.sqrt(np.diag(covariance))
+        corr = covariance / np.outer(stan_devs, stan_devs)
+        corr[(1.0 < corr) & (corr < (1.0 + self._corr_tolerance))] = 1.0
+        corr[((-1.0 - self._corr_tolerance) < corr) & (corr < -1.0)] = -1.0
+        return corr
+
+    def _scaled_factor_vols(self, obs_start, fwd_contracts) -> np.ndarray:
+        """Array of shape (num_factors, num_contracts) holding vol * exp(-mean_reversion * time_to_fwd)."""
+        fwd_contracts = list(fwd_contracts)
+        fwd_t = np.array([self._time_func(obs_start, fwd_contract) for fwd_contract in fwd_contracts])
+        fwd_index = None
+        scaled_vols = np.empty((len(self._factors), len(fwd_contracts)))
+        for i, (mr, vol_curve) in enumerate(self._factors):
+            if isinstance(vol_curve, pd.Series) and isinstance(vol_curve.index, pd.PeriodIndex):
+                if fwd_index is None:
+                    fwd_index = pd.PeriodIndex(fwd_contracts, freq=self._freq)
+                vols = self._get_factor_vols(i, fwd_contracts, fwd_index, vol_curve)
+            else:
+                vols = np.array([self._get_factor_vol(i, fwd_contract, vol_curve) for fwd_contract in fwd_contracts])
+            scaled_vols[i] = vols * np.exp(-mr * fwd_t)
+        return scaled_vols
+
+    def _factor_covar_weights(self, obs_end_t) -> np.ndarray:
+        """
+        Array of shape (num_factors, num_factors) holding the factor correlations multiplied by the integral over the
+        observation period of exp((mean_reversion_i + mean_reversion_j) * t).
+        """
+        mean_reversions = np.array([mr for mr, vol_curve in self._factors])
+        mr_sums = np.add.outer(mean_reversions, mean_reversions)
+        cont_ext = np.empty_like(mr_sums)
+        zero_mr = mr_sums == 0.0
+        cont_ext[zero_mr] = obs_end_t
+        cont_ext[~zero_mr] = np.expm1(mr_sums[~zero_mr] * obs_end_t) / mr_sums[~zero_mr]
+        return self._factor_corrs * cont_ext
+
+    @staticmethod
+    def _get_factor_vols(factor_num, fwd_contracts, fwd_index, vol_curve) -> np.ndarray:
+        """Looks up the vols of all fwd_contracts from a vol curve with a PeriodIndex in a single indexer call."""
+        positions = vol_curve.index.get_indexer(fwd_index)
+        missing = np.flatnonzero(positions < 0)
+        if len(missing) > 0:
+            raise ValueError(
+                "No point in vol curve of factor {factor_num} for fwd_contracts element {fwd}.".format(
+                    factor_num=factor_num, fwd=fwd_contracts[missing[0]]))
+        return vol_curve.to_numpy()[positions]
+
     @staticmethod
     def _cont_ext(c1, c2, x) -> float:
         if x == 0.0:
@@ -270,17 +514,15 @@ def create_3_factor_season_params(
     start_period = start if isinstance(start, pd.Period) else pd.Period(start, freq=freq)
     end_period = end if isinstance(end, pd.Period) else pd.Period(end, freq=freq)
     index = pd.period_range(start=start_period, end=end_period, freq=freq)
-    long_term_vol_curve = pd.Series(index=index, data=[long_term_vol] * len(index))
-    spot_vol_curve = pd.Series(index=index.copy(), data=[spot_vol] * len(index))
+    num_periods = len(index)
+    long_term_vol_curve = pd.Series(index=index, data=np.full(num_periods, long_term_vol), copy=False)
+    spot_vol_curve = pd.Series(index=index, data=np.full(num_periods, spot_vol), copy=False)
     peak_period = pd.Period(year=start_period.year, month=2, day=1, freq=freq)
     phase = np.pi / 2.0
     amplitude = seasonal_vol / 2.0
-    seasonal_vol_array = np.empty((len(index)))
-    for i, p in enumerate(index):
-        t_from_peak = (p.start_time - peak_period.start_time).total_seconds() / seconds_per_year
-        seasonal_vol_array[i] = 2.0 * np.pi * t_from_peak + phase
-    seasonal_vol_array = np.sin(seasonal_vol_array) * amplitude
-    seasonal_vol_curve = pd.Series(index=index.copy(), data=seasonal_vol_array)
+    t_from_peak = _years_from_period(index, peak_period)
+    seasonal_vol_array = np.sin(2.0 * np.pi * t_from_peak + phase) * amplitude
+    seasonal_vol_curve = pd.Series(index=index, data=seasonal_vol_array, copy=False)
     factors = [
         (spot_mean_reversion, spot_vol_curve),
         (0.0, long_term_vol_curve),
@@ -289,6 +531,17 @@ def create_3_factor_season_params(
     return factors, factor_corrs
 
 
+def _years_from_period(index: pd.PeriodIndex, from_period: pd.Period) -> np.ndarray:
+    """Time in years from the start of from_period to the start of each period in index."""
+    if isinstance(index.freq, pd.offsets.Tick):
+        # Fixed length periods, so time offsets can be calculated directly from the int64 ordinals
+        # Ordinals count in units of the base frequency, e.g. minutes for 30min
+        seconds_from = (index.asi8 - from_period.ordinal) * (index.freq.nanos / index.freq.n / 1E9)
+    else:
+        seconds_from = (index.start_time - from_period.start_time).total_seconds().to_numpy()
+    return seconds_from / seconds_per_year
+
+
 class TriggerPricePoint(tp.NamedTuple):
     volume: float
     price: float
@@ -315,18 +568,29 @@ class MultiFactorValuationResults(tp.NamedTuple):
     sim_pv: pd.DataFrame
     trigger_prices: pd.DataFrame
     trigger_profiles: pd.Series
+    control_variate_npv: float
+    control_variate_npv_std_error: float
+    control_variate_deltas: pd.Series
+    npv_std_error: float
+    backward_npv: float
+    delta_std_errors: pd.Series
+    profile: tp.Dict[str, float]
 
     @property
     def extrinsic_npv(self):
         return self.npv - self.intrinsic_npv
 
+    @property
+    def backward_forward_npv_gap(self):
+        return self.backward_npv - self.npv
+
 
 def three_factor_seasonal_value(cmdty_storage: CmdtyStorage,
                                 val_date: utils.TimePeriodSpecType,
                                 inventory: float,
                                 fwd_curve: pd.Series,
                                 interest_rates: pd.Series,
-                                settlement_rule: tp.Callable[[pd.Period], date],
+                                settlement_rule: settlement_rules.SettlementRuleType,
                                 spot_mean_reversion: float,
                                 spot_vol: float,
                                 long_term_vol: float,
@@ -340,6 +604,10 @@ def three_factor_seasonal_value(cmdty_storage: CmdtyStorage,
                                 num_inventory_grid_points: int = 100,
                                 numerical_tolerance: float = 1E-12,
                                 on_progress_update: tp.Optional[tp.Callable[[float], None]] = None,
+                                parallel_sim: bool = False,
+                                rng: str = 'mersenne_twister',
+                                target_std_error: tp.Optional[float] = None,
+                                max_sims: tp.Optional[int] = None,
                                 ) -> MultiFactorValuationResults:
     time_period_type = utils.FREQ_TO_PERIOD_TYPE[cmdty_storage.freq]
     net_current_period = utils.from_datetime_like(val_date, time_period_type)
@@ -351,7 +619,8 @@ def three_factor_seasonal_value(cmdty_storage: CmdtyStorage,
     return _net_multi_factor_calc(cmdty_storage, fwd_curve, interest_rates, inventory, net_multi_factor_params,
                                   num_inventory_grid_points, num_sims, numerical_tolerance, on_progress_update,
                                   basis_func_transformed, seed, fwd_sim_seed, settlement_rule, time_period_type,
-                                  val_date, discount_deltas, extra_decisions)
+                                  val_date, discount_deltas, extra_decisions, parallel_sim, rng, target_std_error,
+                                  max_sims)
 
 
 def multi_factor_value(cmdty_storage: CmdtyStorage,
@@ -359,7 +628,7 @@ def multi_factor_value(cmdty_storage: CmdtyStorage,
                        inventory: float,
                        fwd_curve: pd.Series,
                        interest_rates: pd.Series,
-                       settlement_rule: tp.Callable[[pd.Period], date],
+                       settlement_rule: settlement_rules.SettlementRuleType,
                        factors: tp.Iterable[tp.Tuple[float, utils.CurveType]],
                        factor_corrs: FactorCorrsType,
                        num_sims: int,
@@ -371,6 +640,10 @@ def multi_factor_value(cmdty_storage: CmdtyStorage,
                        num_inventory_grid_points: int = 100,
                        numerical_tolerance: float = 1E-12,
                        on_progress_update: tp.Optional[tp.Callable[[float], None]] = None,
+                       parallel_sim: bool = False,
+                       rng: str = 'mersenne_twister',
+                       target_std_error: tp.Optional[float] = None,
+                       max_sims: tp.Optional[int] = None,
                        ) -> MultiFactorValuationResults:
     factor_corrs = _validate_multi_factor_params(factors, factor_corrs)
     if cmdty_storage.freq != fwd_curve.index.freqstr:
@@ -380,26 +653,33 @@ def multi_factor_value(cmdty_storage: CmdtyStorage,
     return _net_multi_factor_calc(cmdty_storage, fwd_curve, interest_rates, inventory, net_multi_factor_params,
                                   num_inventory_grid_points, num_sims, numerical_tolerance, on_progress_update,
                                   basis_funcs, seed, fwd_sim_seed, settlement_rule, time_period_type,
-                                  val_date, discount_deltas, extra_decisions)
+                                  val_date, discount_deltas, extra_decisions, parallel_sim, rng, target_std_error,
+                                  max_sims)
 
 
 def _net_multi_factor_calc(cmdty_storage, fwd_curve, interest_rates, inventory, net_multi_factor_params,
                            num_inventory_grid_points, num_sims, numerical_tolerance, on_progress_update,
                            basis_funcs, seed, fwd_sim_seed, settlement_rule, time_period_type,
-                           val_date, discount_deltas, extra_decisions):
+                           val_date, discount_deltas, extra_decisions, parallel_sim, rng, target_std_error, max_sims):
+    _validate_rng(rng)
+    if rng == 'sobol' and parallel_sim:
+        raise ValueError("rng value of 'sobol' cannot be used with parallel_sim.")
+    if target_std_error is not None and max_sims is None:
+        raise ValueError("max_sims must be specified if target_std_error is specified.")
     # Convert inputs to .NET types
     net_forward_curve = utils.series_to_double_time_series(fwd_curve, time_period_type)
     net_current_period = utils.from_datetime_like(val_date, time_period_type)
     net_grid_calc = net_cs.FixedSpacingStateSpaceGridCalc.CreateForFixedNumberOfPointsOnGlobalInventoryRange[
         time_period_type](cmdty_storage.net_storage, num_inventory_grid_points)
-    net_settlement_rule = utils.wrap_settle_for_dotnet(settlement_rule, cmdty_storage.freq)
+    net_settlement_rule = settlement_rules.settle_rule_to_dotnet(settlement_rule, cmdty_storage.freq,
+                                                                 net_current_period, cmdty_storage.net_storage)
     net_interest_rate_time_series = utils.series_to_double_time_series(interest_rates, utils.FREQ_TO_PERIOD_TYPE['D'])
     net_discount_func = net_cs.StorageHelper.CreateAct65ContCompDiscounterFromSeries(net_interest_rate_time_series)
     net_on_progress = utils.wrap_on_progress_for_dotnet(on_progress_update)
 
-    logger.info('Compiling basis functions. Takes a few seconds on the first run.')
+    logger.info('Parsing basis functions.')
     net_basis_functions = net_cs.BasisFunctionsBuilder.Parse(basis_funcs)
-    logger.info('Compilation of basis functions complete.')
+    logger.info('Parsing of basis functions complete.')
 
     # Intrinsic calc
     logger.info('Calculating intrinsic value.')
@@ -428,13 +708,31 @@ def _net_multi_factor_calc(cmdty_storage, fwd_curve, interest_rates, inventory,
     net_lsmc_params_builder.DiscountDeltas = discount_deltas
     if extra_decisions is not None:
         net_lsmc_params_builder.ExtraDecisions = extra_decisions
-    net_lsmc_params_builder.SimulateWithMultiFactorModelAndMersenneTwister(net_multi_factor_params, num_sims, seed,
-                                                                           fwd_sim_seed)
+    if target_std_error is not None:
+        # Forward simulation is run in batches of num_sims valuation sims until the target is reached
+        net_lsmc_params_builder.TargetNpvStandardError = target_std_error
+        net_lsmc_params_builder.MaxValuationSims = max_sims
+    # Payoff of the intrinsic profile on the valuation sims is used as a control variate
+    net_lsmc_params_builder.ControlVariateNetVolumes = utils.series_to_double_time_series(
+        intrinsic_result.profile['net_volume'], time_period_type)
+    if rng == 'sobol':
+        net_lsmc_params_builder.SimulateWithMultiFactorModelAndSobol(net_multi_factor_params, num_sims, seed,
+                                                                     fwd_sim_seed)
+    elif parallel_sim:
+        net_lsmc_params_builder.SimulateWithMultiFactorModelAndMersenneTwisterInParallel(net_multi_factor_params,
+                                                                                         num_sims, seed, fwd_sim_seed,
+                                                                                         None)
+    else:
+        net_lsmc_params_builder.SimulateWithMultiFactorModelAndMersenneTwister(net_multi_factor_params, num_sims, seed,
+                                                                               fwd_sim_seed)
     net_lsmc_params = net_lsmc_params_builder.Build()
     net_val_results = lsmc.Calculate[time_period_type](net_lsmc_params)
     logger.info('Calculation of LSMC value complete.')
 
     deltas = utils.net_time_series_to_pandas_series(net_val_results.Deltas, cmdty_storage.freq)
+    control_variate_deltas = utils.net_time_series_to_pandas_series(net_val_results.ControlVariateDeltas,
+                                                                    cmdty_storage.freq)
+    delta_std_errors = utils.net_time_series_to_pandas_series(net_val_results.DeltaStandardErrors, cmdty_storage.freq)
     expected_profile = cs_intrinsic.profile_to_data_frame(cmdty_storage.freq, net_val_results.ExpectedStorageProfile)
     trigger_prices = _trigger_prices_to_data_frame(cmdty_storage.freq, net_val_results.TriggerPrices)
     trigger_profiles = _trigger_profiles_to_data_frame(cmdty_storage.freq, net_val_results.TriggerPriceVolumeProfiles)
@@ -452,7 +750,25 @@ def _net_multi_factor_calc(cmdty_storage, fwd_curve, interest_rates, inventory,
                                        intrinsic_result.npv, intrinsic_result.profile, sim_spot_regress,
                                        sim_spot_valuation, sim_inventory, sim_inject_withdraw,
                                        sim_cmdty_consumed, sim_inventory_loss, sim_net_volume, sim_pv,
-                                       trigger_prices, trigger_profiles)
+                                       trigger_prices, trigger_profiles, net_val_results.ControlVariateNpv,
+                                       net_val_results.ControlVariateNpvStandardError, control_variate_deltas,
+                                       net_val_results.NpvStandardError, net_val_results.BackwardNpv, delta_std_errors,
+                                       _profile_to_dict(net_val_results.Profile))
+
+
+def _profile_to_dict(net_profile) -> tp.Dict[str, float]:
+    # Timings are in seconds. allocated_bytes is None if not supported by the .NET runtime
+    return {
+        'total': net_profile.Total.TotalSeconds,
+        'regression_price_simulation': net_profile.RegressionPriceSimulation.TotalSeconds,
+        'valuation_price_simulation': net_profile.ValuationPriceSimulation.TotalSeconds,
+        'backward_induction': net_profile.BackwardInduction.TotalSeconds,
+        'pseudo_inverse': net_profile.PseudoInverse.TotalSeconds,
+        'forward_simulation': net_profile.ForwardSimulation.TotalSeconds,
+        'num_regressions_solved': net_profile.NumRegressionsSolved,
+        'num_decisions_evaluated': net_profile.NumDecisionsEvaluated,
+        'allocated_bytes': net_profile.AllocatedBytes,
+    }
 
 
 def _trigger_prices_to_data_frame(freq, net_trigger_prices) -> pd.DataFrame:
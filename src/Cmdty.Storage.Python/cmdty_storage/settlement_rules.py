@@ -0,0 +1,158 @@
+# Copyright(c) 2020 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import clr
+import System.Collections.Generic as dotnet_cols_gen
+from pathlib import Path
+
+clr.AddReference(str(Path('cmdty_storage/lib/Cmdty.Storage')))
+import Cmdty.Storage as net_cs
+clr.AddReference(str(Path("cmdty_storage/lib/Cmdty.TimePeriodValueTypes")))
+import Cmdty.TimePeriodValueTypes as net_tp
+
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+import typing as tp
+import re
+import abc
+from datetime import date
+from cmdty_storage import utils
+
+
+class SettlementRule(abc.ABC):
+    """
+    Base class of the built-in settlement rules. These are implemented in .NET so, unlike a Python function passed as
+    the settlement_rule, are evaluated during valuation without calling back into Python. Instances can also be called
+    with a pandas.Period to get the settlement date as a daily pandas.Period.
+    """
+
+    @abc.abstractmethod
+    def _net_settle_rule(self, time_period_type):
+        """Returns the .NET Func which maps from delivery period of type time_period_type to settlement Day."""
+
+    def __call__(self, period: pd.Period) -> pd.Period:
+        freq = next((freq for freq in utils.FREQ_TO_PERIOD_TYPE if to_offset(freq) == period.freq), None)
+        if freq is None:
+            raise ValueError("period freq of '{}' not supported.".format(period.freqstr))
+        time_period_type = utils.FREQ_TO_PERIOD_TYPE[freq]
+        net_settle_day = self._net_settle_rule(time_period_type)(utils.from_datetime_like(period, time_period_type))
+        return utils.net_time_period_to_pandas_period(net_settle_day, 'D')
+
+
+class DayOfFollowingMonth(SettlementRule):
+    """Settlement on a fixed day of the month following delivery, or the last day of the month if it is shorter."""
+
+    def __init__(self, day_of_month: int):
+        if day_of_month < 1 or day_of_month > 31:
+            raise ValueError("day_of_month must be between 1 and 31 inclusive.")
+        self.day_of_month = day_of_month
+
+    def _net_settle_rule(self, time_period_type):
+        return net_cs.SettlementRules.DayOfFollowingMonth[time_period_type](self.day_of_month)
+
+    def __repr__(self):
+        return 'DayOfFollowingMonth({})'.format(self.day_of_month)
+
+
+class SameDay(SettlementRule):
+    """Settlement on the day of delivery."""
+
+    def _net_settle_rule(self, time_period_type):
+        return net_cs.SettlementRules.SameDay[time_period_type]()
+
+    def __repr__(self):
+        return 'SameDay()'
+
+
+class FirstOfPeriod(SettlementRule):
+    """Settlement on the first day of the period, with granularity freq, in which delivery starts."""
+
+    def __init__(self, freq: str = 'M'):
+        if freq not in utils.FREQ_TO_PERIOD_TYPE:
+            raise ValueError("freq parameter value of '{}' not supported. The allowable values can be found in the "
+                             "keys of the dict FREQ_TO_PERIOD_TYPE.".format(freq))
+        self.freq = freq
+
+    def _net_settle_rule(self, time_period_type):
+        return net_cs.SettlementRules.FirstOfPeriod[time_period_type, utils.FREQ_TO_PERIOD_TYPE[self.freq]]()
+
+    def __repr__(self):
+        return "FirstOfPeriod('{}')".format(self.freq)
+
+
+class BusinessDayOffset(SettlementRule):
+    """
+    Settlement num_business_days business days after the day of delivery, or before if negative. Weekends and holidays
+    are not business days. If num_business_days is zero, settlement is on the first business day on or after delivery.
+    """
+
+    def __init__(self, num_business_days: int, holidays: tp.Optional[tp.Iterable[utils.TimePeriodSpecType]] = None):
+        self.num_business_days = num_business_days
+        self.holidays = [] if holidays is None else list(holidays)
+
+    def _net_settle_rule(self, time_period_type):
+        net_holidays = dotnet_cols_gen.List[net_tp.Day]()
+        for holiday in self.holidays:
+            net_holidays.Add(utils.from_datetime_like(holiday, net_tp.Day))
+        return net_cs.SettlementRules.BusinessDayOffset[time_period_type](self.num_business_days, net_holidays)
+
+    def __repr__(self):
+        return 'BusinessDayOffset({}, {})'.format(self.num_business_days, self.holidays)
+
+
+_NAMED_SETTLEMENT_RULES = {
+    'same_day': SameDay(),
+    'first_of_month': FirstOfPeriod('M'),
+    'first_of_quarter': FirstOfPeriod('Q'),
+    'next_business_day': BusinessDayOffset(1),
+}
+_DAY_OF_FOLLOWING_MONTH_PATTERN = re.compile(r'^day_(\d{1,2})_of_following_month$')
+
+SettlementRuleType = tp.Union[str, SettlementRule, tp.Callable[[pd.Period], date]]
+
+
+def settlement_rule_from_name(name: str) -> SettlementRule:
+    """
+    Looks up a built-in settlement rule by name. The allowable names are 'same_day', 'first_of_month',
+    'first_of_quarter', 'next_business_day' and 'day_N_of_following_month' where N is the day of month, e.g.
+    'day_20_of_following_month'.
+    """
+    rule = _NAMED_SETTLEMENT_RULES.get(name)
+    if rule is not None:
+        return rule
+    match = _DAY_OF_FOLLOWING_MONTH_PATTERN.match(name)
+    if match is not None:
+        return DayOfFollowingMonth(int(match.group(1)))
+    raise ValueError("settlement_rule name '{}' not recognised.".format(name))
+
+
+def settle_rule_to_dotnet(settlement_rule: SettlementRuleType, freq: str, net_current_period, net_storage):
+    """
+    Converts a settlement rule, specified as a name, SettlementRule or Python function, to a .NET Func. Python
+    functions are evaluated up front over the periods of the valuation.
+    """
+    if isinstance(settlement_rule, str):
+        settlement_rule = settlement_rule_from_name(settlement_rule)
+    if isinstance(settlement_rule, SettlementRule):
+        return settlement_rule._net_settle_rule(utils.FREQ_TO_PERIOD_TYPE[freq])
+    return utils.settle_rule_to_dotnet(settlement_rule, freq, net_current_period, net_storage)
@@ -23,7 +23,7 @@
 
 import clr
 import System as dotnet
-from cmdty_storage import utils, CmdtyStorage
+from cmdty_storage import utils, CmdtyStorage, settlement_rules
 from pathlib import Path
 import typing as tp
 from datetime import date
@@ -33,6 +33,11 @@
 import Cmdty.Storage as net_cs
 
 
+class TrinomialValuationResults(tp.NamedTuple):
+    npv: float
+    phase_timings: tp.Dict[str, float]
+
+
 def trinomial_value(cmdty_storage: CmdtyStorage,
                     val_date: utils.TimePeriodSpecType,
                     inventory: float,
@@ -41,16 +46,52 @@ def trinomial_value(cmdty_storage: CmdtyStorage,
                     mean_reversion: float,
                     time_step: float,
                     interest_rates: pd.Series,
-                    settlement_rule: tp.Callable[[pd.Period], date],
+                    settlement_rule: settlement_rules.SettlementRuleType,
                     num_inventory_grid_points: int = 100,
                     numerical_tolerance: float = 1E-12) -> float:
     """
     Calculates the value of commodity storage using a one-factor trinomial tree.
 
     Args:
-        settlement_rule (callable): Mapping function from pandas.Period type to the date on which the cmdty delivered in
-            this period is settled. The pandas.Period parameter will have freq equal to the cmdty_storage parameter's freq property.
+        settlement_rule (str, SettlementRule or callable): Built-in settlement rule, specified by name or object (see
+            cmdty_storage.settlement_rules), or mapping function from pandas.Period type to the date on which the cmdty
+            delivered in this period is settled. The pandas.Period parameter will have freq equal to the cmdty_storage parameter's freq property.
+    """
+    net_val_results = _net_trinomial_calc(cmdty_storage, val_date, inventory, forward_curve, spot_volatility,
+                                          mean_reversion, time_step, interest_rates, settlement_rule,
+                                          num_inventory_grid_points, numerical_tolerance, False)
+    return net_val_results.NetPresentValue
+
+
+def trinomial_value_with_phase_timings(cmdty_storage: CmdtyStorage,
+                                       val_date: utils.TimePeriodSpecType,
+                                       inventory: float,
+                                       forward_curve: pd.Series,
+                                       spot_volatility: pd.Series,
+                                       mean_reversion: float,
+                                       time_step: float,
+                                       interest_rates: pd.Series,
+                                       settlement_rule: settlement_rules.SettlementRuleType,
+                                       num_inventory_grid_points: int = 100,
+                                       numerical_tolerance: float = 1E-12) -> TrinomialValuationResults:
     """
+    Calculates the value of commodity storage using a one-factor trinomial tree, as trinomial_value, also timing each
+    phase of the calculation.
+
+    Returns:
+        TrinomialValuationResults with the NPV and phase_timings, a dict of the time in seconds spent in each phase
+        of the calculation.
+    """
+    net_val_results = _net_trinomial_calc(cmdty_storage, val_date, inventory, forward_curve, spot_volatility,
+                                          mean_reversion, time_step, interest_rates, settlement_rule,
+                                          num_inventory_grid_points, numerical_tolerance, True)
+    return TrinomialValuationResults(net_val_results.NetPresentValue,
+                                     utils.net_phase_timings_to_dict(net_val_results.PhaseTimings))
+
+
+def _net_trinomial_calc(cmdty_storage, val_date, inventory, forward_curve, spot_volatility, mean_reversion, time_step,
+                        interest_rates, settlement_rule, num_inventory_grid_points, numerical_tolerance,
+                        profile_phases):
     if cmdty_storage.freq != forward_curve.index.freqstr:
         raise ValueError("cmdty_storage and forward_curve have different frequencies.")
     if cmdty_storage.freq != spot_volatility.index.freqstr:
@@ -70,7 +111,8 @@ def trinomial_value(cmdty_storage: CmdtyStorage,
     net_cs.TreeStorageValuationExtensions.WithOneFactorTrinomialTree[time_period_type](
         trinomial_calc, net_spot_volatility, mean_reversion, time_step)
 
-    net_settlement_rule = utils.wrap_settle_for_dotnet(settlement_rule, cmdty_storage.freq)
+    net_settlement_rule = settlement_rules.settle_rule_to_dotnet(settlement_rule, cmdty_storage.freq,
+                                                                 current_period, cmdty_storage.net_storage)
     net_cs.ITreeAddCmdtySettlementRule[time_period_type](trinomial_calc).WithCmdtySettlementRule(net_settlement_rule)
 
     interest_rate_time_series = utils.series_to_double_time_series(interest_rates, utils.FREQ_TO_PERIOD_TYPE['D'])
@@ -81,8 +123,9 @@ def trinomial_value(cmdty_storage: CmdtyStorage,
         trinomial_calc, num_inventory_grid_points)
     net_cs.TreeStorageValuationExtensions.WithLinearInventorySpaceInterpolation[time_period_type](trinomial_calc)
     net_cs.ITreeAddNumericalTolerance[time_period_type](trinomial_calc).WithNumericalTolerance(numerical_tolerance)
-    npv = net_cs.ITreeCalculate[time_period_type](trinomial_calc).Calculate()
-    return npv.NetPresentValue
+    if profile_phases:
+        net_cs.ITreeCalculate[time_period_type](trinomial_calc).WithPhaseTimings()
+    return net_cs.ITreeCalculate[time_period_type](trinomial_calc).Calculate()
 
 
 def trinomial_deltas(cmdty_storage: CmdtyStorage,
@@ -93,7 +136,7 @@ def trinomial_deltas(cmdty_storage: CmdtyStorage,
                      mean_reversion: float,
                      time_step: float,
                      interest_rates: pd.Series,
-                     settlement_rule: tp.Callable[[pd.Period], date],
+                     settlement_rule: settlement_rules.SettlementRuleType,
                      fwd_contracts: utils.FwdContractsType,
                      num_inventory_grid_points: int = 100,
                      numerical_tolerance: float = 1E-12,
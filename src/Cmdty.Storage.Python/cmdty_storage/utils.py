@@ -133,18 +133,33 @@ def raise_if_not_none(arg, error_message):
 """
 
 
-def wrap_settle_for_dotnet(py_settle_func, freq):
-    def wrapper_settle_function(py_function, net_time_period, freq):
-        pandas_period = net_time_period_to_pandas_period(net_time_period, freq)
-        py_function_result = py_function(pandas_period)
-        net_settle_day = from_datetime_like(py_function_result, net_tp.Day)
-        return net_settle_day
-
-    def wrapped_function(net_time_period):
-        return wrapper_settle_function(py_settle_func, net_time_period, freq)
-
+def settle_rule_to_dotnet(py_settle_func, freq, net_current_period, net_storage):
+    """
+    Evaluates py_settle_func once for every period which the valuation can settle, from the later of the current
+    period and storage start, up to the storage end. Returns a .NET Func which looks up the precomputed settlement
+    dates, so the valuation never calls back into Python. The valuations don't settle any period before the current
+    period or storage start, which is the first period of the inventory space.
+    """
     time_period_type = FREQ_TO_PERIOD_TYPE[freq]
-    return dotnet.Func[time_period_type, net_tp.Day](wrapped_function)
+    net_start = net_current_period if net_current_period.CompareTo(net_storage.StartPeriod) > 0 \
+        else net_storage.StartPeriod
+    num_periods = max(net_storage.EndPeriod.OffsetFrom(net_start) + 1, 0)
+    periods = pd.period_range(start=net_time_period_to_pandas_period(net_start, freq), periods=num_periods, freq=freq)
+
+    net_periods = dotnet.Array.CreateInstance(time_period_type, num_periods)
+    net_settle_days = dotnet.Array.CreateInstance(net_tp.Day, num_periods)
+    net_settle_day_cache = {}  # Settlement rules map many periods to the same date, so only convert each date once
+    for i, period in enumerate(periods):
+        net_periods[i] = net_start.Offset(i)
+        py_settle_date = py_settle_func(period)
+        net_settle_day = net_settle_day_cache.get(py_settle_date)
+        if net_settle_day is None:
+            net_settle_day = from_datetime_like(py_settle_date, net_tp.Day)
+            net_settle_day_cache[py_settle_date] = net_settle_day
+        net_settle_days[i] = net_settle_day
+
+    net_settle_dates = ts.TimeSeries[time_period_type, net_tp.Day](net_periods, net_settle_days)
+    return net_cs.StorageHelper.CreateSettleDateRuleFromSeries[time_period_type](net_settle_dates)
 
 
 def wrap_on_progress_for_dotnet(py_on_progress):
@@ -320,6 +335,11 @@ def net_panel_to_data_frame(net_panel, freq: str) -> pd.DataFrame:
     return pd.DataFrame(data=np_array, index=period_index)
 
 
+def net_phase_timings_to_dict(net_phase_timings) -> tp.Dict[str, float]:
+    """Converts .NET phase timings keyed by PascalCase phase name to seconds keyed by snake_case name."""
+    return {re.sub(r'(?<!^)(?=[A-Z])', '_', pair.Key).lower(): pair.Value.TotalSeconds for pair in net_phase_timings}
+
+
 def create_net_log_adapter(logger, net_logger_type):
     def log(level, msg):
         logger.log(level, msg)
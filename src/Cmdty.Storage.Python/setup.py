@@ -41,7 +41,7 @@
     long_description=long_description,
     long_description_content_type='text/markdown',
     url='https://github.com/cmdty/storage',
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(exclude=['benchmarks']),
     keywords = 'commodities trading curves oil gas power quantitative finance',
     classifiers=[
         'Development Status :: 4 - Beta',
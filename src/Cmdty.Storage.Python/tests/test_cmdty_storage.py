@@ -25,6 +25,7 @@
 import cmdty_storage as cs
 from datetime import date
 import pandas as pd
+import numpy as np
 from tests import utils
 
 
@@ -434,6 +435,80 @@ def test_inventory_cost_series_init_parameter(self):
                 inventory_cost = storage.inventory_cost(dt, inventory)
                 self.assertEqual(expected_inventory_cost * inventory, inventory_cost)
 
+    _bulk_query_dates = [date(2019, 8, 28), date(2019, 9, 1), date(2019, 9, 20)]
+    _bulk_query_inventories = [0, 500.58, 1234.56, 1800]
+
+    def _bulk_query_points(self):
+        periods = pd.PeriodIndex([dt for dt in self._bulk_query_dates for _ in self._bulk_query_inventories], freq='D')
+        inventories = np.tile(self._bulk_query_inventories, len(self._bulk_query_dates))
+        return periods, inventories
+
+    def test_inject_withdraw_range_array_equals_scalar_method(self):
+        storage = self._create_storage()
+        periods, inventories = self._bulk_query_points()
+        ranges = storage.inject_withdraw_range_array(periods, inventories)
+        self.assertTrue(ranges.index.equals(periods))
+        for period, inventory, (min_rate, max_rate) in zip(periods, inventories, ranges.itertuples(index=False)):
+            expected_min_rate, expected_max_rate = storage.inject_withdraw_range(period, inventory)
+            self.assertEqual(expected_min_rate, min_rate)
+            self.assertEqual(expected_max_rate, max_rate)
+
+    def test_inject_withdraw_range_array_broadcasts_scalar_period(self):
+        storage = self._create_storage()
+        ranges = storage.inject_withdraw_range_array(date(2019, 8, 29), self._bulk_query_inventories)
+        self.assertEqual(len(self._bulk_query_inventories), len(ranges))
+        for inventory, (min_rate, max_rate) in zip(self._bulk_query_inventories, ranges.itertuples(index=False)):
+            self.assertEqual(storage.inject_withdraw_range(date(2019, 8, 29), inventory), (min_rate, max_rate))
+
+    def test_inject_withdraw_range_grid_equals_scalar_method(self):
+        storage = self._create_storage()
+        periods = pd.period_range(start='2019-08-28', end='2019-09-25', freq='D')
+        inventories = np.linspace(0.0, 2000.0, 11)
+        min_rates, max_rates = storage.inject_withdraw_range_grid(periods, inventories)
+        self.assertEqual((len(periods), len(inventories)), min_rates.shape)
+        for period in periods:
+            for inventory in inventories:
+                expected_min_rate, expected_max_rate = storage.inject_withdraw_range(period, inventory)
+                self.assertEqual(expected_min_rate, min_rates.loc[period, inventory])
+                self.assertEqual(expected_max_rate, max_rates.loc[period, inventory])
+
+    def test_min_max_inventory_array_equals_scalar_method(self):
+        storage = self._create_storage(ratchets=None, ratchet_interp=None, min_inventory=self._series_min_inventory,
+                        max_inventory=self._series_max_inventory, max_injection_rate=self._constant_max_injection_rate,
+                        max_withdrawal_rate=self._constant_max_withdrawal_rate)
+        periods = pd.period_range(start='2019-08-28', end='2019-09-25', freq='D')
+        np.testing.assert_array_equal([storage.min_inventory(p) for p in periods], storage.min_inventory_array(periods))
+        np.testing.assert_array_equal([storage.max_inventory(p) for p in periods], storage.max_inventory_array(periods))
+
+    def test_cost_and_cmdty_consumed_arrays_equal_scalar_methods(self):
+        storage = self._create_storage(injection_cost=self._series_injection_cost,
+                                       withdrawal_cost=self._series_withdrawal_cost,
+                                       cmdty_consumed_inject=self._series_cmdty_consumed_inject,
+                                       cmdty_consumed_withdraw=self._series_cmdty_consumed_withdraw,
+                                       inventory_cost=self._series_inventory_cost)
+        periods, inventories = self._bulk_query_points()
+        volume = 58.74
+        points = list(zip(periods, inventories))
+        np.testing.assert_array_equal([storage.injection_cost(p, inv, volume) for p, inv in points],
+                                      storage.injection_cost_array(periods, inventories, volume))
+        np.testing.assert_array_equal([storage.withdrawal_cost(p, inv, volume) for p, inv in points],
+                                      storage.withdrawal_cost_array(periods, inventories, volume))
+        np.testing.assert_array_equal([storage.cmdty_consumed_inject(p, inv, volume) for p, inv in points],
+                                      storage.cmdty_consumed_inject_array(periods, inventories, volume))
+        np.testing.assert_array_equal([storage.cmdty_consumed_withdraw(p, inv, volume) for p, inv in points],
+                                      storage.cmdty_consumed_withdraw_array(periods, inventories, volume))
+        np.testing.assert_array_equal([storage.inventory_cost(p, inv) for p, inv in points],
+                                      storage.inventory_cost_array(periods, inventories))
+
+    def test_array_methods_half_hourly_storage_equal_scalar_methods(self):
+        storage_periods = pd.period_range(start='2019-08-28 00:00', end='2019-08-29 23:30', freq='30min')
+        max_inventory = pd.Series(data=np.linspace(1000.0, 2000.0, len(storage_periods)), index=storage_periods)
+        storage = cs.CmdtyStorage('30min', storage_periods[0], storage_periods[-1], injection_cost=0.01,
+                                  withdrawal_cost=0.02, min_inventory=0.0, max_inventory=max_inventory,
+                                  max_injection_rate=10.0, max_withdrawal_rate=12.0)
+        periods = storage_periods[5:]
+        np.testing.assert_array_equal(max_inventory[5:].values, storage.max_inventory_array(periods))
+
 
 class TestUtils(unittest.TestCase):
     def test_numerics_provider_mkl(self):
@@ -0,0 +1,85 @@
+# Copyright(c) 2020 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import subprocess
+import sys
+import json
+from pathlib import Path
+
+# Generous upper bound on the wall clock time for a bare 'import cmdty_storage', which should no longer load any
+# submodules or .NET assemblies
+IMPORT_TIME_BUDGET_SECONDS = 1.0
+
+_PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+_MEASURE_SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'elapsed': elapsed, 'modules': sorted(sys.modules)}}))
+'''
+
+
+def _import_in_subprocess(statement: str) -> dict:
+    script = _MEASURE_SCRIPT.format(statement=statement)
+    output = subprocess.check_output([sys.executable, '-c', script], cwd=str(_PROJECT_DIR))
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_bare_import_within_budget(self):
+        result = _import_in_subprocess('import cmdty_storage')
+        self.assertLess(result['elapsed'], IMPORT_TIME_BUDGET_SECONDS)
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'Lazy submodule import requires PEP 562 module __getattr__')
+    def test_bare_import_does_not_load_submodules_or_clr(self):
+        modules = _import_in_subprocess('import cmdty_storage')['modules']
+        for module in ['clr', 'cmdty_storage.cmdty_storage', 'cmdty_storage.intrinsic', 'cmdty_storage.trinomial',
+                       'cmdty_storage.multi_factor', 'cmdty_storage.utils']:
+            self.assertNotIn(module, modules)
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'Lazy submodule import requires PEP 562 module __getattr__')
+    def test_intrinsic_import_does_not_load_multi_factor(self):
+        modules = _import_in_subprocess('from cmdty_storage import intrinsic_value')['modules']
+        self.assertIn('cmdty_storage.intrinsic', modules)
+        self.assertNotIn('cmdty_storage.multi_factor', modules)
+        self.assertNotIn('cmdty_storage.trinomial', modules)
+        self.assertNotIn('Cmdty.Core.Simulation', modules)
+
+    def test_lazy_attributes_resolve(self):
+        import cmdty_storage as cs
+        for name in cs._LAZY_ATTRIBUTES:
+            self.assertIs(getattr(cs, name), getattr(sys.modules[cs._LAZY_ATTRIBUTES[name]], name))
+        self.assertTrue(set(cs._LAZY_ATTRIBUTES).issubset(dir(cs)))
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        import cmdty_storage as cs
+        with self.assertRaises(AttributeError):
+            getattr(cs, 'not_an_attribute')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -77,6 +77,13 @@ def terminal_npv_calc(price, inventory):
         twentieth_of_next_month = lambda period: period.asfreq('M').asfreq('D', 'end') + 20
         intrinsic_results = cs.intrinsic_value(cmdty_storage, val_date, inventory, forward_curve, settlement_rule=twentieth_of_next_month,
                         interest_rates=interest_rate_curve, num_inventory_grid_points=100)
+        self.assertIsNone(intrinsic_results.phase_timings)
+
+        profiled_results = cs.intrinsic_value(cmdty_storage, val_date, inventory, forward_curve, settlement_rule=twentieth_of_next_month,
+                        interest_rates=interest_rate_curve, num_inventory_grid_points=100, profile_phases=True)
+        self.assertEqual(intrinsic_results.npv, profiled_results.npv)
+        self.assertEqual({'inventory_space', 'backward_induction', 'interpolator_construction', 'forward_profile'},
+                         set(profiled_results.phase_timings.keys()))
         
     def test_expired_storage_returns_zero_npv_empty_profile(self):
         storage_start = date(2019, 8, 28)
@@ -123,5 +130,30 @@ def test_storage_value_date_equals_storage_end_returns_zero_npv_empty_profile(se
         self.assertEqual(0, len(intrinsic_results.profile))
 
 
+    def test_settlement_rule_evaluated_once_per_period(self):
+        storage_start = date(2019, 8, 28)
+        storage_end = date(2019, 9, 25)
+        cmdty_storage = cs.CmdtyStorage('H', storage_start, storage_end, injection_cost=0.1, withdrawal_cost=0.2,
+                                        min_inventory=0, max_inventory=1000, max_injection_rate=2.5,
+                                        max_withdrawal_rate=3.6)
+        inventory = 0.0
+        val_date = date(2019, 9, 2)
+        forward_curve = utils.create_piecewise_flat_series([58.89, 61.41, 70.89, 70.89],
+                                                           [val_date, date(2019, 9, 12), date(2019, 9, 18), storage_end],
+                                                           freq='H')
+        interest_rate_curve = pd.Series(index=pd.period_range(val_date, storage_end + timedelta(days=60), freq='D'))
+        interest_rate_curve[:] = 0.03
+
+        settled_periods = []
+
+        def twentieth_of_next_month(period):
+            settled_periods.append(period)
+            return period.asfreq('M').asfreq('D', 'end') + 20
+
+        cs.intrinsic_value(cmdty_storage, val_date, inventory, forward_curve, settlement_rule=twentieth_of_next_month,
+                           interest_rates=interest_rate_curve, num_inventory_grid_points=100)
+        expected_periods = list(pd.period_range(pd.Period(val_date, freq='H'), cmdty_storage.end, freq='H'))
+        self.assertEqual(expected_periods, settled_periods)
+
 if __name__ == '__main__':
     unittest.main()
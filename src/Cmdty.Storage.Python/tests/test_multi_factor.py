@@ -90,6 +90,83 @@ def test_regression(self):
         self.assertEqual(42.812676607997183, sim4['2021-01-15'])
         self.assertEqual(76.586790647813046, sim4['2021-07-30'])
 
+    def test_simulate_chunks_concatenated_equals_simulate(self):
+        num_sims = 11
+        single_run = self._create_simulator(seed=12).simulate(num_sims)
+        chunks = list(self._create_simulator(seed=12).simulate_chunks(num_sims, chunk_size=4))
+        self.assertEqual([4, 4, 3], [chunk.shape[1] for chunk in chunks])
+        np.testing.assert_array_equal(single_run.values, np.concatenate(chunks, axis=1))
+
+    def test_simulate_chunks_antithetic_concatenated_equals_simulate(self):
+        num_sims = 10
+        single_run = self._create_simulator(seed=12, antithetic=True).simulate(num_sims)
+        chunks = list(self._create_simulator(seed=12, antithetic=True).simulate_chunks(num_sims, chunk_size=4))
+        self.assertEqual([4, 4, 2], [chunk.shape[1] for chunk in chunks])
+        np.testing.assert_array_equal(single_run.values, np.concatenate(chunks, axis=1))
+
+    def test_simulate_chunks_antithetic_odd_chunk_size_does_not_split_pairs(self):
+        num_sims = 12
+        single_run = self._create_simulator(seed=12, antithetic=True).simulate(num_sims)
+        chunks = list(self._create_simulator(seed=12, antithetic=True).simulate_chunks(num_sims, chunk_size=5))
+        self.assertEqual([4, 4, 4], [chunk.shape[1] for chunk in chunks])
+        np.testing.assert_array_equal(single_run.values, np.concatenate(chunks, axis=1))
+        # Log prices of an antithetic pair are symmetric about the same value, so the sum of each pair's log prices
+        # is the same for every pair within every chunk
+        for chunk in chunks:
+            pair_log_sums = np.log(chunk[:, 0::2]) + np.log(chunk[:, 1::2])
+            np.testing.assert_allclose(pair_log_sums, np.broadcast_to(pair_log_sums[:, :1], pair_log_sums.shape),
+                                       rtol=1E-12)
+
+    def test_parallel_simulate_chunks_concatenated_equals_simulate(self):
+        num_sims = 2500
+        single_run = self._create_simulator(seed=12, parallel=True).simulate(num_sims)
+        # Chunk size which isn't a multiple of the parallel block size is rounded down to one
+        chunks = list(self._create_simulator(seed=12, parallel=True).simulate_chunks(num_sims, chunk_size=1500))
+        self.assertEqual([1000, 1000, 500], [chunk.shape[1] for chunk in chunks])
+        np.testing.assert_array_equal(single_run.values, np.concatenate(chunks, axis=1))
+
+    def test_simulate_with_factors(self):
+        num_sims = 6
+        spot_sims = self._create_simulator(seed=12).simulate(num_sims)
+        sim_results = self._create_simulator(seed=12).simulate_with_factors(num_sims)
+        pd.testing.assert_frame_equal(spot_sims, sim_results.spot_prices)
+        self.assertEqual((2, 3, num_sims), sim_results.markov_factors.shape)
+        # Non mean-reverting factor accumulates variance so shouldn't be zero
+        self.assertTrue((sim_results.markov_factors[0] != 0.0).all())
+
+    def test_simulate_float32(self):
+        num_sims = 6
+        spot_sims = self._create_simulator(seed=12).simulate(num_sims)
+        spot_sims_single = self._create_simulator(seed=12).simulate(num_sims, dtype=np.float32)
+        self.assertEqual(np.float32, spot_sims_single.values.dtype)
+        np.testing.assert_allclose(spot_sims.values, spot_sims_single.values, rtol=1E-6)
+
+    def test_parallel_simulate_same_seed_gives_same_results(self):
+        num_sims = 2500
+        spot_sims_1 = self._create_simulator(seed=12, parallel=True).simulate(num_sims)
+        spot_sims_2 = self._create_simulator(seed=12, parallel=True).simulate(num_sims)
+        self.assertEqual((3, num_sims), spot_sims_1.shape)
+        pd.testing.assert_frame_equal(spot_sims_1, spot_sims_2)
+
+    def test_sobol_simulate_same_seed_gives_same_results(self):
+        num_sims = 512
+        spot_sims_1 = self._create_simulator(seed=12, rng='sobol').simulate(num_sims)
+        spot_sims_2 = self._create_simulator(seed=12, rng='sobol').simulate(num_sims)
+        self.assertEqual((3, num_sims), spot_sims_1.shape)
+        pd.testing.assert_frame_equal(spot_sims_1, spot_sims_2)
+
+    def test_invalid_rng_raises(self):
+        with self.assertRaises(ValueError):
+            self._create_simulator(seed=12, rng='halton')
+
+    @staticmethod
+    def _create_simulator(seed, antithetic=False, parallel=False, rng='mersenne_twister'):
+        factors = [(0.0, {'2020-08-01': 0.35, '2021-01-15': 0.29, '2021-07-30': 0.32}),
+                   (2.5, {'2020-08-01': 0.15, '2021-01-15': 0.18, '2021-07-30': 0.21})]
+        fwd_curve = {'2020-08-01': 56.85, '2021-01-15': 59.08, '2021-07-30': 62.453}
+        return mf.MultiFactorSpotSim('D', factors, 0.6, date(2020, 7, 27), fwd_curve, list(fwd_curve.keys()),
+                                     seed, antithetic, parallel, rng)
+
 
 class TestMultiFactorModel(unittest.TestCase):
     _short_plus_long_indices = pd.period_range(start='2020-09-01', periods=25, freq='D') \
@@ -162,6 +239,50 @@ def test_diff_corr_types_give_same_results(self):
         self.assertEqual(two_f_model_float_corr_covar, two_f_model_int_array_corr_covar)
         # TODO test MultiFactorModel.for_3_factor_seasonal
 
+    def test_create_3_factor_season_params_seasonal_vol_curve(self):
+        for freq, start, end in [('D', '2020-04-01', '2022-03-31'), ('30min', '2020-04-01', '2020-05-01'),
+                                 ('M', '2020-04', '2025-03')]:
+            factors, factor_corrs = mf.create_3_factor_season_params(freq, 12.5, 0.7, 0.2, 0.1, start, end)
+            seasonal_vol_curve = factors[2][1]
+            peak_period = pd.Period(year=2020, month=2, day=1, freq=freq)
+            for period, seasonal_vol in seasonal_vol_curve.items():
+                t_from_peak = (period.start_time - peak_period.start_time).total_seconds() / mf.seconds_per_year
+                expected_seasonal_vol = np.sin(2.0 * np.pi * t_from_peak + np.pi / 2.0) * 0.05
+                self.assertAlmostEqual(expected_seasonal_vol, seasonal_vol, places=14)
+            self.assertTrue((factors[0][1] == 0.7).all())
+            self.assertTrue((factors[1][1] == 0.2).all())
+
+    def test_integrated_covar_matrix_equals_pairwise_integrated_covar(self):
+        fwd_contracts = list(self._short_plus_long_indices)
+        covar_matrix = self._2f_canonical_model.integrated_covar_matrix('2020-08-05', '2021-08-05', fwd_contracts)
+        self.assertEqual((len(fwd_contracts), len(fwd_contracts)), covar_matrix.shape)
+        for (i, j), covar in np.ndenumerate(covar_matrix):
+            expected_covar = self._2f_canonical_model.integrated_covar('2020-08-05', '2021-08-05',
+                                                                       fwd_contracts[i], fwd_contracts[j])
+            self.assertAlmostEqual(expected_covar, covar, places=12)
+
+    def test_integrated_corr_matrix_equals_pairwise_integrated_corr(self):
+        fwd_contracts = list(self._short_plus_long_indices)
+        corr_matrix = self._2f_canonical_model.integrated_corr_matrix('2020-08-05', '2021-08-05', fwd_contracts)
+        for (i, j), corr in np.ndenumerate(corr_matrix):
+            expected_corr = self._2f_canonical_model.integrated_corr('2020-08-05', '2021-08-05',
+                                                                     fwd_contracts[i], fwd_contracts[j])
+            self.assertAlmostEqual(expected_corr, corr, places=12)
+
+    def test_integrated_vols_equal_integrated_vol(self):
+        fwd_contracts = list(self._short_plus_long_indices)
+        vols = self._2f_canonical_model.integrated_vols('2020-08-05', '2021-08-05', fwd_contracts)
+        stan_devs = self._2f_canonical_model.integrated_stan_devs('2020-08-05', '2021-08-05', fwd_contracts)
+        for fwd_contract, vol, stan_dev in zip(fwd_contracts, vols, stan_devs):
+            self.assertAlmostEqual(self._2f_canonical_model.integrated_vol('2020-08-05', '2021-08-05', fwd_contract),
+                                   vol, places=12)
+            self.assertAlmostEqual(self._2f_canonical_model.integrated_stan_dev('2020-08-05', '2021-08-05',
+                                                                                fwd_contract), stan_dev, places=12)
+
+    def test_integrated_variances_fwd_contract_not_in_vol_curve_raises(self):
+        with self.assertRaises(ValueError):
+            self._2f_canonical_model.integrated_variances('2020-08-05', '2021-08-05', ['2020-09-01', '2025-01-01'])
+
 
 class TestMultiFactorValue(unittest.TestCase):
     def test_multi_factor_value_regression(self):
@@ -225,6 +346,16 @@ def on_progress(progress): progresses.append(progress)
                                               on_progress_update=on_progress)
         self.assertAlmostEqual(multi_factor_val.npv, 1780380.7581833513, places=6)
         self.assertEqual(123, len(multi_factor_val.deltas)) # TODO look into why deltas is longer the intrinsic profile
+        self.assertAlmostEqual(multi_factor_val.npv, multi_factor_val.control_variate_npv, delta=multi_factor_val.npv * 0.01)
+        self.assertGreater(multi_factor_val.control_variate_npv_std_error, 0.0)
+        self.assertEqual(123, len(multi_factor_val.control_variate_deltas))
+        self.assertLess(multi_factor_val.control_variate_npv_std_error, multi_factor_val.npv_std_error)
+        self.assertEqual(multi_factor_val.backward_npv - multi_factor_val.npv, multi_factor_val.backward_forward_npv_gap)
+        self.assertEqual(123, len(multi_factor_val.delta_std_errors))
+        self.assertGreater(multi_factor_val.profile['total'], 0.0)
+        self.assertGreaterEqual(multi_factor_val.profile['total'], multi_factor_val.profile['backward_induction'])
+        self.assertGreater(multi_factor_val.profile['num_regressions_solved'], 0)
+        self.assertGreater(multi_factor_val.profile['num_decisions_evaluated'], 0)
         self.assertEqual(123, len(multi_factor_val.expected_profile))
         self.assertEqual(progresses[-1], 1.0)
         self.assertEqual(245, len(progresses))
@@ -310,6 +441,80 @@ def on_progress(progress): progresses.append(progress)
         self.assertEqual((123, num_sims), multi_factor_val.sim_inventory_loss.shape)
         self.assertEqual((123, num_sims), multi_factor_val.sim_net_volume.shape)
 
+    def test_three_factor_seasonal_target_std_error_runs_batches_until_max_sims(self):
+        storage_start = '2019-12-01'
+        storage_end = '2020-04-01'
+        cmdty_storage = CmdtyStorage('D', storage_start, storage_end, 1.23, 0.98, min_inventory=0.0,
+                                     max_inventory=100000.0, max_injection_rate=700.0, max_withdrawal_rate=700.0)
+        val_date = '2019-08-29'
+        forward_curve = utils.create_piecewise_flat_series([23.87, 150.32, 150.32],
+                                                           [val_date, '2020-03-12', storage_end], freq='D')
+        interest_rate_curve = pd.Series(index=pd.period_range(val_date, '2020-06-01', freq='D'))
+        interest_rate_curve[:] = 0.03
+
+        def twentieth_of_next_month(period): return period.asfreq('M').asfreq('D', 'end') + 20
+
+        num_sims = 200
+        max_sims = 600
+        target_std_error = 1E-6  # Unachievable, so should stop at max_sims
+        multi_factor_val = three_factor_seasonal_value(cmdty_storage, val_date, 0.0, forward_curve,
+                                                       interest_rate_curve, twentieth_of_next_month,
+                                                       16.2, 1.15, 0.14, 0.18, num_sims,
+                                                       '1 + x_st + x_sw + x_lt', False, seed=11,
+                                                       target_std_error=target_std_error, max_sims=max_sims)
+        self.assertEqual((123, num_sims), multi_factor_val.sim_spot_regress.shape)
+        self.assertEqual((123, max_sims), multi_factor_val.sim_spot_valuation.shape)
+        self.assertEqual((123, max_sims), multi_factor_val.sim_pv.shape)
+        self.assertAlmostEqual(multi_factor_val.npv, multi_factor_val.sim_pv.sum().mean(), places=6)
+
+        with self.assertRaises(ValueError):
+            three_factor_seasonal_value(cmdty_storage, val_date, 0.0, forward_curve, interest_rate_curve,
+                                        twentieth_of_next_month, 16.2, 1.15, 0.14, 0.18, num_sims,
+                                        '1 + x_st + x_sw + x_lt', False, target_std_error=target_std_error)
+
+
+    def test_three_factor_seasonal_orthogonal_polynomial_basis_funcs_npv_independent_of_batch_size(self):
+        storage_start = '2019-12-01'
+        storage_end = '2020-04-01'
+        cmdty_storage = CmdtyStorage('D', storage_start, storage_end, 1.23, 0.98, min_inventory=0.0,
+                                     max_inventory=100000.0, max_injection_rate=700.0, max_withdrawal_rate=700.0)
+        val_date = '2019-08-29'
+        forward_curve = utils.create_piecewise_flat_series([23.87, 150.32, 150.32],
+                                                           [val_date, '2020-03-12', storage_end], freq='D')
+        interest_rate_curve = pd.Series(index=pd.period_range(val_date, '2020-06-01', freq='D'))
+        interest_rate_curve[:] = 0.03
+
+        def twentieth_of_next_month(period): return period.asfreq('M').asfreq('D', 'end') + 20
+
+        def value(basis_funcs, **kwargs):
+            return three_factor_seasonal_value(cmdty_storage, val_date, 0.0, forward_curve, interest_rate_curve,
+                                               twentieth_of_next_month, 16.2, 1.15, 0.14, 0.18, num_sims,
+                                               basis_funcs, False, seed=11, **kwargs)
+
+        num_sims = 200
+        # Hermite polynomials up to degree 3 span the same space as monomials of the same variables, so regression
+        # results only match if the forward pass uses the standardisation fitted on the regression sims
+        hermite_basis_funcs = '1 + hermite(x_st, 1) + hermite(x_st, 2) + hermite(x_st, 3) + hermite(x_sw, 1) + ' \
+                              'hermite(x_lt, 1)'
+        monomial_basis_funcs = '1 + x_st + x_st**2 + x_st**3 + x_sw + x_lt'
+
+        # Single batch of valuation sims
+        hermite_val = value(hermite_basis_funcs)
+        monomial_val = value(monomial_basis_funcs)
+        self.assertAlmostEqual(monomial_val.npv, hermite_val.npv, delta=monomial_val.npv_std_error)
+
+        # Three batches of valuation sims, each with different statistics from the regression sims
+        target_std_error = 1E-6  # Unachievable, so should stop at max_sims
+        max_sims = num_sims * 3
+        hermite_batches_val = value(hermite_basis_funcs, target_std_error=target_std_error, max_sims=max_sims)
+        monomial_batches_val = value(monomial_basis_funcs, target_std_error=target_std_error, max_sims=max_sims)
+        self.assertEqual((123, max_sims), hermite_batches_val.sim_pv.shape)
+        self.assertAlmostEqual(monomial_batches_val.npv, hermite_batches_val.npv,
+                               delta=monomial_batches_val.npv_std_error)
+        # The first batch is the same valuation sims as the single batch, so should have the same PVs
+        self.assertAlmostEqual(hermite_val.sim_pv.sum().mean(),
+                               hermite_batches_val.sim_pv.iloc[:, :num_sims].sum().mean(), places=6)
+
 
 if __name__ == '__main__':
     unittest.main()
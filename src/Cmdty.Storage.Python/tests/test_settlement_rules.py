@@ -0,0 +1,88 @@
+# Copyright(c) 2020 Jake Fowler
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use, 
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+import pandas as pd
+import cmdty_storage as cs
+from cmdty_storage import settlement_rules
+from datetime import date, timedelta
+from tests import utils
+
+
+class TestSettlementRules(unittest.TestCase):
+
+    def test_day_of_following_month_returns_day_in_following_month(self):
+        rule = cs.DayOfFollowingMonth(20)
+        self.assertEqual(pd.Period('2020-02-20', freq='D'), rule(pd.Period('2020-01-31 23:00', freq='H')))
+        self.assertEqual(pd.Period('2020-02-29', freq='D'), cs.DayOfFollowingMonth(31)(pd.Period('2020-01-15', freq='D')))
+
+    def test_same_day_returns_delivery_day(self):
+        self.assertEqual(pd.Period('2020-03-08', freq='D'), cs.SameDay()(pd.Period('2020-03-08 23:30', freq='30min')))
+
+    def test_first_of_period_returns_first_day_of_containing_period(self):
+        self.assertEqual(pd.Period('2020-03-01', freq='D'), cs.FirstOfPeriod('M')(pd.Period('2020-03-17', freq='D')))
+        self.assertEqual(pd.Period('2020-01-01', freq='D'), cs.FirstOfPeriod('Q')(pd.Period('2020-03-17', freq='D')))
+
+    def test_business_day_offset_skips_weekends_and_holidays(self):
+        rule = cs.BusinessDayOffset(2, holidays=[date(2020, 12, 25), '2020-12-28'])
+        self.assertEqual(pd.Period('2020-12-30', freq='D'), rule(pd.Period('2020-12-24', freq='D')))
+
+    def test_settlement_rule_without_net_settle_rule_cannot_be_instantiated(self):
+        class NoNetSettleRule(cs.SettlementRule):
+            pass
+
+        with self.assertRaises(TypeError):
+            NoNetSettleRule()
+
+    def test_settlement_rule_from_name(self):
+        self.assertIsInstance(settlement_rules.settlement_rule_from_name('same_day'), cs.SameDay)
+        day_20 = settlement_rules.settlement_rule_from_name('day_20_of_following_month')
+        self.assertEqual(20, day_20.day_of_month)
+        with self.assertRaises(ValueError):
+            settlement_rules.settlement_rule_from_name('twentieth_of_next_month')
+
+    def test_intrinsic_value_built_in_rule_equals_python_rule(self):
+        storage_start = date(2019, 8, 28)
+        storage_end = date(2019, 10, 25)
+        cmdty_storage = cs.CmdtyStorage('D', storage_start, storage_end, injection_cost=0.1, withdrawal_cost=0.2,
+                                        min_inventory=0, max_inventory=1000, max_injection_rate=25.5,
+                                        max_withdrawal_rate=30.6)
+        val_date = date(2019, 8, 20)
+        forward_curve = utils.create_piecewise_flat_series([58.89, 61.41, 70.89, 70.89],
+                                                           [val_date, date(2019, 9, 12), date(2019, 10, 18), storage_end],
+                                                           freq='D')
+        interest_rate_curve = pd.Series(index=pd.period_range(val_date, storage_end + timedelta(days=60), freq='D'))
+        interest_rate_curve[:] = 0.03
+
+        def twentieth_of_next_month(period): return period.asfreq('M').asfreq('D', 'end') + 20
+
+        python_rule_npv = cs.intrinsic_value(cmdty_storage, val_date, 0.0, forward_curve, interest_rate_curve,
+                                             twentieth_of_next_month).npv
+        for settlement_rule in [cs.DayOfFollowingMonth(20), 'day_20_of_following_month']:
+            built_in_rule_npv = cs.intrinsic_value(cmdty_storage, val_date, 0.0, forward_curve, interest_rate_curve,
+                                                   settlement_rule).npv
+            self.assertEqual(python_rule_npv, built_in_rule_npv)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -91,6 +91,15 @@ def terminal_npv_calc(price, inventory):
                                              interest_rates=interest_rate_curve, num_inventory_grid_points=100)
         self.assertTrue(isinstance(trinomial_value, float))
 
+        profiled_results = cs.trinomial_value_with_phase_timings(cmdty_storage, val_date, inventory, forward_curve,
+                                                                 spot_volatility, mean_reversion, time_step,
+                                                                 settlement_rule=twentieth_of_next_month,
+                                                                 interest_rates=interest_rate_curve,
+                                                                 num_inventory_grid_points=100)
+        self.assertEqual(trinomial_value, profiled_results.npv)
+        self.assertEqual({'inventory_space', 'tree_build', 'backward_induction', 'interpolator_construction'},
+                         set(profiled_results.phase_timings.keys()))
+
     def test_trinomial_deltas_runs(self):
         constraints = [
             (date(2019, 8, 28),
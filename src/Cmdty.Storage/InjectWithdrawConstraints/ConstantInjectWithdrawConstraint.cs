@@ -47,6 +47,13 @@ public InjectWithdrawRange GetInjectWithdrawRange(double inventory)
             return _injectWithdrawRange;
         }
 
+        public void GetInjectWithdrawRange(ReadOnlySpan<double> inventories, Span<InjectWithdrawRange> injectWithdrawRanges)
+        {
+            if (inventories.Length != injectWithdrawRanges.Length)
+                throw new ArgumentException("Inventories and inject/withdraw ranges must have the same length.", nameof(injectWithdrawRanges));
+            injectWithdrawRanges.Fill(_injectWithdrawRange);
+        }
+
         public double InventorySpaceUpperBound(double nextPeriodInventorySpaceLowerBound,
             double nextPeriodInventorySpaceUpperBound, double currentPeriodMinInventory,
             double currentPeriodMaxInventory, double inventoryPercentLoss)
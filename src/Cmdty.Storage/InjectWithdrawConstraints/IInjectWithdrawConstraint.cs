@@ -23,11 +23,14 @@
 // OTHER DEALINGS IN THE SOFTWARE.
 #endregion
 
+using System;
+
 namespace Cmdty.Storage
 {
     public interface IInjectWithdrawConstraint
     {
         InjectWithdrawRange GetInjectWithdrawRange(double inventory);
+        void GetInjectWithdrawRange(ReadOnlySpan<double> inventories, Span<InjectWithdrawRange> injectWithdrawRanges);
         double InventorySpaceUpperBound(double nextPeriodInventorySpaceLowerBound, double nextPeriodInventorySpaceUpperBound, 
             double currentPeriodMinInventory, double currentPeriodMaxInventory, double inventoryPercentLoss);
         double InventorySpaceLowerBound(double nextPeriodInventorySpaceLowerBound, double nextPeriodInventorySpaceUpperBound, 
@@ -27,7 +27,6 @@
 using System.Collections.Generic;
 using System.Linq;
 using JetBrains.Annotations;
-using MathNet.Numerics.Interpolation;
 
 namespace Cmdty.Storage
 {
@@ -35,8 +34,14 @@ public sealed class PiecewiseLinearInjectWithdrawConstraint : IInjectWithdrawCon
     {
         private readonly InjectWithdrawRangeByInventory[] _injectWithdrawRanges;
 
-        private readonly LinearSpline _maxInjectWithdrawLinear;
-        private readonly LinearSpline _minInjectWithdrawLinear;
+        // Each segment is evaluated as rate = intercept + slope * (inventory - segment start inventory), with the first and
+        // last segments extrapolated for inventory outside of the breakpoints
+        private readonly double[] _inventories;
+        private readonly double[] _maxInjectWithdrawIntercepts;
+        private readonly double[] _maxInjectWithdrawSlopes;
+        private readonly double[] _minInjectWithdrawIntercepts;
+        private readonly double[] _minInjectWithdrawSlopes;
+        private readonly double _inventorySpacingReciprocal;
 
         public PiecewiseLinearInjectWithdrawConstraint([NotNull] IEnumerable<InjectWithdrawRangeByInventory> injectWithdrawRanges)
         {
@@ -48,7 +53,7 @@ public PiecewiseLinearInjectWithdrawConstraint([NotNull] IEnumerable<InjectWithd
             if (_injectWithdrawRanges.Length < 2)
                 throw new ArgumentException("Inject/withdraw ranges collection must contain at least two elements.", nameof(injectWithdrawRanges));
 
-            double[] inventories = _injectWithdrawRanges.Select(injectWithdrawRange => injectWithdrawRange.Inventory)
+            _inventories = _injectWithdrawRanges.Select(injectWithdrawRange => injectWithdrawRange.Inventory)
                                                         .ToArray();
 
             double[] maxInjectWithdrawRates = _injectWithdrawRanges
@@ -59,18 +64,43 @@ public PiecewiseLinearInjectWithdrawConstraint([NotNull] IEnumerable<InjectWithd
                                                     .Select(injectWithdrawRange => injectWithdrawRange.InjectWithdrawRange.MinInjectWithdrawRate)
                                                     .ToArray();
 
-            _maxInjectWithdrawLinear = LinearSpline.InterpolateSorted(inventories, maxInjectWithdrawRates);
-            _minInjectWithdrawLinear = LinearSpline.InterpolateSorted(inventories, minInjectWithdrawRates);
+            int numSegments = _inventories.Length - 1;
+            _maxInjectWithdrawIntercepts = new double[numSegments];
+            _maxInjectWithdrawSlopes = new double[numSegments];
+            _minInjectWithdrawIntercepts = new double[numSegments];
+            _minInjectWithdrawSlopes = new double[numSegments];
+            for (int i = 0; i < numSegments; i++)
+            {
+                double segmentWidth = _inventories[i + 1] - _inventories[i];
+                _maxInjectWithdrawIntercepts[i] = maxInjectWithdrawRates[i];
+                _maxInjectWithdrawSlopes[i] = (maxInjectWithdrawRates[i + 1] - maxInjectWithdrawRates[i]) / segmentWidth;
+                _minInjectWithdrawIntercepts[i] = minInjectWithdrawRates[i];
+                _minInjectWithdrawSlopes[i] = (minInjectWithdrawRates[i + 1] - minInjectWithdrawRates[i]) / segmentWidth;
+            }
 
+            _inventorySpacingReciprocal = StorageHelper.UniformSpacingReciprocal(_inventories);
         }
 
         public InjectWithdrawRange GetInjectWithdrawRange(double inventory)
         {
-            double maxInjectWithdrawRate = _maxInjectWithdrawLinear.Interpolate(inventory);
-            double minInjectWithdrawRate = _minInjectWithdrawLinear.Interpolate(inventory);
+            int segmentIndex = Math.Min(StorageHelper.FloorIndex(_inventories, inventory, _inventorySpacingReciprocal), 
+                                            _inventories.Length - 2);
+            double inventoryFromSegmentStart = inventory - _inventories[segmentIndex];
+            double maxInjectWithdrawRate = _maxInjectWithdrawIntercepts[segmentIndex] + 
+                                           _maxInjectWithdrawSlopes[segmentIndex] * inventoryFromSegmentStart;
+            double minInjectWithdrawRate = _minInjectWithdrawIntercepts[segmentIndex] + 
+                                           _minInjectWithdrawSlopes[segmentIndex] * inventoryFromSegmentStart;
             return new InjectWithdrawRange(minInjectWithdrawRate, maxInjectWithdrawRate);
         }
 
+        public void GetInjectWithdrawRange(ReadOnlySpan<double> inventories, Span<InjectWithdrawRange> injectWithdrawRanges)
+        {
+            if (inventories.Length != injectWithdrawRanges.Length)
+                throw new ArgumentException("Inventories and inject/withdraw ranges must have the same length.", nameof(injectWithdrawRanges));
+            for (int i = 0; i < inventories.Length; i++)
+                injectWithdrawRanges[i] = GetInjectWithdrawRange(inventories[i]);
+        }
+
         public double InventorySpaceUpperBound(double nextPeriodInventorySpaceLowerBound,
             double nextPeriodInventorySpaceUpperBound,
             double currentPeriodMinInventory, double currentPeriodMaxInventory, double inventoryPercentLoss)
@@ -26,8 +26,10 @@
 using System;
 using System.Collections.Generic;
 using System.Linq;
+using System.Numerics;
 using JetBrains.Annotations;
 using MathNet.Numerics;
+using MathNet.Numerics.LinearAlgebra;
 using MathNet.Numerics.RootFinding;
 
 namespace Cmdty.Storage
@@ -38,6 +40,8 @@ public sealed class PolynomialInjectWithdrawConstraint : IInjectWithdrawConstrai
         private readonly Polynomial _minInjectWithdrawPolynomial;
         private readonly Polynomial _maxInjectWithdrawPolynomial1StDeriv;
         private readonly Polynomial _minInjectWithdrawPolynomial1StDeriv;
+        private readonly double[] _maxInjectWithdrawCoefficients;
+        private readonly double[] _minInjectWithdrawCoefficients;
         private readonly double _newtonRaphsonAccuracy;
         private readonly int _newtonRaphsonMaxNumIterations;
         private readonly int _newtonRaphsonSubdivision;
@@ -66,10 +70,12 @@ public sealed class PolynomialInjectWithdrawConstraint : IInjectWithdrawConstrai
             // Polynomial of order n can be fitted exactly to n + 1 data points
             int polyOrder = injectWithdrawRangesList.Count - 1;
 
-            _maxInjectWithdrawPolynomial = new Polynomial(Fit.Polynomial(inventories, maxInjectWithdrawRates, polyOrder));
+            _maxInjectWithdrawCoefficients = Fit.Polynomial(inventories, maxInjectWithdrawRates, polyOrder);
+            _maxInjectWithdrawPolynomial = new Polynomial(_maxInjectWithdrawCoefficients);
             _maxInjectWithdrawPolynomial1StDeriv = _maxInjectWithdrawPolynomial.Differentiate();
 
-            _minInjectWithdrawPolynomial = new Polynomial(Fit.Polynomial(inventories, minInjectWithdrawRates, polyOrder));
+            _minInjectWithdrawCoefficients = Fit.Polynomial(inventories, minInjectWithdrawRates, polyOrder);
+            _minInjectWithdrawPolynomial = new Polynomial(_minInjectWithdrawCoefficients);
             _minInjectWithdrawPolynomial1StDeriv = _minInjectWithdrawPolynomial.Differentiate();
 
             _newtonRaphsonAccuracy = newtonRaphsonAccuracy;
@@ -83,6 +89,14 @@ public InjectWithdrawRange GetInjectWithdrawRange(double inventory)
             double minInjectWithdrawRate = _minInjectWithdrawPolynomial.Evaluate(inventory);
             return new InjectWithdrawRange(minInjectWithdrawRate, maxInjectWithdrawRate);
         }
+
+        public void GetInjectWithdrawRange(ReadOnlySpan<double> inventories, Span<InjectWithdrawRange> injectWithdrawRanges)
+        {
+            if (inventories.Length != injectWithdrawRanges.Length)
+                throw new ArgumentException("Inventories and inject/withdraw ranges must have the same length.", nameof(injectWithdrawRanges));
+            for (int i = 0; i < inventories.Length; i++)
+                injectWithdrawRanges[i] = GetInjectWithdrawRange(inventories[i]);
+        }
         
         public double InventorySpaceUpperBound(double nextPeriodInventorySpaceLowerBound,
             double nextPeriodInventorySpaceUpperBound, double currentPeriodMinInventory,
@@ -101,14 +115,17 @@ public InjectWithdrawRange GetInjectWithdrawRange(double inventory)
                 return currentPeriodMaxInventory;
             }
             
+            // Upper bound is the highest inventory from which the next period inventory space upper bound can be reached
             double PolyToSolve(double inventory) => inventory * (1 - inventoryPercentLoss) 
                                                     + _minInjectWithdrawPolynomial.Evaluate(inventory)
                                                     - nextPeriodInventorySpaceUpperBound ;
             double PolyToSolve1StDeriv(double inventory) => (1 - inventoryPercentLoss) + _minInjectWithdrawPolynomial1StDeriv.Evaluate(inventory);
 
-            if (!RobustNewtonRaphson.TryFindRoot(PolyToSolve, PolyToSolve1StDeriv, currentPeriodMinInventory,
+            if (!TryFindRootFromEigenvalues(_minInjectWithdrawCoefficients, inventoryPercentLoss, nextPeriodInventorySpaceUpperBound,
+                    currentPeriodMinInventory, currentPeriodMaxInventory, true, out double thisPeriodMaxInventory) && 
+                !RobustNewtonRaphson.TryFindRoot(PolyToSolve, PolyToSolve1StDeriv, currentPeriodMinInventory,
                 currentPeriodMaxInventory, _newtonRaphsonAccuracy, _newtonRaphsonMaxNumIterations,
-                        _newtonRaphsonSubdivision, out double thisPeriodMaxInventory))
+                        _newtonRaphsonSubdivision, out thisPeriodMaxInventory))
             {
                 throw new ApplicationException("Cannot solve for the current period inventory space upper bound. Try changing Newton Raphson parameters.");
             }
@@ -136,14 +153,17 @@ public InjectWithdrawRange GetInjectWithdrawRange(double inventory)
                 return currentPeriodMinInventory;
             }
 
+            // Lower bound is the lowest inventory from which the next period inventory space lower bound can be reached
             double PolyToSolve(double inventory) => inventory * (1 - inventoryPercentLoss) 
                                                     + _maxInjectWithdrawPolynomial.Evaluate(inventory)
                                                     - nextPeriodInventorySpaceLowerBound;
             double PolyToSolve1StDeriv(double inventory) => (1 - inventoryPercentLoss) + _maxInjectWithdrawPolynomial1StDeriv.Evaluate(inventory);
 
-            if (!RobustNewtonRaphson.TryFindRoot(PolyToSolve, PolyToSolve1StDeriv, currentPeriodMinInventory,
+            if (!TryFindRootFromEigenvalues(_maxInjectWithdrawCoefficients, inventoryPercentLoss, nextPeriodInventorySpaceLowerBound,
+                    currentPeriodMinInventory, currentPeriodMaxInventory, false, out double thisPeriodMinInventory) &&
+                !RobustNewtonRaphson.TryFindRoot(PolyToSolve, PolyToSolve1StDeriv, currentPeriodMinInventory,
                 currentPeriodMaxInventory, _newtonRaphsonAccuracy, _newtonRaphsonMaxNumIterations, 
-                        _newtonRaphsonSubdivision, out double thisPeriodMinInventory))
+                        _newtonRaphsonSubdivision, out thisPeriodMinInventory))
             {
                 throw new ApplicationException("Cannot solve for the current period inventory space lower bound. Try changing Newton Raphson parameters.");
             }
@@ -154,5 +174,104 @@ public InjectWithdrawRange GetInjectWithdrawRange(double inventory)
             return Math.Max(thisPeriodMinInventory, currentPeriodMinInventory);
         }
 
+        // Solves inventory * (1 - inventoryPercentLoss) + rate(inventory) = nextPeriodInventory, where rate is the polynomial
+        // with coefficients rateCoefficients, by calculating all roots at once as the eigenvalues of the companion matrix.
+        // The real root within [lowerInventory, upperInventory] which is highest (if findHighest is true) or lowest is
+        // returned, after polishing with Newton-Raphson. Polished roots at which the polynomial isn't within tolerance of
+        // zero are rejected. Returns false if no such root exists, in which case the caller should fall back to an
+        // iterative solver.
+        private bool TryFindRootFromEigenvalues(double[] rateCoefficients, double inventoryPercentLoss, double nextPeriodInventory,
+                        double lowerInventory, double upperInventory, bool findHighest, out double root)
+        {
+            var coefficients = (double[])rateCoefficients.Clone();
+            coefficients[0] -= nextPeriodInventory;
+            coefficients[1] += 1 - inventoryPercentLoss;
+
+            int degree = coefficients.Length - 1;
+            while (degree > 0 && coefficients[degree] == 0.0)
+                degree--;
+
+            root = double.NaN;
+            if (degree == 0)
+                return false;
+
+            double tolerance = Math.Max(_newtonRaphsonAccuracy, 1E-10 * Math.Max(1.0, Math.Abs(upperInventory)));
+            bool rootFound = false;
+            double bestRoot = double.NaN;
+
+            void ConsiderRoot(double candidateRoot)
+            {
+                candidateRoot = PolishRoot(coefficients, degree, candidateRoot);
+                if (candidateRoot < lowerInventory - tolerance || candidateRoot > upperInventory + tolerance)
+                    return;
+                // Residual tolerance is relative to the magnitude of the terms summed, to allow for rounding error
+                (double residual, double sumAbsoluteTerms) = EvaluatePolynomial(coefficients, degree, candidateRoot);
+                if (Math.Abs(residual) > Math.Max(_newtonRaphsonAccuracy, 1E-10 * sumAbsoluteTerms))
+                    return;
+                // Within tolerance of the bounds, so clamp to remove numerical error
+                candidateRoot = Math.Max(lowerInventory, Math.Min(upperInventory, candidateRoot));
+                if (!rootFound || (findHighest ? candidateRoot > bestRoot : candidateRoot < bestRoot))
+                    bestRoot = candidateRoot;
+                rootFound = true;
+            }
+
+            if (degree == 1)
+            {
+                ConsiderRoot(-coefficients[0] / coefficients[1]);
+                root = bestRoot;
+                return rootFound;
+            }
+
+            // Companion matrix of the monic polynomial, the eigenvalues of which are the polynomial roots
+            Matrix<double> companion = Matrix<double>.Build.Dense(degree, degree);
+            for (int i = 1; i < degree; i++)
+                companion[i, i - 1] = 1.0;
+            for (int i = 0; i < degree; i++)
+                companion[i, degree - 1] = -coefficients[i] / coefficients[degree];
+
+            foreach (Complex eigenvalue in companion.Evd().EigenValues)
+            {
+                if (Math.Abs(eigenvalue.Imaginary) <= 1E-8 * Math.Max(1.0, Math.Abs(eigenvalue.Real)))
+                    ConsiderRoot(eigenvalue.Real);
+            }
+
+            root = bestRoot;
+            return rootFound;
+        }
+
+        // Returns the value of the polynomial, and the sum of absolute values of its terms, using Horner's method
+        private static (double Value, double SumAbsoluteTerms) EvaluatePolynomial(double[] coefficients, int degree, double x)
+        {
+            double value = coefficients[degree];
+            double sumAbsoluteTerms = Math.Abs(coefficients[degree]);
+            double absoluteX = Math.Abs(x);
+            for (int i = degree - 1; i >= 0; i--)
+            {
+                value = value * x + coefficients[i];
+                sumAbsoluteTerms = sumAbsoluteTerms * absoluteX + Math.Abs(coefficients[i]);
+            }
+            return (value, sumAbsoluteTerms);
+        }
+
+        private static double PolishRoot(double[] coefficients, int degree, double root)
+        {
+            const int numPolishIterations = 2;
+            for (int iteration = 0; iteration < numPolishIterations; iteration++)
+            {
+                // Horner's method for polynomial value and first derivative
+                double value = coefficients[degree];
+                double derivative = 0.0;
+                for (int i = degree - 1; i >= 0; i--)
+                {
+                    derivative = derivative * root + value;
+                    value = value * root + coefficients[i];
+                }
+                if (derivative == 0.0)
+                    break;
+                root -= value / derivative;
+            }
+            return root;
+        }
+
     }
 }
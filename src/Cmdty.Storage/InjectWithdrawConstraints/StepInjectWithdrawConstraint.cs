@@ -34,6 +34,7 @@ public sealed class StepInjectWithdrawConstraint : IInjectWithdrawConstraint
     {
         private readonly InjectWithdrawRangeByInventory[] _injectWithdrawRanges;
         private readonly double[] _inventories;
+        private readonly double _inventorySpacingReciprocal;
 
         public StepInjectWithdrawConstraint([NotNull] IEnumerable<InjectWithdrawRangeByInventory> injectWithdrawRanges)
         {
@@ -67,17 +68,25 @@ public StepInjectWithdrawConstraint([NotNull] IEnumerable<InjectWithdrawRangeByI
                 }
             }
 
+            _inventorySpacingReciprocal = StorageHelper.UniformSpacingReciprocal(_inventories);
         }
 
         public InjectWithdrawRange GetInjectWithdrawRange(double inventory)
         {
             if (inventory < _inventories[0] || inventory > _inventories[_inventories.Length - 1])
                 throw new ArgumentException($"Value of inventory is outside of the interval [{_inventories[0]}, {_inventories[_inventories.Length - 1]}].", nameof(inventory));
-            int searchIndex = Array.BinarySearch(_inventories, inventory);
-            int index = searchIndex >= 0 ? searchIndex : ~searchIndex - 1; 
+            int index = StorageHelper.FloorIndex(_inventories, inventory, _inventorySpacingReciprocal);
             return _injectWithdrawRanges[index].InjectWithdrawRange;
         }
 
+        public void GetInjectWithdrawRange(ReadOnlySpan<double> inventories, Span<InjectWithdrawRange> injectWithdrawRanges)
+        {
+            if (inventories.Length != injectWithdrawRanges.Length)
+                throw new ArgumentException("Inventories and inject/withdraw ranges must have the same length.", nameof(injectWithdrawRanges));
+            for (int i = 0; i < inventories.Length; i++)
+                injectWithdrawRanges[i] = GetInjectWithdrawRange(inventories[i]);
+        }
+
         public double InventorySpaceUpperBound(double nextPeriodInventorySpaceLowerBound, double nextPeriodInventorySpaceUpperBound,
             double currentPeriodMinInventory, double currentPeriodMaxInventory, double inventoryPercentLoss)
         {
@@ -31,5 +31,9 @@ public interface IIntrinsicCalculate<T>
         where T : ITimePeriod<T>
     {
         IntrinsicStorageValuationResults<T> Calculate();
+        /// <summary>
+        /// Records the time spent in each phase of the calculation in <see cref="IntrinsicStorageValuationResults{T}.PhaseTimings"/>.
+        /// </summary>
+        IIntrinsicCalculate<T> WithPhaseTimings();
     }
 }
\ No newline at end of file
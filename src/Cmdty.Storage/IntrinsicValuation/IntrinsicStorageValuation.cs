@@ -45,6 +45,7 @@ public sealed class IntrinsicStorageValuation<T> : IIntrinsicAddStartingInventor
         private Func<ICmdtyStorage<T>, IDoubleStateSpaceGridCalc> _gridCalcFactory;
         private IInterpolatorFactory _interpolatorFactory;
         private double _numericalTolerance;
+        private bool _recordPhaseTimings;
 
         private IntrinsicStorageValuation([NotNull] ICmdtyStorage<T> storage)
         {
@@ -111,16 +112,22 @@ IIntrinsicCalculate<T> IIntrinsicAddNumericalTolerance<T>.WithNumericalTolerance
             return this;
         }
 
+        IIntrinsicCalculate<T> IIntrinsicCalculate<T>.WithPhaseTimings()
+        {
+            _recordPhaseTimings = true;
+            return this;
+        }
+
         IntrinsicStorageValuationResults<T> IIntrinsicCalculate<T>.Calculate()
         {
             return Calculate(_currentPeriod, _startingInventory, _forwardCurve, _storage, _settleDateRule, _discountFactors,
-                    _gridCalcFactory, _interpolatorFactory, _numericalTolerance);
+                    _gridCalcFactory, _interpolatorFactory, _numericalTolerance, new PhaseTimer(_recordPhaseTimings));
         }
 
         private static IntrinsicStorageValuationResults<T> Calculate(T currentPeriod, double startingInventory,
                 TimeSeries<T, double> forwardCurve, ICmdtyStorage<T> storage, Func<T, Day> settleDateRule,
                 Func<Day, Day, double> discountFactors, Func<ICmdtyStorage<T>, IDoubleStateSpaceGridCalc> gridCalcFactory,
-                IInterpolatorFactory interpolatorFactory, double numericalTolerance)
+                IInterpolatorFactory interpolatorFactory, double numericalTolerance, PhaseTimer phaseTimer)
         {
             if (startingInventory < 0)
                 throw new ArgumentException("Inventory cannot be negative.", nameof(startingInventory));
@@ -151,7 +158,11 @@ IntrinsicStorageValuationResults<T> IIntrinsicCalculate<T>.Calculate()
                 return new IntrinsicStorageValuationResults<T>(npv, TimeSeries<T, StorageProfile>.Empty);
             }
 
-            TimeSeries<T, InventoryRange> inventorySpace = StorageHelper.CalculateInventorySpace(storage, startingInventory, currentPeriod);
+            storage = StorageHelper.CompileIfCmdtyStorage(storage);
+
+            phaseTimer.Start(PhaseTimer.InventorySpace);
+            TimeSeries<T, InventoryRange> inventorySpace = StorageHelper.GetOrCalculateInventorySpace(storage, startingInventory, currentPeriod);
+            phaseTimer.Stop(PhaseTimer.InventorySpace);
 
             // TODO think of method to put in TimeSeries class to perform the validation check below in one line
             if (forwardCurve.IsEmpty)
@@ -179,6 +190,7 @@ IntrinsicStorageValuationResults<T> IIntrinsicCalculate<T>.Calculate()
             }
 
             // Perform backward induction
+            phaseTimer.Start(PhaseTimer.BackwardInduction);
             var storageValueByInventory = new Func<double, double>[inventorySpace.Count];
 
             double cmdtyPriceAtEnd = forwardCurve[storage.EndPeriod];
@@ -210,12 +222,16 @@ IntrinsicStorageValuationResults<T> IIntrinsicCalculate<T>.Calculate()
                                                 discountFactorFromCmdtySettlement, DiscountToCurrentDay, numericalTolerance).StorageNpv;
                 }
 
+                phaseTimer.Start(PhaseTimer.InterpolatorConstruction);
                 storageValueByInventory[backCounter] =
                     interpolatorFactory.CreateInterpolator(inventorySpaceGrid, storageValuesGrid);
+                phaseTimer.Stop(PhaseTimer.InterpolatorConstruction);
                 backCounter--;
             }
+            phaseTimer.Stop(PhaseTimer.BackwardInduction);
 
             // Loop forward from start inventory choosing optimal decisions
+            phaseTimer.Start(PhaseTimer.ForwardProfile);
             int numStorageProfiles = inventorySpace.Count + 1;
             var storageProfiles = new StorageProfile[numStorageProfiles];
             var periods = new T[numStorageProfiles];
@@ -255,8 +271,10 @@ IntrinsicStorageValuationResults<T> IIntrinsicCalculate<T>.Calculate()
             }
 
             double storageNpv = storageProfiles.Sum(profile => profile.PeriodPv);
+            phaseTimer.Stop(PhaseTimer.ForwardProfile);
 
-            return new IntrinsicStorageValuationResults<T>(storageNpv, new TimeSeries<T, StorageProfile>(periods, storageProfiles));
+            return new IntrinsicStorageValuationResults<T>(storageNpv, new TimeSeries<T, StorageProfile>(periods, storageProfiles),
+                phaseTimer.Timings);
         }
 
         private static (double StorageNpv, double OptimalInjectWithdraw, double CmdtyConsumedOnAction, double InventoryLoss, double PeriodPv) 
@@ -24,6 +24,7 @@
 #endregion
 
 using System;
+using System.Collections.Generic;
 using Cmdty.TimePeriodValueTypes;
 using Cmdty.TimeSeries;
 using JetBrains.Annotations;
@@ -36,11 +37,17 @@ public sealed class IntrinsicStorageValuationResults<T>
         public double NetPresentValue { get; }
         // TODO develop Time Series pane type and include data for StorageProfile
         public TimeSeries<T, StorageProfile> StorageProfile { get; set; }
+        /// <summary>
+        /// Time spent in each phase of the calculation, keyed by phase name. Empty unless phase timings were requested.
+        /// </summary>
+        public IReadOnlyDictionary<string, TimeSpan> PhaseTimings { get; }
 
-        public IntrinsicStorageValuationResults(double netPresentValue, [NotNull] TimeSeries<T, StorageProfile> storageProfile)
+        public IntrinsicStorageValuationResults(double netPresentValue, [NotNull] TimeSeries<T, StorageProfile> storageProfile,
+            IReadOnlyDictionary<string, TimeSpan> phaseTimings = null)
         {
             NetPresentValue = netPresentValue;
             StorageProfile = storageProfile ?? throw new ArgumentNullException(nameof(storageProfile));
+            PhaseTimings = phaseTimings ?? new Dictionary<string, TimeSpan>();
         }
 
         public override string ToString()
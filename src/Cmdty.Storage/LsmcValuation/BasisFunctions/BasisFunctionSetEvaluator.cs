@@ -0,0 +1,296 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Runtime.InteropServices;
+using System.Numerics;
+using DoubleVector = System.Numerics.Vector<double>;
+
+namespace Cmdty.Storage
+{
+    internal sealed class PowerMonomialTerms
+    {
+        public int SpotPower { get; }
+        public IReadOnlyDictionary<int, int> MarkovFactorPowers { get; }
+
+        public PowerMonomialTerms(int spotPower, Dictionary<int, int> markovFactorPowers)
+        {
+            SpotPower = spotPower;
+            MarkovFactorPowers = markovFactorPowers.ToDictionary(pair => pair.Key, pair => pair.Value);
+        }
+    }
+
+    internal sealed class OrthogonalPolynomialTerm
+    {
+        public OrthogonalPolynomialFamily Family { get; }
+        public int? MarkovFactor { get; } // Null for the spot price
+        public int Degree { get; }
+
+        public OrthogonalPolynomialTerm(OrthogonalPolynomialFamily family, int? markovFactor, int degree)
+        {
+            Family = family;
+            MarkovFactor = markovFactor;
+            Degree = degree;
+        }
+    }
+
+    /// <summary>
+    /// Shift and scale multiplier used to standardise the variable of each orthogonal polynomial basis function, indexed
+    /// by the position of the basis function in the set. Elements for other basis functions are not used.
+    /// </summary>
+    internal sealed class BasisFunctionStandardisation
+    {
+        public double[] Shifts { get; }
+        public double[] ScaleMultipliers { get; }
+
+        public BasisFunctionStandardisation(double[] shifts, double[] scaleMultipliers)
+        {
+            Shifts = shifts;
+            ScaleMultipliers = scaleMultipliers;
+        }
+    }
+
+    /// <summary>
+    /// Evaluates a set of basis functions into the columns of a design matrix. Basis functions which are power
+    /// monomials (created via <see cref="BasisFunctions"/> or <see cref="PowerMonomialBuilder"/>) are evaluated
+    /// together: the powers of each variable are calculated once incrementally, rather than with Math.Pow for
+    /// every column, and a monomial whose terms extend those of an earlier column starts from that column. Any other
+    /// basis function delegate is called as normal, except orthogonal polynomials, which are standardised using a
+    /// <see cref="BasisFunctionStandardisation"/> so that the same statistics can be used for different sets of sims.
+    /// </summary>
+    internal sealed class BasisFunctionSetEvaluator
+    {
+        private const int SpotVariable = -1;
+
+        private readonly IReadOnlyList<BasisFunction> _basisFunctions;
+        private readonly ColumnPlan[] _columnPlans;
+        private readonly OrthogonalPolynomialTerm[] _orthogonalPolynomialTerms;
+        private readonly Dictionary<int, int> _maxPowerByVariable;
+        private readonly Dictionary<int, double[][]> _powerBuffersByVariable;
+        private int _bufferLength;
+
+        public BasisFunctionSetEvaluator(IReadOnlyList<BasisFunction> basisFunctions)
+        {
+            _basisFunctions = basisFunctions;
+            _columnPlans = new ColumnPlan[basisFunctions.Count];
+            _orthogonalPolynomialTerms = new OrthogonalPolynomialTerm[basisFunctions.Count];
+            _maxPowerByVariable = new Dictionary<int, int>();
+            _powerBuffersByVariable = new Dictionary<int, double[][]>();
+            var columnByTerms = new Dictionary<string, int>();
+
+            for (int basisIndex = 0; basisIndex < basisFunctions.Count; basisIndex++)
+            {
+                if (BasisFunctions.TryGetOrthogonalPolynomialTerm(basisFunctions[basisIndex], out OrthogonalPolynomialTerm orthogonalTerm))
+                {
+                    _orthogonalPolynomialTerms[basisIndex] = orthogonalTerm;
+                    continue;
+                }
+                if (!BasisFunctions.TryGetPowerMonomialTerms(basisFunctions[basisIndex], out PowerMonomialTerms monomial))
+                    continue; // Not a power monomial so will be evaluated by calling the delegate
+
+                // Order of terms matches BasisFunctions.Generic, i.e. spot price first
+                var terms = new List<(int Variable, int Power)>();
+                if (monomial.SpotPower > 0)
+                    terms.Add((SpotVariable, monomial.SpotPower));
+                terms.AddRange(monomial.MarkovFactorPowers.Where(pair => pair.Value > 0)
+                                                    .Select(pair => (pair.Key, pair.Value)));
+
+                foreach ((int variable, int power) in terms)
+                    if (!_maxPowerByVariable.TryGetValue(variable, out int maxPower) || power > maxPower)
+                        _maxPowerByVariable[variable] = power;
+
+                // Look for the longest leading run of terms already evaluated into an earlier column
+                int startColumn = -1;
+                int numTermsFromStartColumn = 0;
+                for (int numLeadingTerms = terms.Count - 1; numLeadingTerms > 0; numLeadingTerms--)
+                {
+                    if (columnByTerms.TryGetValue(TermsKey(terms, numLeadingTerms), out int column))
+                    {
+                        startColumn = column;
+                        numTermsFromStartColumn = numLeadingTerms;
+                        break;
+                    }
+                }
+
+                string key = TermsKey(terms, terms.Count);
+                if (!columnByTerms.ContainsKey(key))
+                    columnByTerms[key] = basisIndex;
+                _columnPlans[basisIndex] = new ColumnPlan(terms.ToArray(), startColumn, numTermsFromStartColumn);
+            }
+        }
+
+        private static string TermsKey(List<(int Variable, int Power)> terms, int numTerms) =>
+            string.Join(",", terms.Take(numTerms).Select(term => $"{term.Variable}^{term.Power}"));
+
+        /// <summary>
+        /// Calculates the standardisation of the orthogonal polynomial basis functions from the statistics of the sims
+        /// passed in. Returns null if there are no orthogonal polynomial basis functions.
+        /// </summary>
+        public BasisFunctionStandardisation FitStandardisation(ReadOnlyMemory<double>[] markovFactors, ReadOnlySpan<double> spotPrices)
+        {
+            if (_orthogonalPolynomialTerms.All(term => term == null))
+                return null;
+            var shifts = new double[_basisFunctions.Count];
+            var scaleMultipliers = new double[_basisFunctions.Count];
+            for (int basisIndex = 0; basisIndex < _basisFunctions.Count; basisIndex++)
+            {
+                OrthogonalPolynomialTerm term = _orthogonalPolynomialTerms[basisIndex];
+                if (term == null)
+                    continue;
+                (shifts[basisIndex], scaleMultipliers[basisIndex]) = 
+                    BasisFunctions.OrthogonalPolynomialStandardisation(term.Family, Values(term, markovFactors, spotPrices));
+            }
+            return new BasisFunctionStandardisation(shifts, scaleMultipliers);
+        }
+
+        public void Evaluate(ReadOnlyMemory<double>[] markovFactors, ReadOnlySpan<double> spotPrices,
+                                double[] designMatrixColumnMajor, int numSims)
+            => Evaluate(markovFactors, spotPrices, designMatrixColumnMajor, numSims, FitStandardisation(markovFactors, spotPrices));
+
+        public void Evaluate(ReadOnlyMemory<double>[] markovFactors, ReadOnlySpan<double> spotPrices,
+                                double[] designMatrixColumnMajor, int numSims, BasisFunctionStandardisation standardisation)
+        {
+            CalculatePowers(markovFactors, spotPrices, numSims);
+
+            for (int basisIndex = 0; basisIndex < _basisFunctions.Count; basisIndex++)
+            {
+                var designMatrixColumn = new Span<double>(designMatrixColumnMajor, basisIndex * numSims, numSims);
+                OrthogonalPolynomialTerm orthogonalTerm = _orthogonalPolynomialTerms[basisIndex];
+                if (orthogonalTerm != null)
+                {
+                    BasisFunctions.EvaluateOrthogonalPolynomial(orthogonalTerm.Family, orthogonalTerm.Degree,
+                        Values(orthogonalTerm, markovFactors, spotPrices), standardisation.Shifts[basisIndex],
+                        standardisation.ScaleMultipliers[basisIndex], designMatrixColumn);
+                    continue;
+                }
+
+                ColumnPlan columnPlan = _columnPlans[basisIndex];
+                if (columnPlan == null)
+                {
+                    _basisFunctions[basisIndex](markovFactors, spotPrices, designMatrixColumn);
+                    continue;
+                }
+
+                (int Variable, int Power)[] terms = columnPlan.Terms;
+                int termIndex;
+                if (columnPlan.StartColumn >= 0)
+                {
+                    new ReadOnlySpan<double>(designMatrixColumnMajor, columnPlan.StartColumn * numSims, numSims)
+                        .CopyTo(designMatrixColumn);
+                    termIndex = columnPlan.NumTermsFromStartColumn;
+                }
+                else if (terms.Length == 0)
+                {
+                    designMatrixColumn.Fill(1.0);
+                    continue;
+                }
+                else
+                {
+                    Power(terms[0], markovFactors, spotPrices).CopyTo(designMatrixColumn);
+                    termIndex = 1;
+                }
+
+                for (; termIndex < terms.Length; termIndex++)
+                    Multiply(designMatrixColumn, Power(terms[termIndex], markovFactors, spotPrices), designMatrixColumn);
+            }
+        }
+
+        private static ReadOnlySpan<double> Values(OrthogonalPolynomialTerm term, ReadOnlyMemory<double>[] markovFactors,
+                                            ReadOnlySpan<double> spotPrices)
+            => term.MarkovFactor == null ? spotPrices : markovFactors[term.MarkovFactor.Value].Span;
+
+        private ReadOnlySpan<double> Power((int Variable, int Power) term, ReadOnlyMemory<double>[] markovFactors,
+                                            ReadOnlySpan<double> spotPrices)
+        {
+            if (term.Power == 1)
+                return term.Variable == SpotVariable ? spotPrices : markovFactors[term.Variable].Span;
+            return _powerBuffersByVariable[term.Variable][term.Power - 2];
+        }
+
+        private void CalculatePowers(ReadOnlyMemory<double>[] markovFactors, ReadOnlySpan<double> spotPrices, int numSims)
+        {
+            if (_bufferLength != numSims)
+            {
+                _powerBuffersByVariable.Clear();
+                _bufferLength = numSims;
+            }
+
+            foreach (KeyValuePair<int, int> pair in _maxPowerByVariable)
+            {
+                int variable = pair.Key;
+                int maxPower = pair.Value;
+                if (maxPower < 2)
+                    continue;
+                if (!_powerBuffersByVariable.TryGetValue(variable, out double[][] powerBuffers))
+                {
+                    // Buffer at index i holds the variable raised to the power of i + 2
+                    powerBuffers = new double[maxPower - 1][];
+                    for (int i = 0; i < powerBuffers.Length; i++)
+                        powerBuffers[i] = new double[numSims];
+                    _powerBuffersByVariable[variable] = powerBuffers;
+                }
+
+                ReadOnlySpan<double> values = variable == SpotVariable ? spotPrices : markovFactors[variable].Span;
+                Multiply(values, values, powerBuffers[0]);
+                for (int i = 1; i < powerBuffers.Length; i++)
+                    Multiply(powerBuffers[i - 1], values, powerBuffers[i]);
+            }
+        }
+
+        internal static void Multiply(ReadOnlySpan<double> left, ReadOnlySpan<double> right, Span<double> result)
+        {
+            int length = result.Length;
+            int index = 0;
+            if (Vector.IsHardwareAccelerated)
+            {
+                ReadOnlySpan<DoubleVector> leftVectors = MemoryMarshal.Cast<double, DoubleVector>(left.Slice(0, length));
+                ReadOnlySpan<DoubleVector> rightVectors = MemoryMarshal.Cast<double, DoubleVector>(right.Slice(0, length));
+                Span<DoubleVector> resultVectors = MemoryMarshal.Cast<double, DoubleVector>(result);
+                for (int i = 0; i < resultVectors.Length; i++)
+                    resultVectors[i] = leftVectors[i] * rightVectors[i];
+                index = resultVectors.Length * DoubleVector.Count;
+            }
+            for (; index < length; index++)
+                result[index] = left[index] * right[index];
+        }
+
+        private sealed class ColumnPlan
+        {
+            public (int Variable, int Power)[] Terms { get; }
+            public int StartColumn { get; }
+            public int NumTermsFromStartColumn { get; }
+
+            public ColumnPlan((int Variable, int Power)[] terms, int startColumn, int numTermsFromStartColumn)
+            {
+                Terms = terms;
+                StartColumn = startColumn;
+                NumTermsFromStartColumn = numTermsFromStartColumn;
+            }
+        }
+
+    }
+}
@@ -26,11 +26,19 @@
 using System;
 using System.Collections.Generic;
 using System.Linq;
+using System.Runtime.CompilerServices;
 
 namespace Cmdty.Storage
 {
     public static class BasisFunctions
     {
+        // Powers of basis functions which are power monomials, used by BasisFunctionSetEvaluator to evaluate these more efficiently
+        private static readonly ConditionalWeakTable<BasisFunction, PowerMonomialTerms> PowerMonomials = 
+            new ConditionalWeakTable<BasisFunction, PowerMonomialTerms>();
+        // Orthogonal polynomial basis functions, used by BasisFunctionSetEvaluator to standardise with fixed statistics
+        private static readonly ConditionalWeakTable<BasisFunction, OrthogonalPolynomialTerm> OrthogonalPolynomials =
+            new ConditionalWeakTable<BasisFunction, OrthogonalPolynomialTerm>();
+
         public static BasisFunction Ones
         {
             get
@@ -41,7 +49,7 @@ public static BasisFunction Ones
                     for (int i = 0; i < designMatrixCol.Length; i++)
                         designMatrixCol[i] = 1.0;
                 }
-                return Ones;
+                return RegisterPowerMonomial(Ones, 0, new Dictionary<int, int>());
             }
         }
 
@@ -53,7 +61,7 @@ public static BasisFunction SpotPricePower(int power)
                 for (int i = 0; i < designMatrixCol.Length; i++)
                     designMatrixCol[i] = Math.Pow(spotPriceBySim[i], power);
             }
-            return BasisFunc;
+            return RegisterPowerMonomial(BasisFunc, power, new Dictionary<int, int>());
         }
 
         public static BasisFunction MarkovFactorPower(int markovFactor, int power)
@@ -65,9 +73,19 @@ public static BasisFunction MarkovFactorPower(int markovFactor, int power)
                 for (int i = 0; i < designMatrixCol.Length; i++)
                     designMatrixCol[i] = Math.Pow(markovFactorBySim[i], power);
             }
-            return BasisFunc;
+            return RegisterPowerMonomial(BasisFunc, 0, new Dictionary<int, int> {{markovFactor, power}});
         }
 
+        private static BasisFunction RegisterPowerMonomial(BasisFunction basisFunction, int spotPower, 
+                                    Dictionary<int, int> markovFactorPowers)
+        {
+            PowerMonomials.Add(basisFunction, new PowerMonomialTerms(spotPower, markovFactorPowers));
+            return basisFunction;
+        }
+
+        internal static bool TryGetPowerMonomialTerms(BasisFunction basisFunction, out PowerMonomialTerms powerMonomialTerms)
+            => PowerMonomials.TryGetValue(basisFunction, out powerMonomialTerms);
+
         public static IEnumerable<BasisFunction> MarkovFactorAllPositiveIntegerPowersUpTo(int markovFactor, int maxPower)
         {
             MaxPowerPrecondition(maxPower);
@@ -89,6 +107,136 @@ public static IEnumerable<BasisFunction> AllMarkovFactorAllPositiveIntegerPowers
                     yield return basisFunction;
         }
 
+        public static BasisFunction SpotPriceOrthogonalPolynomial(OrthogonalPolynomialFamily family, int degree)
+        {
+            DegreePrecondition(degree);
+            void BasisFunc(ReadOnlyMemory<double>[] markovFactors, ReadOnlySpan<double> spotPriceBySim,
+                Span<double> designMatrixCol)
+            {
+                EvaluateStandardisedOrthogonalPolynomial(family, degree, spotPriceBySim, designMatrixCol);
+            }
+            return RegisterOrthogonalPolynomial(BasisFunc, new OrthogonalPolynomialTerm(family, null, degree));
+        }
+
+        public static BasisFunction MarkovFactorOrthogonalPolynomial(OrthogonalPolynomialFamily family, int markovFactor, int degree)
+        {
+            DegreePrecondition(degree);
+            void BasisFunc(ReadOnlyMemory<double>[] markovFactors, ReadOnlySpan<double> spotPriceBySim,
+                Span<double> designMatrixCol)
+            {
+                EvaluateStandardisedOrthogonalPolynomial(family, degree, markovFactors[markovFactor].Span, designMatrixCol);
+            }
+            return RegisterOrthogonalPolynomial(BasisFunc, new OrthogonalPolynomialTerm(family, markovFactor, degree));
+        }
+
+        private static void DegreePrecondition(int degree)
+        {
+            if (degree < 1)
+                throw new ArgumentException("Polynomial degree must be greater than zero.");
+        }
+
+        private static BasisFunction RegisterOrthogonalPolynomial(BasisFunction basisFunction, OrthogonalPolynomialTerm term)
+        {
+            OrthogonalPolynomials.Add(basisFunction, term);
+            return basisFunction;
+        }
+
+        internal static bool TryGetOrthogonalPolynomialTerm(BasisFunction basisFunction, out OrthogonalPolynomialTerm term)
+            => OrthogonalPolynomials.TryGetValue(basisFunction, out term);
+
+        // Called directly the basis function standardises using the statistics of the values passed in. The LSMC valuation
+        // instead evaluates through BasisFunctionSetEvaluator, which fixes the statistics from the regression sims of each
+        // period, so that the same basis is used on the valuation sims whatever their batch size.
+        private static void EvaluateStandardisedOrthogonalPolynomial(OrthogonalPolynomialFamily family, int degree,
+                                        ReadOnlySpan<double> valuesBySim, Span<double> designMatrixCol)
+        {
+            (double shift, double scaleMultiplier) = OrthogonalPolynomialStandardisation(family, valuesBySim);
+            EvaluateOrthogonalPolynomial(family, degree, valuesBySim, shift, scaleMultiplier, designMatrixCol);
+        }
+
+        internal static (double Shift, double ScaleMultiplier) OrthogonalPolynomialStandardisation(
+                                        OrthogonalPolynomialFamily family, ReadOnlySpan<double> valuesBySim)
+        {
+            double sum = 0.0;
+            double min = double.PositiveInfinity;
+            double max = double.NegativeInfinity;
+            for (int i = 0; i < valuesBySim.Length; i++)
+            {
+                double value = valuesBySim[i];
+                sum += value;
+                min = Math.Min(min, value);
+                max = Math.Max(max, value);
+            }
+            double mean = sum / valuesBySim.Length;
+            double sumSquaredDeviations = 0.0;
+            for (int i = 0; i < valuesBySim.Length; i++)
+            {
+                double deviation = valuesBySim[i] - mean;
+                sumSquaredDeviations += deviation * deviation;
+            }
+            double standardDeviation = Math.Sqrt(sumSquaredDeviations / valuesBySim.Length);
+
+            double shift, scale;
+            switch (family)
+            {
+                case OrthogonalPolynomialFamily.Hermite:
+                    shift = mean;
+                    scale = standardDeviation;
+                    break;
+                case OrthogonalPolynomialFamily.Laguerre:
+                    shift = min;
+                    scale = standardDeviation;
+                    break;
+                case OrthogonalPolynomialFamily.Legendre:
+                    shift = (max + min) / 2.0;
+                    scale = (max - min) / 2.0;
+                    break;
+                default:
+                    throw new ArgumentOutOfRangeException(nameof(family), family, null);
+            }
+            // If all sims have the same value evaluate the polynomial at zero, rather than dividing by zero
+            double scaleMultiplier = scale > 0.0 ? 1.0 / scale : 0.0;
+            return (shift, scaleMultiplier);
+        }
+
+        internal static void EvaluateOrthogonalPolynomial(OrthogonalPolynomialFamily family, int degree,
+                    ReadOnlySpan<double> valuesBySim, double shift, double scaleMultiplier, Span<double> designMatrixCol)
+        {
+            for (int i = 0; i < designMatrixCol.Length; i++)
+            {
+                double standardisedValue = (valuesBySim[i] - shift) * scaleMultiplier;
+                designMatrixCol[i] = OrthogonalPolynomial(family, degree, standardisedValue);
+            }
+        }
+
+        // Evaluated using the three-term recurrence relation of each family
+        internal static double OrthogonalPolynomial(OrthogonalPolynomialFamily family, int degree, double x)
+        {
+            double previous = 1.0;
+            double current = family == OrthogonalPolynomialFamily.Laguerre ? 1.0 - x : x;
+            for (int n = 1; n < degree; n++)
+            {
+                double next;
+                switch (family)
+                {
+                    case OrthogonalPolynomialFamily.Hermite:
+                        next = x * current - n * previous;
+                        break;
+                    case OrthogonalPolynomialFamily.Laguerre:
+                        next = ((2 * n + 1 - x) * current - n * previous) / (n + 1);
+                        break;
+                    case OrthogonalPolynomialFamily.Legendre:
+                        next = ((2 * n + 1) * x * current - n * previous) / (n + 1);
+                        break;
+                    default:
+                        throw new ArgumentOutOfRangeException(nameof(family), family, null);
+                }
+                previous = current;
+                current = next;
+            }
+            return degree == 0 ? previous : current;
+        }
+
         public static BasisFunction Generic(int spotPower, Dictionary<int, int> markovFactorPowers)
         {
             if (spotPower < 0)
@@ -130,6 +278,7 @@ public static BasisFunction Generic(int spotPower, Dictionary<int, int> markovFa
                         }
                     }
                 };
+                basisFunction = RegisterPowerMonomial(basisFunction, spotPower, markovFactorPowers);
             }
             return basisFunction;
         }
@@ -29,6 +29,7 @@
 using System.Collections.Generic;
 using System.Linq;
 using System.Reflection;
+using System.Runtime.CompilerServices;
 using System.Text.RegularExpressions;
 using JetBrains.Annotations;
 using Microsoft.CodeAnalysis.CSharp.Scripting;
@@ -87,6 +88,12 @@ public static BasisFunctionsBuilder MarkovFactorAllPositiveIntegerPowersUpTo(int
         public static BasisFunctionsBuilder AllMarkovFactorAllPositiveIntegerPowersUpTo(int maxPower, int numMarkovFactors)
             => new BasisFunctionsBuilder(BasisFunctions.AllMarkovFactorAllPositiveIntegerPowersUpTo(maxPower, numMarkovFactors));
 
+        public static BasisFunctionsBuilder SpotPriceOrthogonalPolynomial(OrthogonalPolynomialFamily family, int degree)
+            => new BasisFunctionsBuilder(BasisFunctions.SpotPriceOrthogonalPolynomial(family, degree));
+
+        public static BasisFunctionsBuilder MarkovFactorOrthogonalPolynomial(OrthogonalPolynomialFamily family, int markovFactor, int degree)
+            => new BasisFunctionsBuilder(BasisFunctions.MarkovFactorOrthogonalPolynomial(family, markovFactor, degree));
+
         public static BasisFunction[] Parse([NotNull] string basisFunctionExpression)
         {
             if (basisFunctionExpression == null) throw new ArgumentNullException(nameof(basisFunctionExpression));
@@ -101,16 +108,19 @@ public static BasisFunction[] Parse([NotNull] string basisFunctionExpression)
             });
         }
 
-        private static readonly ScriptOptions ParserScriptOptions;
         private static readonly ConcurrentDictionary<string, BasisFunction[]> BasisFunctionsCache;
         private static readonly ConcurrentDictionary<string, BasisFunction> MonomialsCache;
+        private static readonly Regex PowerMonomialRegex;
+        private static readonly Regex OrthogonalPolynomialRegex;
 
         static BasisFunctionsBuilder()
         {
-            ParserScriptOptions = ScriptOptions.Default.WithImports("Cmdty.Storage.Sim")
-                .WithReferences(Assembly.GetExecutingAssembly());
             BasisFunctionsCache = new ConcurrentDictionary<string, BasisFunction[]>();
             MonomialsCache = new ConcurrentDictionary<string, BasisFunction>();
+            const string factorPattern = @"(?<Factor>(?:s|x\d+)(?:\s*\*\*\s*\d+)?)";
+            PowerMonomialRegex = new Regex($@"^\s*{factorPattern}(?:\s*\*\s*{factorPattern})*\s*$", RegexOptions.Compiled);
+            OrthogonalPolynomialRegex = new Regex(@"^\s*(?<Family>hermite|laguerre|legendre)\s*\(\s*(?<Variable>s|x\d+)\s*,\s*(?<Degree>\d+)\s*\)\s*$",
+                RegexOptions.Compiled);
         }
 
         private static BasisFunction ParseMonomial(string monomialExpression)
@@ -119,6 +129,89 @@ private static BasisFunction ParseMonomial(string monomialExpression)
             {
                 if (monomialExpression == "1")
                     return BasisFunctions.Ones;
+                if (TryParsePowerMonomial(monomialExpression, out PowerMonomialBuilder powerMonomial))
+                    return powerMonomial;
+                if (TryParseOrthogonalPolynomial(monomialExpression, out BasisFunction orthogonalPolynomial))
+                    return orthogonalPolynomial;
+                return CompileMonomial(monomialExpression);
+            });
+        }
+
+        /// <summary>
+        /// Parses a product of integer powers of the spot price and Markov factors, e.g. "s * x0**2 * x1", without the
+        /// start-up cost of compiling with Roslyn.
+        /// </summary>
+        internal static bool TryParsePowerMonomial(string monomialExpression, out PowerMonomialBuilder powerMonomial)
+        {
+            Match match = PowerMonomialRegex.Match(monomialExpression);
+            if (!match.Success)
+            {
+                powerMonomial = null;
+                return false;
+            }
+
+            int spotPower = 0;
+            var markovFactorPowers = new Dictionary<int, int>();
+            // Each capture is one factor of the product, optionally raised to a power, e.g. "x0 ** 2"
+            CaptureCollection factorCaptures = match.Groups["Factor"].Captures;
+            foreach (Capture factorCapture in factorCaptures)
+            {
+                string factorExpression = factorCapture.Value;
+                int powerIndex = factorExpression.IndexOf("**", StringComparison.Ordinal);
+                int power = powerIndex < 0 ? 1 : int.Parse(factorExpression.Substring(powerIndex + 2).Trim());
+                string baseExpression = (powerIndex < 0 ? factorExpression : factorExpression.Substring(0, powerIndex)).Trim();
+                if (baseExpression == "s")
+                {
+                    spotPower += power;
+                }
+                else
+                {
+                    int factorIndex = int.Parse(baseExpression.Substring(1));
+                    markovFactorPowers.TryGetValue(factorIndex, out int currentPower);
+                    markovFactorPowers[factorIndex] = currentPower + power;
+                }
+            }
+
+            powerMonomial = new PowerMonomialBuilder(spotPower, markovFactorPowers);
+            return true;
+        }
+
+        /// <summary>
+        /// Parses an orthogonal polynomial of the spot price or a Markov factor, standardised per period, e.g.
+        /// "hermite(x0, 3)", "laguerre(s, 2)" or "legendre(x1, 4)".
+        /// </summary>
+        internal static bool TryParseOrthogonalPolynomial(string expression, out BasisFunction basisFunction)
+        {
+            Match match = OrthogonalPolynomialRegex.Match(expression);
+            if (!match.Success)
+            {
+                basisFunction = null;
+                return false;
+            }
+
+            var family = (OrthogonalPolynomialFamily)Enum.Parse(typeof(OrthogonalPolynomialFamily), 
+                                        match.Groups["Family"].Value, true);
+            int degree = int.Parse(match.Groups["Degree"].Value);
+            string variable = match.Groups["Variable"].Value;
+            basisFunction = variable == "s" ? BasisFunctions.SpotPriceOrthogonalPolynomial(family, degree) : 
+                BasisFunctions.MarkovFactorOrthogonalPolynomial(family, int.Parse(variable.Substring(1)), degree);
+            return true;
+        }
+
+        // Not inlined so that Roslyn is only loaded if an expression cannot be parsed by TryParsePowerMonomial
+        [MethodImpl(MethodImplOptions.NoInlining)]
+        private static BasisFunction CompileMonomial(string monomialExpression)
+        {
+            return ScriptCompiler.Compile(monomialExpression);
+        }
+
+        private static class ScriptCompiler
+        {
+            private static readonly ScriptOptions ParserScriptOptions = ScriptOptions.Default.WithImports("Cmdty.Storage.Sim")
+                .WithReferences(Assembly.GetExecutingAssembly());
+
+            public static BasisFunction Compile(string monomialExpression)
+            {
                 monomialExpression = monomialExpression.Replace('s', 'S');
                 // Replace xi with Factor(i)
                 monomialExpression = Regex.Replace(monomialExpression, @"x(?<FactorNum>\d+)", match =>
@@ -127,7 +220,7 @@ private static BasisFunction ParseMonomial(string monomialExpression)
                 monomialExpression = Regex.Replace(monomialExpression, @"\*\*(?<Power>\d+)", match =>
                     $".Pow({match.Groups["Power"].Value})");
                 return CSharpScript.EvaluateAsync<BasisFunction>(monomialExpression, ParserScriptOptions).Result;
-            });
+            }
         }
 
         public IEnumerator<BasisFunction> GetEnumerator()
@@ -0,0 +1,47 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+namespace Cmdty.Storage
+{
+    /// <summary>
+    /// Family of orthogonal polynomials used for basis functions. Each family is evaluated on the simulated values
+    /// standardised for the period, so that the regression design matrix is better conditioned than with raw powers.
+    /// </summary>
+    public enum OrthogonalPolynomialFamily
+    {
+        /// <summary>
+        /// Probabilists' Hermite polynomials, evaluated on the values standardised to zero mean and unit standard deviation.
+        /// </summary>
+        Hermite,
+        /// <summary>
+        /// Laguerre polynomials, evaluated on the values shifted to a minimum of zero and scaled to unit standard deviation.
+        /// </summary>
+        Laguerre,
+        /// <summary>
+        /// Legendre polynomials, evaluated on the values rescaled to the interval [-1, 1].
+        /// </summary>
+        Legendre
+    }
+}
@@ -0,0 +1,77 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+
+namespace Cmdty.Storage
+{
+    internal static class ControlVariate
+    {
+        /// <summary>
+        /// Estimates the mean of samples using a control variate with known expectation, with the coefficient
+        /// estimated from the sample covariance. If the controls have no variance the sample mean is returned.
+        /// </summary>
+        public static (double Estimate, double StandardError) Estimate(ReadOnlySpan<double> samples, 
+            ReadOnlySpan<double> controls, double controlExpectation)
+        {
+            if (samples.Length != controls.Length)
+                throw new ArgumentException("Samples and controls must have the same length.", nameof(controls));
+            int numSamples = samples.Length;
+
+            double sampleMean = 0.0;
+            double controlMean = 0.0;
+            for (int i = 0; i < numSamples; i++)
+            {
+                sampleMean += samples[i];
+                controlMean += controls[i];
+            }
+            sampleMean /= numSamples;
+            controlMean /= numSamples;
+
+            double covariance = 0.0;
+            double controlVariance = 0.0;
+            for (int i = 0; i < numSamples; i++)
+            {
+                double controlDeviation = controls[i] - controlMean;
+                covariance += (samples[i] - sampleMean) * controlDeviation;
+                controlVariance += controlDeviation * controlDeviation;
+            }
+
+            double beta = controlVariance > 0.0 ? covariance / controlVariance : 0.0;
+            double estimate = sampleMean - beta * (controlMean - controlExpectation);
+
+            double sumSquaredResiduals = 0.0;
+            for (int i = 0; i < numSamples; i++)
+            {
+                double residual = samples[i] - sampleMean - beta * (controls[i] - controlMean);
+                sumSquaredResiduals += residual * residual;
+            }
+            double standardError = numSamples > 1 ? Math.Sqrt(sumSquaredResiduals / (numSamples - 1) / numSamples) : double.NaN;
+
+            return (estimate, standardError);
+        }
+
+    }
+}
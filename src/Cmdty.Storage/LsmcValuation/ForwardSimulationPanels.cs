@@ -0,0 +1,85 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System.Collections.Generic;
+using System.Linq;
+using Cmdty.Core.Common;
+using Cmdty.TimePeriodValueTypes;
+
+namespace Cmdty.Storage
+{
+    /// <summary>
+    /// Results by simulation of the LSMC forward simulation for one batch of valuation sims.
+    /// </summary>
+    internal sealed class ForwardSimulationPanels<T>
+        where T : ITimePeriod<T>
+    {
+        public int NumSims { get; }
+        public Panel<T, double> InventoryBySim { get; }
+        public Panel<T, double> InjectWithdrawVolumeBySim { get; }
+        public Panel<T, double> CmdtyConsumedBySim { get; }
+        public Panel<T, double> InventoryLossBySim { get; }
+        public Panel<T, double> NetVolumeBySim { get; }
+        public Panel<T, double> PvByPeriodAndSim { get; }
+        public double[] PvBySim { get; }
+
+        public ForwardSimulationPanels(T[] periods, int numSims)
+        {
+            NumSims = numSims;
+            InventoryBySim = new Panel<T, double>(periods, numSims);
+            InjectWithdrawVolumeBySim = new Panel<T, double>(periods, numSims);
+            CmdtyConsumedBySim = new Panel<T, double>(periods, numSims);
+            InventoryLossBySim = new Panel<T, double>(periods, numSims);
+            NetVolumeBySim = new Panel<T, double>(periods, numSims);
+            PvByPeriodAndSim = new Panel<T, double>(periods, numSims);
+            PvBySim = new double[numSims];
+        }
+
+        public static ForwardSimulationPanels<T> Merge(IReadOnlyList<ForwardSimulationPanels<T>> batches, T[] periods)
+        {
+            var merged = new ForwardSimulationPanels<T>(periods, batches.Sum(batch => batch.NumSims));
+            int simOffset = 0;
+            foreach (ForwardSimulationPanels<T> batch in batches)
+            {
+                for (int periodIndex = 0; periodIndex < periods.Length; periodIndex++)
+                {
+                    CopyRow(batch.InventoryBySim, merged.InventoryBySim, periodIndex, simOffset);
+                    CopyRow(batch.InjectWithdrawVolumeBySim, merged.InjectWithdrawVolumeBySim, periodIndex, simOffset);
+                    CopyRow(batch.CmdtyConsumedBySim, merged.CmdtyConsumedBySim, periodIndex, simOffset);
+                    CopyRow(batch.InventoryLossBySim, merged.InventoryLossBySim, periodIndex, simOffset);
+                    CopyRow(batch.NetVolumeBySim, merged.NetVolumeBySim, periodIndex, simOffset);
+                    CopyRow(batch.PvByPeriodAndSim, merged.PvByPeriodAndSim, periodIndex, simOffset);
+                }
+                batch.PvBySim.CopyTo(merged.PvBySim, simOffset);
+                simOffset += batch.NumSims;
+            }
+            return merged;
+        }
+
+        private static void CopyRow(Panel<T, double> source, Panel<T, double> destination, int rowIndex, int simOffset)
+            => source[rowIndex].CopyTo(destination[rowIndex].Slice(simOffset));
+
+    }
+}
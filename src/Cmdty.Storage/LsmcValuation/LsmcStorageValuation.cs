@@ -83,9 +83,12 @@ public LsmcStorageValuationResults<T> Calculate<T>(LsmcValuationParameters<T> ls
                 return LsmcStorageValuationResults<T>.CreateEndPeriodResults(npv);
             }
 
+            // Array backed snapshot of the storage to avoid time series lookups and delegate calls within the loops below
+            ICmdtyStorage<T> storage = StorageHelper.CompileIfCmdtyStorage(lsmcParams.Storage);
+
             var basisFunctionList = lsmcParams.BasisFunctions.ToList();
 
-            TimeSeries<T, InventoryRange> inventorySpace = StorageHelper.CalculateInventorySpace(lsmcParams.Storage, lsmcParams.Inventory, lsmcParams.CurrentPeriod);
+            TimeSeries<T, InventoryRange> inventorySpace = StorageHelper.GetOrCalculateInventorySpace(storage, lsmcParams.Inventory, lsmcParams.CurrentPeriod);
             T startActiveStorage = inventorySpace.Start.Offset(-1);
 
             if (lsmcParams.ForwardCurve.Start.CompareTo(startActiveStorage) > 0)
@@ -105,13 +108,13 @@ public LsmcStorageValuationResults<T> Calculate<T>(LsmcValuationParameters<T> ls
             var inventorySpaceGrids = new double[numPeriods][];
 
             // Calculate NPVs at end period
-            (double endMinInventory, double endMaxInventory) = inventorySpace[lsmcParams.Storage.EndPeriod];
+            (double endMinInventory, double endMaxInventory) = inventorySpace[storage.EndPeriod];
             double[] endInventorySpaceGrid = lsmcParams.GridCalc.GetGridPoints(endMinInventory, endMaxInventory)
                                             .ToArray();
             inventorySpaceGrids[numPeriods - 1] = endInventorySpaceGrid;
 
             var storageActualValuesNextPeriod = new Vector<double>[endInventorySpaceGrid.Length];
-            ReadOnlySpan<double> endPeriodSimSpotPrices = regressionSpotSims.SpotPricesForPeriod(lsmcParams.Storage.EndPeriod).Span;
+            ReadOnlySpan<double> endPeriodSimSpotPrices = regressionSpotSims.SpotPricesForPeriod(storage.EndPeriod).Span;
 
             int numSims = regressionSpotSims.NumSims;
 
@@ -122,7 +125,7 @@ public LsmcStorageValuationResults<T> Calculate<T>(LsmcValuationParameters<T> ls
                 for (int simIndex = 0; simIndex < numSims; simIndex++)
                 {
                     double simSpotPrice = endPeriodSimSpotPrices[simIndex];
-                    storageValueBySim[simIndex] = lsmcParams.Storage.TerminalStorageNpv(simSpotPrice, inventory);
+                    storageValueBySim[simIndex] = storage.TerminalStorageNpv(simSpotPrice, inventory);
                 }
                 storageActualValuesNextPeriod[i] = storageValueBySim;
             }
@@ -143,6 +146,7 @@ public LsmcStorageValuationResults<T> Calculate<T>(LsmcValuationParameters<T> ls
             }
 
             Matrix<double> designMatrix = Matrix<double>.Build.Dense(numSims, basisFunctionList.Count);
+            var basisFunctionEvaluator = new BasisFunctionSetEvaluator(basisFunctionList);
             for (int i = 0; i < numSims; i++)
                 designMatrix[i, 0] = 1.0;
 
@@ -154,6 +158,8 @@ public LsmcStorageValuationResults<T> Calculate<T>(LsmcValuationParameters<T> ls
             T[] periodsForResultsTimeSeries = startActiveStorage.EnumerateTo(inventorySpace.End).ToArray();
 
             var regressCoeffsBuilder = new TimeSeries<T, Panel<int, double>>.Builder(periodsForResultsTimeSeries.Length - 1);
+            // Standardisation of orthogonal polynomial basis functions calculated from the regression sims, reused for the valuation sims
+            var regressStandardisations = new Dictionary<T, BasisFunctionStandardisation>();
 
             int backCounter = numPeriods - 2;
             Vector<double> numSimsMemoryBuffer = Vector<double>.Build.Dense(numSims); // Performance optimisation: heap memory that will be reused
@@ -161,6 +167,13 @@ public LsmcStorageValuationResults<T> Calculate<T>(LsmcValuationParameters<T> ls
             double backStepProgressPcnt = BackwardPcntTime / (periodsForResultsTimeSeries.Length - 1);
 
             double[] currentPeriodContinuationValues = null;
+            // Buffers for the per inventory decision calculations, sized for the largest possible decision set
+            int maxNumDecisions = lsmcParams.ExtraDecisions * 2 + 3;
+            var backwardInjectWithdrawCostNpvs = new double[maxNumDecisions];
+            var backwardCmdtyUsedForInjectWithdrawVolumes = new double[maxNumDecisions];
+            var backwardDecisionNpvsRegress = new double[maxNumDecisions];
+            var regressionContinuationValueByDecisionSet = new Vector<double>[maxNumDecisions];
+            var actualContinuationValueByDecisionSet = new Vector<double>[maxNumDecisions];
             _logger?.LogInformation("Starting backward induction.");
             stopwatches.BackwardInduction.Start();
             foreach (T period in periodsForResultsTimeSeries.Reverse().Skip(1))
@@ -182,7 +195,7 @@ public LsmcStorageValuationResults<T> Calculate<T>(LsmcValuationParameters<T> ls
                 }
                 else
                 {
-                    PopulateDesignMatrix(designMatrix, period, regressionSpotSims, basisFunctionList);
+                    regressStandardisations[period] = PopulateDesignMatrix(designMatrix, period, regressionSpotSims, basisFunctionEvaluator);
                     stopwatches.PseudoInverse.Start();
                     QR<double> designMatrixQr = designMatrix.QR(QRMethod.Thin);
                     Matrix<double> rInverse = designMatrixQr.R.Inverse();
@@ -191,6 +204,7 @@ public LsmcStorageValuationResults<T> Calculate<T>(LsmcValuationParameters<T> ls
                     stopwatches.PseudoInverse.Stop();
 
                     var thisPeriodRegressCoeffs = new Panel<int, double>(Enumerable.Range(0, nextPeriodInventorySpaceGrid.Length), basisFunctionList.Count);
+                    stopwatches.NumRegressionsSolved += nextPeriodInventorySpaceGrid.Length;
                     // TODO doing the regressions for all next inventory could be inefficient as they might not all be needed
                     for (int i = 0; i < nextPeriodInventorySpaceGrid.Length; i++)
                     {
@@ -231,30 +245,32 @@ public LsmcStorageValuationResults<T> Calculate<T>(LsmcValuationParameters<T> ls
                 else
                     simulatedPrices = regressionSpotSims.SpotPricesForPeriod(period).Span;
 
+                double inventoryPercentLoss = storage.CmdtyInventoryPercentLoss(period);
                 for (int inventoryIndex = 0; inventoryIndex < inventorySpaceGrid.Length; inventoryIndex++)
                 {
                     double inventory = inventorySpaceGrid[inventoryIndex];
-                    InjectWithdrawRange injectWithdrawRange = lsmcParams.Storage.GetInjectWithdrawRange(period, inventory);
-                    double inventoryLoss = lsmcParams.Storage.CmdtyInventoryPercentLoss(period) * inventory;
+                    InjectWithdrawRange injectWithdrawRange = storage.GetInjectWithdrawRange(period, inventory);
+                    double inventoryLoss = inventoryPercentLoss * inventory;
                     double[] decisionSet = StorageHelper.CalculateBangBangDecisionSet(injectWithdrawRange, inventory, inventoryLoss,
                         nextStepInventorySpaceMin, nextStepInventorySpaceMax, lsmcParams.NumericalTolerance, lsmcParams.ExtraDecisions);
-                    IReadOnlyList<DomesticCashFlow> inventoryCostCashFlows = lsmcParams.Storage.CmdtyInventoryCost(period, inventory);
+                    IReadOnlyList<DomesticCashFlow> inventoryCostCashFlows = storage.CmdtyInventoryCost(period, inventory);
                     double inventoryCostNpv = inventoryCostCashFlows.Sum(cashFlow => cashFlow.Amount * DiscountToCurrentDay(cashFlow.Date));
 
-                    double[] injectWithdrawCostNpvs = new double[decisionSet.Length];
-                    double[] cmdtyUsedForInjectWithdrawVolume = new double[decisionSet.Length];
-                    
-                    var regressionContinuationValueByDecisionSet = new Vector<double>[decisionSet.Length];
-                    var actualContinuationValueByDecisionSet = new Vector<double>[decisionSet.Length];
+                    Span<double> injectWithdrawCostNpvs = backwardInjectWithdrawCostNpvs.AsSpan(0, decisionSet.Length);
+                    Span<double> cmdtyUsedForInjectWithdrawVolume = backwardCmdtyUsedForInjectWithdrawVolumes.AsSpan(0, decisionSet.Length);
+                    // Clear continuation values of the previous inventory, so a decision with none found fails rather than reusing them
+                    Array.Clear(regressionContinuationValueByDecisionSet, 0, decisionSet.Length);
+                    Array.Clear(actualContinuationValueByDecisionSet, 0, decisionSet.Length);
+
                     for (int decisionIndex = 0; decisionIndex < decisionSet.Length; decisionIndex++)
                     {
                         double decisionVolume = decisionSet[decisionIndex];
 
                         // Inject/Withdraw cost (same for all price sims)
-                        injectWithdrawCostNpvs[decisionIndex] = InjectWithdrawCostNpv(lsmcParams.Storage, decisionVolume, period, inventory, DiscountToCurrentDay);
+                        injectWithdrawCostNpvs[decisionIndex] = InjectWithdrawCostNpv(storage, decisionVolume, period, inventory, DiscountToCurrentDay);
 
                         // Cmdty Used For Inject/Withdraw (same for all price sims)
-                        cmdtyUsedForInjectWithdrawVolume[decisionIndex] = CmdtyVolumeConsumedOnDecision(lsmcParams.Storage, decisionVolume, period, inventory);
+                        cmdtyUsedForInjectWithdrawVolume[decisionIndex] = CmdtyVolumeConsumedOnDecision(storage, decisionVolume, period, inventory);
 
                         // Calculate continuation values
                         double inventoryAfterDecision = inventory + decisionVolume - inventoryLoss;
@@ -300,7 +316,8 @@ public LsmcStorageValuationResults<T> Calculate<T>(LsmcValuationParameters<T> ls
                     }
 
                     var storageValuesBySim = new DenseVector(numSims);
-                    var decisionNpvsRegress = new double[decisionSet.Length];
+                    Span<double> decisionNpvsRegress = backwardDecisionNpvsRegress.AsSpan(0, decisionSet.Length);
+                    stopwatches.NumDecisionsEvaluated += (long)decisionSet.Length * numSims;
                     for (int simIndex = 0; simIndex < numSims; simIndex++)
                     {
                         double simulatedSpotPrice = simulatedPrices[simIndex];
@@ -341,158 +358,303 @@ public LsmcStorageValuationResults<T> Calculate<T>(LsmcValuationParameters<T> ls
             stopwatches.BackwardInduction.Stop();
             _logger?.LogInformation("Completed backward induction.");
 
-            _logger?.LogInformation("Starting valuation spot price simulation.");
-            stopwatches.ValuationPriceSimulation.Start();
-            ISpotSimResults<T> valuationSpotSims = lsmcParams.ValuationSpotSimsGenerator();
-            stopwatches.ValuationPriceSimulation.Stop();
-            _logger?.LogInformation("Valuation spot price simulation complete.");
-
             TimeSeries<T, Panel<int, double>> regressCoeffs = regressCoeffsBuilder.Build();
-            var inventoryBySim = new Panel<T, double>(periodsForResultsTimeSeries, numSims);
-            var injectWithdrawVolumeBySim = new Panel<T, double>(periodsForResultsTimeSeries, numSims);
-            var cmdtyConsumedBySim = new Panel<T, double>(periodsForResultsTimeSeries, numSims);
-            var inventoryLossBySim = new Panel<T, double>(periodsForResultsTimeSeries, numSims);
-            var netVolumeBySim = new Panel<T, double>(periodsForResultsTimeSeries, numSims);
-            var pvByPeriodAndSim = new Panel<T, double>(periodsForResultsTimeSeries, numSims);
-            var storageProfiles = new StorageProfile[periodsForResultsTimeSeries.Length];
-            var pvBySim = new double[numSims];
-
-            var deltas = new double[periodsForResultsTimeSeries.Length];
-
-            var startingInventories = inventoryBySim[0];
-            for (int i = 0; i < numSims; i++)
-                startingInventories[i] = lsmcParams.Inventory;
+            int numForwardPeriods = periodsForResultsTimeSeries.Length - 1; // TODO more clearly handle this -1
 
-            // Trigger price variables
-            int numTriggerPriceVolumes = 10; // TODO move to parameters?
-            var triggerVolumeProfilesArray = new TriggerPriceVolumeProfiles[periodsForResultsTimeSeries.Length - 1];
-            var triggerPricesArray = new TriggerPrices[periodsForResultsTimeSeries.Length - 1];
+            // Sums over all valuation sims of regressed continuation values, used for trigger prices
+            var sumContinuationValues = new double[numForwardPeriods][];
+            for (int periodIndex = 0; periodIndex < numForwardPeriods; periodIndex++)
+                sumContinuationValues[periodIndex] = new double[inventorySpaceGrids[periodIndex + 1].Length];
 
             double forwardStepProgressPcnt = (1.0 - BackwardPcntTime) / periodsForResultsTimeSeries.Length;
-            _logger?.LogInformation("Starting calculations of optimal decisions by simulation forward in time.");
-            stopwatches.ForwardSimulation.Start();
-            for (int periodIndex = 0; periodIndex < periodsForResultsTimeSeries.Length - 1; periodIndex++) // TODO more clearly handle this -1
-            {
-                T period = periodsForResultsTimeSeries[periodIndex];
-                Span<double> nextPeriodInventories = inventoryBySim[periodIndex + 1];
 
-                double[] nextPeriodInventorySpaceGrid = inventorySpaceGrids[periodIndex + 1];
-                //Vector<double>[] regressContinuationValues = storageRegressValuesByPeriod[periodIndex + 1];
-                Vector<double>[] regressContinuationValues = new Vector<double>[nextPeriodInventorySpaceGrid.Length];
-                if (period.Equals(lsmcParams.CurrentPeriod))
+            ForwardSimulationPanels<T> SimulateDecisions(ISpotSimResults<T> batchSpotSims, bool reportProgress)
+            {
+                int batchNumSims = batchSpotSims.NumSims;
+                var batch = new ForwardSimulationPanels<T>(periodsForResultsTimeSeries, batchNumSims);
+                Matrix<double> batchDesignMatrix = batchNumSims == numSims ? designMatrix :
+                    Matrix<double>.Build.Dense(batchNumSims, basisFunctionList.Count);
+
+                Span<double> startingInventories = batch.InventoryBySim[0];
+                for (int i = 0; i < batchNumSims; i++)
+                    startingInventories[i] = lsmcParams.Inventory;
+                var injectWithdrawRanges = new InjectWithdrawRange[batchNumSims];
+                var inventoryCostNpvs = new double[batchNumSims];
+                // Buffers for the per sim decision calculations, sized for the largest possible decision set
+                var decisionInventories = new double[maxNumDecisions];
+                var injectWithdrawCostNpvs = new double[maxNumDecisions];
+                var cmdtyUsedForInjectWithdrawVolumesBuffer = new double[maxNumDecisions];
+                var decisionNpvsRegressBuffer = new double[maxNumDecisions];
+                var immediatePvBuffer = new double[maxNumDecisions];
+                Func<Day, double> discountToCurrentDay = DiscountToCurrentDay;
+
+                for (int periodIndex = 0; periodIndex < numForwardPeriods; periodIndex++)
                 {
-                    // Current period, for which the price isn't random so expected storage values are just the average of the values for all sims
+                    T period = periodsForResultsTimeSeries[periodIndex];
+                    Span<double> nextPeriodInventories = batch.InventoryBySim[periodIndex + 1];
+
+                    double[] nextPeriodInventorySpaceGrid = inventorySpaceGrids[periodIndex + 1];
+                    //Vector<double>[] regressContinuationValues = storageRegressValuesByPeriod[periodIndex + 1];
+                    Vector<double>[] regressContinuationValues = new Vector<double>[nextPeriodInventorySpaceGrid.Length];
+                    if (period.Equals(lsmcParams.CurrentPeriod))
+                    {
+                        // Current period, for which the price isn't random so expected storage values are just the average of the values for all sims
+                        for (int i = 0; i < nextPeriodInventorySpaceGrid.Length; i++)
+                        {
+                            double expectedStorageValueNextPeriod = currentPeriodContinuationValues[i];
+                            regressContinuationValues[i] = Vector<double>.Build.Dense(batchNumSims, expectedStorageValueNextPeriod); // TODO this is a bit inefficent, review
+                        }
+                    }
+                    else
+                    {
+                        PopulateDesignMatrix(batchDesignMatrix, period, batchSpotSims, basisFunctionEvaluator, 
+                                                regressStandardisations[period]);
+                        Panel<int, double> regressCoeffsThisPeriod = regressCoeffs[period];
+                        for (int i = 0; i < nextPeriodInventorySpaceGrid.Length; i++)
+                        {
+                            // TODO add own MKL wrapping to do matrix multiplication on Span<double>
+                            Span<double> regressCoeffsSpan = regressCoeffsThisPeriod[i];
+                            var regressCoeffsVector = Vector<double>.Build.DenseOfArray(regressCoeffsSpan.ToArray());
+                            regressContinuationValues[i] = batchDesignMatrix * regressCoeffsVector;
+                        }
+                    }
+
+                    double[] thisPeriodSumContinuationValues = sumContinuationValues[periodIndex];
                     for (int i = 0; i < nextPeriodInventorySpaceGrid.Length; i++)
+                        thisPeriodSumContinuationValues[i] += regressContinuationValues[i].Sum();
+
+                    Day cmdtySettlementDate = lsmcParams.SettleDateRule(period);
+                    double discountFactorFromCmdtySettlement = DiscountToCurrentDay(cmdtySettlementDate);
+
+                    ReadOnlySpan<double> simulatedPrices;
+                    if (period.Equals(lsmcParams.CurrentPeriod))
                     {
-                        double expectedStorageValueNextPeriod = currentPeriodContinuationValues[i];
-                        regressContinuationValues[i] = Vector<double>.Build.Dense(numSims, expectedStorageValueNextPeriod); // TODO this is a bit inefficent, review
+                        double spotPrice = lsmcParams.ForwardCurve[period];
+                        simulatedPrices = Enumerable.Repeat(spotPrice, batchNumSims).ToArray(); // TODO inefficient - review, and share code with backward induction
                     }
+                    else
+                        simulatedPrices = batchSpotSims.SpotPricesForPeriod(period).Span;
+
+                    (double nextStepInventorySpaceMin, double nextStepInventorySpaceMax) = inventorySpace[period.Offset(1)];
+                    Span<double> thisPeriodInventories = batch.InventoryBySim[periodIndex];
+                    Span<double> thisPeriodInjectWithdrawVolumes = batch.InjectWithdrawVolumeBySim[periodIndex];
+                    Span<double> thisPeriodCmdtyConsumed = batch.CmdtyConsumedBySim[periodIndex];
+                    Span<double> thisPeriodInventoryLoss = batch.InventoryLossBySim[periodIndex];
+                    Span<double> thisPeriodNetVolume = batch.NetVolumeBySim[periodIndex];
+                    Span<double> thisPeriodPv = batch.PvByPeriodAndSim[periodIndex];
+                    storage.GetInjectWithdrawRange(period, thisPeriodInventories, injectWithdrawRanges);
+                    storage.CmdtyInventoryCostNpvs(period, thisPeriodInventories, discountToCurrentDay, inventoryCostNpvs);
+                    double inventoryPercentLoss = storage.CmdtyInventoryPercentLoss(period);
+
+                    for (int simIndex = 0; simIndex < batchNumSims; simIndex++)
+                    {
+                        double simulatedSpotPrice = simulatedPrices[simIndex];
+                        double inventory = thisPeriodInventories[simIndex];
+
+                        InjectWithdrawRange injectWithdrawRange = injectWithdrawRanges[simIndex];
+                        double inventoryLoss = inventoryPercentLoss * inventory;
+                        double[] decisionSet = StorageHelper.CalculateBangBangDecisionSet(injectWithdrawRange, inventory,
+                            inventoryLoss, nextStepInventorySpaceMin, nextStepInventorySpaceMax, lsmcParams.NumericalTolerance, lsmcParams.ExtraDecisions);
+                        double inventoryCostNpv = inventoryCostNpvs[simIndex];
+
+                        Span<double> decisionNpvsRegress = decisionNpvsRegressBuffer.AsSpan(0, decisionSet.Length);
+                        Span<double> cmdtyUsedForInjectWithdrawVolumes = cmdtyUsedForInjectWithdrawVolumesBuffer.AsSpan(0, decisionSet.Length);
+                        stopwatches.NumDecisionsEvaluated += decisionSet.Length;
+                        Span<double> immediatePv = immediatePvBuffer.AsSpan(0, decisionSet.Length);
+
+                        Span<double> thisSimDecisionInventories = decisionInventories.AsSpan(0, decisionSet.Length);
+                        thisSimDecisionInventories.Fill(inventory);
+                        Span<double> thisSimInjectWithdrawCostNpvs = injectWithdrawCostNpvs.AsSpan(0, decisionSet.Length);
+                        storage.InjectWithdrawCostNpvs(period, thisSimDecisionInventories, decisionSet, discountToCurrentDay, thisSimInjectWithdrawCostNpvs);
+                        storage.CmdtyVolumesConsumedOnInjectWithdraw(period, thisSimDecisionInventories, decisionSet, cmdtyUsedForInjectWithdrawVolumes);
+
+                        for (var decisionIndex = 0; decisionIndex < decisionSet.Length; decisionIndex++)
+                        {
+                            double decisionVolume = decisionSet[decisionIndex];
+                            double inventoryAfterDecision = inventory + decisionVolume - inventoryLoss;
+
+                            double cmdtyUsedForInjectWithdrawVolume = cmdtyUsedForInjectWithdrawVolumes[decisionIndex];
+
+                            double injectWithdrawNpv = -decisionVolume * simulatedSpotPrice * discountFactorFromCmdtySettlement;
+                            double cmdtyUsedForInjectWithdrawNpv = -cmdtyUsedForInjectWithdrawVolume * simulatedSpotPrice * discountFactorFromCmdtySettlement;
+
+                            double injectWithdrawCostNpv = thisSimInjectWithdrawCostNpvs[decisionIndex];
+
+                            double immediateNpv = injectWithdrawNpv - injectWithdrawCostNpv + cmdtyUsedForInjectWithdrawNpv - inventoryCostNpv; // TODO IMPORTANT check if inventoryCostNpv should be subtracted
+
+                            double continuationValue =
+                                InterpolateContinuationValue(inventoryAfterDecision, nextPeriodInventorySpaceGrid, regressContinuationValues, simIndex, lsmcParams.NumericalTolerance);
+
+                            double totalNpv = immediateNpv + continuationValue;
+                            decisionNpvsRegress[decisionIndex] = totalNpv;
+                            immediatePv[decisionIndex] = immediateNpv;
+                        }
+                        (double _, int indexOfOptimalDecision) = StorageHelper.MaxValueAndIndex(decisionNpvsRegress);
+                        double optimalDecisionVolume = decisionSet[indexOfOptimalDecision];
+                        double optimalNextStepInventory = inventory + optimalDecisionVolume - inventoryLoss;
+                        nextPeriodInventories[simIndex] = optimalNextStepInventory;
+
+                        double optimalCmdtyUsedForInjectWithdrawVolume = cmdtyUsedForInjectWithdrawVolumes[indexOfOptimalDecision];
+
+                        thisPeriodInjectWithdrawVolumes[simIndex] = optimalDecisionVolume;
+                        thisPeriodCmdtyConsumed[simIndex] = optimalCmdtyUsedForInjectWithdrawVolume;
+                        thisPeriodInventoryLoss[simIndex] = inventoryLoss;
+                        thisPeriodNetVolume[simIndex] = -optimalDecisionVolume - optimalCmdtyUsedForInjectWithdrawVolume;
+                        double optimalImmediatePv = immediatePv[indexOfOptimalDecision];
+                        thisPeriodPv[simIndex] = optimalImmediatePv;
+                        batch.PvBySim[simIndex] += optimalImmediatePv;
+                    }
+
+                    if (reportProgress)
+                    {
+                        progress += forwardStepProgressPcnt;
+                        lsmcParams.OnProgressUpdate?.Invoke(progress);
+                    }
+                    lsmcParams.CancellationToken.ThrowIfCancellationRequested();
                 }
-                else
+
+                // Pv on final period
+                if (!storage.MustBeEmptyAtEnd)
                 {
-                    PopulateDesignMatrix(designMatrix, period, valuationSpotSims, basisFunctionList);
-                    Panel<int, double> regressCoeffsThisPeriod = regressCoeffs[period];
-                    for (int i = 0; i < nextPeriodInventorySpaceGrid.Length; i++)
+                    ReadOnlySpan<double> storageEndPeriodSpotPrices = batchSpotSims.SpotPricesForPeriod(storage.EndPeriod).Span;
+                    Span<double> storageEndInventory = batch.InventoryBySim[storage.EndPeriod];
+                    Span<double> storageEndPv = batch.PvByPeriodAndSim[periodsForResultsTimeSeries.Length - 1];
+                    for (int simIndex = 0; simIndex < batchNumSims; simIndex++)
                     {
-                        // TODO add own MKL wrapping to do matrix multiplication on Span<double>
-                        Span<double> regressCoeffsSpan = regressCoeffsThisPeriod[i];
-                        var regressCoeffsVector = Vector<double>.Build.DenseOfArray(regressCoeffsSpan.ToArray());
-                        regressContinuationValues[i] = designMatrix * regressCoeffsVector;
+                        double inventory = storageEndInventory[simIndex];
+                        double spotPrice = storageEndPeriodSpotPrices[simIndex];
+                        double terminalPv = storage.TerminalStorageNpv(spotPrice, inventory);
+                        storageEndPv[simIndex] = terminalPv;
+                        batch.PvBySim[simIndex] += terminalPv;
                     }
                 }
+                return batch;
+            }
+
+            // Forward simulation is run on batches of valuation sims, all using the same decision policy from the regressions,
+            // until the target standard error is reached. Without a target this is just one batch.
+            var valuationSpotSimsBatches = new List<ISpotSimResults<T>>();
+            var forwardSimBatches = new List<ForwardSimulationPanels<T>>();
+            int numValuationSims = 0;
+            // Running sums of PV across batches, shifted by the first PV to limit cancellation when calculating the variance
+            double pvShift = double.NaN;
+            double sumShiftedPv = 0.0;
+            double sumShiftedPvSquared = 0.0;
+            while (true)
+            {
+                _logger?.LogInformation("Starting valuation spot price simulation.");
+                stopwatches.ValuationPriceSimulation.Start();
+                ISpotSimResults<T> batchSpotSims = lsmcParams.ValuationSpotSimsGenerator();
+                stopwatches.ValuationPriceSimulation.Stop();
+                _logger?.LogInformation("Valuation spot price simulation complete.");
+
+                _logger?.LogInformation("Starting calculations of optimal decisions by simulation forward in time.");
+                stopwatches.ForwardSimulation.Start();
+                forwardSimBatches.Add(SimulateDecisions(batchSpotSims, valuationSpotSimsBatches.Count == 0));
+                stopwatches.ForwardSimulation.Stop();
+                valuationSpotSimsBatches.Add(batchSpotSims);
+                numValuationSims += batchSpotSims.NumSims;
+
+                if (lsmcParams.TargetNpvStandardError == null)
+                    break;
+                double[] batchPvBySim = forwardSimBatches[forwardSimBatches.Count - 1].PvBySim;
+                if (double.IsNaN(pvShift))
+                    pvShift = batchPvBySim[0];
+                // ReSharper disable once ForCanBeConvertedToForeach
+                for (int simIndex = 0; simIndex < batchPvBySim.Length; simIndex++)
+                {
+                    double shiftedPv = batchPvBySim[simIndex] - pvShift;
+                    sumShiftedPv += shiftedPv;
+                    sumShiftedPvSquared += shiftedPv * shiftedPv;
+                }
+                double batchesNpvStandardError = StandardError(numValuationSims, sumShiftedPv, sumShiftedPvSquared);
+                _logger?.LogInformation($"Forward Pv standard error after {numValuationSims} sims: " +
+                                        batchesNpvStandardError.ToString("N", CultureInfo.InvariantCulture));
+                if (batchesNpvStandardError <= lsmcParams.TargetNpvStandardError.Value)
+                    break;
+                // ReSharper disable once PossibleInvalidOperationException
+                if (numValuationSims >= lsmcParams.MaxValuationSims.Value)
+                {
+                    _logger?.LogWarning($"Maximum number of valuation sims {lsmcParams.MaxValuationSims} reached before target standard error.");
+                    break;
+                }
+            }
+
+            ISpotSimResults<T> valuationSpotSims = valuationSpotSimsBatches.Count == 1 ? valuationSpotSimsBatches[0]
+                                                        : ParallelSpotSimulator<T>.Merge(valuationSpotSimsBatches);
+            ForwardSimulationPanels<T> forwardSims = forwardSimBatches.Count == 1 ? forwardSimBatches[0]
+                                                        : ForwardSimulationPanels<T>.Merge(forwardSimBatches, periodsForResultsTimeSeries);
 
+            var storageProfiles = new StorageProfile[periodsForResultsTimeSeries.Length];
+            var deltas = new double[periodsForResultsTimeSeries.Length];
+            var deltaStandardErrors = new double[periodsForResultsTimeSeries.Length];
+            var spotPriceTimesVolumeBySim = new double[numValuationSims];
+
+            // Control variate is the payoff of the static policy, less its expectation, so has expected value of zero
+            TimeSeries<T, double> controlVariateNetVolumes = lsmcParams.ControlVariateNetVolumes;
+            bool useControlVariate = controlVariateNetVolumes != null;
+            double[] controlVariateBySim = useControlVariate ? new double[numValuationSims] : null;
+            double[] controlVariateDeltas = useControlVariate ? new double[periodsForResultsTimeSeries.Length] : null;
+
+            // Trigger price variables
+            int numTriggerPriceVolumes = 10; // TODO move to parameters?
+            var triggerVolumeProfilesArray = new TriggerPriceVolumeProfiles[numForwardPeriods];
+            var triggerPricesArray = new TriggerPrices[numForwardPeriods];
+
+            for (int periodIndex = 0; periodIndex < numForwardPeriods; periodIndex++)
+            {
+                T period = periodsForResultsTimeSeries[periodIndex];
                 Day cmdtySettlementDate = lsmcParams.SettleDateRule(period);
                 double discountFactorFromCmdtySettlement = DiscountToCurrentDay(cmdtySettlementDate);
                 double discountForDeltas = lsmcParams.DiscountDeltas ? discountFactorFromCmdtySettlement : 1.0;
-                double sumSpotPriceTimesVolume = 0.0;
 
                 ReadOnlySpan<double> simulatedPrices;
                 if (period.Equals(lsmcParams.CurrentPeriod))
                 {
                     double spotPrice = lsmcParams.ForwardCurve[period];
-                    simulatedPrices = Enumerable.Repeat(spotPrice, numSims).ToArray(); // TODO inefficient - review, and share code with backward induction
+                    simulatedPrices = Enumerable.Repeat(spotPrice, numValuationSims).ToArray(); // TODO inefficient - review, and share code with backward induction
                 }
                 else
                     simulatedPrices = valuationSpotSims.SpotPricesForPeriod(period).Span;
-                
-                (double nextStepInventorySpaceMin, double nextStepInventorySpaceMax) = inventorySpace[period.Offset(1)];
-                Span<double> thisPeriodInventories = inventoryBySim[periodIndex];
-                Span<double> thisPeriodInjectWithdrawVolumes = injectWithdrawVolumeBySim[periodIndex];
-                Span<double> thisPeriodCmdtyConsumed = cmdtyConsumedBySim[periodIndex];
-                Span<double> thisPeriodInventoryLoss = inventoryLossBySim[periodIndex];
-                Span<double> thisPeriodNetVolume = netVolumeBySim[periodIndex];
-                Span<double> thisPeriodPv = pvByPeriodAndSim[periodIndex];
 
-                for (int simIndex = 0; simIndex < numSims; simIndex++)
+                Span<double> thisPeriodInventories = forwardSims.InventoryBySim[periodIndex];
+                Span<double> thisPeriodNetVolume = forwardSims.NetVolumeBySim[periodIndex];
+                double sumSpotPriceTimesVolume = 0.0;
+                for (int simIndex = 0; simIndex < numValuationSims; simIndex++)
                 {
-                    double simulatedSpotPrice = simulatedPrices[simIndex];
-                    double inventory = thisPeriodInventories[simIndex];
-
-                    InjectWithdrawRange injectWithdrawRange = lsmcParams.Storage.GetInjectWithdrawRange(period, inventory);
-                    double inventoryLoss = lsmcParams.Storage.CmdtyInventoryPercentLoss(period) * inventory;
-                    double[] decisionSet = StorageHelper.CalculateBangBangDecisionSet(injectWithdrawRange, inventory,
-                        inventoryLoss, nextStepInventorySpaceMin, nextStepInventorySpaceMax, lsmcParams.NumericalTolerance, lsmcParams.ExtraDecisions);
-                    IReadOnlyList<DomesticCashFlow> inventoryCostCashFlows = lsmcParams.Storage.CmdtyInventoryCost(period, inventory);
-                    double inventoryCostNpv = inventoryCostCashFlows.Sum(cashFlow => cashFlow.Amount * DiscountToCurrentDay(cashFlow.Date));
-
-                    var decisionNpvsRegress = new double[decisionSet.Length];
-                    var cmdtyUsedForInjectWithdrawVolumes = new double[decisionSet.Length];
-                    var immediatePv = new double[decisionSet.Length];
-
-                    for (var decisionIndex = 0; decisionIndex < decisionSet.Length; decisionIndex++)
-                    {
-                        double decisionVolume = decisionSet[decisionIndex];
-                        double inventoryAfterDecision = inventory + decisionVolume - inventoryLoss;
-
-                        double cmdtyUsedForInjectWithdrawVolume = CmdtyVolumeConsumedOnDecision(lsmcParams.Storage, decisionVolume, period, inventory);
-
-                        double injectWithdrawNpv = -decisionVolume * simulatedSpotPrice * discountFactorFromCmdtySettlement;
-                        double cmdtyUsedForInjectWithdrawNpv = -cmdtyUsedForInjectWithdrawVolume * simulatedSpotPrice * discountFactorFromCmdtySettlement;
-
-                        double injectWithdrawCostNpv = InjectWithdrawCostNpv(lsmcParams.Storage, decisionVolume, period, inventory, DiscountToCurrentDay);
-
-                        double immediateNpv = injectWithdrawNpv - injectWithdrawCostNpv + cmdtyUsedForInjectWithdrawNpv - inventoryCostNpv; // TODO IMPORTANT check if inventoryCostNpv should be subtracted
-
-                        double continuationValue =
-                            InterpolateContinuationValue(inventoryAfterDecision, nextPeriodInventorySpaceGrid, regressContinuationValues, simIndex, lsmcParams.NumericalTolerance);
-
-                        double totalNpv = immediateNpv + continuationValue; 
-                        decisionNpvsRegress[decisionIndex] = totalNpv;
-                        cmdtyUsedForInjectWithdrawVolumes[decisionIndex] = cmdtyUsedForInjectWithdrawVolume;
-                        immediatePv[decisionIndex] = immediateNpv;
-                    }
-                    (double _, int indexOfOptimalDecision) = StorageHelper.MaxValueAndIndex(decisionNpvsRegress);
-                    double optimalDecisionVolume = decisionSet[indexOfOptimalDecision];
-                    double optimalNextStepInventory = inventory + optimalDecisionVolume - inventoryLoss;
-                    nextPeriodInventories[simIndex] = optimalNextStepInventory;
-
-                    double optimalCmdtyUsedForInjectWithdrawVolume = cmdtyUsedForInjectWithdrawVolumes[indexOfOptimalDecision];
-
-                    sumSpotPriceTimesVolume += -(optimalDecisionVolume + optimalCmdtyUsedForInjectWithdrawVolume) * simulatedSpotPrice;
-
-                    thisPeriodInjectWithdrawVolumes[simIndex] = optimalDecisionVolume;
-                    thisPeriodCmdtyConsumed[simIndex] = optimalCmdtyUsedForInjectWithdrawVolume;
-                    thisPeriodInventoryLoss[simIndex] = inventoryLoss;
-                    thisPeriodNetVolume[simIndex] = -optimalDecisionVolume - optimalCmdtyUsedForInjectWithdrawVolume;
-                    double optimalImmediatePv = immediatePv[indexOfOptimalDecision];
-                    thisPeriodPv[simIndex] = optimalImmediatePv;
-                    pvBySim[simIndex] += optimalImmediatePv;
+                    double spotPriceTimesVolume = thisPeriodNetVolume[simIndex] * simulatedPrices[simIndex];
+                    spotPriceTimesVolumeBySim[simIndex] = spotPriceTimesVolume;
+                    sumSpotPriceTimesVolume += spotPriceTimesVolume;
                 }
 
                 double expectedInventory = Average(thisPeriodInventories);
-                storageProfiles[periodIndex] = new StorageProfile(expectedInventory, Average(thisPeriodInjectWithdrawVolumes),
-                    Average(thisPeriodCmdtyConsumed), Average(thisPeriodInventoryLoss), Average(thisPeriodNetVolume), Average(thisPeriodPv));
+                storageProfiles[periodIndex] = new StorageProfile(expectedInventory, Average(forwardSims.InjectWithdrawVolumeBySim[periodIndex]),
+                    Average(forwardSims.CmdtyConsumedBySim[periodIndex]), Average(forwardSims.InventoryLossBySim[periodIndex]),
+                    Average(thisPeriodNetVolume), Average(forwardSims.PvByPeriodAndSim[periodIndex]));
                 double forwardPrice = lsmcParams.ForwardCurve[period];
-                double periodDelta = (sumSpotPriceTimesVolume / forwardPrice / numSims) * discountForDeltas;
+                double periodDelta = (sumSpotPriceTimesVolume / forwardPrice / numValuationSims) * discountForDeltas;
                 deltas[periodIndex] = periodDelta;
-                progress += forwardStepProgressPcnt;
-                lsmcParams.OnProgressUpdate?.Invoke(progress);
-                lsmcParams.CancellationToken.ThrowIfCancellationRequested();
+                deltaStandardErrors[periodIndex] = StandardError(spotPriceTimesVolumeBySim) / forwardPrice * discountForDeltas;
+                if (useControlVariate)
+                {
+                    if (!controlVariateNetVolumes.TryGetValue(period, out double controlVariateNetVolume))
+                        controlVariateNetVolume = 0.0;
+                    double controlVariateWeight = controlVariateNetVolume * discountFactorFromCmdtySettlement;
+                    for (int simIndex = 0; simIndex < numValuationSims; simIndex++)
+                        controlVariateBySim[simIndex] += controlVariateWeight * (simulatedPrices[simIndex] - forwardPrice);
+                    (double expectedSpotPriceTimesVolume, double _) = ControlVariate.Estimate(spotPriceTimesVolumeBySim, simulatedPrices, forwardPrice);
+                    controlVariateDeltas[periodIndex] = expectedSpotPriceTimesVolume / forwardPrice * discountForDeltas;
+                }
 
                 #region Trigger Price Calculation
 
-                double expectedInventoryInventoryLoss = lsmcParams.Storage.CmdtyInventoryPercentLoss(period) * expectedInventory;
-                InjectWithdrawRange expectedInventoryInjectWithdrawRange = lsmcParams.Storage.GetInjectWithdrawRange(period, expectedInventory);
+                double[] expectedContinuationValues = sumContinuationValues[periodIndex];
+                for (int i = 0; i < expectedContinuationValues.Length; i++)
+                    expectedContinuationValues[i] /= numValuationSims;
+
+                (double nextStepInventorySpaceMin, double nextStepInventorySpaceMax) = inventorySpace[period.Offset(1)];
+                double expectedInventoryInventoryLoss = storage.CmdtyInventoryPercentLoss(period) * expectedInventory;
+                InjectWithdrawRange expectedInventoryInjectWithdrawRange = storage.GetInjectWithdrawRange(period, expectedInventory);
                 double[] triggerPriceDecisionSet = StorageHelper.CalculateBangBangDecisionSet(expectedInventoryInjectWithdrawRange, expectedInventory,
                     expectedInventoryInventoryLoss, nextStepInventorySpaceMin, nextStepInventorySpaceMax, lsmcParams.NumericalTolerance, lsmcParams.ExtraDecisions);
                 double[] inventoryGridNexPeriod = inventorySpaceGrids[periodIndex + 1];
@@ -510,14 +672,14 @@ public LsmcStorageValuationResults<T> Calculate<T>(LsmcValuationParameters<T> ls
                     if (triggerPriceMaxInjectVolume > alternativeVolume)
                     {
                         (double alternativeContinuationValue, double alternativeDecisionCost, double alternativeCmdtyConsumed) =
-                            CalcAlternatives(lsmcParams.Storage, expectedInventory, alternativeVolume, expectedInventoryInventoryLoss, inventoryGridNexPeriod, 
-                                regressContinuationValues, period, DiscountToCurrentDay, lsmcParams.NumericalTolerance);
+                            CalcAlternatives(storage, expectedInventory, alternativeVolume, expectedInventoryInventoryLoss, inventoryGridNexPeriod,
+                                expectedContinuationValues, period, DiscountToCurrentDay, lsmcParams.NumericalTolerance);
                         double[] triggerPriceVolumes = CalcInjectTriggerPriceVolumes<T>(triggerPriceMaxInjectVolume, alternativeVolume, numTriggerPriceVolumes);
 
                         foreach (double triggerVolume in triggerPriceVolumes)
                         {
-                            double injectTriggerPrice = CalcTriggerPrice(lsmcParams.Storage, expectedInventory, triggerVolume, expectedInventoryInventoryLoss, inventoryGridNexPeriod,
-                                regressContinuationValues, alternativeContinuationValue, alternativeVolume, period, alternativeDecisionCost,
+                            double injectTriggerPrice = CalcTriggerPrice(storage, expectedInventory, triggerVolume, expectedInventoryInventoryLoss, inventoryGridNexPeriod,
+                                expectedContinuationValues, alternativeContinuationValue, alternativeVolume, period, alternativeDecisionCost,
                                 alternativeCmdtyConsumed, discountFactorFromCmdtySettlement, DiscountToCurrentDay, lsmcParams.NumericalTolerance);
                             injectTriggerPrices.Add(new TriggerPricePoint(triggerVolume, injectTriggerPrice));
                         }
@@ -526,7 +688,7 @@ public LsmcStorageValuationResults<T> Calculate<T>(LsmcValuationParameters<T> ls
                         triggerPricesBuilder.MaxInjectVolume = triggerPriceMaxInjectVolume;
                     }
                 }
-                
+
                 double maxWithdrawVolume = triggerPriceDecisionSet.Min();
                 var withdrawTriggerPrices = new List<TriggerPricePoint>();
                 if (maxWithdrawVolume < 0)
@@ -538,14 +700,14 @@ public LsmcStorageValuationResults<T> Calculate<T>(LsmcValuationParameters<T> ls
                     if (maxWithdrawVolume < alternativeVolume)
                     {
                         (double alternativeContinuationValue, double alternativeDecisionCost, double alternativeCmdtyConsumed) =
-                            CalcAlternatives(lsmcParams.Storage, expectedInventory, alternativeVolume, expectedInventoryInventoryLoss, inventoryGridNexPeriod, 
-                                regressContinuationValues, period, DiscountToCurrentDay, lsmcParams.NumericalTolerance);
+                            CalcAlternatives(storage, expectedInventory, alternativeVolume, expectedInventoryInventoryLoss, inventoryGridNexPeriod,
+                                expectedContinuationValues, period, DiscountToCurrentDay, lsmcParams.NumericalTolerance);
                         double[] triggerPriceVolumes = CalcWithdrawTriggerPriceVolumes<T>(maxWithdrawVolume, alternativeVolume, numTriggerPriceVolumes);
 
                         foreach (double triggerVolume in triggerPriceVolumes.Reverse())
                         {
-                            double withdrawTriggerPrice = CalcTriggerPrice(lsmcParams.Storage, expectedInventory, triggerVolume, expectedInventoryInventoryLoss, inventoryGridNexPeriod,
-                                regressContinuationValues, alternativeContinuationValue, alternativeVolume, period, alternativeDecisionCost,
+                            double withdrawTriggerPrice = CalcTriggerPrice(storage, expectedInventory, triggerVolume, expectedInventoryInventoryLoss, inventoryGridNexPeriod,
+                                expectedContinuationValues, alternativeContinuationValue, alternativeVolume, period, alternativeDecisionCost,
                                 alternativeCmdtyConsumed, discountFactorFromCmdtySettlement, DiscountToCurrentDay, lsmcParams.NumericalTolerance);
                             withdrawTriggerPrices.Add(new TriggerPricePoint(triggerVolume, withdrawTriggerPrice));
                         }
@@ -560,29 +722,24 @@ public LsmcStorageValuationResults<T> Calculate<T>(LsmcValuationParameters<T> ls
 
                 #endregion Trigger Price Calculation
             }
-            // Pv on final period
-            double endPeriodPv = 0.0;
-            if (!lsmcParams.Storage.MustBeEmptyAtEnd)
-            {
-                ReadOnlySpan<double> storageEndPeriodSpotPrices = regressionSpotSims.SpotPricesForPeriod(lsmcParams.Storage.EndPeriod).Span;
-                Span<double> storageEndInventory = inventoryBySim[lsmcParams.Storage.EndPeriod];
-                Span<double> storageEndPv = pvByPeriodAndSim[periodsForResultsTimeSeries.Length-1];
-                for (int simIndex = 0; simIndex < numSims; simIndex++)
-                {
-                    double inventory = storageEndInventory[simIndex];
-                    double spotPrice = storageEndPeriodSpotPrices[simIndex];
-                    double terminalPv = lsmcParams.Storage.TerminalStorageNpv(spotPrice, inventory);
-                    storageEndPv[simIndex] = terminalPv;
-                    pvBySim[simIndex] += terminalPv;
-                }
-                endPeriodPv = Average(storageEndPv);
-            }
-
-            stopwatches.ForwardSimulation.Stop();
-            _logger?.LogInformation("Starting calculations of optimal decisions by simulation forward in time.");
+            double endPeriodPv = storage.MustBeEmptyAtEnd ? 0.0 :
+                                    Average(forwardSims.PvByPeriodAndSim[periodsForResultsTimeSeries.Length - 1]);
 
+            double[] pvBySim = forwardSims.PvBySim;
             double forwardNpv = pvBySim.Average();
+            double npvStandardError = StandardError(pvBySim);
             _logger?.LogInformation("Forward Pv: " + forwardNpv.ToString("N", CultureInfo.InvariantCulture));
+            _logger?.LogInformation("Forward Pv Standard Error: " + npvStandardError.ToString("N", CultureInfo.InvariantCulture));
+
+            double controlVariateNpv = double.NaN;
+            double controlVariateNpvStandardError = double.NaN;
+            DoubleTimeSeries<T> controlVariateDeltasSeries = null;
+            if (useControlVariate)
+            {
+                (controlVariateNpv, controlVariateNpvStandardError) = ControlVariate.Estimate(pvBySim, controlVariateBySim, 0.0);
+                controlVariateDeltasSeries = new DoubleTimeSeries<T>(periodsForResultsTimeSeries[0], controlVariateDeltas);
+                _logger?.LogInformation("Control Variate Forward Pv: " + controlVariateNpv.ToString("N", CultureInfo.InvariantCulture));
+            }
 
             // Calculate NPVs for first active period using current inventory
             // TODO this is unnecessarily introducing floating point error if the val date is during the storage active period and there should not be a Vector of simulated spot prices
@@ -590,17 +747,19 @@ public LsmcStorageValuationResults<T> Calculate<T>(LsmcValuationParameters<T> ls
 
             _logger?.LogInformation("Backward Pv: " + backwardNpv.ToString("N", CultureInfo.InvariantCulture));
 
+            Panel<T, double> inventoryBySim = forwardSims.InventoryBySim;
             double expectedFinalInventory = Average(inventoryBySim[inventoryBySim.NumRows - 1]);
             // Profile at storage end when no decisions can happen
             storageProfiles[storageProfiles.Length - 1] = new StorageProfile(expectedFinalInventory, 0.0, 0.0, 0.0, 0.0, endPeriodPv);
 
             var deltasSeries = new DoubleTimeSeries<T>(periodsForResultsTimeSeries[0], deltas);
+            var deltaStandardErrorsSeries = new DoubleTimeSeries<T>(periodsForResultsTimeSeries[0], deltaStandardErrors);
             var storageProfileSeries = new TimeSeries<T, StorageProfile>(periodsForResultsTimeSeries[0], storageProfiles);
             var triggerPriceVolumeProfiles = new TimeSeries<T, TriggerPriceVolumeProfiles>(periodsForResultsTimeSeries.First(), triggerVolumeProfilesArray);
             var triggerPrices = new TimeSeries<T, TriggerPrices>(periodsForResultsTimeSeries.First(), triggerPricesArray);
 
             var regressionSpotPricePanel = Panel.UseRawDataArray(regressionSpotSims.SpotPrices, regressionSpotSims.SimulatedPeriods, numSims);
-            var valuationSpotPricePanel = Panel.UseRawDataArray(valuationSpotSims.SpotPrices, valuationSpotSims.SimulatedPeriods, numSims);
+            var valuationSpotPricePanel = Panel.UseRawDataArray(valuationSpotSims.SpotPrices, valuationSpotSims.SimulatedPeriods, numValuationSims);
             lsmcParams.OnProgressUpdate?.Invoke(1.0); // Progress with approximately 1.0 should have occurred already, but might have been a bit off because of floating-point error.
 
             stopwatches.All.Stop();
@@ -612,18 +771,20 @@ public LsmcStorageValuationResults<T> Calculate<T>(LsmcValuationParameters<T> ls
             }
 
             return new LsmcStorageValuationResults<T>(forwardNpv, deltasSeries, storageProfileSeries, regressionSpotPricePanel,
-                valuationSpotPricePanel, inventoryBySim, injectWithdrawVolumeBySim, cmdtyConsumedBySim, inventoryLossBySim, netVolumeBySim, 
-                triggerPrices, triggerPriceVolumeProfiles, pvByPeriodAndSim, pvBySim);
+                valuationSpotPricePanel, inventoryBySim, forwardSims.InjectWithdrawVolumeBySim, forwardSims.CmdtyConsumedBySim,
+                forwardSims.InventoryLossBySim, forwardSims.NetVolumeBySim, triggerPrices, triggerPriceVolumeProfiles,
+                forwardSims.PvByPeriodAndSim, pvBySim, controlVariateNpv, controlVariateNpvStandardError,
+                controlVariateDeltasSeries, npvStandardError, backwardNpv, deltaStandardErrorsSeries, stopwatches.CreateProfile());
         }
 
         private static double CalcTriggerPrice<T>(ICmdtyStorage<T> storage, double expectedInventory, double triggerVolume, double inventoryLoss,
-                double[] inventoryGridNexPeriod, Vector<double>[] regressContinuationValues, double alternativeContinuationValue, double alternativeVolume, T period,
+                double[] inventoryGridNexPeriod, double[] expectedContinuationValues, double alternativeContinuationValue, double alternativeVolume, T period,
                 double alternativeDecisionCost, double alternativeCmdtyConsumed, double discountFactorFromCmdtySettlement, Func<Day, double> discountToCurrentDay,
                 double numericalTolerance) 
             where T : ITimePeriod<T>
         {
             double inventoryAfterTriggerVolume = expectedInventory + triggerVolume - inventoryLoss;
-            double triggerVolumeContinuationValue = AverageContinuationValue(inventoryAfterTriggerVolume, inventoryGridNexPeriod, regressContinuationValues, numericalTolerance);
+            double triggerVolumeContinuationValue = AverageContinuationValue(inventoryAfterTriggerVolume, inventoryGridNexPeriod, expectedContinuationValues, numericalTolerance);
             double triggerVolumeContinuationValueChange = triggerVolumeContinuationValue - alternativeContinuationValue;
 
             double triggerVolumeExcessVolume = triggerVolume - alternativeVolume;
@@ -660,10 +821,10 @@ private static double[] CalcWithdrawTriggerPriceVolumes<T>(double maxWithdrawVol
 
         private static (double alternativeContinuationValue, double alternativeDecisionCost, double alternativeCmdtyConsumed) CalcAlternatives<T>(
             ICmdtyStorage<T> storage, double expectedInventory, double alternativeVolume, double inventoryLoss, double[] inventoryGridNexPeriod,
-            Vector<double>[] regressContinuationValues, T period, Func<Day, double> discountToPresent, double numericalTolerance) where T : ITimePeriod<T>
+            double[] expectedContinuationValues, T period, Func<Day, double> discountToPresent, double numericalTolerance) where T : ITimePeriod<T>
         {
             double inventoryAfterAlternative = expectedInventory + alternativeVolume - inventoryLoss;
-            double alternativeContinuationValue = AverageContinuationValue(inventoryAfterAlternative, inventoryGridNexPeriod, regressContinuationValues, numericalTolerance);
+            double alternativeContinuationValue = AverageContinuationValue(inventoryAfterAlternative, inventoryGridNexPeriod, expectedContinuationValues, numericalTolerance);
             double alternativeDecisionCost = InjectWithdrawCostNpv(storage, alternativeVolume, period, expectedInventory, discountToPresent);
             double alternativeCmdtyConsumed = CmdtyVolumeConsumedOnDecision(storage, alternativeVolume, period, expectedInventory);
             return (alternativeContinuationValue, alternativeDecisionCost, alternativeCmdtyConsumed);
@@ -697,13 +858,41 @@ private static double Average(Span<double> span)
             return sum/span.Length;
         }
 
+        private static double StandardError(ReadOnlySpan<double> samples)
+        {
+            if (samples.Length < 2)
+                return double.NaN;
+            double mean = 0.0;
+            // ReSharper disable once ForCanBeConvertedToForeach
+            for (int i = 0; i < samples.Length; i++)
+                mean += samples[i];
+            mean /= samples.Length;
+            double sumSquaredDeviations = 0.0;
+            // ReSharper disable once ForCanBeConvertedToForeach
+            for (int i = 0; i < samples.Length; i++)
+            {
+                double deviation = samples[i] - mean;
+                sumSquaredDeviations += deviation * deviation;
+            }
+            return Math.Sqrt(sumSquaredDeviations / (samples.Length - 1) / samples.Length);
+        }
+
+        private static double StandardError(int numSamples, double sum, double sumOfSquares)
+        {
+            if (numSamples < 2)
+                return double.NaN;
+            double mean = sum / numSamples;
+            double sumSquaredDeviations = Math.Max(sumOfSquares - sum * mean, 0.0);
+            return Math.Sqrt(sumSquaredDeviations / (numSamples - 1) / numSamples);
+        }
+
         private static double AverageContinuationValue(double inventoryAfterDecision, double[] inventoryGrid,
-                Vector<double>[] storageRegressValuesNextPeriod, double numericalTolerance)
+                double[] expectedContinuationValues, double numericalTolerance)
         {
             (int lowerInventoryIndex, int upperInventoryIndex) = StorageHelper.BisectInventorySpace(inventoryGrid, inventoryAfterDecision, numericalTolerance);
 
             if (lowerInventoryIndex == upperInventoryIndex)
-                return storageRegressValuesNextPeriod[lowerInventoryIndex].Average();
+                return expectedContinuationValues[lowerInventoryIndex];
 
             double lowerInventory = inventoryGrid[lowerInventoryIndex];
             double upperInventory = inventoryGrid[upperInventoryIndex];
@@ -711,12 +900,8 @@ private static double Average(Span<double> span)
             double lowerWeight = (upperInventory - inventoryAfterDecision) / inventoryGridSpace;
             double upperWeight = 1.0 - lowerWeight;
 
-            Vector<double> lowerStorageRegressValues = storageRegressValuesNextPeriod[lowerInventoryIndex];
-            Vector<double> upperStorageRegressValues = storageRegressValuesNextPeriod[upperInventoryIndex];
-            Vector<double> weightedAverageStorageRegressValues =
-                lowerStorageRegressValues * lowerWeight + upperStorageRegressValues * upperWeight;
-
-            return weightedAverageStorageRegressValues.Average();
+            // Interpolation is linear, so interpolating the averages over sims equals the average of the interpolated values
+            return expectedContinuationValues[lowerInventoryIndex] * lowerWeight + expectedContinuationValues[upperInventoryIndex] * upperWeight;
         }
 
         private static double InterpolateContinuationValue(double inventoryAfterDecision, double[] inventoryGrid, 
@@ -750,9 +935,21 @@ private static double Average(Span<double> span)
             return interpolatedRegressContinuationValue;
         }
 
+        // Convenience overload for one-off calls, which builds a new BasisFunctionSetEvaluator each time. The valuation
+        // itself creates one evaluator per Calculate call and passes it to the internal overload for every period and
+        // batch. Evaluators are not cached here as they hold mutable power buffers, so can't be shared across threads.
         public static void PopulateDesignMatrix<T>(Matrix<double> designMatrix, T period, ISpotSimResults<T> spotSims,
             IReadOnlyList<BasisFunction> basisFunctions)
             where T : ITimePeriod<T>
+        {
+            PopulateDesignMatrix(designMatrix, period, spotSims, new BasisFunctionSetEvaluator(basisFunctions));
+        }
+
+        // If standardisation is null it is calculated from spotSims. Returns the standardisation used.
+        internal static BasisFunctionStandardisation PopulateDesignMatrix<T>(Matrix<double> designMatrix, T period, 
+            ISpotSimResults<T> spotSims, BasisFunctionSetEvaluator basisFunctionEvaluator, 
+            BasisFunctionStandardisation standardisation = null)
+            where T : ITimePeriod<T>
         {
             ReadOnlySpan<double> spotPrices = spotSims.SpotPricesForPeriod(period).Span;
             int numSims = spotSims.NumSims;
@@ -761,12 +958,10 @@ private static double Average(Span<double> span)
             for (int i = 0; i < numFactors; i++)
                 markovFactors[i] = spotSims.MarkovFactorsForPeriod(period, i);
 
-            for (int basisIndex = 0; basisIndex < basisFunctions.Count; basisIndex++)
-            {
-                Span<double> designMatrixColumn = new Span<double>(designMatrix.AsColumnMajorArray(), basisIndex * numSims, numSims);
-                BasisFunction basisFunction = basisFunctions[basisIndex];
-                basisFunction(markovFactors, spotPrices, designMatrixColumn);
-            }
+            if (standardisation == null)
+                standardisation = basisFunctionEvaluator.FitStandardisation(markovFactors, spotPrices);
+            basisFunctionEvaluator.Evaluate(markovFactors, spotPrices, designMatrix.AsColumnMajorArray(), numSims, standardisation);
+            return standardisation;
         }
         
     }
@@ -48,6 +48,22 @@ public sealed class LsmcStorageValuationResults<T>
         public IReadOnlyList<double> PvBySim { get; }
         public TimeSeries<T, TriggerPriceVolumeProfiles> TriggerPriceVolumeProfiles { get; }
         public TimeSeries<T, TriggerPrices> TriggerPrices { get; }
+        /// <summary>
+        /// NPV adjusted using the control variate payoff of <see cref="LsmcValuationParameters{T}.ControlVariateNetVolumes"/>.
+        /// NaN if no control variate was used.
+        /// </summary>
+        public double ControlVariateNpv { get; }
+        public double ControlVariateNpvStandardError { get; }
+        public DoubleTimeSeries<T> ControlVariateDeltas { get; }
+        public double NpvStandardError { get; }
+        /// <summary>
+        /// NPV calculated in the backward induction, which uses the same simulations for decisions and valuation,
+        /// so is usually biased high relative to <see cref="Npv"/>.
+        /// </summary>
+        public double BackwardNpv { get; }
+        public double BackwardForwardNpvGap => BackwardNpv - Npv;
+        public DoubleTimeSeries<T> DeltaStandardErrors { get; }
+        public LsmcValuationProfile Profile { get; }
         //public TimeSeries<T, Panel<int, double>> RegressionCoefficients { get; } // TODO create matrix type and use instead of Panel
         //public TimeSeries<T, IReadOnlyList<double>> InventoryGrids { get; }
         // TODO add spot simulation Markov factors
@@ -56,7 +72,10 @@ public sealed class LsmcStorageValuationResults<T>
             Panel<T, double> regressionSpotPriceSim, Panel<T, double> valuationSpotPriceSim,
             Panel<T, double> inventoryBySim, Panel<T, double> injectWithdrawVolumeBySim, Panel<T, double> cmdtyConsumedBySim, 
             Panel<T, double> inventoryLossBySim, Panel<T, double> netVolumeBySim, TimeSeries<T, TriggerPrices> triggerPrices,
-            TimeSeries<T, TriggerPriceVolumeProfiles> triggerPriceVolumeProfiles, Panel<T, double> pvByPeriodAndSim, IEnumerable<double> pvBySim)
+            TimeSeries<T, TriggerPriceVolumeProfiles> triggerPriceVolumeProfiles, Panel<T, double> pvByPeriodAndSim, IEnumerable<double> pvBySim,
+            double controlVariateNpv = double.NaN, double controlVariateNpvStandardError = double.NaN, DoubleTimeSeries<T> controlVariateDeltas = null,
+            double npvStandardError = double.NaN, double backwardNpv = double.NaN, DoubleTimeSeries<T> deltaStandardErrors = null,
+            LsmcValuationProfile profile = null)
         {
             Npv = npv;
             Deltas = deltas;
@@ -72,8 +91,16 @@ public sealed class LsmcStorageValuationResults<T>
             TriggerPriceVolumeProfiles = triggerPriceVolumeProfiles;
             PvByPeriodAndSim = pvByPeriodAndSim;
             PvBySim = pvBySim.ToArray();
+            ControlVariateNpv = controlVariateNpv;
+            ControlVariateNpvStandardError = controlVariateNpvStandardError;
+            ControlVariateDeltas = controlVariateDeltas ?? DoubleTimeSeries<T>.Empty;
+            NpvStandardError = npvStandardError;
+            BackwardNpv = backwardNpv;
+            DeltaStandardErrors = deltaStandardErrors ?? DoubleTimeSeries<T>.Empty;
+            Profile = profile ?? LsmcValuationProfile.Empty;
         }
 
+        // No control variate is used for expired or end period results, so the control variate properties keep their NaN defaults
         public static LsmcStorageValuationResults<T> CreateExpiredResults()
         {
             return new LsmcStorageValuationResults<T>(0.0, DoubleTimeSeries<T>.Empty, TimeSeries<T, StorageProfile>.Empty,
@@ -82,7 +109,7 @@ public static LsmcStorageValuationResults<T> CreateExpiredResults()
                 Panel<T, double>.CreateEmpty(), Panel<T, double>.CreateEmpty(),
                 Panel<T, double>.CreateEmpty(), TimeSeries <T, TriggerPrices >.Empty,
                         TimeSeries<T, TriggerPriceVolumeProfiles>.Empty, Panel<T, double>.CreateEmpty(), 
-                    new double[0]);
+                    new double[0], npvStandardError: 0.0, backwardNpv: 0.0);
         }
 
         public static LsmcStorageValuationResults<T> CreateEndPeriodResults(double npv)
@@ -93,7 +120,7 @@ public static LsmcStorageValuationResults<T> CreateEndPeriodResults(double npv)
                 Panel<T, double>.CreateEmpty(), Panel<T, double>.CreateEmpty(),
                 Panel<T, double>.CreateEmpty(), TimeSeries<T, TriggerPrices>.Empty, 
                 TimeSeries<T, TriggerPriceVolumeProfiles>.Empty, Panel<T, double>.CreateEmpty(),
-                new double[0]);
+                new double[0], npvStandardError: 0.0, backwardNpv: npv);
         }
 
     }
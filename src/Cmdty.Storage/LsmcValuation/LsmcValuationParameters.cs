@@ -54,11 +54,15 @@ public sealed class LsmcValuationParameters<T>
         public Action<double> OnProgressUpdate { get; }
         public bool DiscountDeltas { get; }
         public int ExtraDecisions { get; }
+        public TimeSeries<T, double> ControlVariateNetVolumes { get; }
+        public double? TargetNpvStandardError { get; }
+        public int? MaxValuationSims { get; }
 
         private LsmcValuationParameters(T currentPeriod, double inventory, TimeSeries<T, double> forwardCurve, 
             ICmdtyStorage<T> storage, Func<T, Day> settleDateRule, Func<Day, Day, double> discountFactors, IDoubleStateSpaceGridCalc gridCalc, 
             double numericalTolerance, SimulateSpotPrice regressionSpotSims, SimulateSpotPrice valuationSpotSims, IEnumerable<BasisFunction> basisFunctions, 
-            CancellationToken cancellationToken, bool discountDeltas, int extraDecisions, Action<double> onProgressUpdate = null)
+            CancellationToken cancellationToken, bool discountDeltas, int extraDecisions, Action<double> onProgressUpdate = null,
+            TimeSeries<T, double> controlVariateNetVolumes = null, double? targetNpvStandardError = null, int? maxValuationSims = null)
         {
             CurrentPeriod = currentPeriod;
             Inventory = inventory;
@@ -75,6 +79,9 @@ public sealed class LsmcValuationParameters<T>
             DiscountDeltas = discountDeltas;
             ExtraDecisions = extraDecisions;
             OnProgressUpdate = onProgressUpdate;
+            ControlVariateNetVolumes = controlVariateNetVolumes;
+            TargetNpvStandardError = targetNpvStandardError;
+            MaxValuationSims = maxValuationSims;
         }
 
         public delegate ISpotSimResults<T> SimulateSpotPrice(T currentPeriod, T storageStart, T storageEnd, 
@@ -97,6 +104,18 @@ public sealed class Builder
             public CancellationToken CancellationToken { get; set; }
             public Action<double> OnProgressUpdate { get; set; }
             public int ExtraDecisions { get; set; }
+            /// <summary>
+            /// Net volumes of a static policy, usually the intrinsic storage profile. If set, the payoff of this policy on the
+            /// valuation simulations, which has known expectation, is used as a control variate for the NPV and deltas.
+            /// </summary>
+            public TimeSeries<T, double> ControlVariateNetVolumes { get; set; }
+            /// <summary>
+            /// If set, the forward simulation is repeated on further batches of valuation sims, using the same regression
+            /// coefficients, until the standard error of the NPV is at or below this value, or <see cref="MaxValuationSims"/>
+            /// valuation sims have been run. Each batch is generated by a call to <see cref="ValuationSpotSimsGenerator"/>.
+            /// </summary>
+            public double? TargetNpvStandardError { get; set; }
+            public int? MaxValuationSims { get; set; }
 
             public bool DiscountDeltas { get; set; }
             private T _currentPeriod;
@@ -133,11 +152,21 @@ public LsmcValuationParameters<T> Build()
                 ThrowIfNotSet(BasisFunctions, nameof(BasisFunctions));
                 if (ExtraDecisions < 0)
                     throw new InvalidOperationException(nameof(ExtraDecisions) + " must be non-negative.");
+                if (TargetNpvStandardError != null)
+                {
+                    if (TargetNpvStandardError <= 0)
+                        throw new InvalidOperationException(nameof(TargetNpvStandardError) + " must be positive.");
+                    if (MaxValuationSims == null)
+                        throw new InvalidOperationException(nameof(MaxValuationSims) + " must be set if " + nameof(TargetNpvStandardError) + " is set.");
+                }
+                if (MaxValuationSims <= 0)
+                    throw new InvalidOperationException(nameof(MaxValuationSims) + " must be positive.");
 
                 // ReSharper disable once PossibleInvalidOperationException
                 return new LsmcValuationParameters<T>(CurrentPeriod, Inventory.Value, ForwardCurve, Storage, SettleDateRule, 
                     DiscountFactors, GridCalc, NumericalTolerance, RegressionSpotSimsGenerator, ValuationSpotSimsGenerator, 
-                    BasisFunctions, CancellationToken, DiscountDeltas, ExtraDecisions, OnProgressUpdate);
+                    BasisFunctions, CancellationToken, DiscountDeltas, ExtraDecisions, OnProgressUpdate, ControlVariateNetVolumes,
+                    TargetNpvStandardError, MaxValuationSims);
             }
 
             // ReSharper disable once ParameterOnlyUsedForPreconditionCheck.Local
@@ -159,6 +188,10 @@ private static void ThrowIfNotSet<TField>(TField field, string fieldName)
 
             private static SimulateSpotPrice CreateSimulationSpotPrice(IStandardNormalGenerator randomNumberGenerator, 
                 [NotNull] MultiFactorParameters<T> modelParameters, int numSims)
+                => CreateSimulationSpotPrice(numSteps => randomNumberGenerator, modelParameters, numSims);
+
+            private static SimulateSpotPrice CreateSimulationSpotPrice(Func<int, IStandardNormalGenerator> createRandomNumberGenerator,
+                [NotNull] MultiFactorParameters<T> modelParameters, int numSims)
             {
                 return (currentPeriod, storageStart, storageEnd, forwardCurve) =>
                 {
@@ -171,9 +204,9 @@ private static void ThrowIfNotSet<TField>(TField field, string fieldName)
 
                     DateTime currentDate = currentPeriod.Start; // TODO IMPORTANT, this needs to change;
                     T simStart = new[] { currentPeriod.Offset(1), storageStart }.Max();
-                    var simulatedPeriods = simStart.EnumerateTo(storageEnd);
+                    T[] simulatedPeriods = simStart.EnumerateTo(storageEnd).ToArray();
                     var simulator = new MultiFactorSpotPriceSimulator<T>(modelParameters, currentDate,
-                        forwardCurve, simulatedPeriods, TimeFunctions.Act365, randomNumberGenerator);
+                        forwardCurve, simulatedPeriods, TimeFunctions.Act365, createRandomNumberGenerator(simulatedPeriods.Length));
                     return simulator.Simulate(numSims);
                 };
             }
@@ -191,6 +224,80 @@ private static void ThrowIfNotSet<TField>(TField field, string fieldName)
                 return SimulateWithMultiFactorModel(regressionSimNormalGenerator, valuationSimNormalGenerator, modelParameters, numSims);
             }
 
+            /// <summary>
+            /// Simulates using scrambled Sobol quasi-random numbers with Brownian bridge path construction, which for
+            /// a given number of simulations usually gives a lower standard error than pseudo-random numbers.
+            /// </summary>
+            public Builder SimulateWithMultiFactorModelAndSobol([NotNull] MultiFactorParameters<T> modelParameters, int numSims, 
+                                        int? simSeed = null, int? valuationSimSeed = null)
+            {
+                if (modelParameters == null) throw new ArgumentNullException(nameof(modelParameters));
+                int numFactors = modelParameters.NumFactors;
+                int regressionSeed = simSeed ?? Guid.NewGuid().GetHashCode();
+                SobolBrownianBridgeGenerator regressionSimNormalGenerator = null;
+                SobolBrownianBridgeGenerator valuationSimNormalGenerator = null;
+
+                IStandardNormalGenerator CreateRegressionSimNormalGenerator(int numSteps)
+                    => regressionSimNormalGenerator = new SobolBrownianBridgeGenerator(numFactors, numSteps, regressionSeed);
+
+                // If valuationSimSeed is null then use the same generator as regression, which will continue the Sobol sequence.
+                // Generators are reused on repeated calls, e.g. for batches of valuation sims, so that points are not repeated.
+                IStandardNormalGenerator CreateValuationSimNormalGenerator(int numSteps)
+                {
+                    if (valuationSimSeed == null && regressionSimNormalGenerator?.NumSteps == numSteps)
+                        return regressionSimNormalGenerator;
+                    if (valuationSimNormalGenerator?.NumSteps != numSteps)
+                        valuationSimNormalGenerator = new SobolBrownianBridgeGenerator(numFactors, numSteps, valuationSimSeed ?? regressionSeed);
+                    return valuationSimNormalGenerator;
+                }
+
+                RegressionSpotSimsGenerator = CreateSimulationSpotPrice(CreateRegressionSimNormalGenerator, modelParameters, numSims);
+                ValuationSpotSimsGenerator = CreateSimulationSpotPrice(CreateValuationSimNormalGenerator, modelParameters, numSims);
+                return this;
+            }
+
+            /// <summary>
+            /// Same as <see cref="SimulateWithMultiFactorModelAndMersenneTwister"/>, but with the simulations spread
+            /// across threads using <see cref="ParallelSpotSimulator{T}"/>. Results are reproducible for a given seed, but
+            /// differ from the single threaded simulation.
+            /// </summary>
+            public Builder SimulateWithMultiFactorModelAndMersenneTwisterInParallel(
+                                        [NotNull] MultiFactorParameters<T> modelParameters, int numSims, int? simSeed = null,
+                                        int? valuationSimSeed = null, int? maxDegreeOfParallelism = null)
+            {
+                if (modelParameters == null) throw new ArgumentNullException(nameof(modelParameters));
+                int regressionSeed = simSeed ?? Guid.NewGuid().GetHashCode();
+                // If valuationSimSeed is null then derive from the regression seed, so valuation sims are independent of the regression sims
+                int valuationSeed = valuationSimSeed ?? ParallelSpotSimulator<T>.SubstreamSeed(regressionSeed, long.MaxValue);
+                RegressionSpotSimsGenerator = CreateParallelSimulationSpotPrice(modelParameters, numSims, regressionSeed, maxDegreeOfParallelism);
+                ValuationSpotSimsGenerator = CreateParallelSimulationSpotPrice(modelParameters, numSims, valuationSeed, maxDegreeOfParallelism);
+                return this;
+            }
+
+            private static SimulateSpotPrice CreateParallelSimulationSpotPrice([NotNull] MultiFactorParameters<T> modelParameters, 
+                int numSims, int seed, int? maxDegreeOfParallelism)
+            {
+                long numCalls = 0;
+                return (currentPeriod, storageStart, storageEnd, forwardCurve) =>
+                {
+                    // Repeated calls, e.g. for batches of valuation sims, use a different substream so sims are not repeated
+                    int callSeed = numCalls == 0 ? seed : ParallelSpotSimulator<T>.SubstreamSeed(seed, -numCalls);
+                    numCalls++;
+                    if (currentPeriod.Equals(storageEnd))
+                    {
+                        return new MultiFactorSpotSimResults<T>(new double[0],
+                            new double[0], new T[0], 0, numSims, modelParameters.NumFactors);
+                    }
+
+                    DateTime currentDate = currentPeriod.Start; // TODO IMPORTANT, this needs to change;
+                    T simStart = new[] { currentPeriod.Offset(1), storageStart }.Max();
+                    T[] simulatedPeriods = simStart.EnumerateTo(storageEnd).ToArray();
+                    var simulator = new ParallelSpotSimulator<T>(normalGenerator => new MultiFactorSpotPriceSimulator<T>(modelParameters,
+                        currentDate, forwardCurve, simulatedPeriods, TimeFunctions.Act365, normalGenerator), callSeed, true, maxDegreeOfParallelism);
+                    return simulator.Simulate(numSims);
+                };
+            }
+
             public Builder Clone()
             {
                 return new Builder
@@ -209,7 +316,10 @@ public Builder Clone()
                     RegressionSpotSimsGenerator = this.RegressionSpotSimsGenerator,
                     ValuationSpotSimsGenerator = this.ValuationSpotSimsGenerator,
                     Storage = this.Storage,
-                    ExtraDecisions = this.ExtraDecisions
+                    ExtraDecisions = this.ExtraDecisions,
+                    ControlVariateNetVolumes = this.ControlVariateNetVolumes,
+                    TargetNpvStandardError = this.TargetNpvStandardError,
+                    MaxValuationSims = this.MaxValuationSims
                 };
             }
 
@@ -0,0 +1,70 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+
+namespace Cmdty.Storage
+{
+    /// <summary>
+    /// Timings of the phases of an LSMC valuation, and counts of the main units of work performed.
+    /// </summary>
+    public sealed class LsmcValuationProfile
+    {
+        public TimeSpan Total { get; }
+        public TimeSpan RegressionPriceSimulation { get; }
+        public TimeSpan ValuationPriceSimulation { get; }
+        /// <summary>
+        /// Total time of backward induction, which includes <see cref="PseudoInverse"/>.
+        /// </summary>
+        public TimeSpan BackwardInduction { get; }
+        public TimeSpan PseudoInverse { get; }
+        public TimeSpan ForwardSimulation { get; }
+        public int NumRegressionsSolved { get; }
+        public long NumDecisionsEvaluated { get; }
+        /// <summary>
+        /// Bytes allocated by the process during the valuation. Null if not supported by the runtime.
+        /// </summary>
+        public long? AllocatedBytes { get; }
+
+        public LsmcValuationProfile(TimeSpan total, TimeSpan regressionPriceSimulation, TimeSpan valuationPriceSimulation,
+            TimeSpan backwardInduction, TimeSpan pseudoInverse, TimeSpan forwardSimulation, int numRegressionsSolved,
+            long numDecisionsEvaluated, long? allocatedBytes)
+        {
+            Total = total;
+            RegressionPriceSimulation = regressionPriceSimulation;
+            ValuationPriceSimulation = valuationPriceSimulation;
+            BackwardInduction = backwardInduction;
+            PseudoInverse = pseudoInverse;
+            ForwardSimulation = forwardSimulation;
+            NumRegressionsSolved = numRegressionsSolved;
+            NumDecisionsEvaluated = numDecisionsEvaluated;
+            AllocatedBytes = allocatedBytes;
+        }
+
+        public static LsmcValuationProfile Empty => new LsmcValuationProfile(TimeSpan.Zero, TimeSpan.Zero, TimeSpan.Zero,
+            TimeSpan.Zero, TimeSpan.Zero, TimeSpan.Zero, 0, 0, null);
+
+    }
+}
@@ -0,0 +1,147 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Threading.Tasks;
+using Cmdty.Core.Simulation;
+using Cmdty.Core.Simulation.MultiFactor;
+using Cmdty.TimePeriodValueTypes;
+using JetBrains.Annotations;
+
+namespace Cmdty.Storage
+{
+    /// <summary>
+    /// Simulates spot prices across multiple threads by splitting the simulations into fixed size blocks, each simulated
+    /// with its own <see cref="MersenneTwisterGenerator"/> seeded from the master seed and the block index. As the
+    /// blocks don't depend on the number of threads, results for a given seed are reproducible on any machine.
+    /// </summary>
+    public sealed class ParallelSpotSimulator<T>
+        where T : ITimePeriod<T>
+    {
+        // Even, so that antithetic pairs are never split across blocks
+        public const int DefaultSimsPerBlock = 1_000;
+
+        private readonly Func<IStandardNormalGenerator, MultiFactorSpotPriceSimulator<T>> _simulatorFactory;
+        private readonly int _seed;
+        private readonly bool _antithetic;
+        private readonly int _simsPerBlock;
+        private readonly ParallelOptions _parallelOptions;
+        private long _nextBlockIndex;
+
+        public ParallelSpotSimulator([NotNull] Func<IStandardNormalGenerator, MultiFactorSpotPriceSimulator<T>> simulatorFactory,
+            int? seed, bool antithetic, int? maxDegreeOfParallelism = null, int simsPerBlock = DefaultSimsPerBlock)
+        {
+            _simulatorFactory = simulatorFactory ?? throw new ArgumentNullException(nameof(simulatorFactory));
+            if (simsPerBlock <= 0)
+                throw new ArgumentException("Number of simulations per block must be positive.", nameof(simsPerBlock));
+            if (antithetic && simsPerBlock % 2 != 0)
+                throw new ArgumentException("Number of simulations per block must be even when using antithetic variance reduction.", nameof(simsPerBlock));
+            if (maxDegreeOfParallelism <= 0)
+                throw new ArgumentException("Max degree of parallelism must be positive.", nameof(maxDegreeOfParallelism));
+            _seed = seed ?? Guid.NewGuid().GetHashCode();
+            _antithetic = antithetic;
+            _simsPerBlock = simsPerBlock;
+            _parallelOptions = new ParallelOptions {MaxDegreeOfParallelism = maxDegreeOfParallelism ?? -1};
+        }
+
+        /// <summary>
+        /// Simulates spot prices. Repeated calls continue the sequence of blocks, so do not repeat the same paths.
+        /// </summary>
+        public MultiFactorSpotSimResults<T> Simulate(int numSims)
+        {
+            if (numSims <= 0)
+                throw new ArgumentException("Number of simulations must be positive.", nameof(numSims));
+
+            int numBlocks = (numSims + _simsPerBlock - 1) / _simsPerBlock;
+            // Simulators are created on the calling thread as the factory might not be thread safe, e.g. when called from Python
+            var simulators = new MultiFactorSpotPriceSimulator<T>[numBlocks];
+            for (int blockIndex = 0; blockIndex < numBlocks; blockIndex++)
+            {
+                int blockSeed = SubstreamSeed(_seed, _nextBlockIndex + blockIndex);
+                simulators[blockIndex] = _simulatorFactory(new MersenneTwisterGenerator(blockSeed, _antithetic));
+            }
+            _nextBlockIndex += numBlocks;
+
+            var blockResults = new ISpotSimResults<T>[numBlocks];
+            Parallel.For(0, numBlocks, _parallelOptions, blockIndex =>
+            {
+                int blockNumSims = Math.Min(_simsPerBlock, numSims - blockIndex * _simsPerBlock);
+                blockResults[blockIndex] = simulators[blockIndex].Simulate(blockNumSims);
+            });
+
+            return Merge(blockResults);
+        }
+
+        /// <summary>
+        /// Concatenates simulation results for the same periods, with simulations in the order of the blocks.
+        /// </summary>
+        internal static MultiFactorSpotSimResults<T> Merge(IReadOnlyList<ISpotSimResults<T>> blockResults)
+        {
+            T[] simulatedPeriods = blockResults[0].SimulatedPeriods.ToArray();
+            int numSims = blockResults.Sum(block => block.NumSims);
+            int numSteps = simulatedPeriods.Length;
+            int numFactors = blockResults[0].NumFactors;
+            var spotPrices = new double[numSteps * numSims];
+            // Markov factors ordered by factor, then step, then simulation
+            var markovFactors = new double[numFactors * numSteps * numSims];
+
+            int simOffset = 0;
+            foreach (ISpotSimResults<T> block in blockResults)
+            {
+                for (int stepIndex = 0; stepIndex < numSteps; stepIndex++)
+                {
+                    T period = simulatedPeriods[stepIndex];
+                    block.SpotPricesForPeriod(period).Span
+                        .CopyTo(spotPrices.AsSpan(stepIndex * numSims + simOffset, block.NumSims));
+                    for (int factorIndex = 0; factorIndex < numFactors; factorIndex++)
+                    {
+                        block.MarkovFactorsForPeriod(period, factorIndex).Span
+                            .CopyTo(markovFactors.AsSpan((factorIndex * numSteps + stepIndex) * numSims + simOffset, block.NumSims));
+                    }
+                }
+                simOffset += block.NumSims;
+            }
+
+            return new MultiFactorSpotSimResults<T>(spotPrices, markovFactors, simulatedPeriods, numSteps, numSims, numFactors);
+        }
+
+        // SplitMix64 finaliser applied to the master seed and block index, to give well separated generator seeds
+        internal static int SubstreamSeed(int seed, long blockIndex)
+        {
+            unchecked
+            {
+                ulong z = ((ulong)(uint)seed << 32) ^ (ulong)blockIndex;
+                z += 0x9E3779B97F4A7C15UL;
+                z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9UL;
+                z = (z ^ (z >> 27)) * 0x94D049BB133111EBUL;
+                z ^= z >> 31;
+                return (int)z;
+            }
+        }
+
+    }
+}
@@ -0,0 +1,115 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+
+namespace Cmdty.Storage
+{
+    /// <summary>
+    /// Brownian bridge construction over unit time steps. Maps independent standard normals, ordered by decreasing
+    /// importance, to independent standard normal Brownian increments, with the first normal determining the terminal value,
+    /// the second the mid-point, and so on. Used with quasi-random numbers so the best distributed dimensions drive the
+    /// coarse shape of the path.
+    /// </summary>
+    internal sealed class BrownianBridge
+    {
+        private readonly int[] _bridgeIndex;
+        private readonly int[] _leftIndex;
+        private readonly int[] _rightIndex;
+        private readonly double[] _leftWeight;
+        private readonly double[] _rightWeight;
+        private readonly double[] _stanDev;
+        private readonly double[] _path;
+
+        public int NumSteps { get; }
+
+        public BrownianBridge(int numSteps)
+        {
+            if (numSteps <= 0)
+                throw new ArgumentException("Number of steps must be positive.", nameof(numSteps));
+            NumSteps = numSteps;
+            _bridgeIndex = new int[numSteps];
+            _leftIndex = new int[numSteps];
+            _rightIndex = new int[numSteps];
+            _leftWeight = new double[numSteps];
+            _rightWeight = new double[numSteps];
+            _stanDev = new double[numSteps];
+            _path = new double[numSteps];
+
+            // Path point i is at time i + 1, with the path starting at zero at time zero
+            var isPointMapped = new bool[numSteps];
+            isPointMapped[numSteps - 1] = true;
+            _bridgeIndex[0] = numSteps - 1;
+            _stanDev[0] = Math.Sqrt(numSteps);
+            int leftIndex = 0;
+            for (int i = 1; i < numSteps; i++)
+            {
+                // Find the next gap of unmapped points, and bridge at its mid-point
+                while (isPointMapped[leftIndex])
+                    leftIndex++;
+                int rightIndex = leftIndex;
+                while (!isPointMapped[rightIndex])
+                    rightIndex++;
+                int bridgeIndex = leftIndex + ((rightIndex - 1 - leftIndex) >> 1);
+                isPointMapped[bridgeIndex] = true;
+                _bridgeIndex[i] = bridgeIndex;
+                _leftIndex[i] = leftIndex;
+                _rightIndex[i] = rightIndex;
+
+                double leftTime = leftIndex; // Time of path point leftIndex - 1, the known point to the left
+                double bridgeTime = bridgeIndex + 1;
+                double rightTime = rightIndex + 1;
+                _leftWeight[i] = (rightTime - bridgeTime) / (rightTime - leftTime);
+                _rightWeight[i] = (bridgeTime - leftTime) / (rightTime - leftTime);
+                _stanDev[i] = Math.Sqrt((bridgeTime - leftTime) * (rightTime - bridgeTime) / (rightTime - leftTime));
+
+                leftIndex = rightIndex + 1;
+                if (leftIndex >= numSteps)
+                    leftIndex = 0;
+            }
+        }
+
+        public void Transform(ReadOnlySpan<double> normals, Span<double> increments)
+        {
+            if (normals.Length != NumSteps)
+                throw new ArgumentException($"Length of normals must equal number of steps {NumSteps}.", nameof(normals));
+            if (increments.Length != NumSteps)
+                throw new ArgumentException($"Length of increments must equal number of steps {NumSteps}.", nameof(increments));
+
+            _path[NumSteps - 1] = _stanDev[0] * normals[0];
+            for (int i = 1; i < NumSteps; i++)
+            {
+                int leftIndex = _leftIndex[i];
+                double leftValue = leftIndex == 0 ? 0.0 : _path[leftIndex - 1];
+                _path[_bridgeIndex[i]] = _leftWeight[i] * leftValue + _rightWeight[i] * _path[_rightIndex[i]] + _stanDev[i] * normals[i];
+            }
+
+            increments[0] = _path[0];
+            for (int i = 1; i < NumSteps; i++)
+                increments[i] = _path[i] - _path[i - 1];
+        }
+
+    }
+}
@@ -0,0 +1,87 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+using Cmdty.Core.Simulation;
+using MathNet.Numerics.Distributions;
+
+namespace Cmdty.Storage
+{
+    /// <summary>
+    /// Quasi-random standard normal generator using a digitally shifted Sobol sequence, with Brownian bridge
+    /// construction of the path of each factor. For multi-factor simulation each call to <see cref="Generate"/> populates
+    /// one simulated path of normals for all steps and factors, ordered by step and then factor.
+    /// </summary>
+    public sealed class SobolBrownianBridgeGenerator : IStandardNormalGenerator
+    {
+        private readonly SobolSequence _sobolSequence;
+        private readonly BrownianBridge _brownianBridge;
+        private readonly double[] _uniforms;
+        private readonly double[] _bridgeNormals;
+        private readonly double[] _increments;
+
+        public int NumFactors { get; }
+        public int NumSteps { get; }
+
+        /// <param name="numFactors">Number of factors of the model being simulated.</param>
+        /// <param name="numSteps">Number of time steps per simulated path.</param>
+        /// <param name="scrambleSeed">Seed of the random digital shift. If null the Sobol sequence is not scrambled.</param>
+        public SobolBrownianBridgeGenerator(int numFactors, int numSteps, int? scrambleSeed = null)
+        {
+            if (numFactors <= 0)
+                throw new ArgumentException("Number of factors must be positive.", nameof(numFactors));
+            if (numSteps <= 0)
+                throw new ArgumentException("Number of steps must be positive.", nameof(numSteps));
+            NumFactors = numFactors;
+            NumSteps = numSteps;
+            int dimensions = numFactors * numSteps;
+            _sobolSequence = new SobolSequence(dimensions, scrambleSeed);
+            _brownianBridge = new BrownianBridge(numSteps);
+            _uniforms = new double[dimensions];
+            _bridgeNormals = new double[numSteps];
+            _increments = new double[numSteps];
+        }
+
+        public void Generate(Span<double> randomNormals)
+        {
+            if (randomNormals.Length != _uniforms.Length)
+                throw new ArgumentException($"Length of randomNormals must equal number of dimensions {_uniforms.Length}.", nameof(randomNormals));
+            _sobolSequence.NextPoint(_uniforms);
+            for (int factorIndex = 0; factorIndex < NumFactors; factorIndex++)
+            {
+                // Sobol dimensions are interleaved across factors in bridge order, so that the lowest, best distributed,
+                // dimensions drive the terminal and mid-point values of every factor
+                for (int bridgeIndex = 0; bridgeIndex < NumSteps; bridgeIndex++)
+                    _bridgeNormals[bridgeIndex] = Normal.InvCDF(0.0, 1.0, _uniforms[bridgeIndex * NumFactors + factorIndex]);
+                _brownianBridge.Transform(_bridgeNormals, _increments);
+                for (int stepIndex = 0; stepIndex < NumSteps; stepIndex++)
+                    randomNormals[stepIndex * NumFactors + factorIndex] = _increments[stepIndex];
+            }
+        }
+
+        public bool MatchesDimensions(int numDims) => numDims == _uniforms.Length;
+
+    }
+}
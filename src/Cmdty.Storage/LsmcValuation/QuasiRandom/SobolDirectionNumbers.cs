@@ -0,0 +1,293 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+namespace Cmdty.Storage
+{
+    internal static class SobolDirectionNumbers
+    {
+        // Initial direction numbers m_1...m_s of Joe & Kuo (2008), file new-joe-kuo-6.21201, for Sobol dimensions 2 to 256.
+        // The first dimension is the van der Corput sequence, so needs no initial numbers. The primitive polynomials
+        // of Joe & Kuo are in order of degree, then value, so are enumerated in SobolSequence rather than stored here.
+        public static readonly uint[][] JoeKuoInitialNumbers =
+        {
+            new uint[] {1},
+            new uint[] {1, 3},
+            new uint[] {1, 3, 1},
+            new uint[] {1, 1, 1},
+            new uint[] {1, 1, 3, 3},
+            new uint[] {1, 3, 5, 13},
+            new uint[] {1, 1, 5, 5, 17},
+            new uint[] {1, 1, 5, 5, 5},
+            new uint[] {1, 1, 7, 11, 19},
+            new uint[] {1, 1, 5, 1, 1},
+            new uint[] {1, 1, 1, 3, 11},
+            new uint[] {1, 3, 5, 5, 31},
+            new uint[] {1, 3, 3, 9, 7, 49},
+            new uint[] {1, 1, 1, 15, 21, 21},
+            new uint[] {1, 3, 1, 13, 27, 49},
+            new uint[] {1, 1, 1, 15, 7, 5},
+            new uint[] {1, 3, 1, 15, 13, 25},
+            new uint[] {1, 1, 5, 5, 19, 61},
+            new uint[] {1, 3, 7, 11, 23, 15, 103},
+            new uint[] {1, 3, 7, 13, 13, 15, 69},
+            new uint[] {1, 1, 3, 13, 7, 35, 63},
+            new uint[] {1, 3, 5, 9, 1, 25, 53},
+            new uint[] {1, 3, 1, 13, 9, 35, 107},
+            new uint[] {1, 3, 1, 5, 27, 61, 31},
+            new uint[] {1, 1, 5, 11, 19, 41, 61},
+            new uint[] {1, 3, 5, 3, 3, 13, 69},
+            new uint[] {1, 1, 7, 13, 1, 19, 1},
+            new uint[] {1, 3, 7, 5, 13, 19, 59},
+            new uint[] {1, 1, 3, 9, 25, 29, 41},
+            new uint[] {1, 3, 5, 13, 23, 1, 55},
+            new uint[] {1, 3, 7, 3, 13, 59, 17},
+            new uint[] {1, 3, 1, 3, 5, 53, 69},
+            new uint[] {1, 1, 5, 5, 23, 33, 13},
+            new uint[] {1, 1, 7, 7, 1, 61, 123},
+            new uint[] {1, 1, 7, 9, 13, 61, 49},
+            new uint[] {1, 3, 3, 5, 3, 55, 33},
+            new uint[] {1, 3, 1, 15, 31, 13, 49, 245},
+            new uint[] {1, 3, 5, 15, 31, 59, 63, 97},
+            new uint[] {1, 3, 1, 11, 11, 11, 77, 249},
+            new uint[] {1, 3, 1, 11, 27, 43, 71, 9},
+            new uint[] {1, 1, 7, 15, 21, 11, 81, 45},
+            new uint[] {1, 3, 7, 3, 25, 31, 65, 79},
+            new uint[] {1, 3, 1, 1, 19, 11, 3, 205},
+            new uint[] {1, 1, 5, 9, 19, 21, 29, 157},
+            new uint[] {1, 3, 7, 11, 1, 33, 89, 185},
+            new uint[] {1, 3, 3, 3, 15, 9, 79, 71},
+            new uint[] {1, 3, 7, 11, 15, 39, 119, 27},
+            new uint[] {1, 1, 3, 1, 11, 31, 97, 225},
+            new uint[] {1, 1, 1, 3, 23, 43, 57, 177},
+            new uint[] {1, 3, 7, 7, 17, 17, 37, 71},
+            new uint[] {1, 3, 1, 5, 27, 63, 123, 213},
+            new uint[] {1, 1, 3, 5, 11, 43, 53, 133},
+            new uint[] {1, 3, 5, 5, 29, 17, 47, 173, 479},
+            new uint[] {1, 3, 3, 11, 3, 1, 109, 9, 69},
+            new uint[] {1, 1, 1, 5, 17, 39, 23, 5, 343},
+            new uint[] {1, 3, 1, 5, 25, 15, 31, 103, 499},
+            new uint[] {1, 1, 1, 11, 11, 17, 63, 105, 183},
+            new uint[] {1, 1, 5, 11, 9, 29, 97, 231, 363},
+            new uint[] {1, 1, 5, 15, 19, 45, 41, 7, 383},
+            new uint[] {1, 3, 7, 7, 31, 19, 83, 137, 221},
+            new uint[] {1, 1, 1, 3, 23, 15, 111, 223, 83},
+            new uint[] {1, 1, 5, 13, 31, 15, 55, 25, 161},
+            new uint[] {1, 1, 3, 13, 25, 47, 39, 87, 257},
+            new uint[] {1, 1, 1, 11, 21, 53, 125, 249, 293},
+            new uint[] {1, 1, 7, 11, 11, 7, 57, 79, 323},
+            new uint[] {1, 1, 5, 5, 17, 13, 81, 3, 131},
+            new uint[] {1, 1, 7, 13, 23, 7, 65, 251, 475},
+            new uint[] {1, 3, 5, 1, 9, 43, 3, 149, 11},
+            new uint[] {1, 1, 3, 13, 31, 13, 13, 255, 487},
+            new uint[] {1, 3, 3, 1, 5, 63, 89, 91, 127},
+            new uint[] {1, 1, 3, 3, 1, 19, 123, 127, 237},
+            new uint[] {1, 1, 5, 7, 23, 31, 37, 243, 289},
+            new uint[] {1, 1, 5, 11, 17, 53, 117, 183, 491},
+            new uint[] {1, 1, 1, 5, 1, 13, 13, 209, 345},
+            new uint[] {1, 1, 3, 15, 1, 57, 115, 7, 33},
+            new uint[] {1, 3, 1, 11, 7, 43, 81, 207, 175},
+            new uint[] {1, 3, 1, 1, 15, 27, 63, 255, 49},
+            new uint[] {1, 3, 5, 3, 27, 61, 105, 171, 305},
+            new uint[] {1, 1, 5, 3, 1, 3, 57, 249, 149},
+            new uint[] {1, 1, 3, 5, 5, 57, 15, 13, 159},
+            new uint[] {1, 1, 1, 11, 7, 11, 105, 141, 225},
+            new uint[] {1, 3, 3, 5, 27, 59, 121, 101, 271},
+            new uint[] {1, 3, 5, 9, 11, 49, 51, 59, 115},
+            new uint[] {1, 1, 7, 1, 23, 45, 125, 71, 419},
+            new uint[] {1, 1, 3, 5, 23, 5, 105, 109, 75},
+            new uint[] {1, 1, 7, 15, 7, 11, 67, 121, 453},
+            new uint[] {1, 3, 7, 3, 9, 13, 31, 27, 449},
+            new uint[] {1, 3, 1, 15, 19, 39, 39, 89, 15},
+            new uint[] {1, 1, 1, 1, 1, 33, 73, 145, 379},
+            new uint[] {1, 3, 1, 15, 15, 43, 29, 13, 483},
+            new uint[] {1, 1, 7, 3, 19, 27, 85, 131, 431},
+            new uint[] {1, 3, 3, 3, 5, 35, 23, 195, 349},
+            new uint[] {1, 3, 3, 7, 9, 27, 39, 59, 297},
+            new uint[] {1, 1, 3, 9, 11, 17, 13, 241, 157},
+            new uint[] {1, 3, 7, 15, 25, 57, 33, 189, 213},
+            new uint[] {1, 1, 7, 1, 9, 55, 73, 83, 217},
+            new uint[] {1, 3, 3, 13, 19, 27, 23, 113, 249},
+            new uint[] {1, 3, 5, 3, 23, 43, 3, 253, 479},
+            new uint[] {1, 1, 5, 5, 11, 5, 45, 117, 217},
+            new uint[] {1, 3, 3, 7, 29, 37, 33, 123, 147},
+            new uint[] {1, 3, 1, 15, 5, 5, 37, 227, 223, 459},
+            new uint[] {1, 1, 7, 5, 5, 39, 63, 255, 135, 487},
+            new uint[] {1, 3, 1, 7, 9, 7, 87, 249, 217, 599},
+            new uint[] {1, 1, 3, 13, 9, 47, 7, 225, 363, 247},
+            new uint[] {1, 3, 7, 13, 19, 13, 9, 67, 9, 737},
+            new uint[] {1, 3, 5, 5, 19, 59, 7, 41, 319, 677},
+            new uint[] {1, 1, 5, 3, 31, 63, 15, 43, 207, 789},
+            new uint[] {1, 1, 7, 9, 13, 39, 3, 47, 497, 169},
+            new uint[] {1, 3, 1, 7, 21, 17, 97, 19, 415, 905},
+            new uint[] {1, 3, 7, 1, 3, 31, 71, 111, 165, 127},
+            new uint[] {1, 1, 5, 11, 1, 61, 83, 119, 203, 847},
+            new uint[] {1, 3, 3, 13, 9, 61, 19, 97, 47, 35},
+            new uint[] {1, 1, 7, 7, 15, 29, 63, 95, 417, 469},
+            new uint[] {1, 3, 1, 9, 25, 9, 71, 57, 213, 385},
+            new uint[] {1, 3, 5, 13, 31, 47, 101, 57, 39, 341},
+            new uint[] {1, 1, 3, 3, 31, 57, 125, 173, 365, 551},
+            new uint[] {1, 3, 7, 1, 13, 57, 67, 157, 451, 707},
+            new uint[] {1, 1, 1, 7, 21, 13, 105, 89, 429, 965},
+            new uint[] {1, 1, 5, 9, 17, 51, 45, 119, 157, 141},
+            new uint[] {1, 3, 7, 7, 13, 45, 91, 9, 129, 741},
+            new uint[] {1, 3, 7, 1, 23, 57, 67, 141, 151, 571},
+            new uint[] {1, 1, 3, 11, 17, 47, 93, 107, 375, 157},
+            new uint[] {1, 3, 3, 5, 11, 21, 43, 51, 169, 915},
+            new uint[] {1, 1, 5, 3, 15, 55, 101, 67, 455, 625},
+            new uint[] {1, 3, 5, 9, 1, 23, 29, 47, 345, 595},
+            new uint[] {1, 3, 7, 7, 5, 49, 29, 155, 323, 589},
+            new uint[] {1, 3, 3, 7, 5, 41, 127, 61, 261, 717},
+            new uint[] {1, 3, 7, 7, 17, 23, 117, 67, 129, 1009},
+            new uint[] {1, 1, 3, 13, 11, 39, 21, 207, 123, 305},
+            new uint[] {1, 1, 3, 9, 29, 3, 95, 47, 231, 73},
+            new uint[] {1, 3, 1, 9, 1, 29, 117, 21, 441, 259},
+            new uint[] {1, 3, 1, 13, 21, 39, 125, 211, 439, 723},
+            new uint[] {1, 1, 7, 3, 17, 63, 115, 89, 49, 773},
+            new uint[] {1, 3, 7, 13, 11, 33, 101, 107, 63, 73},
+            new uint[] {1, 1, 5, 5, 13, 57, 63, 135, 437, 177},
+            new uint[] {1, 1, 3, 7, 27, 63, 93, 47, 417, 483},
+            new uint[] {1, 1, 3, 1, 23, 29, 1, 191, 49, 23},
+            new uint[] {1, 1, 3, 15, 25, 55, 9, 101, 219, 607},
+            new uint[] {1, 3, 1, 7, 7, 19, 51, 251, 393, 307},
+            new uint[] {1, 3, 3, 3, 25, 55, 17, 75, 337, 3},
+            new uint[] {1, 1, 1, 13, 25, 17, 65, 45, 479, 413},
+            new uint[] {1, 1, 7, 7, 27, 49, 99, 161, 213, 727},
+            new uint[] {1, 3, 5, 1, 23, 5, 43, 41, 251, 857},
+            new uint[] {1, 3, 3, 7, 11, 61, 39, 87, 383, 835},
+            new uint[] {1, 1, 3, 15, 13, 7, 29, 7, 505, 923},
+            new uint[] {1, 3, 7, 1, 5, 31, 47, 157, 445, 501},
+            new uint[] {1, 1, 3, 7, 1, 43, 9, 147, 115, 605},
+            new uint[] {1, 3, 3, 13, 5, 1, 119, 211, 455, 1001},
+            new uint[] {1, 1, 3, 5, 13, 19, 3, 243, 75, 843},
+            new uint[] {1, 3, 7, 7, 1, 19, 91, 249, 357, 589},
+            new uint[] {1, 1, 1, 9, 1, 25, 109, 197, 279, 411},
+            new uint[] {1, 3, 1, 15, 23, 57, 59, 135, 191, 75},
+            new uint[] {1, 1, 5, 15, 29, 21, 39, 253, 383, 349},
+            new uint[] {1, 3, 3, 5, 19, 45, 61, 151, 199, 981},
+            new uint[] {1, 3, 5, 13, 9, 61, 107, 141, 141, 1},
+            new uint[] {1, 3, 1, 11, 27, 25, 85, 105, 309, 979},
+            new uint[] {1, 3, 3, 11, 19, 7, 115, 223, 349, 43},
+            new uint[] {1, 1, 7, 9, 21, 39, 123, 21, 275, 927},
+            new uint[] {1, 1, 7, 13, 15, 41, 47, 243, 303, 437},
+            new uint[] {1, 1, 1, 7, 7, 3, 15, 99, 409, 719},
+            new uint[] {1, 3, 3, 15, 27, 49, 113, 123, 113, 67, 469},
+            new uint[] {1, 3, 7, 11, 3, 23, 87, 169, 119, 483, 199},
+            new uint[] {1, 1, 5, 15, 7, 17, 109, 229, 179, 213, 741},
+            new uint[] {1, 1, 5, 13, 11, 17, 25, 135, 403, 557, 1433},
+            new uint[] {1, 3, 1, 1, 1, 61, 67, 215, 189, 945, 1243},
+            new uint[] {1, 1, 7, 13, 17, 33, 9, 221, 429, 217, 1679},
+            new uint[] {1, 1, 3, 11, 27, 3, 15, 93, 93, 865, 1049},
+            new uint[] {1, 3, 7, 7, 25, 41, 121, 35, 373, 379, 1547},
+            new uint[] {1, 3, 3, 9, 11, 35, 45, 205, 241, 9, 59},
+            new uint[] {1, 3, 1, 7, 3, 51, 7, 177, 53, 975, 89},
+            new uint[] {1, 1, 3, 5, 27, 1, 113, 231, 299, 759, 861},
+            new uint[] {1, 3, 3, 15, 25, 29, 5, 255, 139, 891, 2031},
+            new uint[] {1, 3, 1, 1, 13, 9, 109, 193, 419, 95, 17},
+            new uint[] {1, 1, 7, 9, 3, 7, 29, 41, 135, 839, 867},
+            new uint[] {1, 1, 7, 9, 25, 49, 123, 217, 113, 909, 215},
+            new uint[] {1, 1, 7, 3, 23, 15, 43, 133, 217, 327, 901},
+            new uint[] {1, 1, 3, 3, 13, 53, 63, 123, 477, 711, 1387},
+            new uint[] {1, 1, 3, 15, 7, 29, 75, 119, 181, 957, 247},
+            new uint[] {1, 1, 1, 11, 27, 25, 109, 151, 267, 99, 1461},
+            new uint[] {1, 3, 7, 15, 5, 5, 53, 145, 11, 725, 1501},
+            new uint[] {1, 3, 7, 1, 9, 43, 71, 229, 157, 607, 1835},
+            new uint[] {1, 3, 3, 13, 25, 1, 5, 27, 471, 349, 127},
+            new uint[] {1, 1, 1, 1, 23, 37, 9, 221, 269, 897, 1685},
+            new uint[] {1, 1, 3, 3, 31, 29, 51, 19, 311, 553, 1969},
+            new uint[] {1, 3, 7, 5, 5, 55, 17, 39, 475, 671, 1529},
+            new uint[] {1, 1, 7, 1, 1, 35, 47, 27, 437, 395, 1635},
+            new uint[] {1, 1, 7, 3, 13, 23, 43, 135, 327, 139, 389},
+            new uint[] {1, 3, 7, 3, 9, 25, 91, 25, 429, 219, 513},
+            new uint[] {1, 1, 3, 5, 13, 29, 119, 201, 277, 157, 2043},
+            new uint[] {1, 3, 5, 3, 29, 57, 13, 17, 167, 739, 1031},
+            new uint[] {1, 3, 3, 5, 29, 21, 95, 27, 255, 679, 1531},
+            new uint[] {1, 3, 7, 15, 9, 5, 21, 71, 61, 961, 1201},
+            new uint[] {1, 3, 5, 13, 15, 57, 33, 93, 459, 867, 223},
+            new uint[] {1, 1, 1, 15, 17, 43, 127, 191, 67, 177, 1073},
+            new uint[] {1, 1, 1, 15, 23, 7, 21, 199, 75, 293, 1611},
+            new uint[] {1, 3, 7, 13, 15, 39, 21, 149, 65, 741, 319},
+            new uint[] {1, 3, 7, 11, 23, 13, 101, 89, 277, 519, 711},
+            new uint[] {1, 3, 7, 15, 19, 27, 85, 203, 441, 97, 1895},
+            new uint[] {1, 3, 1, 3, 29, 25, 21, 155, 11, 191, 197},
+            new uint[] {1, 1, 7, 5, 27, 11, 81, 101, 457, 675, 1687},
+            new uint[] {1, 3, 1, 5, 25, 5, 65, 193, 41, 567, 781},
+            new uint[] {1, 3, 1, 5, 11, 15, 113, 77, 411, 695, 1111},
+            new uint[] {1, 1, 3, 9, 11, 53, 119, 171, 55, 297, 509},
+            new uint[] {1, 1, 1, 1, 11, 39, 113, 139, 165, 347, 595},
+            new uint[] {1, 3, 7, 11, 9, 17, 101, 13, 81, 325, 1733},
+            new uint[] {1, 3, 1, 1, 21, 43, 115, 9, 113, 907, 645},
+            new uint[] {1, 1, 7, 3, 9, 25, 117, 197, 159, 471, 475},
+            new uint[] {1, 3, 1, 9, 11, 21, 57, 207, 485, 613, 1661},
+            new uint[] {1, 1, 7, 7, 27, 55, 49, 223, 89, 85, 1523},
+            new uint[] {1, 1, 5, 3, 19, 41, 45, 51, 447, 299, 1355},
+            new uint[] {1, 3, 1, 13, 1, 33, 117, 143, 313, 187, 1073},
+            new uint[] {1, 1, 7, 7, 5, 11, 65, 97, 377, 377, 1501},
+            new uint[] {1, 3, 1, 1, 21, 35, 95, 65, 99, 23, 1239},
+            new uint[] {1, 1, 5, 9, 3, 37, 95, 167, 115, 425, 867},
+            new uint[] {1, 3, 3, 13, 1, 37, 27, 189, 81, 679, 773},
+            new uint[] {1, 1, 3, 11, 1, 61, 99, 233, 429, 969, 49},
+            new uint[] {1, 1, 1, 7, 25, 63, 99, 165, 245, 793, 1143},
+            new uint[] {1, 1, 5, 11, 11, 43, 55, 65, 71, 283, 273},
+            new uint[] {1, 1, 5, 5, 9, 3, 101, 251, 355, 379, 1611},
+            new uint[] {1, 1, 1, 15, 21, 63, 85, 99, 49, 749, 1335},
+            new uint[] {1, 1, 5, 13, 27, 9, 121, 43, 255, 715, 289},
+            new uint[] {1, 3, 1, 5, 27, 19, 17, 223, 77, 571, 1415},
+            new uint[] {1, 1, 5, 3, 13, 59, 125, 251, 195, 551, 1737},
+            new uint[] {1, 3, 3, 15, 13, 27, 49, 105, 389, 971, 755},
+            new uint[] {1, 3, 5, 15, 23, 43, 35, 107, 447, 763, 253},
+            new uint[] {1, 3, 5, 11, 21, 3, 17, 39, 497, 407, 611},
+            new uint[] {1, 1, 7, 13, 15, 31, 113, 17, 23, 507, 1995},
+            new uint[] {1, 1, 7, 15, 3, 15, 31, 153, 423, 79, 503},
+            new uint[] {1, 1, 7, 9, 19, 25, 23, 171, 505, 923, 1989},
+            new uint[] {1, 1, 5, 9, 21, 27, 121, 223, 133, 87, 697},
+            new uint[] {1, 1, 5, 5, 9, 19, 107, 99, 319, 765, 1461},
+            new uint[] {1, 1, 3, 3, 19, 25, 3, 101, 171, 729, 187},
+            new uint[] {1, 1, 3, 1, 13, 23, 85, 93, 291, 209, 37},
+            new uint[] {1, 1, 1, 15, 25, 25, 77, 253, 333, 947, 1073},
+            new uint[] {1, 1, 3, 9, 17, 29, 55, 47, 255, 305, 2037},
+            new uint[] {1, 3, 3, 9, 29, 63, 9, 103, 489, 939, 1523},
+            new uint[] {1, 3, 7, 15, 7, 31, 89, 175, 369, 339, 595},
+            new uint[] {1, 3, 7, 13, 25, 5, 71, 207, 251, 367, 665},
+            new uint[] {1, 3, 3, 3, 21, 25, 75, 35, 31, 321, 1603},
+            new uint[] {1, 1, 1, 9, 11, 1, 65, 5, 11, 329, 535},
+            new uint[] {1, 1, 5, 3, 19, 13, 17, 43, 379, 485, 383},
+            new uint[] {1, 3, 5, 13, 13, 9, 85, 147, 489, 787, 1133},
+            new uint[] {1, 3, 1, 1, 5, 51, 37, 129, 195, 297, 1783},
+            new uint[] {1, 1, 3, 15, 19, 57, 59, 181, 455, 697, 2033},
+            new uint[] {1, 3, 7, 1, 27, 9, 65, 145, 325, 189, 201},
+            new uint[] {1, 3, 1, 15, 31, 23, 19, 5, 485, 581, 539},
+            new uint[] {1, 1, 7, 13, 11, 15, 65, 83, 185, 847, 831},
+            new uint[] {1, 3, 5, 7, 7, 55, 73, 15, 303, 511, 1905},
+            new uint[] {1, 3, 5, 9, 7, 21, 45, 15, 397, 385, 597},
+            new uint[] {1, 3, 7, 3, 23, 13, 73, 221, 511, 883, 1265},
+            new uint[] {1, 1, 3, 11, 1, 51, 73, 185, 33, 975, 1441},
+            new uint[] {1, 3, 3, 9, 19, 59, 21, 39, 339, 37, 143},
+            new uint[] {1, 1, 7, 1, 31, 33, 19, 167, 117, 635, 639},
+            new uint[] {1, 1, 1, 3, 5, 13, 59, 83, 355, 349, 1967},
+            new uint[] {1, 1, 1, 5, 19, 3, 53, 133, 97, 863, 983}
+        };
+
+    }
+}
@@ -0,0 +1,267 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+
+namespace Cmdty.Storage
+{
+    /// <summary>
+    /// Sobol low discrepancy sequence generated in Gray code order, with optional random digital shift scrambling.
+    /// </summary>
+    internal sealed class SobolSequence
+    {
+        private const int NumBits = 32;
+        private const double UintToUnitInterval = 1.0 / 4294967296.0; // 2^-32
+        // Seed used to choose initial direction numbers for dimensions beyond those of Joe & Kuo, fixed so that the sequence is deterministic
+        private const int ExtraDimensionsSeed = 1;
+        // Enumerating primitive polynomials is slow for thousands of dimensions, so they are cached across instances
+        private static readonly List<uint> PrimitivePolynomialsCache = new List<uint>();
+
+        private readonly uint[][] _directionNumbers;
+        private readonly uint[] _integerPoint;
+        private readonly uint[] _digitalShift;
+        private uint _index;
+
+        public int Dimensions { get; }
+
+        public SobolSequence(int dimensions, int? scrambleSeed)
+        {
+            if (dimensions <= 0)
+                throw new ArgumentException("Number of dimensions must be positive.", nameof(dimensions));
+            Dimensions = dimensions;
+            _directionNumbers = CalculateDirectionNumbers(dimensions);
+            _integerPoint = new uint[dimensions];
+            _digitalShift = new uint[dimensions];
+            if (scrambleSeed.HasValue)
+            {
+                var random = new Random(scrambleSeed.Value);
+                var shiftBytes = new byte[4];
+                for (int i = 0; i < dimensions; i++)
+                {
+                    random.NextBytes(shiftBytes);
+                    _digitalShift[i] = BitConverter.ToUInt32(shiftBytes, 0);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Populates uniforms with the next point of the sequence. Values are strictly inside the interval (0, 1).
+        /// </summary>
+        public void NextPoint(Span<double> uniforms)
+        {
+            if (uniforms.Length != Dimensions)
+                throw new ArgumentException($"Length of uniforms must equal number of dimensions {Dimensions}.", nameof(uniforms));
+            if (_index == uint.MaxValue)
+                throw new InvalidOperationException("Sobol sequence has been exhausted.");
+
+            for (int i = 0; i < uniforms.Length; i++)
+                // Offset by half of the smallest increment so that 0 is never returned
+                uniforms[i] = ((_integerPoint[i] ^ _digitalShift[i]) + 0.5) * UintToUnitInterval;
+
+            // Gray code update, flipping the direction number of the lowest zero bit of the index
+            int bitIndex = LowestZeroBit(_index);
+            for (int i = 0; i < _integerPoint.Length; i++)
+                _integerPoint[i] ^= _directionNumbers[i][bitIndex];
+            _index++;
+        }
+
+        private static int LowestZeroBit(uint value)
+        {
+            int bitIndex = 0;
+            while ((value & 1) == 1)
+            {
+                value >>= 1;
+                bitIndex++;
+            }
+            return bitIndex;
+        }
+
+        private static uint[][] CalculateDirectionNumbers(int dimensions)
+        {
+            var directionNumbers = new uint[dimensions][];
+            var firstDimension = new uint[NumBits];
+            for (int k = 0; k < NumBits; k++)
+                firstDimension[k] = 1u << (NumBits - 1 - k);
+            directionNumbers[0] = firstDimension;
+
+            var random = new Random(ExtraDimensionsSeed);
+            uint[][] joeKuoNumbers = SobolDirectionNumbers.JoeKuoInitialNumbers;
+            IReadOnlyList<uint> polynomials = GetPrimitivePolynomials(dimensions - 1);
+            for (int dimensionIndex = 1; dimensionIndex < dimensions; dimensionIndex++)
+            {
+                uint polynomial = polynomials[dimensionIndex - 1];
+                int degree = Degree(polynomial);
+                uint[] initialNumbers;
+                if (dimensionIndex - 1 < joeKuoNumbers.Length)
+                    initialNumbers = joeKuoNumbers[dimensionIndex - 1];
+                else
+                {
+                    // Any odd m_k < 2^k gives a valid Sobol sequence
+                    initialNumbers = new uint[degree];
+                    for (int k = 0; k < degree; k++)
+                        initialNumbers[k] = (uint)random.Next(1 << k) * 2 + 1;
+                }
+                directionNumbers[dimensionIndex] = DirectionNumbersForPolynomial(polynomial, degree, initialNumbers);
+            }
+            return directionNumbers;
+        }
+
+        private static uint[] DirectionNumbersForPolynomial(uint polynomial, int degree, uint[] initialNumbers)
+        {
+            var directionNumbers = new uint[NumBits];
+            int numInitial = Math.Min(degree, NumBits);
+            for (int k = 0; k < numInitial; k++)
+                directionNumbers[k] = initialNumbers[k] << (NumBits - 1 - k);
+
+            // Coefficients of the polynomial excluding the leading and constant terms
+            uint innerCoefficients = (polynomial >> 1) & ((1u << (degree - 1)) - 1);
+            for (int k = degree; k < NumBits; k++)
+            {
+                uint directionNumber = directionNumbers[k - degree] ^ (directionNumbers[k - degree] >> degree);
+                for (int i = 1; i < degree; i++)
+                {
+                    if (((innerCoefficients >> (degree - 1 - i)) & 1) == 1)
+                        directionNumber ^= directionNumbers[k - i];
+                }
+                directionNumbers[k] = directionNumber;
+            }
+            return directionNumbers;
+        }
+
+        private static IReadOnlyList<uint> GetPrimitivePolynomials(int count)
+        {
+            lock (PrimitivePolynomialsCache)
+            {
+                int numToAdd = count - PrimitivePolynomialsCache.Count;
+                if (numToAdd > 0)
+                {
+                    uint lastPolynomial = PrimitivePolynomialsCache.Count == 0 ? 1 : PrimitivePolynomialsCache[PrimitivePolynomialsCache.Count - 1];
+                    PrimitivePolynomialsCache.AddRange(PrimitivePolynomialsAfter(lastPolynomial).Take(numToAdd));
+                }
+                return PrimitivePolynomialsCache.Take(count).ToArray();
+            }
+        }
+
+        // Primitive polynomials over GF(2), in order of degree and then value, represented as bits including the leading and constant terms
+        private static IEnumerable<uint> PrimitivePolynomialsAfter(uint previousPolynomial)
+        {
+            for (int degree = Math.Max(Degree(previousPolynomial), 1); degree < NumBits - 1; degree++)
+            {
+                uint start = Math.Max(1u << degree, previousPolynomial) + 1;
+                uint end = 1u << (degree + 1);
+                for (uint polynomial = start | 1; polynomial < end; polynomial += 2)
+                {
+                    if (IsPrimitive(polynomial, degree))
+                        yield return polynomial;
+                }
+            }
+        }
+
+        private static bool IsPrimitive(uint polynomial, int degree)
+        {
+            // Quick rejection of polynomials with an even number of terms, which have 1 as a root so are divisible by x + 1
+            if (degree > 1 && NumberOfSetBits(polynomial) % 2 == 0)
+                return false;
+            // Primitive if and only if x has multiplicative order 2^degree - 1 modulo the polynomial
+            ulong order = (1ul << degree) - 1;
+            if (PowerOfX(order, polynomial, degree) != 1)
+                return false;
+            foreach (ulong primeFactor in PrimeFactors(order))
+            {
+                if (PowerOfX(order / primeFactor, polynomial, degree) == 1)
+                    return false;
+            }
+            return true;
+        }
+
+        private static ulong PowerOfX(ulong exponent, uint polynomial, int degree)
+        {
+            ulong result = 1;
+            ulong power = Reduce(2, polynomial, degree);
+            while (exponent > 0)
+            {
+                if ((exponent & 1) == 1)
+                    result = MultiplyMod(result, power, polynomial, degree);
+                power = MultiplyMod(power, power, polynomial, degree);
+                exponent >>= 1;
+            }
+            return result;
+        }
+
+        private static ulong MultiplyMod(ulong left, ulong right, uint polynomial, int degree)
+        {
+            ulong result = 0;
+            while (right > 0)
+            {
+                if ((right & 1) == 1)
+                    result ^= left;
+                right >>= 1;
+                left = Reduce(left << 1, polynomial, degree);
+            }
+            return result;
+        }
+
+        private static ulong Reduce(ulong value, uint polynomial, int degree)
+            => ((value >> degree) & 1) == 1 ? value ^ polynomial : value;
+
+        private static IEnumerable<ulong> PrimeFactors(ulong value)
+        {
+            for (ulong factor = 2; factor * factor <= value; factor++)
+            {
+                if (value % factor != 0) continue;
+                yield return factor;
+                while (value % factor == 0)
+                    value /= factor;
+            }
+            if (value > 1)
+                yield return value;
+        }
+
+        private static int NumberOfSetBits(uint value)
+        {
+            int count = 0;
+            while (value > 0)
+            {
+                count += (int)(value & 1);
+                value >>= 1;
+            }
+            return count;
+        }
+
+        private static int Degree(uint polynomial)
+        {
+            int degree = -1;
+            while (polynomial > 0)
+            {
+                polynomial >>= 1;
+                degree++;
+            }
+            return degree;
+        }
+
+    }
+}
@@ -26,6 +26,7 @@
 using System;
 using System.Diagnostics;
 using System.Globalization;
+using System.Reflection;
 using System.Text;
 
 namespace Cmdty.Storage
@@ -38,9 +39,22 @@ internal sealed class Stopwatches
         public Stopwatch BackwardInduction { get; }
         public Stopwatch PseudoInverse { get; }
         public Stopwatch ForwardSimulation { get; }
+        public int NumRegressionsSolved { get; set; }
+        public long NumDecisionsEvaluated { get; set; }
+
+        // GC.GetTotalAllocatedBytes is not part of netstandard2.0 so is bound at runtime, and is null if not available
+        private static readonly Func<bool, long> GetTotalAllocatedBytes = CreateGetTotalAllocatedBytes();
+        private readonly long? _startAllocatedBytes;
+
+        private static Func<bool, long> CreateGetTotalAllocatedBytes()
+        {
+            MethodInfo method = typeof(GC).GetMethod("GetTotalAllocatedBytes", new[] { typeof(bool) });
+            return (Func<bool, long>) method?.CreateDelegate(typeof(Func<bool, long>));
+        }
 
         public Stopwatches()
         {
+            _startAllocatedBytes = GetTotalAllocatedBytes?.Invoke(false);
             All = new Stopwatch();
             RegressionPriceSimulation = new Stopwatch();
             ValuationPriceSimulation = new Stopwatch();
@@ -49,6 +63,14 @@ public Stopwatches()
             ForwardSimulation = new Stopwatch();
         }
 
+        public LsmcValuationProfile CreateProfile()
+        {
+            long? allocatedBytes = GetTotalAllocatedBytes?.Invoke(false) - _startAllocatedBytes;
+            return new LsmcValuationProfile(All.Elapsed, RegressionPriceSimulation.Elapsed, ValuationPriceSimulation.Elapsed,
+                BackwardInduction.Elapsed, PseudoInverse.Elapsed, ForwardSimulation.Elapsed, NumRegressionsSolved,
+                NumDecisionsEvaluated, allocatedBytes);
+        }
+
         public string GenerateProfileReport()
         {
             var stringBuilder = new StringBuilder();
@@ -75,6 +97,8 @@ public string GenerateProfileReport()
             stringBuilder.AppendLine($"Other back ind:\t\t{otherBackwardInduction.ToString("g", CultureInfo.InvariantCulture)}\t({otherBackInductionPercent})");
             stringBuilder.AppendLine($"Fwd sim:\t\t{ForwardSimulation.Elapsed.ToString("g", CultureInfo.InvariantCulture)}\t({forwardSimPercent})");
             stringBuilder.AppendLine($"Other:\t\t\t{otherAll.ToString("g", CultureInfo.InvariantCulture)}\t({otherPercent})");
+            stringBuilder.AppendLine($"Regressions:\t\t{NumRegressionsSolved.ToString("N0", CultureInfo.InvariantCulture)}");
+            stringBuilder.AppendLine($"Decisions:\t\t{NumDecisionsEvaluated.ToString("N0", CultureInfo.InvariantCulture)}");
 
             return stringBuilder.ToString();
         }
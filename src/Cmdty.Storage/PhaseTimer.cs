@@ -0,0 +1,76 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+
+namespace Cmdty.Storage
+{
+    /// <summary>
+    /// Accumulates elapsed time by named calculation phase. When disabled, starting and stopping a phase does nothing.
+    /// </summary>
+    internal sealed class PhaseTimer
+    {
+        public const string InventorySpace = "InventorySpace";
+        public const string TreeBuild = "TreeBuild";
+        public const string BackwardInduction = "BackwardInduction";
+        public const string InterpolatorConstruction = "InterpolatorConstruction";
+        public const string ForwardProfile = "ForwardProfile";
+
+        private static readonly IReadOnlyDictionary<string, TimeSpan> NoTimings = new Dictionary<string, TimeSpan>();
+        private readonly Dictionary<string, Stopwatch> _stopwatches;
+
+        public PhaseTimer(bool enabled)
+        {
+            if (enabled)
+                _stopwatches = new Dictionary<string, Stopwatch>();
+        }
+
+        public void Start(string phase)
+        {
+            if (_stopwatches == null)
+                return;
+            if (!_stopwatches.TryGetValue(phase, out Stopwatch stopwatch))
+            {
+                stopwatch = new Stopwatch();
+                _stopwatches[phase] = stopwatch;
+            }
+            stopwatch.Start();
+        }
+
+        public void Stop(string phase)
+        {
+            if (_stopwatches == null)
+                return;
+            _stopwatches[phase].Stop();
+        }
+
+        public IReadOnlyDictionary<string, TimeSpan> Timings =>
+            _stopwatches?.ToDictionary(pair => pair.Key, pair => pair.Value.Elapsed) ?? NoTimings;
+
+    }
+}
@@ -0,0 +1,163 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+using System.Collections.Generic;
+using Cmdty.TimePeriodValueTypes;
+using JetBrains.Annotations;
+
+namespace Cmdty.Storage.PythonHelpers
+{
+    // Array versions of the ICmdtyStorage<T> query methods, so that Python can evaluate a whole grid of periods and
+    // inventories with one interop call. Periods are specified as offsets from the storage start period, which Python
+    // can calculate for a whole PeriodIndex with one vectorised subtraction rather than creating a .NET time period
+    // object per element.
+    public static class CmdtyStorageBulkQuery
+    {
+        public static double[] MinInventories<T>([NotNull] ICmdtyStorage<T> storage, [NotNull] int[] periodOffsets)
+            where T : ITimePeriod<T>
+        {
+            if (storage == null) throw new ArgumentNullException(nameof(storage));
+            if (periodOffsets == null) throw new ArgumentNullException(nameof(periodOffsets));
+            var minInventories = new double[periodOffsets.Length];
+            for (int i = 0; i < periodOffsets.Length; i++)
+                minInventories[i] = storage.MinInventory(storage.StartPeriod.Offset(periodOffsets[i]));
+            return minInventories;
+        }
+
+        public static double[] MaxInventories<T>([NotNull] ICmdtyStorage<T> storage, [NotNull] int[] periodOffsets)
+            where T : ITimePeriod<T>
+        {
+            if (storage == null) throw new ArgumentNullException(nameof(storage));
+            if (periodOffsets == null) throw new ArgumentNullException(nameof(periodOffsets));
+            var maxInventories = new double[periodOffsets.Length];
+            for (int i = 0; i < periodOffsets.Length; i++)
+                maxInventories[i] = storage.MaxInventory(storage.StartPeriod.Offset(periodOffsets[i]));
+            return maxInventories;
+        }
+
+        // Returned array has the min inject/withdraw rates in the first half, and max in the second half
+        public static double[] InjectWithdrawRanges<T>([NotNull] ICmdtyStorage<T> storage, [NotNull] int[] periodOffsets,
+                                                        [NotNull] double[] inventories) where T : ITimePeriod<T>
+        {
+            ValidateArgs(storage, periodOffsets, inventories);
+            int numPoints = periodOffsets.Length;
+            var injectWithdrawRanges = new double[numPoints * 2];
+            for (int i = 0; i < numPoints; i++)
+            {
+                InjectWithdrawRange injectWithdrawRange = storage.GetInjectWithdrawRange(
+                                        storage.StartPeriod.Offset(periodOffsets[i]), inventories[i]);
+                injectWithdrawRanges[i] = injectWithdrawRange.MinInjectWithdrawRate;
+                injectWithdrawRanges[numPoints + i] = injectWithdrawRange.MaxInjectWithdrawRate;
+            }
+            return injectWithdrawRanges;
+        }
+
+        public static double[] InjectionCosts<T>([NotNull] ICmdtyStorage<T> storage, [NotNull] int[] periodOffsets,
+                                    [NotNull] double[] inventories, [NotNull] double[] injectedVolumes) where T : ITimePeriod<T>
+        {
+            ValidateArgs(storage, periodOffsets, inventories, injectedVolumes);
+            var injectionCosts = new double[periodOffsets.Length];
+            for (int i = 0; i < periodOffsets.Length; i++)
+                injectionCosts[i] = SumAmounts(storage.InjectionCost(storage.StartPeriod.Offset(periodOffsets[i]), 
+                                                    inventories[i], injectedVolumes[i]));
+            return injectionCosts;
+        }
+
+        public static double[] WithdrawalCosts<T>([NotNull] ICmdtyStorage<T> storage, [NotNull] int[] periodOffsets,
+                                    [NotNull] double[] inventories, [NotNull] double[] withdrawnVolumes) where T : ITimePeriod<T>
+        {
+            ValidateArgs(storage, periodOffsets, inventories, withdrawnVolumes);
+            var withdrawalCosts = new double[periodOffsets.Length];
+            for (int i = 0; i < periodOffsets.Length; i++)
+                withdrawalCosts[i] = SumAmounts(storage.WithdrawalCost(storage.StartPeriod.Offset(periodOffsets[i]),
+                                                    inventories[i], withdrawnVolumes[i]));
+            return withdrawalCosts;
+        }
+
+        public static double[] CmdtyVolumesConsumedOnInject<T>([NotNull] ICmdtyStorage<T> storage, [NotNull] int[] periodOffsets,
+                                    [NotNull] double[] inventories, [NotNull] double[] injectedVolumes) where T : ITimePeriod<T>
+        {
+            ValidateArgs(storage, periodOffsets, inventories, injectedVolumes);
+            var cmdtyConsumed = new double[periodOffsets.Length];
+            for (int i = 0; i < periodOffsets.Length; i++)
+                cmdtyConsumed[i] = storage.CmdtyVolumeConsumedOnInject(storage.StartPeriod.Offset(periodOffsets[i]),
+                                                    inventories[i], injectedVolumes[i]);
+            return cmdtyConsumed;
+        }
+
+        public static double[] CmdtyVolumesConsumedOnWithdraw<T>([NotNull] ICmdtyStorage<T> storage, [NotNull] int[] periodOffsets,
+                                    [NotNull] double[] inventories, [NotNull] double[] withdrawnVolumes) where T : ITimePeriod<T>
+        {
+            ValidateArgs(storage, periodOffsets, inventories, withdrawnVolumes);
+            var cmdtyConsumed = new double[periodOffsets.Length];
+            for (int i = 0; i < periodOffsets.Length; i++)
+                cmdtyConsumed[i] = storage.CmdtyVolumeConsumedOnWithdraw(storage.StartPeriod.Offset(periodOffsets[i]),
+                                                    inventories[i], withdrawnVolumes[i]);
+            return cmdtyConsumed;
+        }
+
+        public static double[] CmdtyInventoryCosts<T>([NotNull] ICmdtyStorage<T> storage, [NotNull] int[] periodOffsets,
+                                                        [NotNull] double[] inventories) where T : ITimePeriod<T>
+        {
+            ValidateArgs(storage, periodOffsets, inventories);
+            var inventoryCosts = new double[periodOffsets.Length];
+            for (int i = 0; i < periodOffsets.Length; i++)
+                inventoryCosts[i] = SumAmounts(storage.CmdtyInventoryCost(storage.StartPeriod.Offset(periodOffsets[i]), 
+                                                    inventories[i]));
+            return inventoryCosts;
+        }
+
+        private static double SumAmounts(IReadOnlyList<DomesticCashFlow> cashFlows)
+        {
+            double sum = 0.0;
+            for (int i = 0; i < cashFlows.Count; i++)
+                sum += cashFlows[i].Amount;
+            return sum;
+        }
+
+        private static void ValidateArgs<T>(ICmdtyStorage<T> storage, int[] periodOffsets, double[] inventories)
+            where T : ITimePeriod<T>
+        {
+            if (storage == null) throw new ArgumentNullException(nameof(storage));
+            if (periodOffsets == null) throw new ArgumentNullException(nameof(periodOffsets));
+            if (inventories == null) throw new ArgumentNullException(nameof(inventories));
+            if (inventories.Length != periodOffsets.Length)
+                throw new ArgumentException($"Length of {nameof(inventories)} ({inventories.Length}) must equal length of " +
+                                            $"{nameof(periodOffsets)} ({periodOffsets.Length}).", nameof(inventories));
+        }
+
+        private static void ValidateArgs<T>(ICmdtyStorage<T> storage, int[] periodOffsets, double[] inventories, double[] volumes)
+            where T : ITimePeriod<T>
+        {
+            ValidateArgs(storage, periodOffsets, inventories);
+            if (volumes == null) throw new ArgumentNullException(nameof(volumes));
+            if (volumes.Length != periodOffsets.Length)
+                throw new ArgumentException($"Length of {nameof(volumes)} ({volumes.Length}) must equal length of " +
+                                            $"{nameof(periodOffsets)} ({periodOffsets.Length}).", nameof(volumes));
+        }
+
+    }
+}
@@ -0,0 +1,68 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+using Cmdty.Core.Simulation;
+using Cmdty.TimePeriodValueTypes;
+using JetBrains.Annotations;
+
+namespace Cmdty.Storage.PythonHelpers
+{
+    public static class SpotSimResultsHelper
+    {
+        // Markov factors are copied into a single array, ordered by factor, then simulated period, then simulation,
+        // so that Python can copy them into a numpy array of shape (NumFactors, NumSteps, NumSims) with one memmove.
+        public static double[] MarkovFactorsToArray<T>([NotNull] ISpotSimResults<T> spotSims) where T : ITimePeriod<T>
+        {
+            if (spotSims == null) throw new ArgumentNullException(nameof(spotSims));
+            int numSims = spotSims.NumSims;
+            int numFactors = spotSims.NumFactors;
+            int numSteps = spotSims.SpotPrices.Length / numSims;
+            var markovFactors = new double[numFactors * numSteps * numSims];
+
+            int stepIndex = 0;
+            foreach (T period in spotSims.SimulatedPeriods)
+            {
+                for (int factorIndex = 0; factorIndex < numFactors; factorIndex++)
+                {
+                    Span<double> destination = markovFactors.AsSpan((factorIndex * numSteps + stepIndex) * numSims, numSims);
+                    spotSims.MarkovFactorsForPeriod(period, factorIndex).Span.CopyTo(destination);
+                }
+                stepIndex++;
+            }
+            return markovFactors;
+        }
+
+        public static float[] ToSingleArray([NotNull] double[] values)
+        {
+            if (values == null) throw new ArgumentNullException(nameof(values));
+            var singles = new float[values.Length];
+            for (int i = 0; i < values.Length; i++)
+                singles[i] = (float)values[i];
+            return singles;
+        }
+
+    }
+}
@@ -0,0 +1,117 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+using System.Collections.Generic;
+using Cmdty.TimePeriodValueTypes;
+using JetBrains.Annotations;
+
+namespace Cmdty.Storage
+{
+    /// <summary>
+    /// Commonly used rules mapping the period in which the commodity is delivered to the date on which it is settled,
+    /// for use as the settlement rule of the valuation methods.
+    /// </summary>
+    public static class SettlementRules
+    {
+        /// <summary>
+        /// Settlement on a fixed day of the month following the month in which the period starts, e.g. the 20th of the
+        /// following month. If the month has fewer days than <paramref name="dayOfMonth"/>, settlement is on the last day
+        /// of the month.
+        /// </summary>
+        public static Func<T, Day> DayOfFollowingMonth<T>(int dayOfMonth)
+            where T : ITimePeriod<T>
+        {
+            if (dayOfMonth < 1 || dayOfMonth > 31)
+                throw new ArgumentException("Day of month must be between 1 and 31 inclusive.", nameof(dayOfMonth));
+
+            Day SettleDateRule(T deliveryPeriod)
+            {
+                DateTime followingMonthStart = TimePeriodFactory.FromDateTime<Month>(deliveryPeriod.Start).Offset(1).Start;
+                int daysInMonth = DateTime.DaysInMonth(followingMonthStart.Year, followingMonthStart.Month);
+                return TimePeriodFactory.FromDateTime<Day>(followingMonthStart) + (Math.Min(dayOfMonth, daysInMonth) - 1);
+            }
+            return SettleDateRule;
+        }
+
+        /// <summary>
+        /// Settlement on the day in which the period starts.
+        /// </summary>
+        public static Func<T, Day> SameDay<T>()
+            where T : ITimePeriod<T>
+            => deliveryPeriod => TimePeriodFactory.FromDateTime<Day>(deliveryPeriod.Start);
+
+        /// <summary>
+        /// Settlement on the first day of the period of type <typeparamref name="TContaining"/>, e.g. month or quarter,
+        /// in which the delivery period starts.
+        /// </summary>
+        public static Func<T, Day> FirstOfPeriod<T, TContaining>()
+            where T : ITimePeriod<T>
+            where TContaining : ITimePeriod<TContaining>
+            => deliveryPeriod => TimePeriodFactory.FromDateTime<Day>(
+                                    TimePeriodFactory.FromDateTime<TContaining>(deliveryPeriod.Start).Start);
+
+        /// <summary>
+        /// Settlement a number of business days after (or before if negative) the day in which the period starts. Weekends
+        /// and the days in <paramref name="holidays"/> are not business days. If <paramref name="numBusinessDays"/> is
+        /// zero and the delivery day is not a business day, settlement is on the following business day.
+        /// </summary>
+        public static Func<T, Day> BusinessDayOffset<T>(int numBusinessDays, [NotNull] IEnumerable<Day> holidays)
+            where T : ITimePeriod<T>
+        {
+            if (holidays == null) throw new ArgumentNullException(nameof(holidays));
+            var holidaySet = new HashSet<Day>(holidays);
+
+            bool IsBusinessDay(Day day)
+            {
+                DayOfWeek dayOfWeek = day.Start.DayOfWeek;
+                return dayOfWeek != DayOfWeek.Saturday && dayOfWeek != DayOfWeek.Sunday && !holidaySet.Contains(day);
+            }
+
+            int step = numBusinessDays < 0 ? -1 : 1;
+            int numSteps = Math.Abs(numBusinessDays);
+
+            Day SettleDateRule(T deliveryPeriod)
+            {
+                Day settleDay = TimePeriodFactory.FromDateTime<Day>(deliveryPeriod.Start);
+                if (numSteps == 0)
+                {
+                    while (!IsBusinessDay(settleDay))
+                        settleDay = settleDay.Offset(1);
+                    return settleDay;
+                }
+                for (int i = 0; i < numSteps; i++)
+                {
+                    do
+                        settleDay = settleDay.Offset(step);
+                    while (!IsBusinessDay(settleDay));
+                }
+                return settleDay;
+            }
+            return SettleDateRule;
+        }
+
+    }
+}
@@ -24,9 +24,11 @@
 #endregion
 
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Collections.Immutable;
 using System.Linq;
+using System.Threading;
 using Cmdty.TimePeriodValueTypes;
 using Cmdty.TimeSeries;
 using JetBrains.Annotations;
@@ -48,6 +50,20 @@ public sealed class CmdtyStorage<T> : ICmdtyStorage<T> where T : ITimePeriod<T>
         private readonly Func<T, double> _cmdtyInventoryLoss;
         private readonly Func<T, double, IReadOnlyList<DomesticCashFlow>> _cmdtyInventoryCost;
         private readonly Func<double, double, double> _terminalStorageValue;
+        // Per-unit costs are only non-null if the storage was built with per-unit costs, in which case they are
+        // snapshotted by Compile
+        private readonly Func<T, double> _perUnitInjectionCost;
+        private readonly Func<T, Day> _injectionCostDate;
+        private readonly Func<T, double> _perUnitWithdrawalCost;
+        private readonly Func<T, Day> _withdrawalCostDate;
+        private readonly Func<T, double> _perUnitInventoryCost;
+        private readonly Lazy<CompiledCmdtyStorage<T>> _compiled;
+
+        // Inventory space only depends on the (immutable) storage, starting inventory and current period, so is memoised
+        // to be shared between valuations. Cleared once full to bound memory use when many starting inventories are used.
+        private const int MaxInventorySpaceCacheSize = 64;
+        private readonly ConcurrentDictionary<(double StartingInventory, T CurrentPeriod), TimeSeries<T, InventoryRange>> _inventorySpaceCache
+            = new ConcurrentDictionary<(double StartingInventory, T CurrentPeriod), TimeSeries<T, InventoryRange>>();
 
         public bool MustBeEmptyAtEnd { get; }
 
@@ -63,7 +79,12 @@ public sealed class CmdtyStorage<T> : ICmdtyStorage<T> where T : ITimePeriod<T>
                             Func<T, double, double, double> injectCmdtyConsumed,
                             Func<T, double, double, double> withdrawCmdtyConsumed,
                             Func<T, double> cmdtyInventoryLoss,
-                            Func<T, double, IReadOnlyList<DomesticCashFlow>> cmdtyInventoryCost)
+                            Func<T, double, IReadOnlyList<DomesticCashFlow>> cmdtyInventoryCost,
+                            Func<T, double> perUnitInjectionCost,
+                            Func<T, Day> injectionCostDate,
+                            Func<T, double> perUnitWithdrawalCost,
+                            Func<T, Day> withdrawalCostDate,
+                            Func<T, double> perUnitInventoryCost)
         {
             StartPeriod = startPeriod;
             EndPeriod = endPeriod;
@@ -78,6 +99,13 @@ public sealed class CmdtyStorage<T> : ICmdtyStorage<T> where T : ITimePeriod<T>
             _withdrawCmdtyConsumed = withdrawCmdtyConsumed;
             _cmdtyInventoryLoss = cmdtyInventoryLoss;
             _cmdtyInventoryCost = cmdtyInventoryCost;
+            _perUnitInjectionCost = perUnitInjectionCost;
+            _injectionCostDate = injectionCostDate;
+            _perUnitWithdrawalCost = perUnitWithdrawalCost;
+            _withdrawalCostDate = withdrawalCostDate;
+            _perUnitInventoryCost = perUnitInventoryCost;
+            // PublicationOnly so that exceptions aren't cached
+            _compiled = new Lazy<CompiledCmdtyStorage<T>>(CreateCompiled, LazyThreadSafetyMode.PublicationOnly);
         }
 
         public T StartPeriod { get; }
@@ -98,6 +126,32 @@ public InjectWithdrawRange GetInjectWithdrawRange(T date, double inventory)
 
             return _injectWithdrawConstraints(date).GetInjectWithdrawRange(inventory);
         }
+
+        public void GetInjectWithdrawRange(T date, ReadOnlySpan<double> inventories, Span<InjectWithdrawRange> injectWithdrawRanges)
+        {
+            if (inventories.Length != injectWithdrawRanges.Length)
+                throw new ArgumentException("Inventories and inject/withdraw ranges must have the same length.", nameof(injectWithdrawRanges));
+
+            double minInventory = _minInventory(date);
+            double maxInventory = _maxInventory(date);
+            ValidateInventories(date, inventories, minInventory, maxInventory);
+
+            if (date.CompareTo(EndPeriod) >= 0)
+                injectWithdrawRanges.Fill(new InjectWithdrawRange(0.0, 0.0));
+            else
+                _injectWithdrawConstraints(date).GetInjectWithdrawRange(inventories, injectWithdrawRanges);
+        }
+
+        internal static void ValidateInventories(T date, ReadOnlySpan<double> inventories, double minInventory, double maxInventory)
+        {
+            foreach (double inventory in inventories)
+            {
+                if (inventory < minInventory)
+                    throw new ArgumentException($"Inventory of {inventory} is below minimum allowed value of {minInventory} during period {date}.", nameof(inventories));
+                if (inventory > maxInventory)
+                    throw new ArgumentException($"Inventory of {inventory} above maximum allowed value of {maxInventory} during period {date}.", nameof(inventories));
+            }
+        }
         
         public double MaxInventory(T date)
         {
@@ -168,6 +222,100 @@ public IReadOnlyList<DomesticCashFlow> CmdtyInventoryCost([NotNull] T period, do
             return _cmdtyInventoryCost(period, inventory);
         }
 
+        // The batch methods use the compiled snapshot, which has the fast path for per-unit costs
+        public void InjectWithdrawCostNpvs(T date, ReadOnlySpan<double> inventories, ReadOnlySpan<double> injectWithdrawVolumes,
+            [NotNull] Func<Day, double> discountToPresent, Span<double> costNpvs)
+            => Compile().InjectWithdrawCostNpvs(date, inventories, injectWithdrawVolumes, discountToPresent, costNpvs);
+
+        public void CmdtyVolumesConsumedOnInjectWithdraw(T date, ReadOnlySpan<double> inventories, ReadOnlySpan<double> injectWithdrawVolumes,
+            Span<double> cmdtyVolumesConsumed)
+            => StorageHelper.CmdtyVolumesConsumedOnInjectWithdraw(this, date, inventories, injectWithdrawVolumes, cmdtyVolumesConsumed);
+
+        public void CmdtyInventoryCostNpvs([NotNull] T period, ReadOnlySpan<double> inventories, [NotNull] Func<Day, double> discountToPresent,
+            Span<double> costNpvs)
+        {
+            if (period == null) throw new ArgumentNullException(nameof(period));
+            Compile().CmdtyInventoryCostNpvs(period, inventories, discountToPresent, costNpvs);
+        }
+
+        /// <summary>
+        /// Gets the inventory space, as calculated by <see cref="StorageHelper.CalculateInventorySpace{T}"/>, memoised
+        /// by starting inventory and current period so that it is only calculated once across all valuations of this
+        /// storage instance.
+        /// </summary>
+        public TimeSeries<T, InventoryRange> InventorySpace(double startingInventory, [NotNull] T currentPeriod)
+        {
+            if (currentPeriod == null) throw new ArgumentNullException(nameof(currentPeriod));
+            var key = (startingInventory, currentPeriod);
+            if (_inventorySpaceCache.TryGetValue(key, out TimeSeries<T, InventoryRange> inventorySpace))
+                return inventorySpace;
+
+            inventorySpace = StorageHelper.CalculateInventorySpace(Compile(), startingInventory, currentPeriod);
+            if (_inventorySpaceCache.Count >= MaxInventorySpaceCacheSize)
+                _inventorySpaceCache.Clear();
+            _inventorySpaceCache[key] = inventorySpace;
+            return inventorySpace;
+        }
+
+        public void ClearInventorySpaceCache() => _inventorySpaceCache.Clear();
+
+        /// <summary>
+        /// Gets a snapshot of this storage with the per-period constraints, inventory limits, inventory loss and per-unit
+        /// costs evaluated into arrays indexed by offset from the start period. Used by the valuation engines to avoid
+        /// time series lookups and delegate calls within their inner loops. Memoised, so only created once per instance.
+        /// </summary>
+        public CompiledCmdtyStorage<T> Compile() => _compiled.Value;
+
+        private CompiledCmdtyStorage<T> CreateCompiled()
+        {
+            int numPeriods = EndPeriod.OffsetFrom(StartPeriod) + 1; // Includes end period, for inventory limits
+            int numActivePeriods = numPeriods - 1; // Excludes end period, in which no decisions are made
+
+            var minInventories = new double[numPeriods];
+            var maxInventories = new double[numPeriods];
+            for (int i = 0; i < numPeriods; i++)
+            {
+                T period = StartPeriod.Offset(i);
+                minInventories[i] = _minInventory(period);
+                maxInventories[i] = _maxInventory(period);
+            }
+
+            var injectWithdrawConstraints = new IInjectWithdrawConstraint[numActivePeriods];
+            var inventoryPercentLosses = new double[numActivePeriods];
+            double[] perUnitInjectionCosts = _perUnitInjectionCost == null ? null : new double[numActivePeriods];
+            Day[] injectionCostDates = _perUnitInjectionCost == null ? null : new Day[numActivePeriods];
+            double[] perUnitWithdrawalCosts = _perUnitWithdrawalCost == null ? null : new double[numActivePeriods];
+            Day[] withdrawalCostDates = _perUnitWithdrawalCost == null ? null : new Day[numActivePeriods];
+            double[] perUnitInventoryCosts = _perUnitInventoryCost == null ? null : new double[numActivePeriods];
+            Day[] inventoryCostDates = _perUnitInventoryCost == null ? null : new Day[numActivePeriods];
+
+            for (int i = 0; i < numActivePeriods; i++)
+            {
+                T period = StartPeriod.Offset(i);
+                injectWithdrawConstraints[i] = _injectWithdrawConstraints(period);
+                inventoryPercentLosses[i] = _cmdtyInventoryLoss(period);
+                if (perUnitInjectionCosts != null)
+                {
+                    perUnitInjectionCosts[i] = _perUnitInjectionCost(period);
+                    injectionCostDates[i] = _injectionCostDate(period);
+                }
+                if (perUnitWithdrawalCosts != null)
+                {
+                    perUnitWithdrawalCosts[i] = _perUnitWithdrawalCost(period);
+                    withdrawalCostDates[i] = _withdrawalCostDate(period);
+                }
+                if (perUnitInventoryCosts != null)
+                {
+                    perUnitInventoryCosts[i] = _perUnitInventoryCost(period);
+                    inventoryCostDates[i] = period.First<Day>();
+                }
+            }
+
+            return new CompiledCmdtyStorage<T>(this, injectWithdrawConstraints, minInventories, maxInventories,
+                inventoryPercentLosses, perUnitInjectionCosts, injectionCostDates, perUnitWithdrawalCosts, 
+                withdrawalCostDates, perUnitInventoryCosts, inventoryCostDates);
+        }
+
         public static IBuilder<T> Builder => new StorageBuilder();
 
         private sealed class StorageBuilder : IBuilder<T>, IAddInjectWithdrawConstraints<T>, IAddMaxInventory<T>, IAddMinInventory<T>, IAddInjectionCost<T>, 
@@ -187,6 +335,11 @@ private sealed class StorageBuilder : IBuilder<T>, IAddInjectWithdrawConstraints
             private Func<T, double, double, double> _withdrawCmdtyConsumed;
             private Func<T, double> _cmdtyInventoryLoss;
             private Func<T, double, IReadOnlyList<DomesticCashFlow>> _cmdtyInventoryCost;
+            private Func<T, double> _perUnitInjectionCost;
+            private Func<T, Day> _injectionCostDate;
+            private Func<T, double> _perUnitWithdrawalCost;
+            private Func<T, Day> _withdrawalCostDate;
+            private Func<T, double> _perUnitInventoryCost;
 
             // ReSharper disable once StaticMemberInGenericType
             private static readonly IReadOnlyList<DomesticCashFlow> EmptyCashFlows = ImmutableArray<DomesticCashFlow>.Empty;
@@ -328,6 +481,8 @@ IAddMaxInventory<T> IAddMinInventory<T>.WithMinInventory(Func<T, double> minInve
 
                 _injectionCashFlows = (date, inventory, injectedVolume) 
                     => new [] {new DomesticCashFlow(cashFlowDate(date), perVolumeUnitCost * injectedVolume)};
+                _perUnitInjectionCost = period => perVolumeUnitCost;
+                _injectionCostDate = cashFlowDate;
                 return this;
             }
 
@@ -337,6 +492,8 @@ public IAddCmdtyConsumedOnInject<T> WithPerUnitInjectionCost(double perVolumeUni
                     throw new ArgumentException("Per unit inject cost must be non-negative.", nameof(perVolumeUnitCost));
                 _injectionCashFlows = (period, inventory, injectedVolume) 
                     => new[] { new DomesticCashFlow(period.First<Day>(), perVolumeUnitCost * injectedVolume) };
+                _perUnitInjectionCost = period => perVolumeUnitCost;
+                _injectionCostDate = period => period.First<Day>();
                 return this;
             }
 
@@ -365,6 +522,8 @@ IAddCmdtyConsumedOnInject<T> IAddInjectionCost<T>.WithPerUnitInjectionCostTimeSe
 
                 _injectionCashFlows = (period, inventory, injectedVolume)
                     => new[] { new DomesticCashFlow(period.First<Day>(), perVolumeUnitCostSeries[period] * injectedVolume) };
+                _perUnitInjectionCost = period => perVolumeUnitCostSeries[period];
+                _injectionCostDate = period => period.First<Day>();
                 return this;
             }
 
@@ -372,6 +531,8 @@ IAddCmdtyConsumedOnInject<T> IAddInjectionCost<T>.WithPerUnitInjectionCostTimeSe
                 Func<T, double, double, IReadOnlyList<DomesticCashFlow>> injectionCost)
             {
                 _injectionCashFlows = injectionCost ?? throw new ArgumentNullException(nameof(injectionCost));
+                _perUnitInjectionCost = null;
+                _injectionCostDate = null;
                 return this;
             }
 
@@ -384,6 +545,8 @@ IAddCmdtyConsumedOnInject<T> IAddInjectionCost<T>.WithPerUnitInjectionCostTimeSe
 
                 _withdrawalCashFlows = (date, inventory, withdrawnVolume) 
                     => new[] { new DomesticCashFlow(cashFlowDate(date), perVolumeUnitCost * Math.Abs(withdrawnVolume)) };
+                _perUnitWithdrawalCost = period => perVolumeUnitCost;
+                _withdrawalCostDate = cashFlowDate;
                 return this;
             }
 
@@ -393,6 +556,8 @@ public IAddCmdtyConsumedOnWithdraw<T> WithPerUnitWithdrawalCost(double perVolume
                     throw new ArgumentException("Per unit withdrawal cost must be non-negative.", nameof(perVolumeUnitCost));
                 _withdrawalCashFlows = (period, inventory, withdrawnVolume)
                     => new[] { new DomesticCashFlow(period.First<Day>(), perVolumeUnitCost * Math.Abs(withdrawnVolume)) };
+                _perUnitWithdrawalCost = period => perVolumeUnitCost;
+                _withdrawalCostDate = period => period.First<Day>();
                 return this;
             }
 
@@ -405,6 +570,8 @@ public IAddCmdtyConsumedOnWithdraw<T> WithPerUnitWithdrawalCost(double perVolume
 
                 _withdrawalCashFlows = (period, inventory, withdrawnVolume)
                     => new[] { new DomesticCashFlow(period.First<Day>(), perVolumeUnitCostSeries[period] * Math.Abs(withdrawnVolume)) };
+                _perUnitWithdrawalCost = period => perVolumeUnitCostSeries[period];
+                _withdrawalCostDate = period => period.First<Day>();
                 return this;
             }
 
@@ -412,6 +579,8 @@ public IAddCmdtyConsumedOnWithdraw<T> WithPerUnitWithdrawalCost(double perVolume
                 Func<T, double, double, IReadOnlyList<DomesticCashFlow>> withdrawalCost)
             {
                 _withdrawalCashFlows = withdrawalCost ?? throw new ArgumentNullException(nameof(withdrawalCost));
+                _perUnitWithdrawalCost = null;
+                _withdrawalCostDate = null;
                 return this;
             }
             
@@ -444,7 +613,8 @@ CmdtyStorage<T> IBuildCmdtyStorage<T>.Build()
                 return new CmdtyStorage<T>(_startPeriod, _endPeriod, _injectWithdrawConstraints, maxInventory, 
                         _minInventory, _injectionCashFlows, _withdrawalCashFlows, terminalStorageValue, _mustBeEmptyAtEnd, 
                         _injectCmdtyConsumed, _withdrawCmdtyConsumed, _cmdtyInventoryLoss,
-                        _cmdtyInventoryCost);
+                        _cmdtyInventoryCost, _perUnitInjectionCost, _injectionCostDate, _perUnitWithdrawalCost,
+                        _withdrawalCostDate, _perUnitInventoryCost);
             }
 
             IAddWithdrawalCost<T> IAddCmdtyConsumedOnInject<T>.WithNoCmdtyConsumedOnInject()
@@ -540,12 +710,14 @@ IAddCmdtyInventoryCost<T> IAddCmdtyInventoryLoss<T>.WithFixedPercentCmdtyInvento
                 [NotNull] Func<T, double, IReadOnlyList<DomesticCashFlow>> cmdtyInventoryCost)
             {
                 _cmdtyInventoryCost = cmdtyInventoryCost ?? throw new ArgumentNullException(nameof(cmdtyInventoryCost));
+                _perUnitInventoryCost = null;
                 return this;
             }
 
             IAddTerminalStorageState<T> IAddCmdtyInventoryCost<T>.WithNoInventoryCost()
             {
                 _cmdtyInventoryCost = (period, inventory) => EmptyCashFlows;
+                _perUnitInventoryCost = null;
                 return this;
             }
 
@@ -553,6 +725,7 @@ IAddTerminalStorageState<T> IAddCmdtyInventoryCost<T>.WithFixedPerUnitInventoryC
             {
                 _cmdtyInventoryCost = (period, inventory) 
                     => new[]{new DomesticCashFlow(period.First<Day>(), inventory * perUnitCost)};
+                _perUnitInventoryCost = period => perUnitCost;
                 return this;
             }
 
@@ -564,6 +737,7 @@ IAddTerminalStorageState<T> IAddCmdtyInventoryCost<T>.WithPerUnitInventoryCostTi
 
                 _cmdtyInventoryCost = (period, inventory)
                     => new[] { new DomesticCashFlow(period.First<Day>(), inventory * perUnitCostSeries[period]) };
+                _perUnitInventoryCost = period => perUnitCostSeries[period];
                 return this;
             }
         }
@@ -0,0 +1,245 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+using System.Collections.Generic;
+using Cmdty.TimePeriodValueTypes;
+using Cmdty.TimeSeries;
+
+namespace Cmdty.Storage
+{
+    /// <summary>
+    /// Snapshot of a <see cref="CmdtyStorage{T}"/> with its per-period properties held in arrays indexed by offset
+    /// from the storage start period. Created using <see cref="CmdtyStorage{T}.Compile"/>.
+    /// </summary>
+    public sealed class CompiledCmdtyStorage<T> : ICmdtyStorage<T> where T : ITimePeriod<T>
+    {
+        // Inventory limits cover the end period, everything else only covers the active periods before the end period.
+        // Any period not covered is delegated to the underlying storage.
+        private readonly IInjectWithdrawConstraint[] _injectWithdrawConstraints;
+        private readonly double[] _minInventories;
+        private readonly double[] _maxInventories;
+        private readonly double[] _inventoryPercentLosses;
+        // Per-unit cost arrays are null if the storage wasn't built with per-unit costs
+        private readonly double[] _perUnitInjectionCosts;
+        private readonly Day[] _injectionCostDates;
+        private readonly double[] _perUnitWithdrawalCosts;
+        private readonly Day[] _withdrawalCostDates;
+        private readonly double[] _perUnitInventoryCosts;
+        private readonly Day[] _inventoryCostDates;
+
+        internal CompiledCmdtyStorage(CmdtyStorage<T> storage, IInjectWithdrawConstraint[] injectWithdrawConstraints,
+            double[] minInventories, double[] maxInventories, double[] inventoryPercentLosses, 
+            double[] perUnitInjectionCosts, Day[] injectionCostDates, double[] perUnitWithdrawalCosts, 
+            Day[] withdrawalCostDates, double[] perUnitInventoryCosts, Day[] inventoryCostDates)
+        {
+            Storage = storage;
+            StartPeriod = storage.StartPeriod;
+            EndPeriod = storage.EndPeriod;
+            MustBeEmptyAtEnd = storage.MustBeEmptyAtEnd;
+            _injectWithdrawConstraints = injectWithdrawConstraints;
+            _minInventories = minInventories;
+            _maxInventories = maxInventories;
+            _inventoryPercentLosses = inventoryPercentLosses;
+            _perUnitInjectionCosts = perUnitInjectionCosts;
+            _injectionCostDates = injectionCostDates;
+            _perUnitWithdrawalCosts = perUnitWithdrawalCosts;
+            _withdrawalCostDates = withdrawalCostDates;
+            _perUnitInventoryCosts = perUnitInventoryCosts;
+            _inventoryCostDates = inventoryCostDates;
+        }
+
+        /// <summary>
+        /// The storage which this instance is a snapshot of.
+        /// </summary>
+        public CmdtyStorage<T> Storage { get; }
+        public bool MustBeEmptyAtEnd { get; }
+        public T StartPeriod { get; }
+        public T EndPeriod { get; }
+
+        public int NumActivePeriods => _injectWithdrawConstraints.Length;
+
+        public bool HasPerUnitInjectionCost => _perUnitInjectionCosts != null;
+        public bool HasPerUnitWithdrawalCost => _perUnitWithdrawalCosts != null;
+        public bool HasPerUnitInventoryCost => _perUnitInventoryCosts != null;
+
+        /// <summary>
+        /// Index of period into the snapshot arrays, or -1 if period isn't an active period, i.e. is before the storage
+        /// start or on or after the storage end.
+        /// </summary>
+        public int ActivePeriodIndex(T period)
+        {
+            int periodIndex = period.OffsetFrom(StartPeriod);
+            return (uint)periodIndex < (uint)_injectWithdrawConstraints.Length ? periodIndex : -1;
+        }
+
+        public IInjectWithdrawConstraint InjectWithdrawConstraint(int activePeriodIndex) => _injectWithdrawConstraints[activePeriodIndex];
+        public double PerUnitInjectionCost(int activePeriodIndex) => _perUnitInjectionCosts[activePeriodIndex];
+        public Day InjectionCostDate(int activePeriodIndex) => _injectionCostDates[activePeriodIndex];
+        public double PerUnitWithdrawalCost(int activePeriodIndex) => _perUnitWithdrawalCosts[activePeriodIndex];
+        public Day WithdrawalCostDate(int activePeriodIndex) => _withdrawalCostDates[activePeriodIndex];
+        public double PerUnitInventoryCost(int activePeriodIndex) => _perUnitInventoryCosts[activePeriodIndex];
+        public Day InventoryCostDate(int activePeriodIndex) => _inventoryCostDates[activePeriodIndex];
+
+        public InjectWithdrawRange GetInjectWithdrawRange(T date, double inventory)
+        {
+            int periodIndex = ActivePeriodIndex(date);
+            if (periodIndex < 0)
+                return Storage.GetInjectWithdrawRange(date, inventory);
+
+            double minInventory = _minInventories[periodIndex];
+            if (inventory < minInventory)
+                throw new ArgumentException($"Inventory of {inventory} is below minimum allowed value of {minInventory} during period {date}.", nameof(inventory));
+
+            double maxInventory = _maxInventories[periodIndex];
+            if (inventory > maxInventory)
+                throw new ArgumentException($"Inventory of {inventory} above maximum allowed value of {maxInventory} during period {date}.", nameof(inventory));
+
+            return _injectWithdrawConstraints[periodIndex].GetInjectWithdrawRange(inventory);
+        }
+
+        public void GetInjectWithdrawRange(T date, ReadOnlySpan<double> inventories, Span<InjectWithdrawRange> injectWithdrawRanges)
+        {
+            int periodIndex = ActivePeriodIndex(date);
+            if (periodIndex < 0)
+            {
+                Storage.GetInjectWithdrawRange(date, inventories, injectWithdrawRanges);
+                return;
+            }
+            if (inventories.Length != injectWithdrawRanges.Length)
+                throw new ArgumentException("Inventories and inject/withdraw ranges must have the same length.", nameof(injectWithdrawRanges));
+            CmdtyStorage<T>.ValidateInventories(date, inventories, _minInventories[periodIndex], _maxInventories[periodIndex]);
+            _injectWithdrawConstraints[periodIndex].GetInjectWithdrawRange(inventories, injectWithdrawRanges);
+        }
+
+        public double MaxInventory(T date)
+        {
+            int periodIndex = date.OffsetFrom(StartPeriod);
+            return (uint)periodIndex < (uint)_maxInventories.Length ? _maxInventories[periodIndex] : Storage.MaxInventory(date);
+        }
+
+        public double MinInventory(T date)
+        {
+            int periodIndex = date.OffsetFrom(StartPeriod);
+            return (uint)periodIndex < (uint)_minInventories.Length ? _minInventories[periodIndex] : Storage.MinInventory(date);
+        }
+
+        public IReadOnlyList<DomesticCashFlow> InjectionCost(T date, double inventory, double injectedVolume)
+        {
+            int periodIndex = ActivePeriodIndex(date);
+            if (periodIndex < 0 || _perUnitInjectionCosts == null)
+                return Storage.InjectionCost(date, inventory, injectedVolume);
+            return new[] {new DomesticCashFlow(_injectionCostDates[periodIndex], _perUnitInjectionCosts[periodIndex] * injectedVolume)};
+        }
+
+        public double CmdtyVolumeConsumedOnInject(T date, double inventory, double injectedVolume) 
+            => Storage.CmdtyVolumeConsumedOnInject(date, inventory, injectedVolume);
+
+        public IReadOnlyList<DomesticCashFlow> WithdrawalCost(T date, double inventory, double withdrawnVolume)
+        {
+            int periodIndex = ActivePeriodIndex(date);
+            if (periodIndex < 0 || _perUnitWithdrawalCosts == null)
+                return Storage.WithdrawalCost(date, inventory, withdrawnVolume);
+            return new[] {new DomesticCashFlow(_withdrawalCostDates[periodIndex], _perUnitWithdrawalCosts[periodIndex] * Math.Abs(withdrawnVolume))};
+        }
+
+        public double CmdtyVolumeConsumedOnWithdraw(T date, double inventory, double withdrawnVolume)
+            => Storage.CmdtyVolumeConsumedOnWithdraw(date, inventory, withdrawnVolume);
+
+        public double InventorySpaceUpperBound(T period, double nextPeriodInventorySpaceLowerBound, double nextPeriodInventorySpaceUpperBound)
+        {
+            int periodIndex = ActivePeriodIndex(period);
+            if (periodIndex < 0)
+                return Storage.InventorySpaceUpperBound(period, nextPeriodInventorySpaceLowerBound, nextPeriodInventorySpaceUpperBound);
+            return _injectWithdrawConstraints[periodIndex].InventorySpaceUpperBound(nextPeriodInventorySpaceLowerBound, 
+                nextPeriodInventorySpaceUpperBound, _minInventories[periodIndex], _maxInventories[periodIndex], 
+                _inventoryPercentLosses[periodIndex]);
+        }
+
+        public double InventorySpaceLowerBound(T period, double nextPeriodInventorySpaceLowerBound, double nextPeriodInventorySpaceUpperBound)
+        {
+            int periodIndex = ActivePeriodIndex(period);
+            if (periodIndex < 0)
+                return Storage.InventorySpaceLowerBound(period, nextPeriodInventorySpaceLowerBound, nextPeriodInventorySpaceUpperBound);
+            return _injectWithdrawConstraints[periodIndex].InventorySpaceLowerBound(nextPeriodInventorySpaceLowerBound,
+                nextPeriodInventorySpaceUpperBound, _minInventories[periodIndex], _maxInventories[periodIndex],
+                _inventoryPercentLosses[periodIndex]);
+        }
+
+        public double TerminalStorageNpv(double cmdtyPrice, double finalInventory) 
+            => Storage.TerminalStorageNpv(cmdtyPrice, finalInventory);
+
+        public double CmdtyInventoryPercentLoss(T period)
+        {
+            int periodIndex = ActivePeriodIndex(period);
+            return periodIndex < 0 ? Storage.CmdtyInventoryPercentLoss(period) : _inventoryPercentLosses[periodIndex];
+        }
+
+        public IReadOnlyList<DomesticCashFlow> CmdtyInventoryCost(T period, double inventory)
+        {
+            int periodIndex = ActivePeriodIndex(period);
+            if (periodIndex < 0 || _perUnitInventoryCosts == null)
+                return Storage.CmdtyInventoryCost(period, inventory);
+            return new[] {new DomesticCashFlow(_inventoryCostDates[periodIndex], inventory * _perUnitInventoryCosts[periodIndex])};
+        }
+
+        public void InjectWithdrawCostNpvs(T date, ReadOnlySpan<double> inventories, ReadOnlySpan<double> injectWithdrawVolumes,
+            Func<Day, double> discountToPresent, Span<double> costNpvs)
+        {
+            if (discountToPresent == null) throw new ArgumentNullException(nameof(discountToPresent));
+            int periodIndex = ActivePeriodIndex(date);
+            double? perUnitInjectionCostNpv = null;
+            double? perUnitWithdrawalCostNpv = null;
+            if (periodIndex >= 0)
+            {
+                if (_perUnitInjectionCosts != null)
+                    perUnitInjectionCostNpv = _perUnitInjectionCosts[periodIndex] * discountToPresent(_injectionCostDates[periodIndex]);
+                if (_perUnitWithdrawalCosts != null)
+                    perUnitWithdrawalCostNpv = _perUnitWithdrawalCosts[periodIndex] * discountToPresent(_withdrawalCostDates[periodIndex]);
+            }
+            StorageHelper.InjectWithdrawCostNpvs(this, date, inventories, injectWithdrawVolumes, discountToPresent, 
+                perUnitInjectionCostNpv, perUnitWithdrawalCostNpv, costNpvs);
+        }
+
+        public void CmdtyVolumesConsumedOnInjectWithdraw(T date, ReadOnlySpan<double> inventories, ReadOnlySpan<double> injectWithdrawVolumes,
+            Span<double> cmdtyVolumesConsumed)
+            => StorageHelper.CmdtyVolumesConsumedOnInjectWithdraw(Storage, date, inventories, injectWithdrawVolumes, cmdtyVolumesConsumed);
+
+        public void CmdtyInventoryCostNpvs(T period, ReadOnlySpan<double> inventories, Func<Day, double> discountToPresent,
+            Span<double> costNpvs)
+        {
+            if (discountToPresent == null) throw new ArgumentNullException(nameof(discountToPresent));
+            int periodIndex = ActivePeriodIndex(period);
+            double? perUnitInventoryCostNpv = null;
+            if (periodIndex >= 0 && _perUnitInventoryCosts != null)
+                perUnitInventoryCostNpv = _perUnitInventoryCosts[periodIndex] * discountToPresent(_inventoryCostDates[periodIndex]);
+            StorageHelper.CmdtyInventoryCostNpvs(this, period, inventories, discountToPresent, perUnitInventoryCostNpv, costNpvs);
+        }
+
+        public TimeSeries<T, InventoryRange> InventorySpace(double startingInventory, T currentPeriod)
+            => Storage.InventorySpace(startingInventory, currentPeriod);
+
+    }
+}
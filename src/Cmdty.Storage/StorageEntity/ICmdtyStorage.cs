@@ -23,6 +23,7 @@
 // OTHER DEALINGS IN THE SOFTWARE.
 #endregion
 
+using System;
 using System.Collections.Generic;
 using Cmdty.TimePeriodValueTypes;
 using JetBrains.Annotations;
@@ -35,6 +36,7 @@ public interface ICmdtyStorage<T> where T : ITimePeriod<T>
         T StartPeriod { get; }
         T EndPeriod { get; }
         InjectWithdrawRange GetInjectWithdrawRange(T date, double inventory);
+        void GetInjectWithdrawRange(T date, ReadOnlySpan<double> inventories, Span<InjectWithdrawRange> injectWithdrawRanges);
         double MaxInventory(T date);
         double MinInventory(T date);
         IReadOnlyList<DomesticCashFlow> InjectionCost(T date, double inventory, double injectedVolume);
@@ -46,5 +48,12 @@ public interface ICmdtyStorage<T> where T : ITimePeriod<T>
         double TerminalStorageNpv(double cmdtyPrice, double finalInventory);
         double CmdtyInventoryPercentLoss([NotNull] T period);
         IReadOnlyList<DomesticCashFlow> CmdtyInventoryCost([NotNull] T period, double inventory);
+        // Batch versions, filling the last parameter. Positive inject/withdraw volumes are injections, otherwise withdrawals.
+        void InjectWithdrawCostNpvs(T date, ReadOnlySpan<double> inventories, ReadOnlySpan<double> injectWithdrawVolumes, 
+            [NotNull] Func<Day, double> discountToPresent, Span<double> costNpvs);
+        void CmdtyVolumesConsumedOnInjectWithdraw(T date, ReadOnlySpan<double> inventories, ReadOnlySpan<double> injectWithdrawVolumes, 
+            Span<double> cmdtyVolumesConsumed);
+        void CmdtyInventoryCostNpvs([NotNull] T period, ReadOnlySpan<double> inventories, [NotNull] Func<Day, double> discountToPresent, 
+            Span<double> costNpvs);
     }
 }
\ No newline at end of file
@@ -36,6 +36,30 @@ namespace Cmdty.Storage
     public static class StorageHelper
     {
 
+        // Uses the inventory space memoised by CmdtyStorage<T> if possible, otherwise calculates it
+        public static TimeSeries<T, InventoryRange> GetOrCalculateInventorySpace<T>(ICmdtyStorage<T> storage, double startingInventory, T currentPeriod)
+            where T : ITimePeriod<T>
+        {
+            switch (storage)
+            {
+                case CmdtyStorage<T> cmdtyStorage:
+                    return cmdtyStorage.InventorySpace(startingInventory, currentPeriod);
+                case CompiledCmdtyStorage<T> compiledStorage:
+                    return compiledStorage.InventorySpace(startingInventory, currentPeriod);
+                default:
+                    return CalculateInventorySpace(storage, startingInventory, currentPeriod);
+            }
+        }
+
+        // Returns the array backed snapshot of storage if it's a CmdtyStorage<T>, otherwise storage itself
+        public static ICmdtyStorage<T> CompileIfCmdtyStorage<T>(ICmdtyStorage<T> storage)
+            where T : ITimePeriod<T>
+        {
+            if (storage is CmdtyStorage<T> cmdtyStorage)
+                return cmdtyStorage.Compile();
+            return storage;
+        }
+
         public static TimeSeries<T, InventoryRange> CalculateInventorySpace<T>(ICmdtyStorage<T> storage, double startingInventory, T currentPeriod)
             where T : ITimePeriod<T>
         {
@@ -203,7 +227,10 @@ private static void PopulateExtraDecisions(double min, double max, int extraDeci
                 results[i] = (i + 1) * increment + min;
         }
 
-        public static (double Max, int IndexOfMax) MaxValueAndIndex(double[] array)
+        public static (double Max, int IndexOfMax) MaxValueAndIndex(double[] array) 
+            => MaxValueAndIndex((ReadOnlySpan<double>)array);
+
+        public static (double Max, int IndexOfMax) MaxValueAndIndex(ReadOnlySpan<double> array)
         {
             double max = array[0];
             int indexOfMax = 0;
@@ -247,6 +274,80 @@ public static (double ImmediateNpv, double CmdtyConsumed)
             return (ImmediateNpv: immediateNpv, CmdtyConsumed: cmdtyUsedForInjectWithdrawVolume);
         }
 
+        // Shared implementation of ICmdtyStorage<T>.InjectWithdrawCostNpvs. A non-null per-unit cost NPV is the discounted
+        // cost per unit volume, used instead of calling storage.InjectionCost or storage.WithdrawalCost
+        internal static void InjectWithdrawCostNpvs<T>(ICmdtyStorage<T> storage, T date, ReadOnlySpan<double> inventories,
+            ReadOnlySpan<double> injectWithdrawVolumes, Func<Day, double> discountToPresent, double? perUnitInjectionCostNpv,
+            double? perUnitWithdrawalCostNpv, Span<double> costNpvs)
+            where T : ITimePeriod<T>
+        {
+            if (discountToPresent == null) throw new ArgumentNullException(nameof(discountToPresent));
+            ValidateBatchLengths(inventories, injectWithdrawVolumes, costNpvs, nameof(costNpvs));
+
+            for (int i = 0; i < inventories.Length; i++)
+            {
+                double injectWithdrawVolume = injectWithdrawVolumes[i];
+                if (injectWithdrawVolume > 0.0)
+                    costNpvs[i] = perUnitInjectionCostNpv.HasValue
+                        ? perUnitInjectionCostNpv.Value * injectWithdrawVolume
+                        : CashFlowsNpv(storage.InjectionCost(date, inventories[i], injectWithdrawVolume), discountToPresent);
+                else
+                    costNpvs[i] = perUnitWithdrawalCostNpv.HasValue
+                        ? perUnitWithdrawalCostNpv.Value * -injectWithdrawVolume
+                        : CashFlowsNpv(storage.WithdrawalCost(date, inventories[i], -injectWithdrawVolume), discountToPresent);
+            }
+        }
+
+        // Shared implementation of ICmdtyStorage<T>.CmdtyVolumesConsumedOnInjectWithdraw
+        internal static void CmdtyVolumesConsumedOnInjectWithdraw<T>(ICmdtyStorage<T> storage, T date, ReadOnlySpan<double> inventories,
+            ReadOnlySpan<double> injectWithdrawVolumes, Span<double> cmdtyVolumesConsumed)
+            where T : ITimePeriod<T>
+        {
+            ValidateBatchLengths(inventories, injectWithdrawVolumes, cmdtyVolumesConsumed, nameof(cmdtyVolumesConsumed));
+
+            for (int i = 0; i < inventories.Length; i++)
+            {
+                double injectWithdrawVolume = injectWithdrawVolumes[i];
+                cmdtyVolumesConsumed[i] = injectWithdrawVolume > 0.0
+                    ? storage.CmdtyVolumeConsumedOnInject(date, inventories[i], injectWithdrawVolume)
+                    : storage.CmdtyVolumeConsumedOnWithdraw(date, inventories[i], -injectWithdrawVolume);
+            }
+        }
+
+        // Shared implementation of ICmdtyStorage<T>.CmdtyInventoryCostNpvs. A non-null per-unit cost NPV is the discounted
+        // cost per unit of inventory, used instead of calling storage.CmdtyInventoryCost
+        internal static void CmdtyInventoryCostNpvs<T>(ICmdtyStorage<T> storage, T period, ReadOnlySpan<double> inventories,
+            Func<Day, double> discountToPresent, double? perUnitInventoryCostNpv, Span<double> costNpvs)
+            where T : ITimePeriod<T>
+        {
+            if (discountToPresent == null) throw new ArgumentNullException(nameof(discountToPresent));
+            if (inventories.Length != costNpvs.Length)
+                throw new ArgumentException("Inventories and cost NPVs must have the same length.", nameof(costNpvs));
+
+            for (int i = 0; i < inventories.Length; i++)
+                costNpvs[i] = perUnitInventoryCostNpv.HasValue
+                    ? perUnitInventoryCostNpv.Value * inventories[i]
+                    : CashFlowsNpv(storage.CmdtyInventoryCost(period, inventories[i]), discountToPresent);
+        }
+
+        private static double CashFlowsNpv(IReadOnlyList<DomesticCashFlow> cashFlows, Func<Day, double> discountToPresent)
+        {
+            double npv = 0.0;
+            // ReSharper disable once ForCanBeConvertedToForeach
+            for (int i = 0; i < cashFlows.Count; i++)
+                npv += cashFlows[i].Amount * discountToPresent(cashFlows[i].Date);
+            return npv;
+        }
+
+        private static void ValidateBatchLengths(ReadOnlySpan<double> inventories, ReadOnlySpan<double> injectWithdrawVolumes,
+            Span<double> results, string resultsParamName)
+        {
+            if (inventories.Length != injectWithdrawVolumes.Length)
+                throw new ArgumentException("Inventories and inject/withdraw volumes must have the same length.", nameof(injectWithdrawVolumes));
+            if (inventories.Length != results.Length)
+                throw new ArgumentException("Inventories and results must have the same length.", resultsParamName);
+        }
+
         // Long name because Pythonnet doesn't like overloads
         public static Func<Day, Day, double> CreateAct65ContCompDiscounterFromSeries([NotNull] TimeSeries<Day, double> interestRateCurve)
         {
@@ -259,6 +360,24 @@ public static (double ImmediateNpv, double CmdtyConsumed)
             return CreateAct65ContCompDiscounter(InterestRate);
         }
 
+        // Long name because Pythonnet doesn't like overloads
+        /// <summary>
+        /// Creates a settlement date rule which looks up precomputed settlement dates, so that a rule defined in
+        /// another runtime (e.g. Python) does not have to be called back into for every period during valuation.
+        /// </summary>
+        public static Func<T, Day> CreateSettleDateRuleFromSeries<T>([NotNull] TimeSeries<T, Day> settleDates)
+            where T : ITimePeriod<T>
+        {
+            if (settleDates == null) throw new ArgumentNullException(nameof(settleDates));
+            Day SettleDateRule(T period)
+            {
+                if (!settleDates.TryGetValue(period, out Day settleDate))
+                    throw new ArgumentException($"No settlement date provided for {period.ToString()}.");
+                return settleDate;
+            }
+            return SettleDateRule;
+        }
+
         public static Func<Day, Day, double> CreateAct65ContCompDiscounter([NotNull] Func<Day, double> settleDateToInterestRate)
         {
             if (settleDateToInterestRate == null) throw new ArgumentNullException(nameof(settleDateToInterestRate));
@@ -328,5 +447,51 @@ public static double InterpolateLinearAndSolve(double x1, double y1, double x2,
             double x = (y - constant) / gradient;
             return x;
         }
+
+        /// <summary>
+        /// Returns the reciprocal of the spacing between consecutive elements of sortedValues if they are evenly spaced,
+        /// otherwise zero. Used as the uniformSpacingReciprocal parameter of <see cref="FloorIndex"/>.
+        /// </summary>
+        internal static double UniformSpacingReciprocal(double[] sortedValues)
+        {
+            double spacing = (sortedValues[sortedValues.Length - 1] - sortedValues[0]) / (sortedValues.Length - 1);
+            if (!(spacing > 0.0))
+                return 0.0;
+            double spacingTolerance = spacing * 1E-10;
+            for (int i = 1; i < sortedValues.Length; i++)
+            {
+                if (!EqualsWithinTol(sortedValues[i] - sortedValues[i - 1], spacing, spacingTolerance))
+                    return 0.0;
+            }
+            return 1.0 / spacing;
+        }
+
+        /// <summary>
+        /// Index of the last element of sortedValues which is less than or equal to value, floored at zero. Found by
+        /// direct indexing if uniformSpacingReciprocal is positive, otherwise by bisection.
+        /// </summary>
+        internal static int FloorIndex(double[] sortedValues, double value, double uniformSpacingReciprocal)
+        {
+            int lastIndex = sortedValues.Length - 1;
+            int index;
+            if (uniformSpacingReciprocal > 0.0)
+            {
+                double position = (value - sortedValues[0]) * uniformSpacingReciprocal;
+                if (!(position >= 0.0))
+                    return 0;
+                index = position >= lastIndex ? lastIndex : (int)position;
+                // Correct for rounding error in position
+                if (index > 0 && value < sortedValues[index])
+                    index--;
+                else if (index < lastIndex && value >= sortedValues[index + 1])
+                    index++;
+            }
+            else
+            {
+                int searchIndex = Array.BinarySearch(sortedValues, value);
+                index = searchIndex >= 0 ? searchIndex : ~searchIndex - 1;
+            }
+            return Math.Max(index, 0);
+        }
     }
 }
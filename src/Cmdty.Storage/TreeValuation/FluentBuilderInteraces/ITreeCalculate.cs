@@ -33,5 +33,9 @@ public interface ITreeCalculate<T>
         TreeStorageValuationResults<T> Calculate();
         (TreeStorageValuationResults<T> ValuationResults, ITreeDecisionSimulator<T> DecisionSimulator) CalculateWithDecisionSimulator();
         double CalculateNpv();
+        /// <summary>
+        /// Records the time spent in each phase of the calculation in <see cref="TreeStorageValuationResults{T}.PhaseTimings"/>.
+        /// </summary>
+        ITreeCalculate<T> WithPhaseTimings();
     }
 }
\ No newline at end of file
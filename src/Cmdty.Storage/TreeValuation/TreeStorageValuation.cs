@@ -48,6 +48,7 @@ public sealed class TreeStorageValuation<T> : ITreeAddStartingInventory<T>, ITre
         private Func<ICmdtyStorage<T>, IDoubleStateSpaceGridCalc> _gridCalcFactory;
         private IInterpolatorFactory _interpolatorFactory;
         private double _numericalTolerance;
+        private bool _recordPhaseTimings;
 
         private TreeStorageValuation([NotNull] ICmdtyStorage<T> storage)
         {
@@ -121,11 +122,17 @@ ITreeCalculate<T> ITreeAddNumericalTolerance<T>.WithNumericalTolerance(double nu
             return this;
         }
 
+        ITreeCalculate<T> ITreeCalculate<T>.WithPhaseTimings()
+        {
+            _recordPhaseTimings = true;
+            return this;
+        }
+
         TreeStorageValuationResults<T> ITreeCalculate<T>.Calculate()
         {
             return Calculate(_currentPeriod, _startingInventory, _forwardCurve, _treeFactory, _storage,
                 _settleDateRule, _discountFactors, _gridCalcFactory,
-                    _interpolatorFactory, _numericalTolerance);
+                    _interpolatorFactory, _numericalTolerance, new PhaseTimer(_recordPhaseTimings));
         }
 
         (TreeStorageValuationResults<T> ValuationResults, ITreeDecisionSimulator<T> DecisionSimulator) 
@@ -144,7 +151,7 @@ TreeStorageValuationResults<T> ITreeCalculate<T>.Calculate()
             TimeSeries<T, double> forwardCurve, Func<TimeSeries<T, double>, TimeSeries<T, IReadOnlyList<TreeNode>>> treeFactory, 
             ICmdtyStorage<T> storage, Func<T, Day> settleDateRule, Func<Day, Day, double> discountFactors, 
             Func<ICmdtyStorage<T>, IDoubleStateSpaceGridCalc> gridCalcFactory, IInterpolatorFactory interpolatorFactory, 
-            double numericalTolerance)
+            double numericalTolerance, PhaseTimer phaseTimer)
         {
             if (startingInventory < 0)
                 throw new ArgumentException("Inventory cannot be negative.", nameof(startingInventory));
@@ -162,7 +169,11 @@ TreeStorageValuationResults<T> ITreeCalculate<T>.Calculate()
                 }
             }
 
-            TimeSeries<T, InventoryRange> inventorySpace = StorageHelper.CalculateInventorySpace(storage, startingInventory, currentPeriod);
+            storage = StorageHelper.CompileIfCmdtyStorage(storage);
+
+            phaseTimer.Start(PhaseTimer.InventorySpace);
+            TimeSeries<T, InventoryRange> inventorySpace = StorageHelper.GetOrCalculateInventorySpace(storage, startingInventory, currentPeriod);
+            phaseTimer.Stop(PhaseTimer.InventorySpace);
 
             // TODO think of method to put in TimeSeries class to perform the validation check below in one line
             if (forwardCurve.IsEmpty)
@@ -181,7 +192,9 @@ TreeStorageValuationResults<T> ITreeCalculate<T>.Calculate()
             var storageNpvs = new double[numPeriods][][];
             var injectWithdrawDecisions = new double[numPeriods][][];
 
+            phaseTimer.Start(PhaseTimer.TreeBuild);
             TimeSeries<T, IReadOnlyList<TreeNode>> spotPriceTree = treeFactory(forwardCurve);
+            phaseTimer.Stop(PhaseTimer.TreeBuild);
 
             // Calculate NPVs at end period
             IReadOnlyList<TreeNode> treeNodesForEndPeriod = spotPriceTree[storage.EndPeriod];
@@ -216,6 +229,7 @@ TreeStorageValuationResults<T> ITreeCalculate<T>.Calculate()
 
             int backCounter = numPeriods - 2;
             IDoubleStateSpaceGridCalc gridCalc = gridCalcFactory(storage);
+            phaseTimer.Start(PhaseTimer.BackwardInduction);
 
             foreach (T periodLoop in periodsForResultsTimeSeries.Reverse().Skip(1))
             {
@@ -258,8 +272,10 @@ TreeStorageValuationResults<T> ITreeCalculate<T>.Calculate()
                                         continuationValueByInventory, discountFactorFromCmdtySettlement, DiscountToCurrentDay, numericalTolerance);
                     }
 
+                    phaseTimer.Start(PhaseTimer.InterpolatorConstruction);
                     storageValueByInventory[backCounter][priceLevelIndex] =
                         interpolatorFactory.CreateInterpolator(inventorySpaceGrid, storageValuesGrid);
+                    phaseTimer.Stop(PhaseTimer.InterpolatorConstruction);
                     storageNpvsByPriceLevelAndInventory[priceLevelIndex] = storageValuesGrid;
                     decisionVolumesByPriceLevelAndInventory[priceLevelIndex] = decisionVolumesGrid;
                 }
@@ -268,6 +284,7 @@ TreeStorageValuationResults<T> ITreeCalculate<T>.Calculate()
                 injectWithdrawDecisions[backCounter] = decisionVolumesByPriceLevelAndInventory;
                 backCounter--;
             }
+            phaseTimer.Stop(PhaseTimer.BackwardInduction);
 
             // Calculate NPVs for first active period using current inventory
             double storageNpv = 0;
@@ -290,7 +307,7 @@ TreeStorageValuationResults<T> ITreeCalculate<T>.Calculate()
 
             return new TreeStorageValuationResults<T>(storageNpv, spotPriceTree, storageNpvByInventory, 
                             inventorySpaceGridsTimeSeries, storageNpvsTimeSeries, injectWithdrawDecisionsTimeSeries,
-                            inventorySpace);
+                            inventorySpace, phaseTimer.Timings);
         }
 
         // TODO create class on hold this tuple?
@@ -41,13 +41,18 @@ public sealed class TreeStorageValuationResults<T>
         public TimeSeries<T, IReadOnlyList<IReadOnlyList<double>>> StorageNpvs { get; }
         public TimeSeries<T, IReadOnlyList<IReadOnlyList<double>>> InjectWithdrawDecisions { get; }
         public TimeSeries<T, InventoryRange> InventorySpace { get; }
+        /// <summary>
+        /// Time spent in each phase of the calculation, keyed by phase name. Empty unless phase timings were requested.
+        /// </summary>
+        public IReadOnlyDictionary<string, TimeSpan> PhaseTimings { get; }
 
         public TreeStorageValuationResults(double netPresentValue, TimeSeries<T, IReadOnlyList<TreeNode>> tree,
                                 TimeSeries<T, IReadOnlyList<Func<double, double>>> storageNpvByInventory,
                                 TimeSeries<T, IReadOnlyList<double>> inventorySpaceGrids,
                                 TimeSeries<T, IReadOnlyList<IReadOnlyList<double>>> storageNpvs,
                                 TimeSeries<T, IReadOnlyList<IReadOnlyList<double>>> injectWithdrawDecisions,
-                                TimeSeries<T, InventoryRange> inventorySpace)
+                                TimeSeries<T, InventoryRange> inventorySpace,
+                                IReadOnlyDictionary<string, TimeSpan> phaseTimings = null)
         {
             NetPresentValue = netPresentValue;
             Tree = tree;
@@ -56,6 +61,7 @@ public sealed class TreeStorageValuationResults<T>
             StorageNpvs = storageNpvs;
             InjectWithdrawDecisions = injectWithdrawDecisions;
             InventorySpace = inventorySpace;
+            PhaseTimings = phaseTimings ?? new Dictionary<string, TimeSpan>();
         }
 
         // TODO ToString override
@@ -0,0 +1,153 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+using System.Collections.Generic;
+using Cmdty.TimePeriodValueTypes;
+using Cmdty.TimeSeries;
+using TimeSeriesFactory = Cmdty.TimeSeries.TimeSeries;
+
+namespace Cmdty.Storage.Benchmarks
+{
+    public enum InjectWithdrawConstraintType
+    {
+        Constant,
+        PiecewiseLinear,
+        Polynomial,
+        Step
+    }
+
+    /// <summary>
+    /// Storage facilities and market data shared by the benchmark suites. All storage facilities have an inventory
+    /// range of [0, 10,000] and start on the same date, with the number of periods and inject/withdraw constraint
+    /// type varying.
+    /// </summary>
+    internal static class BenchmarkData
+    {
+        public static readonly Day ValuationDate = new Day(2019, 11, 28);
+        public static readonly Day StorageStart = new Day(2019, 12, 1);
+        public const double MaxInventory = 10_000.0;
+        public const double FlatInterestRate = 0.055;
+        public const double SpotMeanReversion = 12.5;
+        public const double SpotVol = 0.95;
+        public const double NumericalTolerance = 1E-10;
+        private const int DaysBetweenRatchets = 30;
+
+        public static readonly Func<Day, Day, double> DiscountFactors = StorageHelper.CreateAct65ContCompDiscounter(FlatInterestRate);
+
+        // Settlement on 20th of following month
+        public static Day SettleDateRule(Day deliveryDate) => Month.FromDateTime(deliveryDate.Start).Offset(1).First<Day>() + 19;
+
+        public static Day StorageEnd(int numPeriods) => StorageStart.Offset(numPeriods);
+
+        public static InjectWithdrawRangeByInventory[] Ratchets() => new InjectWithdrawRangeByInventory[]
+        {
+            (inventory: 0.0, (minInjectWithdrawRate: -150.0, maxInjectWithdrawRate: 400.0)),
+            (inventory: 4_000.0, (minInjectWithdrawRate: -300.0, maxInjectWithdrawRate: 300.0)),
+            (inventory: 8_000.0, (minInjectWithdrawRate: -450.0, maxInjectWithdrawRate: 200.0)),
+            (inventory: MaxInventory, (minInjectWithdrawRate: -450.0, maxInjectWithdrawRate: 200.0)),
+        };
+
+        public static IInjectWithdrawConstraint CreateConstraint(InjectWithdrawConstraintType constraintType)
+        {
+            switch (constraintType)
+            {
+                case InjectWithdrawConstraintType.Constant:
+                    return new ConstantInjectWithdrawConstraint(-450.0, 400.0);
+                case InjectWithdrawConstraintType.PiecewiseLinear:
+                    return new PiecewiseLinearInjectWithdrawConstraint(Ratchets());
+                case InjectWithdrawConstraintType.Polynomial:
+                    return new PolynomialInjectWithdrawConstraint(Ratchets());
+                case InjectWithdrawConstraintType.Step:
+                    return new StepInjectWithdrawConstraint(Ratchets());
+                default:
+                    throw new ArgumentException($"Inject/withdraw constraint type {constraintType} not recognised.", nameof(constraintType));
+            }
+        }
+
+        public static CmdtyStorage<Day> CreateStorage(InjectWithdrawConstraintType constraintType, int numPeriods)
+        {
+            Day storageEnd = StorageEnd(numPeriods);
+            IAddInjectWithdrawConstraints<Day> addConstraints = CmdtyStorage<Day>.Builder
+                .WithActiveTimePeriod(StorageStart, storageEnd);
+
+            IAddInjectionCost<Day> addInjectionCost;
+            if (constraintType == InjectWithdrawConstraintType.Constant)
+            {
+                addInjectionCost = addConstraints
+                    .WithConstantInjectWithdrawRange(-450.0, 400.0)
+                    .WithZeroMinInventory()
+                    .WithConstantMaxInventory(MaxInventory);
+            }
+            else
+            {
+                // Ratchets are respecified periodically so that the storage has time-varying constraints
+                var ratchetsByPeriod = new List<InjectWithdrawRangeByInventoryAndPeriod<Day>>();
+                for (int offset = 0; offset < numPeriods; offset += DaysBetweenRatchets)
+                    ratchetsByPeriod.Add(new InjectWithdrawRangeByInventoryAndPeriod<Day>(StorageStart.Offset(offset), Ratchets()));
+
+                switch (constraintType)
+                {
+                    case InjectWithdrawConstraintType.PiecewiseLinear:
+                        addInjectionCost = addConstraints.WithTimeAndInventoryVaryingInjectWithdrawRatesPiecewiseLinear(ratchetsByPeriod);
+                        break;
+                    case InjectWithdrawConstraintType.Polynomial:
+                        addInjectionCost = addConstraints.WithTimeAndInventoryVaryingInjectWithdrawRatesPolynomial(ratchetsByPeriod);
+                        break;
+                    case InjectWithdrawConstraintType.Step:
+                        addInjectionCost = addConstraints.WithStepRatchets(ratchetsByPeriod);
+                        break;
+                    default:
+                        throw new ArgumentException($"Inject/withdraw constraint type {constraintType} not recognised.", nameof(constraintType));
+                }
+            }
+
+            return addInjectionCost
+                .WithPerUnitInjectionCost(1.25, injectionDate => injectionDate)
+                .WithNoCmdtyConsumedOnInject()
+                .WithPerUnitWithdrawalCost(0.93, withdrawalDate => withdrawalDate)
+                .WithNoCmdtyConsumedOnWithdraw()
+                .WithNoCmdtyInventoryLoss()
+                .WithNoInventoryCost()
+                .WithTerminalInventoryNpv((cmdtyPrice, inventory) => 0.0)
+                .Build();
+        }
+
+        public static TimeSeries<Day, double> CreateForwardCurve(int numPeriods)
+        {
+            const double baseForwardPrice = 53.5;
+            const double forwardSeasonalFactor = 24.6;
+            return TimeSeriesFactory.FromMap(ValuationDate, StorageEnd(numPeriods), day =>
+            {
+                int daysForward = day.OffsetFrom(ValuationDate);
+                return baseForwardPrice + Math.Sin(2.0 * Math.PI / 365.0 * daysForward) * forwardSeasonalFactor;
+            });
+        }
+
+        public static TimeSeries<Day, double> CreateSpotVolCurve(int numPeriods)
+            => TimeSeriesFactory.ForConstantData(ValuationDate, StorageEnd(numPeriods), SpotVol);
+
+    }
+}
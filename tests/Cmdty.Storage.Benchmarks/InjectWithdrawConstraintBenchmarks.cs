@@ -0,0 +1,107 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using BenchmarkDotNet.Attributes;
+
+namespace Cmdty.Storage.Benchmarks
+{
+    /// <summary>
+    /// Benchmarks the per-call cost of each <see cref="IInjectWithdrawConstraint"/> implementation over a sweep of
+    /// inventories. The inventory space bound benchmarks are set up so that the ratchet constraints have to solve for
+    /// the bound, rather than returning early because the next period inventory space is reachable from the current
+    /// period bounds.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class InjectWithdrawConstraintBenchmarks
+    {
+        private const int NumInventories = 1_000;
+        private const double NextPeriodInventorySpaceWidth = 500.0;
+        private IInjectWithdrawConstraint _constraint;
+        private double[] _inventories;
+        private double[] _nextPeriodInventories;
+        private InjectWithdrawRange[] _injectWithdrawRanges;
+
+        [Params(InjectWithdrawConstraintType.Constant, InjectWithdrawConstraintType.PiecewiseLinear,
+            InjectWithdrawConstraintType.Polynomial, InjectWithdrawConstraintType.Step)]
+        public InjectWithdrawConstraintType ConstraintType { get; set; }
+
+        [GlobalSetup]
+        public void GlobalSetup()
+        {
+            _constraint = BenchmarkData.CreateConstraint(ConstraintType);
+            _inventories = new double[NumInventories];
+            _nextPeriodInventories = new double[NumInventories];
+            _injectWithdrawRanges = new InjectWithdrawRange[NumInventories];
+            for (int i = 0; i < NumInventories; i++)
+            {
+                _inventories[i] = BenchmarkData.MaxInventory * i / (NumInventories - 1);
+                _nextPeriodInventories[i] = 1_000.0 + 8_000.0 * i / (NumInventories - 1);
+            }
+        }
+
+        [Benchmark(OperationsPerInvoke = NumInventories)]
+        public double GetInjectWithdrawRange()
+        {
+            double sum = 0.0;
+            foreach (double inventory in _inventories)
+            {
+                InjectWithdrawRange injectWithdrawRange = _constraint.GetInjectWithdrawRange(inventory);
+                sum += injectWithdrawRange.MaxInjectWithdrawRate - injectWithdrawRange.MinInjectWithdrawRate;
+            }
+            return sum;
+        }
+
+        [Benchmark(OperationsPerInvoke = NumInventories)]
+        public double GetInjectWithdrawRangeBatch()
+        {
+            _constraint.GetInjectWithdrawRange(_inventories, _injectWithdrawRanges);
+            double sum = 0.0;
+            foreach (InjectWithdrawRange injectWithdrawRange in _injectWithdrawRanges)
+                sum += injectWithdrawRange.MaxInjectWithdrawRate - injectWithdrawRange.MinInjectWithdrawRate;
+            return sum;
+        }
+
+        [Benchmark(OperationsPerInvoke = NumInventories)]
+        public double InventorySpaceUpperBound()
+        {
+            double sum = 0.0;
+            foreach (double nextPeriodUpperBound in _nextPeriodInventories)
+                sum += _constraint.InventorySpaceUpperBound(nextPeriodUpperBound - NextPeriodInventorySpaceWidth, 
+                                nextPeriodUpperBound, 0.0, BenchmarkData.MaxInventory, 0.0);
+            return sum;
+        }
+
+        [Benchmark(OperationsPerInvoke = NumInventories)]
+        public double InventorySpaceLowerBound()
+        {
+            double sum = 0.0;
+            foreach (double nextPeriodLowerBound in _nextPeriodInventories)
+                sum += _constraint.InventorySpaceLowerBound(nextPeriodLowerBound, 
+                                nextPeriodLowerBound + NextPeriodInventorySpaceWidth, 0.0, BenchmarkData.MaxInventory, 0.0);
+            return sum;
+        }
+
+    }
+}
@@ -0,0 +1,77 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using BenchmarkDotNet.Attributes;
+using Cmdty.TimePeriodValueTypes;
+using Cmdty.TimeSeries;
+
+namespace Cmdty.Storage.Benchmarks
+{
+    [MemoryDiagnoser]
+    public class IntrinsicValuationBenchmarks
+    {
+        private CmdtyStorage<Day> _storage;
+        private TimeSeries<Day, double> _forwardCurve;
+
+        [Params(InjectWithdrawConstraintType.Constant, InjectWithdrawConstraintType.PiecewiseLinear, 
+            InjectWithdrawConstraintType.Polynomial, InjectWithdrawConstraintType.Step)]
+        public InjectWithdrawConstraintType ConstraintType { get; set; }
+
+        [Params(31, 122, 365)]
+        public int NumPeriods { get; set; }
+
+        [Params(50, 100, 200)]
+        public int NumInventoryGridPoints { get; set; }
+
+        [GlobalSetup]
+        public void GlobalSetup()
+        {
+            _forwardCurve = BenchmarkData.CreateForwardCurve(NumPeriods);
+        }
+
+        // CmdtyStorage<T> memoises its compiled form and inventory space, so a new instance is created for each
+        // iteration to include these calculations in the measurement, as they would be for a first valuation
+        [IterationSetup]
+        public void IterationSetup() => _storage = BenchmarkData.CreateStorage(ConstraintType, NumPeriods);
+
+        [Benchmark]
+        public double CalculateIntrinsicValue()
+        {
+            IntrinsicStorageValuationResults<Day> results = IntrinsicStorageValuation<Day>
+                .ForStorage(_storage)
+                .WithStartingInventory(0.0)
+                .ForCurrentPeriod(BenchmarkData.ValuationDate)
+                .WithForwardCurve(_forwardCurve)
+                .WithCmdtySettlementRule(BenchmarkData.SettleDateRule)
+                .WithDiscountFactorFunc(BenchmarkData.DiscountFactors)
+                .WithFixedNumberOfPointsOnGlobalInventoryRange(NumInventoryGridPoints)
+                .WithLinearInventorySpaceInterpolation()
+                .WithNumericalTolerance(BenchmarkData.NumericalTolerance)
+                .Calculate();
+            return results.NetPresentValue;
+        }
+
+    }
+}
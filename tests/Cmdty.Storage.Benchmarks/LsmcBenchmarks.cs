@@ -32,14 +32,18 @@
 
 namespace Cmdty.Storage.Benchmarks
 {
+    [MemoryDiagnoser]
     public class LsmcBenchmarks
     {
         private const int NumSims = 1_000;
         private const int RandomSeed = 11;
         private const int RegressMaxDegree = 2;
-        // TODO make these static?
-        private readonly LsmcValuationParameters<Day> _valuationParameters;
-        public LsmcBenchmarks()
+        private LsmcValuationParameters<Day> _valuationParameters;
+
+        // CmdtyStorage<T> memoises its compiled form and inventory space, so a new instance is created for each
+        // iteration to include these calculations in the measurement, as they would be for a first valuation
+        [IterationSetup]
+        public void IterationSetup()
         {
             var valDate = new Day(2019, 8, 29);
 
@@ -0,0 +1,126 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System.Collections.Generic;
+using System.Linq;
+using BenchmarkDotNet.Attributes;
+using Cmdty.Core.Simulation.MultiFactor;
+using Cmdty.TimePeriodValueTypes;
+
+namespace Cmdty.Storage.Benchmarks
+{
+    /// <summary>
+    /// Scaling sweeps of the LSMC valuation. Each scenario varies one of the number of simulations, inventory grid points,
+    /// storage periods, extra decisions or basis functions from a baseline, with the others held at their baseline value.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class LsmcScalingBenchmarks
+    {
+        private const int RandomSeed = 11;
+        private LsmcValuationParameters<Day> _valuationParameters;
+
+        [Params(InjectWithdrawConstraintType.Constant, InjectWithdrawConstraintType.PiecewiseLinear, 
+            InjectWithdrawConstraintType.Step)]
+        public InjectWithdrawConstraintType ConstraintType { get; set; }
+
+        [ParamsSource(nameof(Scenarios))]
+        public LsmcScalingScenario Scenario { get; set; }
+
+        public static IEnumerable<LsmcScalingScenario> Scenarios()
+        {
+            var baseline = new LsmcScalingScenario(numSims: 1_000, numInventoryGridPoints: 100, numPeriods: 122, 
+                                    extraDecisions: 0, basisFunctionMaxDegree: 2);
+            var scenarios = new List<LsmcScalingScenario>{baseline};
+            scenarios.AddRange(new[] {250, 4_000, 16_000}.Select(numSims => baseline.With(numSims: numSims)));
+            scenarios.AddRange(new[] {25, 400}.Select(numGridPoints => baseline.With(numInventoryGridPoints: numGridPoints)));
+            scenarios.AddRange(new[] {31, 365}.Select(numPeriods => baseline.With(numPeriods: numPeriods)));
+            scenarios.AddRange(new[] {1, 3}.Select(extraDecisions => baseline.With(extraDecisions: extraDecisions)));
+            scenarios.AddRange(new[] {1, 4, 6}.Select(maxDegree => baseline.With(basisFunctionMaxDegree: maxDegree)));
+            return scenarios;
+        }
+
+        // CmdtyStorage<T> memoises its compiled form and inventory space, so a new instance is created for each
+        // iteration to include these calculations in the measurement, as they would be for a first valuation
+        [IterationSetup]
+        public void IterationSetup()
+        {
+            CmdtyStorage<Day> storage = BenchmarkData.CreateStorage(ConstraintType, Scenario.NumPeriods);
+            Day storageEnd = BenchmarkData.StorageEnd(Scenario.NumPeriods);
+            var multiFactorParams = MultiFactorParameters.For1Factor(BenchmarkData.SpotMeanReversion, 
+                                        BenchmarkData.CreateSpotVolCurve(Scenario.NumPeriods));
+
+            _valuationParameters = new LsmcValuationParameters<Day>.Builder
+                {
+                    BasisFunctions = BasisFunctionsBuilder.Ones +
+                                     BasisFunctionsBuilder.AllMarkovFactorAllPositiveIntegerPowersUpTo(Scenario.BasisFunctionMaxDegree, 1),
+                    CurrentPeriod = BenchmarkData.ValuationDate,
+                    DiscountFactors = BenchmarkData.DiscountFactors,
+                    ForwardCurve = BenchmarkData.CreateForwardCurve(Scenario.NumPeriods),
+                    GridCalc = FixedSpacingStateSpaceGridCalc.CreateForFixedNumberOfPointsOnGlobalInventoryRange(storage, Scenario.NumInventoryGridPoints),
+                    Inventory = 0.0,
+                    Storage = storage,
+                    SettleDateRule = BenchmarkData.SettleDateRule,
+                    ExtraDecisions = Scenario.ExtraDecisions,
+                }
+                .SimulateWithMultiFactorModelAndMersenneTwister(multiFactorParams, Scenario.NumSims, RandomSeed)
+                .Build();
+        }
+
+        [Benchmark]
+        public double CalculateLsmcValue()
+        {
+            LsmcStorageValuationResults<Day> results = LsmcStorageValuation.WithNoLogger.Calculate(_valuationParameters);
+            return results.Npv;
+        }
+
+    }
+
+    public sealed class LsmcScalingScenario
+    {
+        public int NumSims { get; }
+        public int NumInventoryGridPoints { get; }
+        public int NumPeriods { get; }
+        public int ExtraDecisions { get; }
+        public int BasisFunctionMaxDegree { get; }
+
+        public LsmcScalingScenario(int numSims, int numInventoryGridPoints, int numPeriods, int extraDecisions, int basisFunctionMaxDegree)
+        {
+            NumSims = numSims;
+            NumInventoryGridPoints = numInventoryGridPoints;
+            NumPeriods = numPeriods;
+            ExtraDecisions = extraDecisions;
+            BasisFunctionMaxDegree = basisFunctionMaxDegree;
+        }
+
+        public LsmcScalingScenario With(int? numSims = null, int? numInventoryGridPoints = null, int? numPeriods = null, 
+                                        int? extraDecisions = null, int? basisFunctionMaxDegree = null)
+            => new LsmcScalingScenario(numSims ?? NumSims, numInventoryGridPoints ?? NumInventoryGridPoints, 
+                    numPeriods ?? NumPeriods, extraDecisions ?? ExtraDecisions, basisFunctionMaxDegree ?? BasisFunctionMaxDegree);
+
+        // Used by BenchmarkDotNet as the parameter value displayed in the results
+        public override string ToString() => $"Sims={NumSims} Grid={NumInventoryGridPoints} Periods={NumPeriods} " +
+                                             $"ExtraDecisions={ExtraDecisions} BasisSize={BasisFunctionMaxDegree + 1}";
+    }
+}
@@ -0,0 +1,240 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Cmdty.TimePeriodValueTypes;
+using Cmdty.TimeSeries;
+using Xunit;
+
+namespace Cmdty.Storage.Test
+{
+    public sealed class CompiledCmdtyStorageTest
+    {
+        private static readonly Day StorageStart = new Day(2019, 10, 1);
+        private static readonly Day StorageEnd = new Day(2019, 11, 1);
+        private static readonly double[] Inventories = {0.0, 50.0, 150.0, 300.0};
+        private static readonly double[] Volumes = {-25.5, 0.0, 12.0};
+
+        private static TimeSeries<Day, double> CreateSeries(double start, double increment)
+        {
+            var builder = new TimeSeries<Day, double>.Builder();
+            int numPeriods = StorageEnd.OffsetFrom(StorageStart) + 1;
+            for (int i = 0; i < numPeriods; i++)
+                builder.Add(StorageStart.Offset(i), start + increment * i);
+            return builder.Build();
+        }
+
+        private static CmdtyStorage<Day> CreateStorage(bool withPerUnitCosts)
+        {
+            var injectWithdrawConstraints = new List<InjectWithdrawRangeByInventoryAndPeriod<Day>>
+            {
+                (period: StorageStart, injectWithdrawRanges: new List<InjectWithdrawRangeByInventory>
+                {
+                    (inventory: 0.0, (minInjectWithdrawRate: -44.85, maxInjectWithdrawRate: 56.8)),
+                    (inventory: 300.0, (minInjectWithdrawRate: -45.78, maxInjectWithdrawRate: 52.01)),
+                }),
+                (period: new Day(2019, 10, 15), injectWithdrawRanges: new List<InjectWithdrawRangeByInventory>
+                {
+                    (inventory: 0.0, (minInjectWithdrawRate: -30.0, maxInjectWithdrawRate: 40.5)),
+                    (inventory: 300.0, (minInjectWithdrawRate: -35.5, maxInjectWithdrawRate: 32.0)),
+                }),
+            };
+
+            IAddInjectionCost<Day> addInjectionCost = CmdtyStorage<Day>.Builder
+                .WithActiveTimePeriod(StorageStart, StorageEnd)
+                .WithTimeAndInventoryVaryingInjectWithdrawRatesPiecewiseLinear(injectWithdrawConstraints);
+
+            IAddCmdtyInventoryLoss<Day> addInventoryLoss;
+            if (withPerUnitCosts)
+                addInventoryLoss = addInjectionCost
+                    .WithPerUnitInjectionCostTimeSeries(CreateSeries(0.5, 0.01))
+                    .WithFixedPercentCmdtyConsumedOnInject(0.01)
+                    .WithPerUnitWithdrawalCost(0.75, period => period.Offset(2))
+                    .WithFixedPercentCmdtyConsumedOnWithdraw(0.015);
+            else
+                addInventoryLoss = addInjectionCost
+                    .WithInjectionCost((period, inventory, volume) => new[] {new DomesticCashFlow(period, 0.1 * inventory + volume)})
+                    .WithNoCmdtyConsumedOnInject()
+                    .WithWithdrawalCost((period, inventory, volume) => new[] {new DomesticCashFlow(period, 0.2 * inventory + volume)})
+                    .WithNoCmdtyConsumedOnWithdraw();
+
+            IAddCmdtyInventoryCost<Day> addInventoryCost = addInventoryLoss
+                .WithCmdtyInventoryLossTimeSeries(CreateSeries(0.001, 0.0001));
+            IAddTerminalStorageState<Day> addTerminalState = withPerUnitCosts 
+                ? addInventoryCost.WithPerUnitInventoryCostTimeSeries(CreateSeries(0.02, 0.001))
+                : addInventoryCost.WithNoInventoryCost();
+
+            return addTerminalState.MustBeEmptyAtEnd().Build();
+        }
+
+        [Fact]
+        [Trait("Category", "Storage.Compiled")]
+        public void Compile_StorageWithPerUnitCosts_AllMethodsEqualUncompiledStorage()
+        {
+            AssertCompiledStorageEqualsUncompiled(true);
+        }
+
+        [Fact]
+        [Trait("Category", "Storage.Compiled")]
+        public void Compile_StorageWithCostFunctions_AllMethodsEqualUncompiledStorage()
+        {
+            AssertCompiledStorageEqualsUncompiled(false);
+        }
+
+        private static void AssertCompiledStorageEqualsUncompiled(bool withPerUnitCosts)
+        {
+            CmdtyStorage<Day> storage = CreateStorage(withPerUnitCosts);
+            CompiledCmdtyStorage<Day> compiled = storage.Compile();
+
+            Assert.Equal(withPerUnitCosts, compiled.HasPerUnitInjectionCost);
+            Assert.Equal(storage.StartPeriod, compiled.StartPeriod);
+            Assert.Equal(storage.EndPeriod, compiled.EndPeriod);
+            Assert.Equal(storage.MustBeEmptyAtEnd, compiled.MustBeEmptyAtEnd);
+
+            int numPeriods = StorageEnd.OffsetFrom(StorageStart) + 1;
+            for (int i = 0; i < numPeriods; i++)
+            {
+                Day period = StorageStart.Offset(i);
+                Assert.Equal(storage.MinInventory(period), compiled.MinInventory(period));
+                Assert.Equal(storage.MaxInventory(period), compiled.MaxInventory(period));
+                if (period.Equals(StorageEnd))
+                    continue;
+                Assert.Equal(storage.CmdtyInventoryPercentLoss(period), compiled.CmdtyInventoryPercentLoss(period));
+                Assert.Equal(storage.InventorySpaceLowerBound(period, 20.0, 200.0), compiled.InventorySpaceLowerBound(period, 20.0, 200.0));
+                Assert.Equal(storage.InventorySpaceUpperBound(period, 20.0, 200.0), compiled.InventorySpaceUpperBound(period, 20.0, 200.0));
+                foreach (double inventory in Inventories)
+                {
+                    Assert.Equal(storage.GetInjectWithdrawRange(period, inventory).MinInjectWithdrawRate, 
+                                compiled.GetInjectWithdrawRange(period, inventory).MinInjectWithdrawRate);
+                    Assert.Equal(storage.GetInjectWithdrawRange(period, inventory).MaxInjectWithdrawRate,
+                                compiled.GetInjectWithdrawRange(period, inventory).MaxInjectWithdrawRate);
+                    AssertCashFlowsEqual(storage.CmdtyInventoryCost(period, inventory), compiled.CmdtyInventoryCost(period, inventory));
+                    foreach (double volume in Volumes)
+                    {
+                        AssertCashFlowsEqual(storage.InjectionCost(period, inventory, volume), compiled.InjectionCost(period, inventory, volume));
+                        AssertCashFlowsEqual(storage.WithdrawalCost(period, inventory, volume), compiled.WithdrawalCost(period, inventory, volume));
+                        Assert.Equal(storage.CmdtyVolumeConsumedOnInject(period, inventory, volume), 
+                                    compiled.CmdtyVolumeConsumedOnInject(period, inventory, volume));
+                        Assert.Equal(storage.CmdtyVolumeConsumedOnWithdraw(period, inventory, volume),
+                                    compiled.CmdtyVolumeConsumedOnWithdraw(period, inventory, volume));
+                    }
+                }
+            }
+        }
+
+        [Fact]
+        [Trait("Category", "Storage.Compiled")]
+        public void GetInjectWithdrawRange_EndPeriod_ReturnsZeroRange()
+        {
+            CompiledCmdtyStorage<Day> compiled = CreateStorage(true).Compile();
+            InjectWithdrawRange injectWithdrawRange = compiled.GetInjectWithdrawRange(StorageEnd, 0.0);
+            Assert.Equal(0.0, injectWithdrawRange.MinInjectWithdrawRate);
+            Assert.Equal(0.0, injectWithdrawRange.MaxInjectWithdrawRate);
+        }
+
+        [Fact]
+        [Trait("Category", "Storage.Compiled")]
+        public void Compile_CalledTwice_ReturnsSameInstance()
+        {
+            CmdtyStorage<Day> storage = CreateStorage(true);
+            Assert.Same(storage.Compile(), storage.Compile());
+            Assert.Same(storage, storage.Compile().Storage);
+        }
+
+        [Fact]
+        [Trait("Category", "Storage.Compiled")]
+        public void ActivePeriodIndex_PeriodOutsideActivePeriods_ReturnsMinusOne()
+        {
+            CompiledCmdtyStorage<Day> compiled = CreateStorage(true).Compile();
+            Assert.Equal(-1, compiled.ActivePeriodIndex(StorageStart.Offset(-1)));
+            Assert.Equal(-1, compiled.ActivePeriodIndex(StorageEnd));
+            Assert.Equal(0, compiled.ActivePeriodIndex(StorageStart));
+            Assert.Equal(StorageEnd.OffsetFrom(StorageStart) - 1, compiled.ActivePeriodIndex(StorageEnd.Offset(-1)));
+        }
+
+        [Fact]
+        [Trait("Category", "Storage.Compiled")]
+        public void BatchCostMethods_StorageWithPerUnitCosts_EqualScalarMethodsDiscounted()
+        {
+            AssertBatchCostMethodsEqualScalarMethods(true);
+        }
+
+        [Fact]
+        [Trait("Category", "Storage.Compiled")]
+        public void BatchCostMethods_StorageWithCostFunctions_EqualScalarMethodsDiscounted()
+        {
+            AssertBatchCostMethodsEqualScalarMethods(false);
+        }
+
+        private static void AssertBatchCostMethodsEqualScalarMethods(bool withPerUnitCosts)
+        {
+            CmdtyStorage<Day> storage = CreateStorage(withPerUnitCosts);
+            Func<Day, double> discountToPresent = day => Math.Exp(-0.0001 * day.OffsetFrom(StorageStart));
+            double Npv(IReadOnlyList<DomesticCashFlow> cashFlows) 
+                => cashFlows.Sum(cashFlow => cashFlow.Amount * discountToPresent(cashFlow.Date));
+
+            // Pairs of every inventory with every volume
+            double[] inventories = Inventories.SelectMany(inventory => Volumes.Select(volume => inventory)).ToArray();
+            double[] volumes = Inventories.SelectMany(inventory => Volumes).ToArray();
+            var injectWithdrawCostNpvs = new double[inventories.Length];
+            var cmdtyVolumesConsumed = new double[inventories.Length];
+            var inventoryCostNpvs = new double[inventories.Length];
+
+            foreach (ICmdtyStorage<Day> batchStorage in new ICmdtyStorage<Day>[] {storage, storage.Compile()})
+            {
+                for (int periodIndex = 0; periodIndex < StorageEnd.OffsetFrom(StorageStart); periodIndex++)
+                {
+                    Day period = StorageStart.Offset(periodIndex);
+                    batchStorage.InjectWithdrawCostNpvs(period, inventories, volumes, discountToPresent, injectWithdrawCostNpvs);
+                    batchStorage.CmdtyVolumesConsumedOnInjectWithdraw(period, inventories, volumes, cmdtyVolumesConsumed);
+                    batchStorage.CmdtyInventoryCostNpvs(period, inventories, discountToPresent, inventoryCostNpvs);
+                    for (int i = 0; i < inventories.Length; i++)
+                    {
+                        double inventory = inventories[i];
+                        double volume = volumes[i];
+                        double expectedInjectWithdrawCostNpv = volume > 0.0
+                            ? Npv(storage.InjectionCost(period, inventory, volume))
+                            : Npv(storage.WithdrawalCost(period, inventory, -volume));
+                        double expectedCmdtyConsumed = volume > 0.0
+                            ? storage.CmdtyVolumeConsumedOnInject(period, inventory, volume)
+                            : storage.CmdtyVolumeConsumedOnWithdraw(period, inventory, -volume);
+                        Assert.Equal(expectedInjectWithdrawCostNpv, injectWithdrawCostNpvs[i], 12);
+                        Assert.Equal(expectedCmdtyConsumed, cmdtyVolumesConsumed[i], 12);
+                        Assert.Equal(Npv(storage.CmdtyInventoryCost(period, inventory)), inventoryCostNpvs[i], 12);
+                    }
+                }
+            }
+        }
+
+        private static void AssertCashFlowsEqual(IReadOnlyList<DomesticCashFlow> expected, IReadOnlyList<DomesticCashFlow> actual)
+        {
+            Assert.Equal(expected.Select(cashFlow => cashFlow.Date), actual.Select(cashFlow => cashFlow.Date));
+            Assert.Equal(expected.Select(cashFlow => cashFlow.Amount), actual.Select(cashFlow => cashFlow.Amount));
+        }
+
+    }
+}
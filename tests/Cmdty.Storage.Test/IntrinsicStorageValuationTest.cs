@@ -36,7 +36,8 @@ public sealed class IntrinsicStorageValuationTest
     {
 
         private static IntrinsicStorageValuationResults<Day> GenerateValuationResults(double startingInventory, 
-                                                                        TimeSeries<Day, double> forwardCurve, Day currentPeriod)
+                                                                        TimeSeries<Day, double> forwardCurve, Day currentPeriod,
+                                                                        bool withPhaseTimings = false)
         {
             var storageStart = new Day(2019, 9, 1);
             var storageEnd = new Day(2019, 9, 30);
@@ -60,7 +61,7 @@ public sealed class IntrinsicStorageValuationTest
                 .MustBeEmptyAtEnd()
                 .Build();
 
-            IntrinsicStorageValuationResults<Day> valuationResults = IntrinsicStorageValuation<Day>
+            IIntrinsicCalculate<Day> valuation = IntrinsicStorageValuation<Day>
                 .ForStorage(storage)
                 .WithStartingInventory(startingInventory)
                 .ForCurrentPeriod(currentPeriod)
@@ -69,10 +70,11 @@ public sealed class IntrinsicStorageValuationTest
                 .WithDiscountFactorFunc((valuationDate, cashFlowDate) => 1.0) // No discounting
                 .WithFixedGridSpacing(10.0)
                 .WithLinearInventorySpaceInterpolation()
-                .WithNumericalTolerance(1E-10)
-                .Calculate();
+                .WithNumericalTolerance(1E-10);
+            if (withPhaseTimings)
+                valuation = valuation.WithPhaseTimings();
 
-            return valuationResults;
+            return valuation.Calculate();
         }
 
         private static TimeSeries<Day, double> GenerateBackwardatedCurve(Day storageStart, Day storageEnd)
@@ -112,6 +114,30 @@ public void Calculate_ZeroInventoryCurveBackwardated_ResultWithZeroNetPresentVal
             Assert.Equal(0.0, valuationResults.NetPresentValue);
         }
 
+        [Fact]
+        public void Calculate_WithPhaseTimings_ResultContainsTimingForEachPhase()
+        {
+            var currentPeriod = new Day(2019, 9, 15);
+            var forwardCurve = GenerateBackwardatedCurve(new Day(2019, 9, 1), new Day(2019, 9, 30));
+
+            IntrinsicStorageValuationResults<Day> valuationResults = GenerateValuationResults(0.0, forwardCurve, currentPeriod, true);
+
+            Assert.Equal(new[] { "BackwardInduction", "ForwardProfile", "InterpolatorConstruction", "InventorySpace" },
+                valuationResults.PhaseTimings.Keys.OrderBy(phase => phase));
+            Assert.True(valuationResults.PhaseTimings["BackwardInduction"] >= valuationResults.PhaseTimings["InterpolatorConstruction"]);
+        }
+
+        [Fact]
+        public void Calculate_WithoutPhaseTimings_ResultPhaseTimingsEmpty()
+        {
+            var currentPeriod = new Day(2019, 9, 15);
+            var forwardCurve = GenerateBackwardatedCurve(new Day(2019, 9, 1), new Day(2019, 9, 30));
+
+            IntrinsicStorageValuationResults<Day> valuationResults = GenerateValuationResults(0.0, forwardCurve, currentPeriod);
+
+            Assert.Empty(valuationResults.PhaseTimings);
+        }
+
         [Fact]
         public void Calculate_ZeroInventoryCurveBackwardated_ResultWithZerosDecisionProfile()
         {
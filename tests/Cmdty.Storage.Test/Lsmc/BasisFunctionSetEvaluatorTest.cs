@@ -0,0 +1,129 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+using System.Collections.Generic;
+using Xunit;
+
+namespace Cmdty.Storage.Test
+{
+    public sealed class BasisFunctionSetEvaluatorTest
+    {
+
+        [Fact]
+        [Trait("Category", "Lsmc.BasisFunctions")]
+        public void Evaluate_EqualsCallingEachBasisFunction()
+        {
+            const int numSims = 37; // Not a multiple of the SIMD vector width, so remainder elements are tested
+            var random = new Random(12);
+            var spotPriceSims = new double[numSims];
+            var markovFactor0 = new double[numSims];
+            var markovFactor1 = new double[numSims];
+            for (int i = 0; i < numSims; i++)
+            {
+                spotPriceSims[i] = random.NextDouble() * 50.0;
+                markovFactor0[i] = random.NextDouble() - 0.5;
+                markovFactor1[i] = random.NextDouble() * 2.0 - 1.0;
+            }
+            var markovFactors = new ReadOnlyMemory<double>[] { markovFactor0, markovFactor1 };
+
+            static void SinSpot(ReadOnlyMemory<double>[] markovFactorSims, ReadOnlySpan<double> spotPriceBySim,
+                Span<double> designMatrixCol)
+            {
+                for (int i = 0; i < designMatrixCol.Length; i++)
+                    designMatrixCol[i] = Math.Sin(spotPriceBySim[i]);
+            }
+
+            var basisFunctions = new List<BasisFunction>
+            {
+                BasisFunctions.Ones,
+                BasisFunctions.SpotPricePower(1),
+                BasisFunctions.SpotPricePower(3),
+                BasisFunctions.MarkovFactorPower(0, 2),
+                SinSpot,
+                Sim.Spot * Sim.X0,
+                Sim.Spot * Sim.X0 * Sim.X1.Pow(4),
+                Sim.Spot.Pow(2) * Sim.X1.Pow(3),
+                BasisFunctions.SpotPriceOrthogonalPolynomial(OrthogonalPolynomialFamily.Hermite, 3),
+                BasisFunctions.MarkovFactorOrthogonalPolynomial(OrthogonalPolynomialFamily.Legendre, 1, 2)
+            };
+
+            var evaluator = new BasisFunctionSetEvaluator(basisFunctions);
+            var fusedResults = new double[numSims * basisFunctions.Count];
+            evaluator.Evaluate(markovFactors, spotPriceSims, fusedResults, numSims);
+
+            for (int basisIndex = 0; basisIndex < basisFunctions.Count; basisIndex++)
+            {
+                var expectedColumn = new double[numSims];
+                basisFunctions[basisIndex](markovFactors, spotPriceSims, expectedColumn);
+                for (int simIndex = 0; simIndex < numSims; simIndex++)
+                {
+                    double expected = expectedColumn[simIndex];
+                    double actual = fusedResults[basisIndex * numSims + simIndex];
+                    Assert.Equal(expected, actual, 10);
+                }
+            }
+        }
+
+        [Fact]
+        [Trait("Category", "Lsmc.BasisFunctions")]
+        public void Evaluate_WithStandardisationFittedOnAllSims_BatchEqualsRowsOfAllSims()
+        {
+            const int numSims = 40;
+            const int batchNumSims = 15;
+            var random = new Random(12);
+            var spotPriceSims = new double[numSims];
+            var markovFactor0 = new double[numSims];
+            for (int i = 0; i < numSims; i++)
+            {
+                spotPriceSims[i] = random.NextDouble() * 50.0;
+                markovFactor0[i] = random.NextDouble() - 0.5;
+            }
+            var markovFactors = new ReadOnlyMemory<double>[] { markovFactor0 };
+
+            var basisFunctions = new List<BasisFunction>
+            {
+                BasisFunctions.Ones,
+                BasisFunctions.MarkovFactorOrthogonalPolynomial(OrthogonalPolynomialFamily.Hermite, 0, 2),
+                BasisFunctions.SpotPriceOrthogonalPolynomial(OrthogonalPolynomialFamily.Laguerre, 2),
+                BasisFunctions.SpotPriceOrthogonalPolynomial(OrthogonalPolynomialFamily.Legendre, 3)
+            };
+
+            var evaluator = new BasisFunctionSetEvaluator(basisFunctions);
+            BasisFunctionStandardisation standardisation = evaluator.FitStandardisation(markovFactors, spotPriceSims);
+            var allSimsResults = new double[numSims * basisFunctions.Count];
+            evaluator.Evaluate(markovFactors, spotPriceSims, allSimsResults, numSims, standardisation);
+
+            var batchMarkovFactors = new ReadOnlyMemory<double>[] { markovFactor0.AsMemory(0, batchNumSims) };
+            var batchResults = new double[batchNumSims * basisFunctions.Count];
+            evaluator.Evaluate(batchMarkovFactors, spotPriceSims.AsSpan(0, batchNumSims), batchResults, batchNumSims, standardisation);
+
+            for (int basisIndex = 0; basisIndex < basisFunctions.Count; basisIndex++)
+                for (int simIndex = 0; simIndex < batchNumSims; simIndex++)
+                    Assert.Equal(allSimsResults[basisIndex * numSims + simIndex], batchResults[basisIndex * batchNumSims + simIndex]);
+        }
+
+    }
+}
@@ -69,6 +69,61 @@ public void Parse_ValidInput_AsExpected()
                 spotPriceSims.Select((s, i) => s* Math.Pow(thirdFactor[i], 4)));
         }
 
+        [Fact]
+        [Trait("Category", "Lsmc.BasisFunctions")]
+        public void TryParsePowerMonomial_ProductOfPowers_CombinesPowers()
+        {
+            bool parsed = BasisFunctionsBuilder.TryParsePowerMonomial(" s * x0**2 * x1 * x0 ** 3", out PowerMonomialBuilder powerMonomial);
+
+            Assert.True(parsed);
+            Assert.Equal(1, powerMonomial.SpotPower);
+            Assert.Equal(new Dictionary<int, int> { { 0, 5 }, { 1, 1 } }, powerMonomial.MarkovFactorPowers);
+        }
+
+        [Theory]
+        [Trait("Category", "Lsmc.BasisFunctions")]
+        [InlineData("(s*x0)**2")]
+        [InlineData("s**")]
+        [InlineData("s*x0*")]
+        [InlineData("y0")]
+        public void TryParsePowerMonomial_ExpressionNotProductOfPowers_ReturnsFalse(string expression)
+        {
+            Assert.False(BasisFunctionsBuilder.TryParsePowerMonomial(expression, out _));
+        }
+
+        [Fact]
+        [Trait("Category", "Lsmc.BasisFunctions")]
+        public void Parse_OrthogonalPolynomials_EvaluatesOnStandardisedValues()
+        {
+            BasisFunction[] basisFunctions = BasisFunctionsBuilder.Parse("1 + legendre(s, 1) + hermite(x0, 3) + laguerre(x1, 2)");
+
+            Assert.Equal(4, basisFunctions.Length);
+
+            var spotPriceSims = new[] { 10.0, 12.0, 20.0 };
+            var markovFactors = new ReadOnlyMemory<double>[]
+            {
+                new[]{ -1.0, 0.0, 1.0},
+                new[]{ 1.0, 2.0, 3.0}
+            };
+            double stdDev = Math.Sqrt(2.0 / 3.0);
+
+            // Legendre on spot price rescaled to [-1, 1]
+            AssertBasisFunctionApprox(basisFunctions[1], spotPriceSims, markovFactors, new[] { -1.0, -0.6, 1.0 });
+            // Hermite on first factor standardised to zero mean and unit standard deviation: z^3 - 3z
+            AssertBasisFunctionApprox(basisFunctions[2], spotPriceSims, markovFactors, 
+                new[] { -1.0, 0.0, 1.0 }.Select(x => x / stdDev).Select(z => z * z * z - 3.0 * z));
+            // Laguerre on second factor shifted to minimum of zero and scaled to unit standard deviation: (x^2 - 4x + 2)/2
+            AssertBasisFunctionApprox(basisFunctions[3], spotPriceSims, markovFactors,
+                new[] { 0.0, 1.0, 2.0 }.Select(x => x / stdDev).Select(x => (x * x - 4.0 * x + 2.0) / 2.0));
+        }
+
+        [Fact]
+        [Trait("Category", "Lsmc.BasisFunctions")]
+        public void TryParseOrthogonalPolynomial_PowerMonomial_ReturnsFalse()
+        {
+            Assert.False(BasisFunctionsBuilder.TryParseOrthogonalPolynomial("s * x0**2", out _));
+        }
+
         private static void AssertBasisFunction(BasisFunction basisFunction, double[] spotSims, ReadOnlyMemory<double>[] markovSims, 
             IEnumerable<double> expectedResults)
         {
@@ -77,6 +132,17 @@ public void Parse_ValidInput_AsExpected()
             Assert.Equal(expectedResults, results);
         }
 
+        private static void AssertBasisFunctionApprox(BasisFunction basisFunction, double[] spotSims, ReadOnlyMemory<double>[] markovSims,
+            IEnumerable<double> expectedResults)
+        {
+            var results = new double[spotSims.Length];
+            basisFunction(markovSims, spotSims, results);
+            double[] expected = expectedResults.ToArray();
+            Assert.Equal(expected.Length, results.Length);
+            for (int i = 0; i < expected.Length; i++)
+                Assert.Equal(expected[i], results[i], 12);
+        }
+
 
         [Fact]
         [Trait("Category", "Lsmc.BasisFunctions")]
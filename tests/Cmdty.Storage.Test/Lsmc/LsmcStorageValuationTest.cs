@@ -222,6 +222,18 @@ public void Calculate_CurrentPeriodAfterStorageEnd_ResultWithEmptyDeltas()
             LsmcStorageValuationResults<Day> lsmcResults = LsmcStorageValuation.WithNoLogger.Calculate(builder.Build());
             Assert.True(lsmcResults.Deltas.IsEmpty);
         }
+
+        [Fact]
+        [Trait("Category", "Lsmc.AtEndOfStorage")]
+        public void Calculate_CurrentPeriodAfterStorageEnd_ControlVariateNpvIsNaN()
+        {
+            var builder = _1FactorParamsBuilder.Clone();
+            builder.CurrentPeriod = _simpleDailyStorage.EndPeriod + 1;
+            builder.Storage = _simpleDailyStorage;
+            LsmcStorageValuationResults<Day> lsmcResults = LsmcStorageValuation.WithNoLogger.Calculate(builder.Build());
+            Assert.True(double.IsNaN(lsmcResults.ControlVariateNpv));
+            Assert.True(double.IsNaN(lsmcResults.ControlVariateNpvStandardError));
+        }
         // TODO same unit test as above, but testing the other output data, decision, simulated prices etc.
 
         [Fact]
@@ -266,6 +278,19 @@ public void Calculate_CurrentPeriodEqualToStorageEndAndInventoryHasTerminalValue
             Assert.Equal(expectedNpv, lsmcResults.Npv);
         }
 
+        [Fact]
+        [Trait("Category", "Lsmc.AtEndOfStorage")]
+        public void Calculate_CurrentPeriodEqualToStorageEndAndInventoryHasTerminalValue_ControlVariateNpvIsNaN()
+        {
+            var builder = _1FactorParamsBuilder.Clone();
+            builder.CurrentPeriod = _simpleDailyStorageTerminalInventoryValue.EndPeriod;
+            builder.Inventory = 0.0;
+            builder.Storage = _simpleDailyStorageTerminalInventoryValue;
+            LsmcStorageValuationResults<Day> lsmcResults = LsmcStorageValuation.WithNoLogger.Calculate(builder.Build());
+            Assert.True(double.IsNaN(lsmcResults.ControlVariateNpv));
+            Assert.True(double.IsNaN(lsmcResults.ControlVariateNpvStandardError));
+        }
+
         // TODO same unit test as above, but testing the other output data, delta, decision, simulated prices etc.
 
         [Fact]
@@ -508,6 +533,108 @@ public void Calculate_OneFactorSimpleStorageValDateAfterStorageStart_NpvApproxim
             TestHelper.AssertWithinPercentTol(treeResults.NetPresentValue, lsmcResults.Npv, percentageTol);
         }
 
+        [Fact]
+        [Trait("Category", "Lsmc.ControlVariate")]
+        public void Calculate_IntrinsicControlVariate_StandardErrorLowerThanRawStandardError()
+        {
+            var builder = _1FactorParamsBuilder.Clone();
+            builder.Storage = _simpleDailyStorage;
+            IntrinsicStorageValuationResults<Day> intrinsicResults = CalcIntrinsic(builder.Build());
+            TimeSeries<Day, StorageProfile> intrinsicProfile = intrinsicResults.StorageProfile;
+            builder.ControlVariateNetVolumes = new TimeSeries<Day, double>(intrinsicProfile.Indices.ToArray(), 
+                                                    intrinsicProfile.Data.Select(profile => profile.NetVolume).ToArray());
+            LsmcStorageValuationResults<Day> lsmcResults = LsmcStorageValuation.WithNoLogger.Calculate(builder.Build());
+
+            double[] pvBySim = lsmcResults.PvBySim.ToArray();
+            double rawMean = pvBySim.Average();
+            double rawStandardError = Math.Sqrt(pvBySim.Sum(pv => (pv - rawMean) * (pv - rawMean)) / (pvBySim.Length - 1) / pvBySim.Length);
+            _testOutputHelper.WriteLine($"Raw: {lsmcResults.Npv}, standard error {rawStandardError}");
+            _testOutputHelper.WriteLine($"Control variate: {lsmcResults.ControlVariateNpv}, standard error {lsmcResults.ControlVariateNpvStandardError}");
+
+            Assert.InRange(lsmcResults.ControlVariateNpvStandardError, 0.0, rawStandardError);
+            Assert.InRange(lsmcResults.ControlVariateNpv, lsmcResults.Npv - 4 * rawStandardError, lsmcResults.Npv + 4 * rawStandardError);
+            Assert.Equal(lsmcResults.Deltas.Count, lsmcResults.ControlVariateDeltas.Count);
+        }
+
+        [Fact]
+        [Trait("Category", "Lsmc.ControlVariate")]
+        public void Calculate_ControlVariateNetVolumesNotSet_ControlVariateNpvIsNaN()
+        {
+            var builder = _1FactorParamsBuilder.Clone();
+            builder.Storage = _simpleDailyStorage;
+            LsmcStorageValuationResults<Day> lsmcResults = LsmcStorageValuation.WithNoLogger.Calculate(builder.Build());
+
+            Assert.True(double.IsNaN(lsmcResults.ControlVariateNpv));
+            Assert.True(lsmcResults.ControlVariateDeltas.IsEmpty);
+        }
+
+        [Fact]
+        [Trait("Category", "Lsmc.Diagnostics")]
+        public void Calculate_SimpleStorage_NpvStandardErrorEqualsStandardErrorOfPvBySim()
+        {
+            var builder = _1FactorParamsBuilder.Clone();
+            builder.Storage = _simpleDailyStorage;
+            LsmcStorageValuationResults<Day> lsmcResults = LsmcStorageValuation.WithNoLogger.Calculate(builder.Build());
+
+            double[] pvBySim = lsmcResults.PvBySim.ToArray();
+            double mean = pvBySim.Average();
+            double expectedStandardError = Math.Sqrt(pvBySim.Sum(pv => (pv - mean) * (pv - mean)) / (pvBySim.Length - 1) / pvBySim.Length);
+            _testOutputHelper.WriteLine($"Forward: {lsmcResults.Npv}, backward: {lsmcResults.BackwardNpv}");
+
+            Assert.Equal(expectedStandardError, lsmcResults.NpvStandardError, 6);
+            Assert.Equal(lsmcResults.BackwardNpv - lsmcResults.Npv, lsmcResults.BackwardForwardNpvGap);
+            Assert.Equal(lsmcResults.Deltas.Indices, lsmcResults.DeltaStandardErrors.Indices);
+            Assert.All(lsmcResults.DeltaStandardErrors.Data, standardError => Assert.True(standardError >= 0.0));
+        }
+
+        [Fact]
+        [Trait("Category", "Lsmc.Diagnostics")]
+        public void Calculate_SimpleStorage_ProfileContainsPhaseTimingsAndCounts()
+        {
+            var builder = _1FactorParamsBuilder.Clone();
+            builder.Storage = _simpleDailyStorage;
+            LsmcStorageValuationResults<Day> lsmcResults = LsmcStorageValuation.WithNoLogger.Calculate(builder.Build());
+            LsmcValuationProfile profile = lsmcResults.Profile;
+
+            Assert.True(profile.Total > TimeSpan.Zero);
+            Assert.True(profile.Total >= profile.RegressionPriceSimulation + profile.ValuationPriceSimulation + 
+                                        profile.BackwardInduction + profile.ForwardSimulation);
+            Assert.True(profile.BackwardInduction >= profile.PseudoInverse);
+            Assert.True(profile.NumRegressionsSolved > 0);
+            Assert.True(profile.NumDecisionsEvaluated >= NumSims);
+        }
+
+        [Fact]
+        [Trait("Category", "Lsmc.AdaptiveNumSims")]
+        public void Calculate_TargetNpvStandardErrorNotReached_ValuationSimsEqualsMaxValuationSims()
+        {
+            const int maxValuationSims = NumSims * 3;
+            var builder = _1FactorParamsBuilder.Clone();
+            builder.Storage = _simpleDailyStorage;
+            builder.TargetNpvStandardError = 1E-10;
+            builder.MaxValuationSims = maxValuationSims;
+            LsmcStorageValuationResults<Day> lsmcResults = LsmcStorageValuation.WithNoLogger.Calculate(builder.Build());
+
+            Assert.Equal(maxValuationSims, lsmcResults.PvBySim.Count);
+            Assert.Equal(maxValuationSims, lsmcResults.ValuationSpotPriceSim.NumCols);
+            Assert.Equal(NumSims, lsmcResults.RegressionSpotPriceSim.NumCols);
+            Assert.Equal(lsmcResults.PvBySim.Average(), lsmcResults.Npv, 8);
+        }
+
+        [Fact]
+        [Trait("Category", "Lsmc.AdaptiveNumSims")]
+        public void Calculate_TargetNpvStandardErrorReachedOnFirstBatch_OneBatchOfValuationSims()
+        {
+            var builder = _1FactorParamsBuilder.Clone();
+            builder.Storage = _simpleDailyStorage;
+            builder.TargetNpvStandardError = double.MaxValue;
+            builder.MaxValuationSims = NumSims * 3;
+            LsmcStorageValuationResults<Day> lsmcResults = LsmcStorageValuation.WithNoLogger.Calculate(builder.Build());
+
+            Assert.Equal(NumSims, lsmcResults.PvBySim.Count);
+            Assert.InRange(lsmcResults.NpvStandardError, 0.0, double.MaxValue);
+        }
+
         private IntrinsicStorageValuationResults<Day> CalcIntrinsic(LsmcValuationParameters<Day> lsmcParams) => IntrinsicStorageValuation<Day>
                                             .ForStorage(lsmcParams.Storage)
                                             .WithStartingInventory(Inventory)
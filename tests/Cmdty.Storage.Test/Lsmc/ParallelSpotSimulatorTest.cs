@@ -0,0 +1,110 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+using System.Linq;
+using Cmdty.Core.Simulation;
+using Cmdty.Core.Simulation.MultiFactor;
+using Cmdty.TimePeriodValueTypes;
+using Cmdty.TimeSeries;
+using Xunit;
+using TimeSeriesFactory = Cmdty.TimeSeries.TimeSeries;
+
+namespace Cmdty.Storage.Test
+{
+    public sealed class ParallelSpotSimulatorTest
+    {
+        private const int Seed = 12;
+        private const int SimsPerBlock = 100;
+        private readonly Func<IStandardNormalGenerator, MultiFactorSpotPriceSimulator<Day>> _simulatorFactory;
+
+        public ParallelSpotSimulatorTest()
+        {
+            var currentDate = new DateTime(2020, 7, 27);
+            var simStart = new Day(2020, 8, 1);
+            var simEnd = new Day(2020, 12, 31);
+            TimeSeries<Day, double> forwardCurve = TimeSeriesFactory.ForConstantData(simStart, simEnd, 56.85);
+            var multiFactorParams = MultiFactorParameters.For2Factors(0.6,
+                new Factor<Day>(0.0, TimeSeriesFactory.ForConstantData(simStart, simEnd, 0.35)),
+                new Factor<Day>(2.5, TimeSeriesFactory.ForConstantData(simStart, simEnd, 0.95)));
+            Day[] simulatedPeriods = simStart.EnumerateTo(simEnd).ToArray();
+            _simulatorFactory = normalGenerator => new MultiFactorSpotPriceSimulator<Day>(multiFactorParams, currentDate,
+                forwardCurve, simulatedPeriods, TimeFunctions.Act365, normalGenerator);
+        }
+
+        [Fact]
+        [Trait("Category", "Lsmc.ParallelSimulation")]
+        public void Simulate_SameSeedDifferentDegreeOfParallelism_IdenticalResults()
+        {
+            const int numSims = 1_050;
+            var singleThreaded = new ParallelSpotSimulator<Day>(_simulatorFactory, Seed, true, 1, SimsPerBlock).Simulate(numSims);
+            var multiThreaded = new ParallelSpotSimulator<Day>(_simulatorFactory, Seed, true, 4, SimsPerBlock).Simulate(numSims);
+
+            Assert.Equal(singleThreaded.SpotPrices, multiThreaded.SpotPrices);
+            foreach (Day period in singleThreaded.SimulatedPeriods)
+                for (int factorIndex = 0; factorIndex < singleThreaded.NumFactors; factorIndex++)
+                    Assert.Equal(singleThreaded.MarkovFactorsForPeriod(period, factorIndex).ToArray(), 
+                        multiThreaded.MarkovFactorsForPeriod(period, factorIndex).ToArray());
+        }
+
+        [Fact]
+        [Trait("Category", "Lsmc.ParallelSimulation")]
+        public void Simulate_ResultsHaveExpectedDimensions()
+        {
+            const int numSims = 1_050;
+            var simResults = new ParallelSpotSimulator<Day>(_simulatorFactory, Seed, true, null, SimsPerBlock).Simulate(numSims);
+
+            Assert.Equal(numSims, simResults.NumSims);
+            Assert.Equal(2, simResults.NumFactors);
+            Assert.Equal(153, simResults.SimulatedPeriods.Count());
+            Assert.Equal(153 * numSims, simResults.SpotPrices.Length);
+            Assert.All(simResults.SpotPrices, spotPrice => Assert.True(spotPrice > 0.0));
+        }
+
+        [Fact]
+        [Trait("Category", "Lsmc.ParallelSimulation")]
+        public void Simulate_CalledTwice_ContinuesSequenceOfBlocks()
+        {
+            var simulator = new ParallelSpotSimulator<Day>(_simulatorFactory, Seed, true, null, SimsPerBlock);
+            var firstSimResults = simulator.Simulate(SimsPerBlock);
+            var secondSimResults = simulator.Simulate(SimsPerBlock);
+            var bothSimResults = new ParallelSpotSimulator<Day>(_simulatorFactory, Seed, true, null, SimsPerBlock).Simulate(SimsPerBlock * 2);
+
+            Day firstPeriod = bothSimResults.SimulatedPeriods.First();
+            double[] bothFirstPeriodSpot = bothSimResults.SpotPricesForPeriod(firstPeriod).ToArray();
+            Assert.Equal(firstSimResults.SpotPricesForPeriod(firstPeriod).ToArray(), bothFirstPeriodSpot.Take(SimsPerBlock));
+            Assert.Equal(secondSimResults.SpotPricesForPeriod(firstPeriod).ToArray(), bothFirstPeriodSpot.Skip(SimsPerBlock));
+        }
+
+        [Fact]
+        [Trait("Category", "Lsmc.ParallelSimulation")]
+        public void SubstreamSeed_DifferentBlockIndices_GiveDifferentSeeds()
+        {
+            var seeds = Enumerable.Range(0, 10_000).Select(blockIndex => ParallelSpotSimulator<Day>.SubstreamSeed(Seed, blockIndex));
+            Assert.Equal(10_000, seeds.Distinct().Count());
+        }
+
+    }
+}
@@ -0,0 +1,132 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+using System.Linq;
+using Xunit;
+
+namespace Cmdty.Storage.Test
+{
+    public sealed class SobolBrownianBridgeGeneratorTest
+    {
+        [Fact]
+        [Trait("Category", "Lsmc.QuasiRandom")]
+        public void SobolSequence_Unscrambled_FirstPointsEqualJoeKuoSequence()
+        {
+            // Expected values from the Joe & Kuo Sobol sequence, generated by scipy.stats.qmc.Sobol with scramble=False
+            double[][] expectedPoints =
+            {
+                new[] {0.0, 0.0, 0.0, 0.0},
+                new[] {0.5, 0.5, 0.5, 0.5},
+                new[] {0.75, 0.25, 0.25, 0.25},
+                new[] {0.25, 0.75, 0.75, 0.75},
+                new[] {0.375, 0.375, 0.625, 0.875},
+                new[] {0.875, 0.875, 0.125, 0.375}
+            };
+            var sobolSequence = new SobolSequence(4, null);
+            var point = new double[4];
+            foreach (double[] expectedPoint in expectedPoints)
+            {
+                sobolSequence.NextPoint(point);
+                for (int i = 0; i < point.Length; i++)
+                    Assert.Equal(expectedPoint[i], point[i], 9);
+            }
+        }
+
+        [Fact]
+        [Trait("Category", "Lsmc.QuasiRandom")]
+        public void SobolSequence_HighDimensionsScrambled_EachDimensionStratified()
+        {
+            const int numDimensions = 1_000;
+            const int numPoints = 256;
+            var sobolSequence = new SobolSequence(numDimensions, 12);
+            var point = new double[numDimensions];
+            var pointCountsPerStratum = new int[numDimensions, numPoints];
+            for (int pointIndex = 0; pointIndex < numPoints; pointIndex++)
+            {
+                sobolSequence.NextPoint(point);
+                for (int i = 0; i < numDimensions; i++)
+                {
+                    Assert.InRange(point[i], double.Epsilon, 1.0 - double.Epsilon);
+                    pointCountsPerStratum[i, (int)(point[i] * numPoints)]++;
+                }
+            }
+            // Each one dimensional projection of the first 2^k points of a Sobol sequence has exactly one point in each interval of width 2^-k
+            Assert.All(pointCountsPerStratum.Cast<int>(), count => Assert.Equal(1, count));
+        }
+
+        [Fact]
+        [Trait("Category", "Lsmc.QuasiRandom")]
+        public void BrownianBridge_Transform_IsOrthonormal()
+        {
+            const int numSteps = 13;
+            var brownianBridge = new BrownianBridge(numSteps);
+            var transformMatrix = new double[numSteps][];
+            for (int i = 0; i < numSteps; i++)
+            {
+                var unitVector = new double[numSteps];
+                unitVector[i] = 1.0;
+                transformMatrix[i] = new double[numSteps];
+                brownianBridge.Transform(unitVector, transformMatrix[i]);
+            }
+            // Orthonormal transform maps independent standard normals to independent standard normals
+            for (int i = 0; i < numSteps; i++)
+            for (int j = 0; j < numSteps; j++)
+            {
+                double dotProduct = transformMatrix[i].Zip(transformMatrix[j], (x, y) => x * y).Sum();
+                Assert.Equal(i == j ? 1.0 : 0.0, dotProduct, 12);
+            }
+        }
+
+        [Fact]
+        [Trait("Category", "Lsmc.QuasiRandom")]
+        public void Generate_NormalsHaveMeanZeroAndUnitVariance()
+        {
+            const int numFactors = 3;
+            const int numSteps = 50;
+            const int numSims = 4_096;
+            var generator = new SobolBrownianBridgeGenerator(numFactors, numSteps, 11);
+            Assert.True(generator.MatchesDimensions(numFactors * numSteps));
+            var normals = new double[numFactors * numSteps];
+            var sums = new double[normals.Length];
+            var sumSquares = new double[normals.Length];
+            for (int simIndex = 0; simIndex < numSims; simIndex++)
+            {
+                generator.Generate(normals);
+                for (int i = 0; i < normals.Length; i++)
+                {
+                    sums[i] += normals[i];
+                    sumSquares[i] += normals[i] * normals[i];
+                }
+            }
+            for (int i = 0; i < normals.Length; i++)
+            {
+                Assert.Equal(0.0, sums[i] / numSims, 1);
+                Assert.Equal(1.0, sumSquares[i] / numSims, 1);
+            }
+        }
+
+    }
+}
@@ -261,5 +261,62 @@ public void GetInjectWithdrawRange_InventoryHalfWayBetweenPillars_EqualToMeanOfA
             Assert.Equal(maxInjectWithdrawExpected, maxInjectWithdraw);
         }
 
+        [Fact]
+        public void GetInjectWithdrawRange_UniformlySpacedPillars_EqualToMeanOfAdjacentPillarRatesHalfWayBetweenPillars()
+        {
+            var injectWithdrawalRanges = new List<InjectWithdrawRangeByInventory>
+            {
+                (inventory: 0.0, (minInjectWithdrawRate: -44.85, maxInjectWithdrawRate: 56.8)),
+                (inventory: 0.1, (minInjectWithdrawRate: -45.01, maxInjectWithdrawRate: 54.5)),
+                (inventory: 0.2, (minInjectWithdrawRate: -45.78, maxInjectWithdrawRate: 52.01)),
+                (inventory: 0.3, (minInjectWithdrawRate: -46.17, maxInjectWithdrawRate: 51.9)),
+                (inventory: 0.4, (minInjectWithdrawRate: -46.99, maxInjectWithdrawRate: 50.8)),
+                (inventory: 0.5, (minInjectWithdrawRate: -47.12, maxInjectWithdrawRate: 50.01))
+            };
+
+            var linearInjectWithdrawConstraint = new PiecewiseLinearInjectWithdrawConstraint(injectWithdrawalRanges);
+
+            for (int i = 0; i < injectWithdrawalRanges.Count - 1; i++)
+            {
+                (double lowerInventory, InjectWithdrawRange lowerInjectWithdrawRange) = injectWithdrawalRanges[i];
+                (double upperInventory, InjectWithdrawRange upperInjectWithdrawRange) = injectWithdrawalRanges[i + 1];
+                (double minInjectWithdraw, double maxInjectWithdraw) = 
+                    linearInjectWithdrawConstraint.GetInjectWithdrawRange((lowerInventory + upperInventory) / 2.0);
+
+                double minInjectWithdrawExpected = (lowerInjectWithdrawRange.MinInjectWithdrawRate + upperInjectWithdrawRange.MinInjectWithdrawRate) / 2.0;
+                double maxInjectWithdrawExpected = (lowerInjectWithdrawRange.MaxInjectWithdrawRate + upperInjectWithdrawRange.MaxInjectWithdrawRate) / 2.0;
+
+                Assert.Equal(minInjectWithdrawExpected, minInjectWithdraw, 12);
+                Assert.Equal(maxInjectWithdrawExpected, maxInjectWithdraw, 12);
+            }
+        }
+
+        [Fact]
+        public void GetInjectWithdrawRangeBatch_EqualToScalarGetInjectWithdrawRange()
+        {
+            var injectWithdrawalRanges = new List<InjectWithdrawRangeByInventory>
+            {
+                (inventory: 0.0, (minInjectWithdrawRate: -44.85, maxInjectWithdrawRate: 56.8)),
+                (inventory: 100.0, (minInjectWithdrawRate: -45.01, maxInjectWithdrawRate: 54.5)),
+                (inventory: 300.0, (minInjectWithdrawRate: -45.78, maxInjectWithdrawRate: 52.01)),
+                (inventory: 600.0, (minInjectWithdrawRate: -46.17, maxInjectWithdrawRate: 51.9)),
+                (inventory: 800.0, (minInjectWithdrawRate: -46.99, maxInjectWithdrawRate: 50.8)),
+                (inventory: 1000.0, (minInjectWithdrawRate: -47.12, maxInjectWithdrawRate: 50.01))
+            };
+
+            var linearInjectWithdrawConstraint = new PiecewiseLinearInjectWithdrawConstraint(injectWithdrawalRanges);
+
+            double[] inventories = {0.0, 55.5, 100.0, 200.0, 650.2, 999.9, 1000.0};
+            var injectWithdrawRanges = new InjectWithdrawRange[inventories.Length];
+            linearInjectWithdrawConstraint.GetInjectWithdrawRange(inventories, injectWithdrawRanges);
+
+            for (int i = 0; i < inventories.Length; i++)
+            {
+                InjectWithdrawRange expectedInjectWithdrawRange = linearInjectWithdrawConstraint.GetInjectWithdrawRange(inventories[i]);
+                Assert.Equal(expectedInjectWithdrawRange.MinInjectWithdrawRate, injectWithdrawRanges[i].MinInjectWithdrawRate);
+                Assert.Equal(expectedInjectWithdrawRange.MaxInjectWithdrawRate, injectWithdrawRanges[i].MaxInjectWithdrawRate);
+            }
+        }
+
     }
 }
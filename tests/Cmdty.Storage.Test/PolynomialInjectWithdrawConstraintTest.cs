@@ -153,6 +153,69 @@ public void InventorySpaceLowerBound_InventoryDependentInjectWithdrawRate_Consis
             Assert.Equal(nextPeriodMinInventory, derivedNextPeriodMinInventory, 12);
         }
 
+        [Fact]
+        public void InventorySpaceUpperBound_LinearInjectWithdrawRate_EqualsAnalyticSolution()
+        {
+            const double inventoryPercentLoss = 0.01;
+            var injectWithdrawalRanges = new List<InjectWithdrawRangeByInventory>
+            {
+                (inventory: 0.0, (minInjectWithdrawRate: -10.0, maxInjectWithdrawRate: 25.0)),
+                (inventory: 1000.0, (minInjectWithdrawRate: -20.0, maxInjectWithdrawRate: 15.0)),
+            };
+            var polynomialInjectWithdrawConstraint = new PolynomialInjectWithdrawConstraint(injectWithdrawalRanges);
+
+            const double nextPeriodMinInventory = 100.0;
+            const double nextPeriodMaxInventory = 400.0;
+            double thisPeriodMaxInventory = polynomialInjectWithdrawConstraint.InventorySpaceUpperBound(nextPeriodMinInventory, 
+                                                nextPeriodMaxInventory, 0.0, 1000.0, inventoryPercentLoss);
+
+            // Solves inventory * (1 - loss) - 10 - 0.01 * inventory = nextPeriodMaxInventory
+            double expectedThisPeriodMaxInventory = (nextPeriodMaxInventory + 10.0) / (1 - inventoryPercentLoss - 0.01);
+            Assert.Equal(expectedThisPeriodMaxInventory, thisPeriodMaxInventory, 10);
+        }
+
+        [Fact]
+        public void InventorySpaceLowerBound_LinearInjectWithdrawRate_EqualsAnalyticSolution()
+        {
+            const double inventoryPercentLoss = 0.01;
+            var injectWithdrawalRanges = new List<InjectWithdrawRangeByInventory>
+            {
+                (inventory: 0.0, (minInjectWithdrawRate: -10.0, maxInjectWithdrawRate: 25.0)),
+                (inventory: 1000.0, (minInjectWithdrawRate: -20.0, maxInjectWithdrawRate: 15.0)),
+            };
+            var polynomialInjectWithdrawConstraint = new PolynomialInjectWithdrawConstraint(injectWithdrawalRanges);
+
+            const double nextPeriodMinInventory = 600.0;
+            const double nextPeriodMaxInventory = 900.0;
+            double thisPeriodMinInventory = polynomialInjectWithdrawConstraint.InventorySpaceLowerBound(nextPeriodMinInventory, 
+                                                nextPeriodMaxInventory, 0.0, 1000.0, inventoryPercentLoss);
+
+            // Solves inventory * (1 - loss) + 25 - 0.01 * inventory = nextPeriodMinInventory
+            double expectedThisPeriodMinInventory = (nextPeriodMinInventory - 25.0) / (1 - inventoryPercentLoss - 0.01);
+            Assert.Equal(expectedThisPeriodMinInventory, thisPeriodMinInventory, 10);
+        }
+
+        [Fact]
+        public void InventorySpaceUpperBound_ThreeRatchetsWithTwoRootsInInventoryRange_EqualsHighestRoot()
+        {
+            // Min inject/withdraw rate is the quadratic 0.0005 * (inventory - 400) * (inventory - 900) - inventory + 250,
+            // so inventory + rate = 250 has roots at 400 and 900. Above 900 the next period inventory can't be brought
+            // down to 250, so the upper bound is 900, not the other root of 400.
+            const double nextPeriodMaxInventory = 250.0;
+            var injectWithdrawalRanges = new List<InjectWithdrawRangeByInventory>
+            {
+                (inventory: 300.0, (minInjectWithdrawRate: -20.0, maxInjectWithdrawRate: 50.0)),
+                (inventory: 650.0, (minInjectWithdrawRate: -431.25, maxInjectWithdrawRate: 50.0)),
+                (inventory: 1000.0, (minInjectWithdrawRate: -720.0, maxInjectWithdrawRate: 50.0)),
+            };
+            var polynomialInjectWithdrawConstraint = new PolynomialInjectWithdrawConstraint(injectWithdrawalRanges);
+
+            const double nextPeriodMinInventory = 200.0;
+            double thisPeriodMaxInventory = polynomialInjectWithdrawConstraint.InventorySpaceUpperBound(nextPeriodMinInventory,
+                                                nextPeriodMaxInventory, 300.0, 1000.0, 0.0);
+
+            Assert.Equal(900.0, thisPeriodMaxInventory, 8);
+        }
 
         // TODO tests for being bounded by global max and min inventory
 
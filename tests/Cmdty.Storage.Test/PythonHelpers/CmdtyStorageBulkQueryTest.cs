@@ -0,0 +1,132 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+using System.Collections.Generic;
+using Cmdty.Storage.PythonHelpers;
+using Cmdty.TimePeriodValueTypes;
+using Xunit;
+
+namespace Cmdty.Storage.Test
+{
+    public sealed class CmdtyStorageBulkQueryTest
+    {
+        private static readonly int[] PeriodOffsets = {0, 0, 5, 5, 20, 31};
+        private static readonly double[] Inventories = {0.0, 150.0, 50.0, 299.0, 100.0, 250.0};
+        private static readonly double[] Volumes = {10.0, 5.5, 0.0, 20.0, 1.25, 7.0};
+
+        private static CmdtyStorage<Day> CreateStorage()
+        {
+            var injectWithdrawConstraints = new List<InjectWithdrawRangeByInventoryAndPeriod<Day>>
+            {
+                (period: new Day(2019, 10, 1), injectWithdrawRanges: new List<InjectWithdrawRangeByInventory>
+                {
+                    (inventory: 0.0, (minInjectWithdrawRate: -44.85, maxInjectWithdrawRate: 56.8)),
+                    (inventory: 300.0, (minInjectWithdrawRate: -45.78, maxInjectWithdrawRate: 52.01)),
+                }),
+                (period: new Day(2019, 10, 15), injectWithdrawRanges: new List<InjectWithdrawRangeByInventory>
+                {
+                    (inventory: 0.0, (minInjectWithdrawRate: -30.0, maxInjectWithdrawRate: 40.5)),
+                    (inventory: 300.0, (minInjectWithdrawRate: -35.5, maxInjectWithdrawRate: 32.0)),
+                }),
+            };
+            return CmdtyStorage<Day>.Builder
+                .WithActiveTimePeriod(new Day(2019, 10, 1), new Day(2019, 11, 1))
+                .WithTimeAndInventoryVaryingInjectWithdrawRatesPiecewiseLinear(injectWithdrawConstraints)
+                .WithPerUnitInjectionCost(0.75, injectionDate => injectionDate)
+                .WithFixedPercentCmdtyConsumedOnInject(0.01)
+                .WithPerUnitWithdrawalCost(0.5, withdrawalDate => withdrawalDate)
+                .WithFixedPercentCmdtyConsumedOnWithdraw(0.015)
+                .WithNoCmdtyInventoryLoss()
+                .WithFixedPerUnitInventoryCost(0.02)
+                .MustBeEmptyAtEnd()
+                .Build();
+        }
+
+        [Fact]
+        [Trait("Category", "PythonHelpers")]
+        public void InjectWithdrawRanges_EqualsGetInjectWithdrawRange()
+        {
+            CmdtyStorage<Day> storage = CreateStorage();
+            double[] ranges = CmdtyStorageBulkQuery.InjectWithdrawRanges(storage, PeriodOffsets, Inventories);
+
+            Assert.Equal(PeriodOffsets.Length * 2, ranges.Length);
+            for (int i = 0; i < PeriodOffsets.Length; i++)
+            {
+                InjectWithdrawRange expected = storage.GetInjectWithdrawRange(storage.StartPeriod.Offset(PeriodOffsets[i]), Inventories[i]);
+                Assert.Equal(expected.MinInjectWithdrawRate, ranges[i]);
+                Assert.Equal(expected.MaxInjectWithdrawRate, ranges[PeriodOffsets.Length + i]);
+            }
+        }
+
+        [Fact]
+        [Trait("Category", "PythonHelpers")]
+        public void MinAndMaxInventories_EqualsStorageMethods()
+        {
+            CmdtyStorage<Day> storage = CreateStorage();
+            double[] minInventories = CmdtyStorageBulkQuery.MinInventories(storage, PeriodOffsets);
+            double[] maxInventories = CmdtyStorageBulkQuery.MaxInventories(storage, PeriodOffsets);
+
+            for (int i = 0; i < PeriodOffsets.Length; i++)
+            {
+                Day period = storage.StartPeriod.Offset(PeriodOffsets[i]);
+                Assert.Equal(storage.MinInventory(period), minInventories[i]);
+                Assert.Equal(storage.MaxInventory(period), maxInventories[i]);
+            }
+        }
+
+        [Fact]
+        [Trait("Category", "PythonHelpers")]
+        public void CostsAndCmdtyConsumed_EqualsStorageMethods()
+        {
+            CmdtyStorage<Day> storage = CreateStorage();
+            double[] injectionCosts = CmdtyStorageBulkQuery.InjectionCosts(storage, PeriodOffsets, Inventories, Volumes);
+            double[] withdrawalCosts = CmdtyStorageBulkQuery.WithdrawalCosts(storage, PeriodOffsets, Inventories, Volumes);
+            double[] consumedOnInject = CmdtyStorageBulkQuery.CmdtyVolumesConsumedOnInject(storage, PeriodOffsets, Inventories, Volumes);
+            double[] consumedOnWithdraw = CmdtyStorageBulkQuery.CmdtyVolumesConsumedOnWithdraw(storage, PeriodOffsets, Inventories, Volumes);
+            double[] inventoryCosts = CmdtyStorageBulkQuery.CmdtyInventoryCosts(storage, PeriodOffsets, Inventories);
+
+            for (int i = 0; i < PeriodOffsets.Length; i++)
+            {
+                Day period = storage.StartPeriod.Offset(PeriodOffsets[i]);
+                Assert.Equal(storage.InjectionCost(period, Inventories[i], Volumes[i])[0].Amount, injectionCosts[i]);
+                Assert.Equal(storage.WithdrawalCost(period, Inventories[i], Volumes[i])[0].Amount, withdrawalCosts[i]);
+                Assert.Equal(storage.CmdtyVolumeConsumedOnInject(period, Inventories[i], Volumes[i]), consumedOnInject[i]);
+                Assert.Equal(storage.CmdtyVolumeConsumedOnWithdraw(period, Inventories[i], Volumes[i]), consumedOnWithdraw[i]);
+                Assert.Equal(storage.CmdtyInventoryCost(period, Inventories[i])[0].Amount, inventoryCosts[i]);
+            }
+        }
+
+        [Fact]
+        [Trait("Category", "PythonHelpers")]
+        public void InjectionCosts_ArrayLengthsDiffer_ThrowsArgumentException()
+        {
+            CmdtyStorage<Day> storage = CreateStorage();
+            Assert.Throws<ArgumentException>(() =>
+                CmdtyStorageBulkQuery.InjectionCosts(storage, PeriodOffsets, Inventories, new[] {1.0, 2.0}));
+        }
+
+    }
+}
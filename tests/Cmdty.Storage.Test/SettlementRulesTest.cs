@@ -0,0 +1,105 @@
+﻿#region License
+// Copyright (c) 2020 Jake Fowler
+//
+// Permission is hereby granted, free of charge, to any person 
+// obtaining a copy of this software and associated documentation 
+// files (the "Software"), to deal in the Software without 
+// restriction, including without limitation the rights to use, 
+// copy, modify, merge, publish, distribute, sublicense, and/or sell 
+// copies of the Software, and to permit persons to whom the 
+// Software is furnished to do so, subject to the following 
+// conditions:
+//
+// The above copyright notice and this permission notice shall be 
+// included in all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+// EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES 
+// OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND 
+// NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+// HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, 
+// WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING 
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+// OTHER DEALINGS IN THE SOFTWARE.
+#endregion
+
+using System;
+using Cmdty.TimePeriodValueTypes;
+using Xunit;
+
+namespace Cmdty.Storage.Test
+{
+    public sealed class SettlementRulesTest
+    {
+        [Fact]
+        [Trait("Category", "SettlementRules")]
+        public void DayOfFollowingMonth_ReturnsDayInFollowingMonth()
+        {
+            Func<Hour, Day> settleDateRule = SettlementRules.DayOfFollowingMonth<Hour>(20);
+            Assert.Equal(new Day(2020, 2, 20), settleDateRule(new Hour(2020, 1, 31, 23)));
+            Assert.Equal(new Day(2021, 1, 20), settleDateRule(new Hour(2020, 12, 1, 0)));
+        }
+
+        [Fact]
+        [Trait("Category", "SettlementRules")]
+        public void DayOfFollowingMonth_DayAfterEndOfFollowingMonth_ReturnsLastDayOfFollowingMonth()
+        {
+            Func<Day, Day> settleDateRule = SettlementRules.DayOfFollowingMonth<Day>(31);
+            Assert.Equal(new Day(2020, 2, 29), settleDateRule(new Day(2020, 1, 15)));
+            Assert.Equal(new Day(2020, 3, 31), settleDateRule(new Day(2020, 2, 15)));
+        }
+
+        [Fact]
+        [Trait("Category", "SettlementRules")]
+        public void DayOfFollowingMonth_DayOfMonthOutOfRange_ThrowsArgumentException()
+        {
+            Assert.Throws<ArgumentException>(() => SettlementRules.DayOfFollowingMonth<Day>(0));
+            Assert.Throws<ArgumentException>(() => SettlementRules.DayOfFollowingMonth<Day>(32));
+        }
+
+        [Fact]
+        [Trait("Category", "SettlementRules")]
+        public void SameDay_ReturnsDayOfPeriodStart()
+        {
+            Func<Hour, Day> settleDateRule = SettlementRules.SameDay<Hour>();
+            Assert.Equal(new Day(2020, 3, 8), settleDateRule(new Hour(2020, 3, 8, 23)));
+        }
+
+        [Fact]
+        [Trait("Category", "SettlementRules")]
+        public void FirstOfPeriod_ReturnsFirstDayOfContainingPeriod()
+        {
+            Assert.Equal(new Day(2020, 3, 1), SettlementRules.FirstOfPeriod<Day, Month>()(new Day(2020, 3, 17)));
+            Assert.Equal(new Day(2020, 1, 1), SettlementRules.FirstOfPeriod<Day, Quarter>()(new Day(2020, 3, 17)));
+        }
+
+        [Fact]
+        [Trait("Category", "SettlementRules")]
+        public void BusinessDayOffset_SkipsWeekendsAndHolidays()
+        {
+            // 2020-12-24 is a Thursday
+            Func<Day, Day> settleDateRule = SettlementRules.BusinessDayOffset<Day>(2, 
+                                                new[] {new Day(2020, 12, 25), new Day(2020, 12, 28)});
+            Assert.Equal(new Day(2020, 12, 30), settleDateRule(new Day(2020, 12, 24)));
+        }
+
+        [Fact]
+        [Trait("Category", "SettlementRules")]
+        public void BusinessDayOffset_NegativeOffset_RollsBackwards()
+        {
+            // 2020-03-09 is a Monday
+            Func<Day, Day> settleDateRule = SettlementRules.BusinessDayOffset<Day>(-1, new Day[0]);
+            Assert.Equal(new Day(2020, 3, 6), settleDateRule(new Day(2020, 3, 9)));
+        }
+
+        [Fact]
+        [Trait("Category", "SettlementRules")]
+        public void BusinessDayOffset_ZeroOffsetOnWeekend_ReturnsNextBusinessDay()
+        {
+            Func<Day, Day> settleDateRule = SettlementRules.BusinessDayOffset<Day>(0, new Day[0]);
+            Assert.Equal(new Day(2020, 3, 9), settleDateRule(new Day(2020, 3, 7)));
+            Assert.Equal(new Day(2020, 3, 10), settleDateRule(new Day(2020, 3, 10)));
+        }
+
+    }
+}
@@ -166,6 +166,51 @@ public void GetInjectWithdrawRange_InventoryEqualsPiecewisePillars_EqualToInputs
             }
         }
 
+        [Fact]
+        public void GetInjectWithdrawRange_UniformlySpacedPillars_EqualToInputsAtAndJustBelowPillars()
+        {
+            var injectWithdrawRanges = new List<InjectWithdrawRangeByInventory>
+            {
+                (inventory: 0.0, (minInjectWithdrawRate: -44.85, maxInjectWithdrawRate: 56.8)),
+                (inventory: 0.1, (minInjectWithdrawRate: -45.01, maxInjectWithdrawRate: 54.5)),
+                (inventory: 0.2, (minInjectWithdrawRate: -45.78, maxInjectWithdrawRate: 52.01)),
+                (inventory: 0.3, (minInjectWithdrawRate: -46.17, maxInjectWithdrawRate: 51.9)),
+                (inventory: 0.4, (minInjectWithdrawRate: -46.99, maxInjectWithdrawRate: 50.8)),
+                (inventory: 0.5, (minInjectWithdrawRate: -46.99, maxInjectWithdrawRate: 50.8))
+            };
+            var stepConstraint = new StepInjectWithdrawConstraint(injectWithdrawRanges);
+
+            for (int i = 0; i < injectWithdrawRanges.Count; i++)
+            {
+                (double inventoryPillar, InjectWithdrawRange inputInjectWithdrawRange) = injectWithdrawRanges[i];
+                InjectWithdrawRange outputInjectWithdrawRange = stepConstraint.GetInjectWithdrawRange(inventoryPillar);
+                Assert.Equal(inputInjectWithdrawRange.MinInjectWithdrawRate, outputInjectWithdrawRange.MinInjectWithdrawRate);
+                Assert.Equal(inputInjectWithdrawRange.MaxInjectWithdrawRate, outputInjectWithdrawRange.MaxInjectWithdrawRate);
+                if (i > 0)
+                {
+                    InjectWithdrawRange previousInputInjectWithdrawRange = injectWithdrawRanges[i - 1].InjectWithdrawRange;
+                    InjectWithdrawRange outputJustBelowPillar = stepConstraint.GetInjectWithdrawRange(inventoryPillar - 1E-9);
+                    Assert.Equal(previousInputInjectWithdrawRange.MinInjectWithdrawRate, outputJustBelowPillar.MinInjectWithdrawRate);
+                    Assert.Equal(previousInputInjectWithdrawRange.MaxInjectWithdrawRate, outputJustBelowPillar.MaxInjectWithdrawRate);
+                }
+            }
+        }
+
+        [Fact]
+        public void GetInjectWithdrawRangeBatch_EqualToScalarGetInjectWithdrawRange()
+        {
+            double[] inventories = {0.0, 99.0, 100.0, 610.85, 999.99, 1000.0};
+            var injectWithdrawRanges = new InjectWithdrawRange[inventories.Length];
+            _stepConstraint.GetInjectWithdrawRange(inventories, injectWithdrawRanges);
+
+            for (int i = 0; i < inventories.Length; i++)
+            {
+                InjectWithdrawRange expectedInjectWithdrawRange = _stepConstraint.GetInjectWithdrawRange(inventories[i]);
+                Assert.Equal(expectedInjectWithdrawRange.MinInjectWithdrawRate, injectWithdrawRanges[i].MinInjectWithdrawRate);
+                Assert.Equal(expectedInjectWithdrawRange.MaxInjectWithdrawRate, injectWithdrawRanges[i].MaxInjectWithdrawRate);
+            }
+        }
+
         [Fact]
         public void GetInjectWithdrawRange_InventoryBelowMinInventory_ThrowsArgumentException()
         {
@@ -277,6 +277,17 @@ public void MaxValueAndIndex_ArrayOfZeroLength_ThrowsIndexOutOfRangeException()
             Assert.Throws<IndexOutOfRangeException>(() => StorageHelper.MaxValueAndIndex(new double[0]));
         }
 
+        [Fact]
+        [Trait("Category", "Helper.MaxValueAndIndex")]
+        public void MaxValueAndIndex_SliceOfArray_IgnoresElementsOutsideSlice()
+        {
+            double[] buffer = {4.5, -1.2, 3.2, 9.9};
+            (double maxValue, int indexOfMax) = StorageHelper.MaxValueAndIndex(buffer.AsSpan(0, 3));
+
+            Assert.Equal(4.5, maxValue);
+            Assert.Equal(0, indexOfMax);
+        }
+
         [Fact]
         [Trait("Category", "Helper.CalculateInventorySpace")]
         public void CalculateInventorySpace_CurrentPeriodAfterStorageStartPeriod_AsExpected()
@@ -418,6 +429,57 @@ public void CalculateInventorySpace_CurrentPeriodBeforeStorageStartPeriod_AsExpe
             AssertInventoryRangeEqualsExpected(inventorySpace[new Day(2019, 8, 25)], expectedInventoryLower, expectedInventoryUpper);
 
         }
+
+        private static CmdtyStorage<Day> CreateInventorySpaceCacheTestStorage()
+        {
+            return CmdtyStorage<Day>.Builder
+                        .WithActiveTimePeriod(new Day(2019, 8, 1), new Day(2019, 8, 28))
+                        .WithConstantInjectWithdrawRange(-6.0, 5.0)
+                        .WithConstantMinInventory(0.0)
+                        .WithConstantMaxInventory(23.5)
+                        .WithPerUnitInjectionCost(1.5)
+                        .WithNoCmdtyConsumedOnInject()
+                        .WithPerUnitWithdrawalCost(0.8)
+                        .WithNoCmdtyConsumedOnWithdraw()
+                        .WithFixedPercentCmdtyInventoryLoss(0.03)
+                        .WithNoInventoryCost()
+                        .MustBeEmptyAtEnd()
+                        .Build();
+        }
+
+        [Fact]
+        [Trait("Category", "Helper.CalculateInventorySpace")]
+        public void GetOrCalculateInventorySpace_CmdtyStorage_EqualsCalculateInventorySpace()
+        {
+            CmdtyStorage<Day> storage = CreateInventorySpaceCacheTestStorage();
+            var currentPeriod = new Day(2019, 8, 10);
+
+            TimeSeries<Day, InventoryRange> expectedInventorySpace = StorageHelper.CalculateInventorySpace(storage, 8.0, currentPeriod);
+            TimeSeries<Day, InventoryRange> inventorySpace = StorageHelper.GetOrCalculateInventorySpace(storage, 8.0, currentPeriod);
+
+            Assert.Equal(expectedInventorySpace.Indices, inventorySpace.Indices);
+            foreach (Day period in expectedInventorySpace.Indices)
+                AssertInventoryRangeEqualsExpected(inventorySpace[period], expectedInventorySpace[period].MinInventory, 
+                                    expectedInventorySpace[period].MaxInventory);
+        }
+
+        [Fact]
+        [Trait("Category", "Helper.CalculateInventorySpace")]
+        public void GetOrCalculateInventorySpace_SameInventoryAndCurrentPeriod_ReturnsCachedInstance()
+        {
+            CmdtyStorage<Day> storage = CreateInventorySpaceCacheTestStorage();
+            var currentPeriod = new Day(2019, 8, 10);
+
+            TimeSeries<Day, InventoryRange> inventorySpace1 = StorageHelper.GetOrCalculateInventorySpace(storage, 8.0, currentPeriod);
+            TimeSeries<Day, InventoryRange> inventorySpace2 = StorageHelper.GetOrCalculateInventorySpace(storage, 8.0, currentPeriod);
+            Assert.Same(inventorySpace1, inventorySpace2);
+
+            Assert.NotSame(inventorySpace1, StorageHelper.GetOrCalculateInventorySpace(storage, 9.0, currentPeriod));
+            Assert.NotSame(inventorySpace1, StorageHelper.GetOrCalculateInventorySpace(storage, 8.0, currentPeriod.Offset(1)));
+
+            storage.ClearInventorySpaceCache();
+            Assert.NotSame(inventorySpace1, StorageHelper.GetOrCalculateInventorySpace(storage, 8.0, currentPeriod));
+        }
         
         private void AssertInventoryRangeEqualsExpected(InventoryRange inventoryRange, 
                             double expectedInventoryLower, double expectedInventoryUpper)
@@ -606,5 +668,62 @@ public void BisectInventorySpace_InventoryHigherButWithinToleranceOfInventoryGri
             Assert.Equal(maxIndex, upperIndex);
         }
 
+        [Fact]
+        [Trait("Category", "Helper.SettleDateRule")]
+        public void CreateSettleDateRuleFromSeries_PeriodInSeries_ReturnsSettleDateFromSeries()
+        {
+            var settleDates = new TimeSeries<Hour, Day>.Builder
+            {
+                {new Hour(2020, 1, 31, 22), new Day(2020, 2, 20)},
+                {new Hour(2020, 1, 31, 23), new Day(2020, 2, 20)},
+                {new Hour(2020, 2, 1, 0), new Day(2020, 3, 20)}
+            }.Build();
+            Func<Hour, Day> settleDateRule = StorageHelper.CreateSettleDateRuleFromSeries(settleDates);
+
+            Assert.Equal(new Day(2020, 2, 20), settleDateRule(new Hour(2020, 1, 31, 23)));
+            Assert.Equal(new Day(2020, 3, 20), settleDateRule(new Hour(2020, 2, 1, 0)));
+        }
+
+        [Fact]
+        [Trait("Category", "Helper.SettleDateRule")]
+        public void CreateSettleDateRuleFromSeries_PeriodNotInSeries_ThrowsArgumentException()
+        {
+            var settleDates = new TimeSeries<Day, Day>.Builder
+            {
+                {new Day(2020, 1, 30), new Day(2020, 2, 20)},
+                {new Day(2020, 1, 31), new Day(2020, 2, 20)}
+            }.Build();
+            Func<Day, Day> settleDateRule = StorageHelper.CreateSettleDateRuleFromSeries(settleDates);
+
+            Assert.Throws<ArgumentException>(() => settleDateRule(new Day(2020, 2, 1)));
+        }
+
+        [Fact]
+        [Trait("Category", "Helper.FloorIndex")]
+        public void UniformSpacingReciprocal_UnevenlySpacedValues_ReturnsZero()
+        {
+            double[] values = {0.0, 100.0, 300.0, 600.0};
+            Assert.Equal(0.0, StorageHelper.UniformSpacingReciprocal(values));
+        }
+
+        [Fact]
+        [Trait("Category", "Helper.FloorIndex")]
+        public void FloorIndex_DirectIndexing_EqualsFloorIndexByBisection()
+        {
+            double[] values = {0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7};
+            double uniformSpacingReciprocal = StorageHelper.UniformSpacingReciprocal(values);
+            Assert.Equal(10.0, uniformSpacingReciprocal, 8);
+
+            for (int i = -10; i <= 80; i++)
+            {
+                double value = i / 100.0;
+                int expectedIndex = StorageHelper.FloorIndex(values, value, 0.0);
+                int directIndex = StorageHelper.FloorIndex(values, value, uniformSpacingReciprocal);
+                Assert.Equal(expectedIndex, directIndex);
+            }
+            foreach (double value in values)
+                Assert.Equal(Array.IndexOf(values, value), StorageHelper.FloorIndex(values, value, uniformSpacingReciprocal));
+        }
+
     }
 }
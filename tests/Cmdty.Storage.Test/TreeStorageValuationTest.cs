@@ -78,6 +78,33 @@ public void Calculate_StorageLooksLikeCallOptions_NpvEqualsBlack76()
             Assert.InRange(percentError, -percentTolerance, percentTolerance);
         }
         
+        [Fact]
+        public void Calculate_WithPhaseTimings_ResultContainsTimingForEachPhase()
+        {
+            var currentDate = new Day(2019, 8, 29);
+            (DoubleTimeSeries<Day> forwardCurve, DoubleTimeSeries<Day> spotVolCurve) =
+                TestHelper.CreateDailyTestForwardAndSpotVolCurves(currentDate, new Day(2020, 4, 1));
+            TestHelper.CallOptionLikeTestData testData = TestHelper.CreateThreeCallsLikeStorageTestData(forwardCurve);
+
+            TreeStorageValuationResults<Day> valuationResults =
+                TreeStorageValuation<Day>.ForStorage(testData.Storage)
+                .WithStartingInventory(testData.Inventory)
+                .ForCurrentPeriod(currentDate)
+                .WithForwardCurve(forwardCurve)
+                .WithOneFactorTrinomialTree(spotVolCurve, 16.5, 1.0 / 365.0)
+                .WithMonthlySettlement(testData.SettleDates)
+                .WithAct365ContinuouslyCompoundedInterestRate(day => 0.09)
+                .WithFixedNumberOfPointsOnGlobalInventoryRange(100)
+                .WithLinearInventorySpaceInterpolation()
+                .WithNumericalTolerance(1E-10)
+                .WithPhaseTimings()
+                .Calculate();
+
+            Assert.Equal(new[] { "BackwardInduction", "InterpolatorConstruction", "InventorySpace", "TreeBuild" },
+                valuationResults.PhaseTimings.Keys.OrderBy(phase => phase));
+            Assert.True(valuationResults.PhaseTimings["BackwardInduction"] >= valuationResults.PhaseTimings["InterpolatorConstruction"]);
+        }
+
         [Fact]
         public void Calculate_StorageWithForcedInjectAndWithdraw_NpvEqualsTrivialIntrinsicCalc()
         {